@@ -0,0 +1,196 @@
+"""
+Resolución por lotes sin interfaz gráfica.
+
+Lee un archivo JSONL con un problema por línea:
+    {"id": 1, "objective": "Maximizar Z = 3x1 + 2x2", "restrictions": ["1x1 + 1x2 <= 6", ...]}
+
+reparte los problemas entre procesos de trabajo que mantienen un SimplexSolver
+cargado y escribe un JSONL de resultados en el mismo orden de entrada, sin
+cargar el archivo completo en memoria.
+
+Uso:
+    python batch_solver.py problemas.jsonl -o resultados.jsonl [--workers N]
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple
+
+from simplex_solver import SimplexSolver
+from solve_cache import SolveCache
+
+# Estado de cada proceso de trabajo (se inicializa una vez por proceso)
+_worker_solver = None
+_worker_options = {}
+
+
+def _init_worker(solve_options: Dict, cache_path: str = None):
+    """Crear el solver del proceso de trabajo (con la caché compartida en disco si se pide)"""
+    global _worker_solver, _worker_options
+    _worker_solver = SimplexSolver(cache=SolveCache(cache_path) if cache_path else None)
+    _worker_options = solve_options
+
+
+def _to_jsonable(value):
+    """Convertir valores de NumPy a tipos serializables en JSON"""
+    if hasattr(value, 'tolist'):
+        value = value.tolist()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, list):
+        return [_to_jsonable(v) for v in value]
+    return value
+
+
+def solve_record(solver: SimplexSolver, line: str, solve_options: Dict) -> str:
+    """
+    Resolver un problema en formato JSON y devolver el resultado como línea JSON
+
+    Args:
+        solver: Solver a utilizar
+        line: Línea JSON con 'objective' y 'restrictions' (y opcionalmente 'id')
+        solve_options: Opciones para solve_from_text
+
+    Returns:
+        Línea JSON con el resultado (sin historial de iteraciones)
+    """
+    try:
+        record = json.loads(line)
+        result = solver.solve_from_text(record['objective'], record['restrictions'],
+                                        **solve_options)
+    except (ValueError, KeyError, TypeError) as e:
+        record = {}
+        result = {'status': 'error', 'message': f'Registro inválido: {str(e)}'}
+
+    output = {'id': record.get('id'), 'status': result['status']}
+    for key in ('message', 'optimal_value', 'solution', 'duals', 'variable_names', 'iteration_count'):
+        if key in result:
+            output[key] = _to_jsonable(result[key])
+    return json.dumps(output, ensure_ascii=False)
+
+
+def _solve_chunk(lines: List[str]) -> Tuple[List[str], int]:
+    """Resolver un bloque de líneas en el proceso de trabajo (resultados y aciertos de caché)"""
+    cache = _worker_solver.cache
+    hits = cache.hits if cache else 0
+    results = [solve_record(_worker_solver, line, _worker_options) for line in lines]
+    return results, (cache.hits - hits if cache else 0)
+
+
+def _chunks(lines: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """Agrupar las líneas no vacías en bloques de chunk_size"""
+    chunk = []
+    for line in lines:
+        if line.strip():
+            chunk.append(line)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_batch(source: TextIO, sink: TextIO, workers: int = None, chunk_size: int = 64,
+              max_pending: int = None, solve_options: Dict = None, cache_path: str = None) -> Dict:
+    """
+    Resolver todos los problemas de source y escribir los resultados en sink
+
+    Como máximo hay max_pending bloques en vuelo, así que la memoria no depende del
+    tamaño del archivo; los resultados se escriben en el orden de entrada.
+
+    Args:
+        source: Archivo JSONL de entrada
+        sink: Archivo JSONL de salida
+        workers: Número de procesos (por defecto, número de CPUs)
+        chunk_size: Problemas enviados a un proceso en cada tarea
+        max_pending: Bloques en vuelo como máximo (por defecto 4 por proceso)
+        solve_options: Opciones para solve_from_text
+        cache_path: Archivo SQLite de la caché de resultados (ver solve_cache.py),
+                    compartido por todos los procesos
+
+    Returns:
+        Diccionario con 'problems', 'elapsed', 'problems_per_second',
+        'cache_hits' y 'cache_hit_rate'
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 4 * workers
+    solve_options = dict(solve_options or {})
+    solve_options.setdefault('history', 'none')
+
+    start = time.perf_counter()
+    n_problems = n_hits = 0
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(solve_options, cache_path)) as pool:
+        for chunk in _chunks(source, chunk_size):
+            pending.append(pool.submit(_solve_chunk, chunk))
+            if len(pending) >= max_pending:
+                written, hits = _write_results(pending.popleft(), sink)
+                n_problems, n_hits = n_problems + written, n_hits + hits
+        while pending:
+            written, hits = _write_results(pending.popleft(), sink)
+            n_problems, n_hits = n_problems + written, n_hits + hits
+
+    elapsed = time.perf_counter() - start
+    return {
+        'problems': n_problems,
+        'elapsed': elapsed,
+        'problems_per_second': n_problems / elapsed if elapsed > 0 else 0.0,
+        'cache_hits': n_hits,
+        'cache_hit_rate': n_hits / n_problems if n_problems else 0.0
+    }
+
+
+def _write_results(future, sink: TextIO) -> Tuple[int, int]:
+    results, hits = future.result()
+    for line in results:
+        sink.write(line + '\n')
+    return len(results), hits
+
+
+def main():
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Resolver problemas de programación lineal desde un archivo JSONL")
+    parser.add_argument('input', help="Archivo JSONL de entrada ('-' para stdin)")
+    parser.add_argument('-o', '--output', default='-', help="Archivo JSONL de salida ('-' para stdout)")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Número de procesos")
+    parser.add_argument('--chunk-size', type=int, default=64, help="Problemas por tarea")
+    parser.add_argument('--max-pending', type=int, default=None, help="Tareas en vuelo como máximo")
+    parser.add_argument('--method', choices=['tableau', 'revised', 'interior_point'], default='tableau')
+    parser.add_argument('--max-iterations', type=int, default=None, help="Límite de pivoteos por problema")
+    parser.add_argument('--presolve', action='store_true', help="Reducir cada problema antes de resolverlo")
+    parser.add_argument('--scaling', choices=['geometric', 'equilibration'], default=None)
+    parser.add_argument('--crossover', action='store_true', help="Terminar el punto interior en un vértice")
+    parser.add_argument('--time-limit', type=float, default=None, help="Segundos por problema como máximo")
+    parser.add_argument('--cache', default=None, help="Archivo SQLite de la caché de resultados")
+    args = parser.parse_args()
+
+    source = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8')
+    sink = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        stats = run_batch(source, sink, workers=args.workers, chunk_size=args.chunk_size,
+                          max_pending=args.max_pending,
+                          solve_options={'method': args.method, 'max_iterations': args.max_iterations,
+                                         'presolve': args.presolve, 'scaling': args.scaling,
+                                         'crossover': args.crossover, 'time_limit': args.time_limit},
+                          cache_path=args.cache)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    print(f"{stats['problems']} problemas en {stats['elapsed']:.2f} s "
+          f"({stats['problems_per_second']:,.0f} problemas/s)", file=sys.stderr)
+    if args.cache:
+        print(f"caché: {stats['cache_hits']} aciertos ({stats['cache_hit_rate']:.1%})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
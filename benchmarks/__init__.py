@@ -0,0 +1,6 @@
+"""
+Benchmarks de rendimiento del solver.
+
+Ejecutar desde la raíz del proyecto, por ejemplo:
+    python -m benchmarks.bench_pivot
+"""
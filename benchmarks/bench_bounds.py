@@ -0,0 +1,83 @@
+"""
+Benchmark del Simplex con variables acotadas: problemas con una cota superior
+por variable resueltos con las cotas como filas (x_j <= u_j en la matriz) y con
+upper_bounds (las cotas en la prueba del cociente). Compara el tamaño del
+tableau, los pivoteos (y cuántos son cambios de cota sin pivoteo), el tiempo y
+el valor óptimo.
+
+Uso:
+    python -m benchmarks.bench_bounds [--sizes M N ...] [--repeat R]
+"""
+import argparse
+import time
+import numpy as np
+from simplex_solver import SimplexSolver
+from bounds import bounds_as_rows
+
+
+def generate(n_constraints: int, n_vars: int, seed: int = 0):
+    """
+    Problema aleatorio con cotas ajustadas: muchas variables terminan en su cota
+    superior, que es el caso que más filas ahorra
+    """
+    rng = np.random.default_rng(seed)
+    c = rng.uniform(1.0, 10.0, size=n_vars)
+    A = rng.uniform(0.1, 10.0, size=(n_constraints, n_vars))
+    upper = rng.uniform(0.5, 5.0, size=n_vars)
+    b = A @ upper * rng.uniform(0.3, 0.8, size=n_constraints)
+    return c, A, b, upper
+
+
+def best_time(action, repeat: int):
+    """Menor tiempo de repeat llamadas y el último resultado"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = action()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(sizes, repeat: int):
+    solver = SimplexSolver()
+    print(f"{'problema':>12}{'forma':>9}{'tableau':>13}{'pivoteos':>10}{'cambios':>9}"
+          f"{'tiempo (ms)':>13}{'valor óptimo':>16}")
+    for n_constraints, n_vars in sizes:
+        c, A, b, upper = generate(n_constraints, n_vars)
+        A_rows, b_rows = bounds_as_rows(A, b, upper)
+        rows_time, rows = best_time(lambda: solver.solve(c, A_rows, b_rows, history='none'), repeat)
+        rows_shape = (len(b_rows) + 1, n_vars + len(b_rows) + 1)
+
+        flips = []
+        bounded_time, bounded = best_time(
+            lambda: solver.solve(c, A, b, history='none', upper_bounds=upper,
+                                 callback=lambda info: flips.append(info['pivot_row'] == -1)),
+            repeat)
+        bounded_flips = sum(flips[-bounded['iteration_count']:]) if bounded['iteration_count'] else 0
+        bounded_shape = (n_constraints + 1, n_vars + n_constraints + 1)
+
+        label = f"{n_constraints}x{n_vars}"
+        for form, shape, result, elapsed, flip_count in (
+                ('filas', rows_shape, rows, rows_time, 0),
+                ('cotas', bounded_shape, bounded, bounded_time, bounded_flips)):
+            print(f"{label:>12}{form:>9}{shape[0]:>6}x{shape[1]:<6}{result['iteration_count']:>10}"
+                  f"{flip_count:>9}{elapsed * 1e3:>13.2f}{result['optimal_value']:>16.6f}")
+        if abs(rows['optimal_value'] - bounded['optimal_value']) > 1e-6 * max(1.0, abs(rows['optimal_value'])):
+            print("  ¡los valores óptimos no coinciden!")
+        print(f"{'':>12}{'':>9}  celdas del tableau: {bounded_shape[0] * bounded_shape[1] / (rows_shape[0] * rows_shape[1]):.1%}"
+              f", tiempo: {bounded_time / rows_time:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del Simplex con variables acotadas")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 20, 50, 100, 100, 300, 200, 600],
+                        help="Pares de filas y columnas")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    if len(args.sizes) % 2:
+        parser.error("--sizes necesita pares de filas y columnas")
+    run(list(zip(args.sizes[::2], args.sizes[1::2])), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark de ramificación y acotamiento: mochilas 0-1 y problemas enteros
+aleatorios resueltos con selección de nodos 'best_bound' y 'depth_first' y con
+uno o varios procesos. Informa nodos, nodos por segundo, pivoteos del Simplex
+dual por nodo, tiempo total, brecha final y la evolución de la brecha.
+
+Uso:
+    python -m benchmarks.bench_branch_and_bound [--knapsack N ...] [--random M N ...]
+                                                [--workers W ...] [--time-limit S]
+"""
+import argparse
+import numpy as np
+from simplex_solver import SimplexSolver
+
+
+def knapsack(n_items: int, seed: int = 0):
+    """Mochila 0-1 con valores correlacionados con los pesos (árboles grandes)"""
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(10, 60, size=n_items).astype(float)
+    values = weights + rng.integers(0, 10, size=n_items)
+    return values, weights[None, :], np.array([weights.sum() / 2]), np.ones(n_items)
+
+
+def random_ip(n_constraints: int, n_vars: int, seed: int = 0):
+    """Problema entero general aleatorio con cotas superiores pequeñas"""
+    rng = np.random.default_rng(seed)
+    c = rng.uniform(1.0, 10.0, size=n_vars)
+    A = rng.uniform(1.0, 10.0, size=(n_constraints, n_vars))
+    upper = rng.integers(1, 6, size=n_vars).astype(float)
+    b = A @ upper * rng.uniform(0.3, 0.6, size=n_constraints)
+    return c, A, b, upper
+
+
+def run(problems, workers_list, time_limit: float):
+    solver = SimplexSolver()
+    print(f"{'problema':>14}{'selección':>13}{'procesos':>10}{'estado':>12}{'nodos':>9}"
+          f"{'nodos/s':>10}{'piv/nodo':>10}{'tiempo (s)':>12}{'brecha':>9}{'valor':>14}")
+    for label, (c, A, b, upper) in problems:
+        values = set()
+        for node_selection in ('best_bound', 'depth_first'):
+            for workers in workers_list:
+                result = solver.solve_integer(c, A, b, np.arange(len(c)), upper_bounds=upper,
+                                              node_selection=node_selection, workers=workers,
+                                              time_limit=time_limit, history='none')
+                info = result['branch_and_bound']
+                gap = '-' if info['gap'] is None else f"{info['gap']:.2%}"
+                value = result.get('optimal_value')
+                per_node = info['pivots'] / info['nodes'] if info['nodes'] else 0.0
+                print(f"{label:>14}{node_selection:>13}{workers:>10}{result['status']:>12}"
+                      f"{info['nodes']:>9}{info['nodes_per_second']:>10.0f}{per_node:>10.2f}"
+                      f"{info['wall_time']:>12.3f}{gap:>9}"
+                      f"{'-' if value is None else f'{value:.4f}':>14}")
+                if result['status'] == 'optimal':
+                    values.add(round(value, 6))
+                history = info['gap_history']
+                if len(history) > 1:
+                    points = ", ".join(f"{elapsed:.2f}s:{'-' if g is None else f'{g:.1%}'}"
+                                       for elapsed, _, _, g in history[:: max(1, len(history) // 5)])
+                    print(f"{'':>14}  brecha: {points}")
+        if len(values) > 1:
+            print("  ¡los valores óptimos no coinciden!")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de ramificación y acotamiento")
+    parser.add_argument('--knapsack', type=int, nargs='+', default=[30, 40, 50],
+                        help="Número de objetos de cada mochila")
+    parser.add_argument('--random', type=int, nargs='+', default=[10, 20, 20, 30],
+                        help="Pares de filas y columnas de los problemas aleatorios")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--time-limit', type=float, default=60.0,
+                        help="Segundos por resolución")
+    args = parser.parse_args()
+    if len(args.random) % 2:
+        parser.error("--random necesita pares de filas y columnas")
+    problems = [(f"mochila {n}", knapsack(n)) for n in args.knapsack]
+    problems += [(f"entero {m}x{n}", random_ip(m, n))
+                 for m, n in zip(args.random[::2], args.random[1::2])]
+    run(problems, args.workers, args.time_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark de la caché de resultados: tiempo de resolver sin caché, de un fallo
+(resolver y guardar), de un acierto en memoria, de un acierto en disco (otra
+instancia sobre el mismo archivo) y de un acierto con las filas reordenadas y
+escaladas, junto con la tasa de aciertos de una carga con repeticiones.
+
+Uso:
+    python -m benchmarks.bench_cache [--size N] [--problems P] [--repeat R]
+"""
+import argparse
+import os
+import tempfile
+import time
+import numpy as np
+from simplex_solver import SimplexSolver
+from solve_cache import SolveCache
+
+
+def generate(size: int, seed: int = 0):
+    """Problema aleatorio de size x size con el origen factible"""
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(1.0, 10.0, size=size), rng.uniform(0.1, 10.0, size=(size, size)),
+            rng.uniform(10.0, 100.0, size=size))
+
+
+def timed(action):
+    start = time.perf_counter()
+    result = action()
+    return time.perf_counter() - start, result
+
+
+def run(size: int, n_problems: int, repeat: int, path: str):
+    """Medir la latencia de cada camino y la tasa de aciertos con repeticiones"""
+    c, A, b = generate(size)
+    options = {'method': 'revised', 'history': 'none'}
+    print(f"problema de {size}x{size}")
+    print(f"{'consulta':<32}{'tiempo (ms)':>14}")
+
+    uncached, reference = timed(lambda: SimplexSolver().solve(c, A, b, **options))
+    solver = SimplexSolver(cache=SolveCache(path))
+    miss, _ = timed(lambda: solver.solve(c, A, b, **options))
+    memory_hit, result = timed(lambda: solver.solve(c, A, b, **options))
+    disk_hit, _ = timed(lambda: SimplexSolver(cache=SolveCache(path)).solve(c, A, b, **options))
+    order = np.random.default_rng(1).permutation(size)
+    factors = np.random.default_rng(2).uniform(0.5, 4.0, size=size)
+    variant_hit, variant = timed(lambda: solver.solve(c, A[order] * factors[order, None],
+                                                      b[order] * factors[order], **options))
+    for label, elapsed in (('sin caché', uncached), ('fallo (resolver y guardar)', miss),
+                           ('acierto en memoria', memory_hit), ('acierto en disco', disk_hit),
+                           ('acierto reordenado y escalado', variant_hit)):
+        print(f"{label:<32}{elapsed * 1e3:>14.3f}")
+    if not (result['cache']['hit'] and variant['cache']['hit']
+            and np.isclose(result['optimal_value'], reference['optimal_value'])
+            and np.allclose(variant['duals'] * factors[order], reference['duals'][order])):
+        raise AssertionError("la caché no devolvió el resultado del problema original")
+
+    # Carga con repeticiones: n_problems distintos, cada uno pedido repeat veces
+    solver = SimplexSolver(cache=SolveCache())
+    problems = [generate(max(2, size // 10), seed) for seed in range(n_problems)]
+    elapsed, _ = timed(lambda: [solver.solve(*problems[i % n_problems], **options)
+                                for i in range(n_problems * repeat)])
+    stats = solver.cache.stats()
+    print(f"\n{n_problems * repeat} consultas de {n_problems} problemas: {elapsed:.2f} s, "
+          f"tasa de aciertos {stats['hit_rate']:.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la caché de resultados")
+    parser.add_argument('--size', type=int, default=200)
+    parser.add_argument('--problems', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        run(args.size, args.problems, args.repeat, os.path.join(directory, 'cache.sqlite'))
+
+
+if __name__ == "__main__":
+    main()
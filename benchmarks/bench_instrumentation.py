@@ -0,0 +1,81 @@
+"""
+Benchmark de la instrumentación de SimplexSolver: desglose del tiempo de
+resolución ('profile') y costo por pivoteo sin callback, con un callback vacío
+y con uno que guarda cada llamada. El costo de los contadores se estima con el
+número de lecturas del reloj por pivoteo.
+
+Uso:
+    python -m benchmarks.bench_instrumentation [--sizes N ...] [--method M] [--repeat R]
+"""
+import argparse
+import time
+import numpy as np
+from simplex_solver import SimplexSolver
+
+# Lecturas de time.perf_counter() que agrega la instrumentación en cada pivoteo
+CLOCK_READS_PER_PIVOT = 4
+
+
+def generate(size: int, seed: int = 0):
+    """Problema aleatorio de size x size con el origen factible"""
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(1.0, 10.0, size=size), rng.uniform(0.1, 10.0, size=(size, size)),
+            rng.uniform(10.0, 100.0, size=size))
+
+
+def best_time(action, repeat: int):
+    """Menor tiempo de repeat llamadas y el último resultado"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = action()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def clock_cost(samples: int = 200_000) -> float:
+    """Segundos por llamada a time.perf_counter()"""
+    clock = time.perf_counter
+    start = clock()
+    for _ in range(samples):
+        clock()
+    return (clock() - start) / samples
+
+
+def run(sizes, method: str, repeat: int):
+    """Medir cada tamaño con y sin callback"""
+    solver = SimplexSolver()
+    per_read = clock_cost()
+    print(f"método {method}; lectura del reloj: {per_read * 1e9:.0f} ns")
+    print(f"{'tamaño':>8}{'pivoteos':>10}{'µs/pivoteo':>12}{'callback vacío':>16}"
+          f"{'callback lista':>16}{'contadores':>12}")
+    for size in sizes:
+        c, A, b = generate(size)
+        options = {'method': method, 'history': 'none'}
+        base, result = best_time(lambda: solver.solve(c, A, b, **options), repeat)
+        noop, _ = best_time(lambda: solver.solve(c, A, b, callback=lambda info: None, **options), repeat)
+        calls = []
+        full, _ = best_time(lambda: solver.solve(c, A, b, callback=calls.append, **options), repeat)
+        pivots = max(result['iteration_count'], 1)
+        counters = CLOCK_READS_PER_PIVOT * per_read * pivots / base
+        print(f"{size:>8}{pivots:>10}{base / pivots * 1e6:>12.1f}{noop / base - 1:>15.1%}"
+              f"{full / base - 1:>15.1%}{counters:>11.2%}")
+
+    profile = result['profile']
+    print(f"\ndesglose del problema de {sizes[-1]}x{sizes[-1]} ({profile['solve_time'] * 1e3:.1f} ms):")
+    for key in ('pricing_time', 'ratio_test_time', 'elimination_time', 'history_time', 'callback_time'):
+        print(f"  {key:<20}{profile[key] * 1e3:>10.2f} ms{profile[key] / profile['solve_time']:>8.1%}")
+    print(f"  {'degenerate_pivots':<20}{profile['degenerate_pivots']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la instrumentación del solver")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[3, 20, 100, 400])
+    parser.add_argument('--method', choices=['tableau', 'revised'], default='tableau')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run(args.sizes, args.method, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
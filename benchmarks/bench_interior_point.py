@@ -0,0 +1,66 @@
+"""
+Benchmark del método de punto interior frente al Simplex en problemas grandes.
+
+Muestra el tiempo, las iteraciones y el valor óptimo de cada método, y la
+historia de la brecha de dualidad del punto interior.
+
+Uso:
+    python -m benchmarks.bench_interior_point [--constraints M] [--variables N] [--density D]
+"""
+import argparse
+import time
+import numpy as np
+from simplex_solver import SimplexSolver
+
+
+def generate(n_constraints: int, n_vars: int, density: float, seed: int = 0):
+    """Problema aleatorio acotado con coeficientes no negativos"""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(1.0, 10.0, size=(n_constraints, n_vars))
+    A *= rng.random((n_constraints, n_vars)) < density
+    b = rng.uniform(50.0, 100.0, size=n_constraints)
+    c = rng.uniform(1.0, 10.0, size=n_vars)
+    return c, A, b
+
+
+def run(n_constraints: int, n_vars: int, density: float, methods):
+    """Resolver el mismo problema con cada método y comparar"""
+    c, A, b = generate(n_constraints, n_vars, density)
+    solver = SimplexSolver()
+    print(f"problema de {n_constraints}x{n_vars}, densidad {density}")
+    print(f"{'método':<28}{'tiempo (s)':>12}{'iteraciones':>13}{'Z':>20}")
+    ipm = None
+    for method, crossover in methods:
+        start = time.perf_counter()
+        result = solver.solve(c, A, b, method=method, history='none', crossover=crossover)
+        elapsed = time.perf_counter() - start
+        label = method + (' + crossover' if crossover else '')
+        print(f"{label:<28}{elapsed:>12.3f}{result['iteration_count']:>13}"
+              f"{result.get('optimal_value', float('nan')):>20.8f}")
+        if method == 'interior_point' and ipm is None:
+            ipm = result['interior_point']
+
+    if ipm is not None:
+        print("\nhistoria del punto interior")
+        print(f"{'iter':>5}{'mu':>12}{'brecha':>12}{'res. primal':>13}{'res. dual':>12}")
+        for row in ipm['gap_history']:
+            print(f"{row['iteration']:>5}{row['mu']:>12.2e}{row['gap']:>12.2e}"
+                  f"{row['primal_residual']:>13.2e}{row['dual_residual']:>12.2e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del punto interior")
+    parser.add_argument('--constraints', type=int, default=1000)
+    parser.add_argument('--variables', type=int, default=1000)
+    parser.add_argument('--density', type=float, default=0.1)
+    parser.add_argument('--skip-tableau', action='store_true',
+                        help="No resolver con el tableau (lento en problemas grandes)")
+    args = parser.parse_args()
+    methods = [('interior_point', False), ('interior_point', True), ('revised', False)]
+    if not args.skip_tableau:
+        methods.append(('tableau', False))
+    run(args.constraints, args.variables, args.density, methods)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark de construcción de modelos: Model (con Model.dot, término a término
+con +=, con Model.quicksum y con arreglos) frente a formatear el modelo como texto y parsearlo con parse_problem, hasta
+tener el (c, A, b) que recibe SimplexSolver.solve.
+
+Uso:
+    python -m benchmarks.bench_model_builder [--variables N] [--constraints M] [--terms K]
+"""
+import argparse
+import time
+import numpy as np
+from model_builder import LinExpr, Model
+from simplex_solver import SimplexSolver
+
+
+def generate(n_vars: int, n_constraints: int, n_terms: int, seed: int = 0):
+    """Datos de un modelo aleatorio: costos, columnas y coeficientes de cada fila y RHS"""
+    rng = np.random.default_rng(seed)
+    c = np.round(rng.uniform(1.0, 10.0, size=n_vars), 3)
+    cols = np.array([rng.choice(n_vars, size=n_terms, replace=False) for _ in range(n_constraints)])
+    vals = np.round(rng.uniform(0.1, 10.0, size=(n_constraints, n_terms)), 3)
+    b = np.round(rng.uniform(10.0, 100.0, size=n_constraints), 3)
+    return c, cols, vals, b
+
+
+def build_text(c, cols, vals, b):
+    """Formatear el modelo como texto y parsearlo"""
+    objective = "Maximizar Z = " + " + ".join(f"{coef}x{j + 1}" for j, coef in enumerate(c))
+    restrictions = [" + ".join(f"{v}x{j + 1}" for j, v in zip(row_cols, row_vals)) + f" <= {rhs}"
+                    for row_cols, row_vals, rhs in zip(cols, vals, b)]
+    return SimplexSolver().parse_problem(objective, restrictions, sparse=True)
+
+
+def build_expressions(c, cols, vals, b):
+    """Model con variables y expresiones (Model.dot)"""
+    model = Model()
+    x = model.add_vars(len(c), obj=c)
+    for row_cols, row_vals, rhs in zip(cols, vals, b):
+        model.add_constraint(Model.dot([x[j] for j in row_cols], row_vals) <= rhs)
+    return model.arrays()
+
+
+def build_increments(c, cols, vals, b):
+    """Model acumulando cada fila término a término con +="""
+    model = Model()
+    x = model.add_vars(len(c), obj=c)
+    for row_cols, row_vals, rhs in zip(cols, vals, b):
+        expr = LinExpr()
+        for j, v in zip(row_cols, row_vals):
+            expr += v * x[j]
+        model.add_constraint(expr <= rhs)
+    return model.arrays()
+
+
+def build_quicksum(c, cols, vals, b):
+    """Model con Model.quicksum sobre los términos de cada fila"""
+    model = Model()
+    x = model.add_vars(len(c), obj=c)
+    for row_cols, row_vals, rhs in zip(cols, vals, b):
+        model.add_constraint(Model.quicksum(v * x[j] for j, v in zip(row_cols, row_vals)) <= rhs)
+    return model.arrays()
+
+
+def build_arrays(c, cols, vals, b):
+    """Model con add_constraint_arrays"""
+    model = Model()
+    model.add_vars(len(c), obj=c)
+    for row_cols, row_vals, rhs in zip(cols, vals, b):
+        model.add_constraint_arrays(row_cols, row_vals, '<=', rhs)
+    return model.arrays()
+
+
+def run(n_vars: int, n_constraints: int, n_terms: int):
+    """Medir cada forma de construir el mismo modelo y comprobar que coinciden"""
+    data = generate(n_vars, n_constraints, n_terms)
+    print(f"{n_vars} variables, {n_constraints} restricciones de {n_terms} términos")
+    print(f"{'construcción':<28}{'tiempo (s)':>12}{'aceleración':>13}")
+    reference = None
+    baseline = None
+    for label, build in (('texto + parse_problem', build_text),
+                         ('Model (Model.dot)', build_expressions),
+                         ('Model (+=)', build_increments),
+                         ('Model (quicksum)', build_quicksum),
+                         ('Model (arreglos)', build_arrays)):
+        start = time.perf_counter()
+        c, A, b = build(*data)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{label:<28}{elapsed:>12.3f}{baseline / elapsed:>12.1f}x")
+        if reference is None:
+            reference = (c, A.toarray(), b)
+        elif not (np.allclose(c, reference[0]) and np.allclose(A.toarray(), reference[1])
+                  and np.allclose(b, reference[2])):
+            raise AssertionError(f"{label}: el modelo no coincide con el parseado")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del constructor de modelos")
+    parser.add_argument('--variables', type=int, default=50_000)
+    parser.add_argument('--constraints', type=int, default=2_000)
+    parser.add_argument('--terms', type=int, default=20)
+    args = parser.parse_args()
+    run(args.variables, args.constraints, args.terms)
+
+
+if __name__ == "__main__":
+    main()
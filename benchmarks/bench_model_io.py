@@ -0,0 +1,76 @@
+"""
+Benchmark de lectura y escritura de modelos MPS y LP: tiempo, filas por segundo
+y memoria máxima de Python durante la lectura (tracemalloc) frente al tamaño del
+archivo.
+
+Uso:
+    python -m benchmarks.bench_model_io [--rows M] [--variables N] [--terms K] [--dir DIR]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+from model_io import LPModel, read_lp, read_mps, write_lp, write_mps
+from sparse_matrix import CSRMatrix
+
+
+def generate(n_rows: int, n_vars: int, n_terms: int, seed: int = 0) -> LPModel:
+    """Modelo aleatorio con filas <=, >= y con rango, y cotas superiores"""
+    rng = np.random.default_rng(seed)
+    rows = np.repeat(np.arange(n_rows), n_terms)
+    cols = rng.integers(0, n_vars, size=n_rows * n_terms)
+    A = CSRMatrix.from_triplets(rows, cols, rng.uniform(0.1, 10.0, size=len(rows)), (n_rows, n_vars))
+    upper = rng.uniform(50.0, 100.0, size=n_rows)
+    lower = np.where(rng.random(n_rows) < 0.2, upper / 2, -np.inf)
+    return LPModel(rng.uniform(1.0, 10.0, size=n_vars), A, lower, upper,
+                   upper=np.where(rng.random(n_vars) < 0.5, 20.0, np.inf), sense='max')
+
+
+def measure(action):
+    """Tiempo y memoria máxima de Python de una llamada (tracemalloc en una segunda pasada)"""
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    action()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run(n_rows: int, n_vars: int, n_terms: int, directory: str):
+    """Escribir el modelo en cada formato y volver a leerlo"""
+    model = generate(n_rows, n_vars, n_terms)
+    print(f"modelo de {n_rows}x{n_vars} con {model.A.nnz} no nulos")
+    print(f"{'formato':<12}{'MB':>8}{'escribir (s)':>14}{'leer (s)':>10}{'filas/s':>12}{'memoria (MB)':>14}")
+    formats = [('MPS libre', 'modelo.mps', write_mps, read_mps),
+               ('MPS fijo', 'modelo_fijo.mps', lambda m, p: write_mps(m, p, fixed=True),
+                lambda p: read_mps(p, fixed=True)),
+               ('LP', 'modelo.lp', write_lp, read_lp)]
+    for label, filename, write, read in formats:
+        path = os.path.join(directory, filename)
+        start = time.perf_counter()
+        write(model, path)
+        write_time = time.perf_counter() - start
+        read_time, peak = measure(lambda: read(path))
+        size = os.path.getsize(path) / 1e6
+        print(f"{label:<12}{size:>8.1f}{write_time:>14.2f}{read_time:>10.2f}"
+              f"{n_rows / read_time:>12,.0f}{peak / 1e6:>14.1f}")
+        os.remove(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de lectura y escritura de modelos")
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--variables', type=int, default=9999)
+    parser.add_argument('--terms', type=int, default=8)
+    parser.add_argument('--dir', default=None, help="Directorio de los archivos temporales")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        run(args.rows, args.variables, args.terms, directory)
+
+
+if __name__ == "__main__":
+    main()
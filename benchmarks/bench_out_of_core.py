@@ -0,0 +1,77 @@
+"""
+Benchmark del tableau fuera de memoria: resolver problemas densos con el
+tableau en RAM y en un archivo mapeado (out_of_core=True) con varios tamaños
+de bloque. Informa el tamaño del tableau, el pico de memoria asignada por
+numpy (tracemalloc), el tiempo, los pivoteos por segundo, el tráfico del
+tableau por pivoteo y la diferencia del valor óptimo.
+
+Uso:
+    python -m benchmarks.bench_out_of_core [--sizes M N ...] [--block-mb MB ...] [--scratch-dir DIR]
+"""
+import argparse
+import time
+import tracemalloc
+import numpy as np
+from simplex_solver import SimplexSolver
+
+
+def generate(n_constraints: int, n_vars: int, seed: int = 0):
+    """Problema denso aleatorio con b > 0"""
+    rng = np.random.default_rng(seed)
+    c = rng.uniform(1.0, 10.0, size=n_vars)
+    A = rng.uniform(0.1, 10.0, size=(n_constraints, n_vars))
+    b = rng.uniform(10.0, 100.0, size=n_constraints) * n_vars
+    return c, A, b
+
+
+def measure(solver: SimplexSolver, c, A, b, **options):
+    """Resolver midiendo el tiempo y el pico de memoria asignada durante solve"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = solver.solve(c, A, b, history='none', **options)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def run(sizes, block_mb, scratch_dir):
+    solver = SimplexSolver()
+    print(f"{'problema':>12}{'modo':>14}{'tableau (MB)':>14}{'pico RAM (MB)':>15}"
+          f"{'tiempo (s)':>12}{'pivoteos':>10}{'piv/s':>9}{'GB/s':>7}{'dif. valor':>12}")
+    for n_constraints, n_vars in sizes:
+        c, A, b = generate(n_constraints, n_vars)
+        tableau_bytes = (n_constraints + 1) * (n_vars + n_constraints + 1) * 8
+        reference, elapsed, peak = measure(solver, c, A, b)
+        rows = [('memoria', reference, elapsed, peak)]
+        for mb in block_mb:
+            block_rows = max(1, int(mb * (1 << 20)) // ((n_vars + n_constraints + 1) * 8))
+            result, elapsed, peak = measure(solver, c, A, b, out_of_core=True,
+                                            scratch_dir=scratch_dir, block_rows=block_rows)
+            rows.append((f'disco {mb:g} MB', result, elapsed, peak))
+        for mode, result, elapsed, peak in rows:
+            pivots = result['iteration_count']
+            # Cada pivoteo lee y escribe el tableau completo
+            traffic = 2 * tableau_bytes * pivots / elapsed / 1e9
+            error = abs(result['optimal_value'] - reference['optimal_value']) / max(abs(reference['optimal_value']), 1.0)
+            print(f"{f'{n_constraints}x{n_vars}':>12}{mode:>14}{tableau_bytes / 1e6:>14.1f}"
+                  f"{peak / 1e6:>15.1f}{elapsed:>12.2f}{pivots:>10}{pivots / elapsed:>9.0f}"
+                  f"{traffic:>7.2f}{error:>12.1e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del tableau fuera de memoria")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 500, 1000, 1000, 2000, 2000],
+                        help="Pares de filas y columnas")
+    parser.add_argument('--block-mb', type=float, nargs='+', default=[1, 16, 64],
+                        help="Tamaños de bloque (MB) a probar con out_of_core")
+    parser.add_argument('--scratch-dir', default=None,
+                        help="Directorio del archivo del tableau (por defecto el temporal del sistema)")
+    args = parser.parse_args()
+    if len(args.sizes) % 2:
+        parser.error("--sizes necesita pares de filas y columnas")
+    run(list(zip(args.sizes[::2], args.sizes[1::2])), args.block_mb, args.scratch_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark de la programación paramétrica: curva del valor óptimo en muchos
+puntos de un precio (c + t·d) o de una capacidad (b + t·g) calculada con
+parametric_sweep frente a una resolución por punto. Informa puntos de quiebre,
+pivoteos, tiempos y la diferencia máxima entre ambas curvas.
+
+Uso:
+    python -m benchmarks.bench_parametric [--sizes M N ...] [--points K]
+"""
+import argparse
+import time
+import numpy as np
+from simplex_solver import SimplexSolver
+
+
+def generate(n_constraints: int, n_vars: int, parameter: str, seed: int = 0):
+    """Problema denso aleatorio y una dirección que mantiene b + t·g >= 0 en [0, 1]"""
+    rng = np.random.default_rng(seed)
+    c = rng.uniform(1.0, 10.0, size=n_vars)
+    A = rng.uniform(0.1, 10.0, size=(n_constraints, n_vars))
+    b = rng.uniform(10.0, 100.0, size=n_constraints) * n_vars
+    if parameter == 'objective':
+        direction = rng.uniform(-1.0, 1.0, size=n_vars) * c
+    else:
+        direction = rng.uniform(-0.5, 0.5, size=n_constraints) * b
+    return c, A, b, direction
+
+
+def run(sizes, n_points: int):
+    solver = SimplexSolver()
+    print(f"{'problema':>12}{'parámetro':>11}{'quiebres':>10}{'piv barrido':>13}"
+          f"{'piv puntos':>12}{'barrido (ms)':>14}{'puntos (ms)':>13}{'aceleración':>13}"
+          f"{'dif. máx':>11}")
+    points = np.linspace(0.0, 1.0, n_points)
+    for n_constraints, n_vars in sizes:
+        for parameter in ('objective', 'rhs'):
+            c, A, b, direction = generate(n_constraints, n_vars, parameter)
+            start = time.perf_counter()
+            sweep = solver.parametric_sweep(c, A, b, direction, parameter=parameter,
+                                            t_range=(0.0, 1.0), points=points)
+            sweep_time = time.perf_counter() - start
+
+            # Una resolución desde cero por punto
+            start = time.perf_counter()
+            values = np.empty(n_points)
+            point_pivots = 0
+            for k, t in enumerate(points):
+                if parameter == 'objective':
+                    result = solver.solve(c + t * direction, A, b, history='none')
+                else:
+                    result = solver.solve(c, A, b + t * direction, history='none')
+                values[k] = result['optimal_value']
+                point_pivots += result['iteration_count']
+            point_time = time.perf_counter() - start
+
+            error = np.max(np.abs(sweep['curve']['values'] - values) / np.maximum(np.abs(values), 1.0))
+            print(f"{f'{n_constraints}x{n_vars}':>12}{parameter:>11}{len(sweep['breakpoints']):>10}"
+                  f"{sweep['pivots']:>13}{point_pivots:>12}{sweep_time * 1e3:>14.2f}"
+                  f"{point_time * 1e3:>13.2f}{point_time / sweep_time:>12.0f}x{error:>11.1e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la programación paramétrica")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 20, 50, 100, 100, 200],
+                        help="Pares de filas y columnas")
+    parser.add_argument('--points', type=int, default=1000,
+                        help="Puntos de la curva")
+    args = parser.parse_args()
+    if len(args.sizes) % 2:
+        parser.error("--sizes necesita pares de filas y columnas")
+    run(list(zip(args.sizes[::2], args.sizes[1::2])), args.points)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark del parser de texto: filas por segundo y MB/s de parse_problem con el
+tokenizador de una sola pasada, frente al parser anterior (split por operador y
+re.findall con una lista densa por expresión).
+
+Uso:
+    python -m benchmarks.bench_parser [--rows M] [--variables N] [--terms K] [--skip-legacy]
+"""
+import argparse
+import re
+import time
+import numpy as np
+from simplex_solver import SimplexSolver
+
+
+def generate(n_rows: int, n_vars: int, n_terms: int, seed: int = 0):
+    """Modelo aleatorio en texto con coeficientes decimales y en notación científica"""
+    rng = np.random.default_rng(seed)
+    objective = "Maximizar Z = " + " + ".join(
+        f"{rng.uniform(1.0, 10.0):.3f}x{j + 1}" for j in range(n_vars))
+    restrictions = []
+    for _ in range(n_rows):
+        columns = rng.choice(n_vars, size=n_terms, replace=False) + 1
+        terms = [f"{coef:.4g}x{j}" for coef, j in zip(rng.uniform(0.01, 100.0, n_terms), columns)]
+        restrictions.append(" + ".join(terms) + f" <= {rng.uniform(1e2, 1e4):.6e}")
+    restrictions.append(", ".join(f"x{j + 1}" for j in range(min(n_vars, 10))) + " >= 0")
+    return objective, restrictions
+
+
+def legacy_expression(expr: str):
+    """Coeficientes de una expresión como lista densa (implementación anterior)"""
+    expr = expr.replace(' ', '').lower()
+    matches = re.findall(r'([+-]?\d+\.?\d*)?x(\d+)', expr)
+    if not matches:
+        return []
+    coeffs = [0.0] * max(int(m[1]) for m in matches)
+    for coef_str, var_num in matches:
+        coeffs[int(var_num) - 1] = 1.0 if coef_str in ('', '+') else (
+            -1.0 if coef_str == '-' else float(coef_str))
+    return coeffs
+
+
+def legacy_parse(objective: str, restrictions):
+    """Parser anterior: split por operador y dos listas densas por restricción"""
+    c = legacy_expression(re.search(r'Z\s*=\s*(.+)', objective, re.IGNORECASE).group(1))
+    n_vars = len(c)
+    A, b = [], []
+    for restriction in restrictions:
+        restriction = restriction.strip()
+        if '>= 0' in restriction or '≥ 0' in restriction:
+            continue
+        for op in ['<=', '>=', '=', '≤', '≥']:
+            if op in restriction:
+                left, right = restriction.split(op)
+                coeffs = legacy_expression(left)
+                legacy_expression(right)
+                coeffs = (coeffs + [0.0] * n_vars)[:n_vars]
+                A.append(coeffs)
+                b.append(float(right))
+                break
+    return np.array(c), np.array(A), np.array(b)
+
+
+def run(n_rows: int, n_vars: int, n_terms: int, skip_legacy: bool):
+    """Medir el tiempo de parseo del mismo modelo con cada parser"""
+    objective, restrictions = generate(n_rows, n_vars, n_terms)
+    megabytes = sum(len(r) + 1 for r in restrictions) / 1e6
+    solver = SimplexSolver()
+    print(f"{n_rows} filas, {n_vars} variables, {n_terms} términos por fila ({megabytes:.1f} MB)")
+    print(f"{'parser':<24}{'tiempo (s)':>12}{'filas/s':>14}{'MB/s':>10}")
+
+    parsers = [('tokenizador (CSR)', lambda: solver.parse_problem(objective, restrictions, sparse=True)),
+               ('tokenizador (denso)', lambda: solver.parse_problem(objective, restrictions))]
+    if not skip_legacy:
+        parsers.append(('anterior', lambda: legacy_parse(objective, restrictions)))
+    for label, parse in parsers:
+        start = time.perf_counter()
+        parse()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<24}{elapsed:>12.3f}{n_rows / elapsed:>14,.0f}{megabytes / elapsed:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del parser de texto")
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--variables', type=int, default=2000)
+    parser.add_argument('--terms', type=int, default=8)
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help="No medir el parser anterior (lento con índices grandes)")
+    args = parser.parse_args()
+    run(args.rows, args.variables, args.terms, args.skip_legacy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Micro-benchmark del pivoteo: bucle por filas original vs PivotKernel.
+
+Uso:
+    python -m benchmarks.bench_pivot [--repeats N]
+"""
+import argparse
+import time
+import numpy as np
+from pivot_kernel import PivotKernel
+
+SIZES = [(10, 10), (100, 200), (500, 1000), (1000, 2000), (2000, 4000)]
+
+
+def legacy_pivot(tableau: np.ndarray, pivot_col: int) -> int:
+    """Prueba del cociente y eliminación fila por fila (implementación anterior)"""
+    n_constraints = tableau.shape[0] - 1
+    ratios = []
+    for i in range(n_constraints):
+        if tableau[i, pivot_col] > 1e-10:
+            ratios.append((tableau[i, -1] / tableau[i, pivot_col], i))
+        else:
+            ratios.append((float('inf'), i))
+
+    min_ratio = float('inf')
+    pivot_row = -1
+    for ratio, idx in ratios:
+        if 0 <= ratio < min_ratio:
+            min_ratio = ratio
+            pivot_row = idx
+
+    tableau[pivot_row, :] /= tableau[pivot_row, pivot_col]
+    for i in range(n_constraints + 1):
+        if i != pivot_row:
+            factor = tableau[i, pivot_col]
+            tableau[i, :] -= factor * tableau[pivot_row, :]
+    return pivot_row
+
+
+def kernel_pivot(kernel: PivotKernel, tableau: np.ndarray, pivot_col: int) -> int:
+    """Prueba del cociente y pivoteo con PivotKernel"""
+    pivot_row = kernel.ratio_test(tableau, pivot_col)
+    kernel.pivot(tableau, pivot_row, pivot_col)
+    return pivot_row
+
+
+def random_tableau(rows: int, cols: int, rng: np.random.Generator) -> np.ndarray:
+    """Tableau aleatorio con columna RHS positiva y fila Z"""
+    tableau = rng.uniform(0.1, 10.0, size=(rows + 1, cols + 1))
+    tableau[-1, :-1] = -rng.uniform(1.0, 10.0, size=cols)
+    return tableau
+
+
+def time_per_pivot(pivot_fn, tableau: np.ndarray, repeats: int) -> float:
+    """Tiempo medio por pivoteo (segundos) sobre columnas distintas"""
+    n_cols = tableau.shape[1] - 1
+    start = time.perf_counter()
+    for k in range(repeats):
+        pivot_fn(tableau, k % n_cols)
+    return (time.perf_counter() - start) / repeats
+
+
+def run(repeats: int = 5, seed: int = 0):
+    """Ejecutar el benchmark e imprimir la tabla de resultados"""
+    rng = np.random.default_rng(seed)
+    print(f"{'tamaño':>12} {'anterior (ms)':>14} {'kernel (ms)':>12} {'aceleración':>12}")
+    for rows, cols in SIZES:
+        base = random_tableau(rows, cols, rng)
+
+        tableau = base.copy()
+        legacy = time_per_pivot(legacy_pivot, tableau, repeats)
+
+        tableau = base.copy()
+        kernel = PivotKernel(tableau.shape)
+        fast = time_per_pivot(lambda t, q: kernel_pivot(kernel, t, q), tableau, repeats)
+
+        print(f"{rows:>5}x{cols:<6} {legacy * 1e3:>14.3f} {fast * 1e3:>12.3f} {legacy / fast:>11.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmark del pivoteo del tableau")
+    parser.add_argument('--repeats', type=int, default=5, help="Pivoteos por tamaño")
+    args = parser.parse_args()
+    run(args.repeats)
+
+
+if __name__ == "__main__":
+    main()
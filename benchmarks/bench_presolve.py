@@ -0,0 +1,77 @@
+"""
+Benchmark del presolve: tamaño del problema y tiempo con y sin reducción.
+
+Los problemas generados imitan lo que suele extraer parse_problem: restricciones
+con filas duplicadas, cotas escritas como filas (1x1 <= 4), columnas vacías y
+filas forzantes.
+
+Uso:
+    python -m benchmarks.bench_presolve [--constraints M] [--variables N] [--method revised]
+"""
+import argparse
+import time
+import numpy as np
+from simplex_solver import SimplexSolver
+
+
+def generate(n_constraints: int, n_vars: int, seed: int = 0):
+    """Problema aleatorio acotado con estructura redundante"""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(1.0, 10.0, size=(n_constraints, n_vars))
+    A *= rng.random((n_constraints, n_vars)) < 0.3
+    b = rng.uniform(50.0, 100.0, size=n_constraints)
+    c = rng.uniform(-2.0, 10.0, size=n_vars)
+
+    # Filas duplicadas (múltiplos positivos con lado derecho más holgado)
+    dup = rng.integers(0, n_constraints, size=n_constraints // 3)
+    factor = rng.uniform(0.5, 2.0, size=(len(dup), 1))
+    # Una cota por variable, escrita como fila
+    bounds = np.eye(n_vars) * rng.uniform(1.0, 4.0, size=n_vars)
+    # Filas forzantes sobre algunas variables
+    forcing = np.zeros((3, n_vars))
+    forcing[np.arange(3), rng.integers(0, n_vars, 3)] = 1.0
+    forcing[:, rng.integers(0, n_vars, 3)] = 2.0
+
+    A = np.vstack([A, A[dup] * factor, bounds, forcing])
+    b = np.concatenate([b, b[dup] * factor[:, 0] * 1.5, rng.uniform(5.0, 20.0, n_vars), np.zeros(3)])
+    # Columnas vacías (sin aporte al objetivo)
+    empty = rng.integers(0, n_vars, n_vars // 20)
+    A[:, empty] = 0.0
+    c[empty] = -1.0
+    return c, A, b
+
+
+def run(n_constraints: int, n_vars: int, method: str):
+    """Resolver el mismo problema con y sin presolve y comparar"""
+    c, A, b = generate(n_constraints, n_vars)
+    solver = SimplexSolver()
+
+    start = time.perf_counter()
+    plain = solver.solve(c, A, b, method=method, history='none')
+    plain_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reduced = solver.solve(c, A, b, method=method, history='none', presolve=True)
+    presolve_time = time.perf_counter() - start
+
+    info = reduced['presolve']
+    print(f"filas: {info['rows'][0]} -> {info['rows'][1]}, columnas: {info['columns'][0]} -> "
+          f"{info['columns'][1]}, no nulos: {info['nonzeros'][0]} -> {info['nonzeros'][1]}, "
+          f"cotas: {info['bounds']}")
+    print(f"sin presolve: {plain_time:.3f} s, {plain['iteration_count']} iteraciones, Z = {plain['optimal_value']:.6f}")
+    print(f"con presolve: {presolve_time:.3f} s ({info['time']:.3f} s de presolve), "
+          f"{reduced['iteration_count']} iteraciones, Z = {reduced['optimal_value']:.6f}")
+    print(f"aceleración: {plain_time / presolve_time:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del presolve")
+    parser.add_argument('--constraints', type=int, default=200)
+    parser.add_argument('--variables', type=int, default=300)
+    parser.add_argument('--method', choices=['tableau', 'revised'], default='tableau')
+    args = parser.parse_args()
+    run(args.constraints, args.variables, args.method)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmark de las reglas de precios: iteraciones y tiempo por regla.
+
+Uso:
+    python -m benchmarks.bench_pricing [--constraints M] [--variables N] [--method revised]
+"""
+import argparse
+import numpy as np
+from simplex_solver import SimplexSolver
+from pricing import PRICING_RULES
+
+
+def run(n_constraints: int, n_vars: int, method: str, density: float = 0.3, seed: int = 0):
+    """Resolver el mismo problema con cada regla y comparar iteraciones y tiempos"""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(0.0, 10.0, size=(n_constraints, n_vars))
+    A *= rng.random((n_constraints, n_vars)) < density
+    b = rng.uniform(1.0, 50.0, size=n_constraints)
+    c = rng.uniform(0.0, 10.0, size=n_vars)
+    solver = SimplexSolver()
+
+    print(f"problema: {n_constraints}x{n_vars}, densidad {density:.0%}, método {method}")
+    print(f"{'regla':<15}{'estado':<12}{'iteraciones':>12}{'tiempo (s)':>12}{'precios (s)':>13}{'Z':>14}")
+    for rule in PRICING_RULES:
+        result = solver.solve(c, A, b, method=method, history='none', pricing=rule)
+        stats = result['pricing']
+        value = result.get('optimal_value', float('nan'))
+        print(f"{rule:<15}{result['status']:<12}{stats['iterations']:>12}"
+              f"{stats['solve_time']:>12.3f}{stats['pricing_time']:>13.3f}{value:>14.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de las reglas de precios")
+    parser.add_argument('--constraints', type=int, default=300)
+    parser.add_argument('--variables', type=int, default=400)
+    parser.add_argument('--method', choices=['tableau', 'revised'], default='revised')
+    args = parser.parse_args()
+    run(args.constraints, args.variables, args.method)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark del Simplex revisado frente al tableau: tiempo por iteración y pico
+de memoria asignada por numpy durante solve (tracemalloc) en problemas densos
+y dispersos (CSRMatrix). Informa también el tamaño del núcleo de la base
+(columnas estructurales básicas), que fija la memoria de la factorización.
+
+Uso:
+    python -m benchmarks.bench_revised [--sizes M N ...] [--density D] [--seed S]
+"""
+import argparse
+import time
+import tracemalloc
+import numpy as np
+from simplex_solver import SimplexSolver
+from sparse_matrix import CSRMatrix
+
+
+def generate(n_constraints: int, n_vars: int, density: float, seed: int = 0):
+    """Problema aleatorio acotado con la densidad indicada y b > 0"""
+    rng = np.random.default_rng(seed)
+    c = rng.uniform(1.0, 10.0, size=n_vars)
+    A = rng.uniform(0.1, 10.0, size=(n_constraints, n_vars))
+    if density < 1.0:
+        A[rng.random(A.shape) >= density] = 0.0
+        # Al menos un coeficiente por columna: sin él la variable no está acotada
+        A[rng.integers(0, n_constraints, size=n_vars), np.arange(n_vars)] = rng.uniform(0.1, 10.0, size=n_vars)
+    b = rng.uniform(10.0, 100.0, size=n_constraints) * max(1.0, density * n_vars)
+    return c, A, b
+
+
+def measure(solver: SimplexSolver, c, A, b, method: str):
+    """Resolver midiendo el tiempo y el pico de memoria asignada durante solve"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = solver.solve(c, A, b, method=method, history='none')
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def run(sizes, density: float, seed: int):
+    solver = SimplexSolver()
+    print(f"{'problema':>12}{'A':>7}{'método':>9}{'pivoteos':>10}{'tiempo (s)':>12}"
+          f"{'ms/iter':>9}{'pico RAM (MB)':>15}{'núcleo':>8}{'dif. valor':>12}")
+    for n_constraints, n_vars in sizes:
+        c, A, b = generate(n_constraints, n_vars, density, seed)
+        runs = [('densa', A)]
+        if density < 1.0:
+            runs.append(('CSR', CSRMatrix.from_dense(A)))
+        reference = None
+        for storage, matrix in runs:
+            for method in ('tableau', 'revised'):
+                result, elapsed, peak = measure(solver, c, matrix, b, method)
+                if reference is None:
+                    reference = result['optimal_value']
+                pivots = result['iteration_count']
+                # Columnas estructurales en la base final: el núcleo k x k de la factorización
+                kernel = int(np.sum(np.asarray(result['basic_vars']) < n_vars))
+                error = abs(result['optimal_value'] - reference) / max(abs(reference), 1.0)
+                print(f"{f'{n_constraints}x{n_vars}':>12}{storage:>7}{method:>9}{pivots:>10}"
+                      f"{elapsed:>12.2f}{elapsed / max(pivots, 1) * 1e3:>9.2f}"
+                      f"{peak / 1e6:>15.1f}{kernel:>8}{error:>12.1e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del Simplex revisado frente al tableau")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[200, 200, 500, 500, 1000, 1000],
+                        help="Pares de filas y columnas")
+    parser.add_argument('--density', type=float, default=1.0,
+                        help="Fracción de coeficientes no nulos (< 1 también prueba CSRMatrix)")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="Semilla de los problemas")
+    args = parser.parse_args()
+    if len(args.sizes) % 2:
+        parser.error("--sizes necesita pares de filas y columnas")
+    run(list(zip(args.sizes[::2], args.sizes[1::2])), args.density, args.seed)
+
+
+if __name__ == "__main__":
+    main()
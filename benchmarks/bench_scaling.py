@@ -0,0 +1,68 @@
+"""
+Benchmark del escalado: iteraciones y precisión con y sin escalado en problemas
+con coeficientes entre 1e-3 y 1e6.
+
+La precisión se mide con la infactibilidad primal max(Ax - b)+ / max|b|, la
+infactibilidad dual max(c - A^T y)+ / max|c| y la brecha |b^T y - c^T x| / |c^T x|.
+
+Uso:
+    python -m benchmarks.bench_scaling [--problems K] [--constraints M] [--variables N]
+"""
+import argparse
+import numpy as np
+from simplex_solver import SimplexSolver
+
+
+def generate(n_constraints: int, n_vars: int, seed: int):
+    """Problema aleatorio con filas y columnas de magnitudes muy distintas"""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(0.5, 2.0, size=(n_constraints, n_vars))
+    A *= rng.random((n_constraints, n_vars)) < 0.5
+    A *= 10.0 ** rng.uniform(-3.0, 3.0, size=(n_constraints, 1))
+    A *= 10.0 ** rng.uniform(0.0, 3.0, size=(1, n_vars))
+    b = rng.uniform(1.0, 10.0, size=n_constraints) * 10.0 ** rng.uniform(-1.0, 4.0, size=n_constraints)
+    c = rng.uniform(0.1, 5.0, size=n_vars) * 10.0 ** rng.uniform(-2.0, 3.0, size=n_vars)
+    return c, A, b
+
+
+def errors(c, A, b, result):
+    """Infactibilidad primal, dual y brecha relativas"""
+    x, y = result['solution'], result['duals']
+    primal = max(float(np.max(A @ x - b)), 0.0) / np.max(np.abs(b))
+    dual = max(float(np.max(c - A.T @ y)), 0.0) / np.max(np.abs(c))
+    gap = abs(b @ y - c @ x) / max(abs(c @ x), 1.0)
+    return max(primal, 0.0), dual, gap
+
+
+def run(n_problems: int, n_constraints: int, n_vars: int):
+    """Resolver el mismo lote con cada combinación de método y escalado"""
+    problems = [generate(n_constraints, n_vars, seed) for seed in range(n_problems)]
+    solver = SimplexSolver()
+    print(f"{n_problems} problemas de {n_constraints}x{n_vars}")
+    print(f"{'método':<9}{'escalado':<15}{'óptimos':>8}{'iteraciones':>13}"
+          f"{'infact. primal':>16}{'infact. dual':>14}{'brecha':>10}")
+    for method in ('tableau', 'revised'):
+        for scaling in (None, 'geometric', 'equilibration'):
+            iterations, worst = [], np.zeros(3)
+            optimal = 0
+            for c, A, b in problems:
+                result = solver.solve(c, A, b, method=method, history='none', scaling=scaling)
+                iterations.append(result['iteration_count'])
+                if result['status'] == 'optimal':
+                    optimal += 1
+                    worst = np.maximum(worst, errors(c, A, b, result))
+            print(f"{method:<9}{str(scaling):<15}{optimal:>8}{np.mean(iterations):>13.1f}"
+                  f"{worst[0]:>16.1e}{worst[1]:>14.1e}{worst[2]:>10.1e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del escalado")
+    parser.add_argument('--problems', type=int, default=20)
+    parser.add_argument('--constraints', type=int, default=60)
+    parser.add_argument('--variables', type=int, default=80)
+    args = parser.parse_args()
+    run(args.problems, args.constraints, args.variables)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark del análisis de sensibilidad: costo de agregar 'sensitivity' a una
+resolución frente a contestar "¿sigue siendo óptima la base si el precio de cada
+variable sube un 10 %?" volviendo a resolver una vez por variable. Comprueba
+que las respuestas coinciden.
+
+Uso:
+    python -m benchmarks.bench_sensitivity [--sizes M N ...] [--change 0.1]
+"""
+import argparse
+import time
+import numpy as np
+from simplex_solver import SimplexSolver
+
+
+def generate(n_constraints: int, n_vars: int, seed: int = 0):
+    """Problema denso aleatorio con b > 0"""
+    rng = np.random.default_rng(seed)
+    c = rng.uniform(1.0, 10.0, size=n_vars)
+    A = rng.uniform(0.1, 10.0, size=(n_constraints, n_vars))
+    b = rng.uniform(10.0, 100.0, size=n_constraints) * n_vars
+    return c, A, b
+
+
+def run(sizes, change: float):
+    solver = SimplexSolver()
+    print(f"{'problema':>12}{'resolver (ms)':>15}{'sensibilidad (ms)':>19}"
+          f"{'re-resolver (ms)':>18}{'aceleración':>13}{'coinciden':>11}")
+    for n_constraints, n_vars in sizes:
+        c, A, b = generate(n_constraints, n_vars)
+        start = time.perf_counter()
+        solver.solve(c, A, b, history='none')
+        plain = time.perf_counter() - start
+        start = time.perf_counter()
+        result = solver.solve(c, A, b, history='none', sensitivity=True)
+        with_report = time.perf_counter() - start
+        ranges = result['sensitivity']['objective_ranges']
+        predicted = ranges[:, 1] >= c * (1.0 + change)
+
+        # Una resolución por pregunta: la base sigue si la solución no cambia
+        start = time.perf_counter()
+        observed = np.empty(n_vars, dtype=bool)
+        for j in range(n_vars):
+            c_new = c.copy()
+            c_new[j] *= 1.0 + change
+            other = solver.solve(c_new, A, b, history='none')
+            observed[j] = np.allclose(other['solution'], result['solution'], atol=1e-7)
+        resolves = time.perf_counter() - start
+
+        overhead = max(with_report - plain, 0.0)
+        print(f"{f'{n_constraints}x{n_vars}':>12}{plain * 1e3:>15.2f}{overhead * 1e3:>19.2f}"
+              f"{resolves * 1e3:>18.2f}{resolves / with_report:>12.0f}x"
+              f"{'sí' if np.array_equal(predicted, observed) else 'no':>11}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del análisis de sensibilidad")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 20, 50, 100, 100, 200, 200, 400],
+                        help="Pares de filas y columnas")
+    parser.add_argument('--change', type=float, default=0.1,
+                        help="Aumento relativo de cada precio que se pregunta")
+    args = parser.parse_args()
+    if len(args.sizes) % 2:
+        parser.error("--sizes necesita pares de filas y columnas")
+    run(list(zip(args.sizes[::2], args.sizes[1::2])), args.change)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark de solve_many frente a llamar a solve en un bucle de Python.
+
+Uso:
+    python -m benchmarks.bench_solve_many [--problems K] [--constraints M] [--variables N]
+"""
+import argparse
+import time
+import numpy as np
+from simplex_solver import SimplexSolver
+
+
+def run(n_problems: int, n_constraints: int, n_vars: int, seed: int = 0):
+    """Resolver el mismo lote con ambos caminos y comparar tiempos y resultados"""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(0.0, 10.0, size=(n_constraints, n_vars))
+    B = rng.uniform(10.0, 100.0, size=(n_problems, n_constraints))
+    C = rng.uniform(1.0, 10.0, size=(n_problems, n_vars))
+    solver = SimplexSolver()
+
+    start = time.perf_counter()
+    batch = solver.solve_many(C, A, B)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    values = [solver.solve(C[i], A, B[i], history='none')['optimal_value'] for i in range(n_problems)]
+    loop_time = time.perf_counter() - start
+
+    max_diff = float(np.max(np.abs(batch['optimal_value'] - np.array(values))))
+    print(f"problemas: {n_problems} ({n_constraints}x{n_vars})")
+    print(f"bucle solve:  {loop_time:.3f} s ({n_problems / loop_time:,.0f} problemas/s)")
+    print(f"solve_many:   {batch_time:.3f} s ({n_problems / batch_time:,.0f} problemas/s)")
+    print(f"aceleración:  {loop_time / batch_time:.1f}x, diferencia máxima: {max_diff:.2e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de SimplexSolver.solve_many")
+    parser.add_argument('--problems', type=int, default=5000)
+    parser.add_argument('--constraints', type=int, default=8)
+    parser.add_argument('--variables', type=int, default=5)
+    args = parser.parse_args()
+    run(args.problems, args.constraints, args.variables)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Suite de benchmarks sobre familias clásicas y sintéticas (ver lp_families.py):
+cubos de Klee-Minty, problemas densos aleatorios, transporte y asignación
+dispersos, instancias degeneradas y planificación de varias plantas (angular
+por bloques).
+
+Para cada instancia y método mide el tiempo (el mejor de --repeat), las
+iteraciones y la memoria máxima de Python (tracemalloc, en una pasada aparte), y
+comprueba el valor óptimo contra el conocido o, si SciPy está instalado, contra
+scipy.optimize.linprog. El informe se escribe en JSON; con --baseline se compara
+con un informe anterior y el programa termina con código 1 si hay regresiones
+(tiempo por encima de la tolerancia, más iteraciones o un estado distinto).
+
+Uso:
+    python -m benchmarks.bench_suite [--scale small|medium|large] [--families F ...]
+                                     [--methods M ...] [--output informe.json]
+                                     [--baseline base.json] [--tolerance 0.25]
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, List, Optional
+import numpy as np
+from simplex_solver import SimplexSolver
+from sparse_matrix import is_sparse
+from benchmarks.lp_families import FAMILIES, LPInstance, instances
+
+try:
+    from scipy.optimize import linprog
+except ImportError:
+    linprog = None
+
+# Error relativo admitido al comparar el valor óptimo con la referencia
+OBJECTIVE_TOLERANCE = 1e-6
+# Por debajo de este tiempo (s) las diferencias se consideran ruido
+MIN_COMPARABLE_TIME = 0.005
+
+
+def reference_objective(instance: LPInstance) -> Optional[float]:
+    """Valor óptimo conocido o, si SciPy está disponible, el de linprog"""
+    if instance.optimum is not None:
+        return instance.optimum
+    if linprog is None:
+        return None
+    A = instance.A.toarray() if is_sparse(instance.A) else instance.A
+    result = linprog(-instance.c, A_ub=A, b_ub=instance.b, bounds=(0, None), method='highs')
+    return float(-result.fun) if result.status == 0 else None
+
+
+def measure(solver: SimplexSolver, instance: LPInstance, method: str, repeat: int,
+            memory: bool) -> Dict:
+    """Resolver la instancia repeat veces (y una más con tracemalloc si memory)"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = solver.solve(instance.c, instance.A, instance.b, method=method, history='none',
+                              max_iterations=instance.max_iterations)
+        best = min(best, time.perf_counter() - start)
+    peak = None
+    if memory:
+        tracemalloc.start()
+        solver.solve(instance.c, instance.A, instance.b, method=method, history='none',
+                     max_iterations=instance.max_iterations)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {
+        'status': result['status'],
+        'objective': result.get('optimal_value'),
+        'time': best,
+        'iterations': result.get('iteration_count', 0),
+        'degenerate_pivots': result['degeneracy']['degenerate_pivots'],
+        'peak_memory': peak
+    }
+
+
+def run(families: List[str], scale: str, methods: List[str], repeat: int,
+        memory: bool = True) -> Dict:
+    """
+    Ejecutar la suite
+
+    Returns:
+        Informe con el entorno y una entrada por instancia y método
+    """
+    solver = SimplexSolver()
+    results = []
+    for instance in instances(families, scale):
+        reference = reference_objective(instance)
+        for method in methods:
+            entry = {'family': instance.family, 'instance': instance.name,
+                     'shape': list(instance.shape), 'method': method}
+            entry.update(measure(solver, instance, method, repeat, memory))
+            entry['reference_objective'] = reference
+            entry['check'] = None
+            if reference is not None and entry['status'] == 'optimal':
+                error = abs(entry['objective'] - reference) / max(1.0, abs(reference))
+                entry['check'] = 'ok' if error <= OBJECTIVE_TOLERANCE else 'mismatch'
+            results.append(entry)
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': {'python': platform.python_version(), 'numpy': np.__version__,
+                        'platform': platform.platform(), 'scipy': linprog is not None},
+        'scale': scale,
+        'repeat': repeat,
+        'results': results
+    }
+
+
+def compare(report: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Comparar un informe con el de referencia
+
+    Args:
+        report: Informe actual
+        baseline: Informe de referencia
+        tolerance: Aumento relativo de tiempo admitido (0.25 = 25 %)
+
+    Returns:
+        Descripción de cada regresión encontrada
+    """
+    previous = {(entry['instance'], entry['method']): entry for entry in baseline['results']}
+    regressions = []
+    for entry in report['results']:
+        key = (entry['instance'], entry['method'])
+        old = previous.get(key)
+        entry['baseline_time'] = old['time'] if old else None
+        if old is None:
+            continue
+        label = f"{entry['instance']} ({entry['method']})"
+        if entry['status'] != old['status']:
+            regressions.append(f"{label}: estado {old['status']} -> {entry['status']}")
+        if entry['iterations'] > old['iterations']:
+            regressions.append(f"{label}: iteraciones {old['iterations']} -> {entry['iterations']}")
+        if (max(entry['time'], old['time']) >= MIN_COMPARABLE_TIME
+                and entry['time'] > old['time'] * (1.0 + tolerance)):
+            regressions.append(f"{label}: tiempo {old['time']:.4f} s -> {entry['time']:.4f} s "
+                               f"({entry['time'] / old['time'] - 1:+.0%})")
+    return regressions
+
+
+def print_report(report: Dict):
+    """Tabla legible del informe"""
+    print(f"{'instancia':<26}{'método':<16}{'estado':<17}{'tiempo (s)':>11}{'iter':>7}"
+          f"{'memoria (MB)':>14}{'base (s)':>10}  verificación")
+    for entry in report['results']:
+        memory = '-' if entry['peak_memory'] is None else f"{entry['peak_memory'] / 1e6:.2f}"
+        baseline = entry.get('baseline_time')
+        baseline = '-' if baseline is None else f"{baseline:.4f}"
+        print(f"{entry['instance']:<26}{entry['method']:<16}{entry['status']:<17}"
+              f"{entry['time']:>11.4f}{entry['iterations']:>7}{memory:>14}{baseline:>10}"
+              f"  {entry['check'] or 'sin referencia'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de familias de PL")
+    parser.add_argument('--families', nargs='+', choices=sorted(FAMILIES), default=sorted(FAMILIES))
+    parser.add_argument('--scale', choices=['small', 'medium', 'large'], default='small')
+    parser.add_argument('--methods', nargs='+', choices=['tableau', 'revised', 'interior_point'],
+                        default=['tableau', 'revised'])
+    parser.add_argument('--repeat', type=int, default=3, help="Repeticiones por medición (el mejor tiempo)")
+    parser.add_argument('--no-memory', action='store_true', help="No medir la memoria con tracemalloc")
+    parser.add_argument('--output', default=None, help="Archivo JSON del informe")
+    parser.add_argument('--baseline', default=None, help="Informe JSON de referencia")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Aumento de tiempo admitido frente a la referencia")
+    args = parser.parse_args()
+
+    report = run(args.families, args.scale, args.methods, args.repeat, memory=not args.no_memory)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        report['regressions'] = regressions
+    print_report(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    mismatches = [entry for entry in report['results'] if entry['check'] == 'mismatch']
+    for entry in mismatches:
+        print(f"valor óptimo distinto de la referencia: {entry['instance']} ({entry['method']}): "
+              f"{entry['objective']} != {entry['reference_objective']}", file=sys.stderr)
+    for regression in regressions:
+        print(f"regresión: {regression}", file=sys.stderr)
+    if regressions or mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
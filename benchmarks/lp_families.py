@@ -0,0 +1,189 @@
+"""
+Familias de problemas de prueba para los benchmarks, todas en la forma que
+resuelve SimplexSolver: max c^T x, Ax <= b (b >= 0), x >= 0.
+
+Cada generador devuelve un LPInstance con el valor óptimo conocido cuando se
+puede calcular de forma analítica (Klee-Minty, Beale, asignación con pesos
+separables); si no, 'optimum' es None y el benchmark compara con SciPy.
+"""
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from sparse_matrix import CSRMatrix
+
+
+class LPInstance:
+    """
+    Problema de prueba con su familia, su valor óptimo (si se conoce) y el límite
+    de pivoteos con que debe resolverse (None: el del solver)
+    """
+
+    def __init__(self, family: str, name: str, c: np.ndarray, A, b: np.ndarray,
+                 optimum: Optional[float] = None, max_iterations: Optional[int] = None):
+        self.family = family
+        self.name = name
+        self.c = c
+        self.A = A
+        self.b = b
+        self.optimum = optimum
+        self.max_iterations = max_iterations
+
+    @property
+    def shape(self):
+        return self.A.shape
+
+
+def klee_minty(n: int) -> LPInstance:
+    """
+    Cubo de Klee-Minty (versión de Chvátal): con la regla de Dantzig el Simplex
+    visita los 2^n vértices
+
+    max sum 10^(n-j) x_j  s.a.  2 sum_{j<i} 10^(i-j) x_j + x_i <= 100^(i-1)
+    """
+    A = np.zeros((n, n))
+    for i in range(n):
+        A[i, :i] = 2.0 * 10.0 ** (i - np.arange(i))
+        A[i, i] = 1.0
+    c = 10.0 ** (n - 1 - np.arange(n))
+    b = 100.0 ** np.arange(n)
+    return LPInstance('klee_minty', f'klee_minty_{n}', c, A, b, optimum=100.0 ** (n - 1),
+                      max_iterations=2 ** n)
+
+
+def random_dense(n_constraints: int, n_vars: int, seed: int = 0) -> LPInstance:
+    """Problema denso aleatorio con coeficientes positivos (acotado y factible)"""
+    rng = np.random.default_rng(seed)
+    return LPInstance('random_dense', f'random_dense_{n_constraints}x{n_vars}',
+                      rng.uniform(1.0, 10.0, size=n_vars),
+                      rng.uniform(0.1, 10.0, size=(n_constraints, n_vars)),
+                      rng.uniform(10.0, 100.0, size=n_constraints))
+
+
+def _bipartite(family: str, name: str, profit: np.ndarray, supply: np.ndarray,
+               demand: np.ndarray, optimum: Optional[float] = None) -> LPInstance:
+    """Flujo en un grafo bipartito completo: una fila por origen y una por destino"""
+    n_sources, n_sinks = profit.shape
+    arcs = np.arange(n_sources * n_sinks)
+    rows = np.concatenate([arcs // n_sinks, n_sources + arcs % n_sinks])
+    cols = np.concatenate([arcs, arcs])
+    A = CSRMatrix.from_triplets(rows, cols, np.ones(len(rows)),
+                                (n_sources + n_sinks, n_sources * n_sinks))
+    return LPInstance(family, name, profit.ravel(), A,
+                      np.concatenate([supply, demand]).astype(float), optimum)
+
+
+def transportation(n_sources: int, n_sinks: int, seed: int = 0) -> LPInstance:
+    """
+    Transporte con ganancias (disperso): max sum p_ij x_ij con la oferta de cada
+    origen y la demanda de cada destino como cotas superiores
+    """
+    rng = np.random.default_rng(seed)
+    return _bipartite('transportation', f'transportation_{n_sources}x{n_sinks}',
+                      rng.uniform(1.0, 20.0, size=(n_sources, n_sinks)),
+                      rng.integers(10, 100, size=n_sources),
+                      rng.integers(10, 100, size=n_sinks))
+
+
+def assignment(n: int, seed: int = 0) -> LPInstance:
+    """
+    Asignación (disperso y muy degenerado: todos los lados derechos valen 1) con
+    ganancias separables p_ij = u_i + v_j, cuyo óptimo es sum u + sum v
+    """
+    rng = np.random.default_rng(seed)
+    u = rng.uniform(1.0, 10.0, size=n)
+    v = rng.uniform(1.0, 10.0, size=n)
+    return _bipartite('assignment', f'assignment_{n}', u[:, None] + v[None, :],
+                      np.ones(n), np.ones(n), optimum=float(u.sum() + v.sum()))
+
+
+def beale() -> LPInstance:
+    """Ejemplo de Beale: cicla con la regla de Dantzig sin anti-ciclado"""
+    c = np.array([0.75, -150.0, 0.02, -6.0])
+    A = np.array([[0.25, -60.0, -0.04, 9.0],
+                  [0.5, -90.0, -0.02, 3.0],
+                  [0.0, 0.0, 1.0, 0.0]])
+    return LPInstance('degenerate', 'beale', c, A, np.array([0.0, 0.0, 1.0]), optimum=0.05)
+
+
+def degenerate(n_constraints: int, n_vars: int, seed: int = 0) -> LPInstance:
+    """
+    Problema aleatorio degenerado: la mitad de las filas son de orden
+    x_i - x_j <= 0 (lado derecho cero, activas en el origen) y el resto se repite
+    escalado
+    """
+    rng = np.random.default_rng(seed)
+    half = n_constraints // 2
+    zero_rows = np.zeros((half, n_vars))
+    pairs = rng.integers(0, n_vars, size=(half, 2))
+    pairs[:, 1] = (pairs[:, 0] + 1 + pairs[:, 1] % (n_vars - 1)) % n_vars
+    zero_rows[np.arange(half), pairs[:, 0]] = 1.0
+    zero_rows[np.arange(half), pairs[:, 1]] = -1.0
+    base = rng.uniform(0.1, 10.0, size=(n_constraints - half, n_vars))
+    base[1::2] = base[::2][:len(base[1::2])] * 2.0
+    rhs = rng.uniform(10.0, 100.0, size=len(base))
+    rhs[1::2] = rhs[::2][:len(rhs[1::2])] * 2.0
+    return LPInstance('degenerate', f'degenerate_{n_constraints}x{n_vars}',
+                      rng.uniform(1.0, 10.0, size=n_vars),
+                      np.vstack([zero_rows, base]),
+                      np.concatenate([np.zeros(half), rhs]))
+
+
+def multi_plant(n_plants: int, n_products: int, n_resources: int, n_linking: int,
+                seed: int = 0) -> LPInstance:
+    """
+    Planificación de varias plantas (angular por bloques): cada planta tiene sus
+    filas de capacidad y de demanda máxima por producto, y n_linking filas de
+    materias primas compartidas enlazan todas las plantas
+    """
+    rng = np.random.default_rng(seed)
+    n_vars = n_plants * n_products
+    rows, cols, vals, b = [], [], [], []
+    for plant in range(n_plants):
+        plant_cols = plant * n_products + np.arange(n_products)
+        usage = rng.uniform(0.5, 5.0, size=(n_resources, n_products))
+        for r in range(n_resources):
+            rows += [len(b)] * n_products
+            cols += plant_cols.tolist()
+            vals += usage[r].tolist()
+            b.append(usage[r].sum() * rng.uniform(2.0, 5.0))
+        for j in plant_cols:
+            rows.append(len(b))
+            cols.append(int(j))
+            vals.append(1.0)
+            b.append(rng.uniform(5.0, 20.0))
+    for _ in range(n_linking):
+        shared = np.flatnonzero(rng.random(n_vars) < 0.5)
+        rows += [len(b)] * len(shared)
+        cols += shared.tolist()
+        vals += rng.uniform(0.1, 1.0, size=len(shared)).tolist()
+        b.append(0.5 * len(shared))
+    A = CSRMatrix.from_triplets(rows, cols, vals, (len(b), n_vars))
+    return LPInstance('multi_plant', f'multi_plant_{n_plants}x{n_products}',
+                      rng.uniform(1.0, 10.0, size=n_vars), A, np.array(b))
+
+
+# Instancias por familia y escala: 'small' para pruebas rápidas, 'medium' y 'large'
+# para medir rendimiento
+FAMILIES: Dict[str, Callable[[str], List[LPInstance]]] = {
+    'klee_minty': lambda scale: [klee_minty(n) for n in
+                                 {'small': (4, 6), 'medium': (8, 10), 'large': (12,)}[scale]],
+    'random_dense': lambda scale: [random_dense(m, n) for m, n in
+                                   {'small': ((20, 20), (50, 30)),
+                                    'medium': ((200, 200), (300, 100)),
+                                    'large': ((800, 800),)}[scale]],
+    'transportation': lambda scale: [transportation(m, n) for m, n in
+                                     {'small': ((5, 8),), 'medium': ((30, 40),),
+                                      'large': ((60, 80),)}[scale]],
+    'assignment': lambda scale: [assignment(n) for n in
+                                 {'small': (6,), 'medium': (25,), 'large': (50,)}[scale]],
+    'degenerate': lambda scale: [beale()] + [degenerate(m, n) for m, n in
+                                             {'small': ((20, 15),), 'medium': ((200, 150),),
+                                              'large': ((600, 400),)}[scale]],
+    'multi_plant': lambda scale: [multi_plant(*size) for size in
+                                  {'small': ((3, 10, 3, 2),), 'medium': ((10, 20, 5, 4),),
+                                   'large': ((20, 30, 10, 6),)}[scale]],
+}
+
+
+def instances(families: List[str], scale: str) -> List[LPInstance]:
+    """Instancias de las familias pedidas a la escala dada"""
+    return [instance for family in families for instance in FAMILIES[family](scale)]
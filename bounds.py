@@ -0,0 +1,85 @@
+import numpy as np
+from typing import Tuple
+from sparse_matrix import CSRMatrix, is_sparse
+
+
+def split_bounds(A, b: np.ndarray) -> Tuple[object, np.ndarray, np.ndarray, np.ndarray,
+                                            np.ndarray, np.ndarray]:
+    """
+    Separar las filas con una sola variable y coeficiente positivo (a·x_j <= b_i)
+    como cotas superiores x_j <= b_i / a
+
+    Las filas de una variable con coeficiente negativo se conservan: con x >= 0
+    y b >= 0 son redundantes, pero su precio dual sigue siendo el de una fila.
+
+    Args:
+        A: Matriz de restricciones (densa o CSRMatrix)
+        b: Valores del lado derecho
+
+    Returns:
+        Tuple con (A sin las filas de cota, su lado derecho, cota superior de cada
+        variable (inf si no tiene), filas conservadas, fila de la que sale cada
+        cota (-1 si la variable no tiene cota), coeficiente a de esa fila (el
+        dual de la fila es el de la cota dividido por a))
+    """
+    b = np.asarray(b, dtype=float)
+    n_rows, n_vars = A.shape
+    if is_sparse(A):
+        counts = np.diff(A.indptr)
+        single = np.flatnonzero(counts == 1)
+        cols = A.indices[A.indptr[single]]
+        coefs = A.data[A.indptr[single]]
+    else:
+        A = np.asarray(A, dtype=float)
+        nonzero = A != 0
+        single = np.flatnonzero(nonzero.sum(axis=1) == 1)
+        cols = np.argmax(nonzero[single], axis=1)
+        coefs = A[single, cols]
+    positive = coefs > 0
+    single, cols, coefs = single[positive], cols[positive], coefs[positive]
+
+    # Con varias filas sobre la misma variable manda la cota más ajustada
+    upper = np.full(n_vars, np.inf)
+    source = np.full(n_vars, -1, dtype=np.int64)
+    coefficient = np.ones(n_vars)
+    values = b[single] / coefs
+    for k in np.argsort(-values, kind='stable'):
+        upper[cols[k]] = values[k]
+        source[cols[k]] = single[k]
+        coefficient[cols[k]] = coefs[k]
+
+    keep = np.ones(n_rows, dtype=bool)
+    keep[single] = False
+    kept_rows = np.flatnonzero(keep)
+    if is_sparse(A):
+        new_row = np.cumsum(keep) - 1
+        rows = A.row_index()
+        mask = keep[rows]
+        A_kept = CSRMatrix.from_triplets(new_row[rows[mask]], A.indices[mask], A.data[mask],
+                                         (len(kept_rows), n_vars))
+    else:
+        A_kept = A[kept_rows]
+    return A_kept, b[kept_rows], upper, kept_rows, source, coefficient
+
+
+def bounds_as_rows(A, b: np.ndarray, upper: np.ndarray) -> Tuple[object, np.ndarray]:
+    """
+    Agregar al final una fila x_j <= u_j por cada cota superior finita (para los
+    métodos que no manejan cotas)
+
+    Returns:
+        Tuple con (A ampliada, b ampliado); A conserva su tipo
+    """
+    bounded = np.flatnonzero(np.isfinite(upper))
+    n_rows, n_vars = A.shape
+    new_rows = n_rows + np.arange(len(bounded))
+    if is_sparse(A):
+        A = CSRMatrix.from_triplets(np.concatenate([A.row_index(), new_rows]),
+                                    np.concatenate([A.indices, bounded]),
+                                    np.concatenate([A.data, np.ones(len(bounded))]),
+                                    (n_rows + len(bounded), n_vars))
+    else:
+        rows = np.zeros((len(bounded), n_vars))
+        rows[np.arange(len(bounded)), bounded] = 1.0
+        A = np.vstack([np.asarray(A, dtype=float).reshape(n_rows, n_vars), rows])
+    return A, np.concatenate([np.asarray(b, dtype=float), upper[bounded]])
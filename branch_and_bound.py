@@ -0,0 +1,612 @@
+import heapq
+import math
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from pivot_kernel import PivotKernel
+from sparse_matrix import is_sparse
+from cancellation import CancellationToken, stop_check
+
+
+class Node:
+    """
+    Subproblema del árbol: cotas de las variables, base óptima del padre (de la
+    que parte el Simplex dual) y cota superior del valor (el óptimo del padre)
+    """
+
+    def __init__(self, lower: np.ndarray, upper: np.ndarray, basic_vars: List[int],
+                 at_upper: np.ndarray, bound: float, depth: int):
+        self.lower = lower
+        self.upper = upper
+        self.basic_vars = basic_vars
+        self.at_upper = at_upper
+        self.bound = bound
+        self.depth = depth
+
+
+def node_tableau(c: np.ndarray, A: np.ndarray, b: np.ndarray, lower: np.ndarray,
+                 upper: np.ndarray, basic_vars: List[int], at_upper: np.ndarray) -> np.ndarray:
+    """
+    Tableau de un nodo en la base dada
+
+    Cada variable se escribe como x = l + x' o, si está en su cota superior
+    (at_upper), como x = u - x'; el desplazamiento pasa al lado derecho y a la
+    constante de la fila Z.
+
+    Args:
+        c, A, b: Problema (A densa)
+        lower, upper: Cotas de las variables en el nodo
+        basic_vars: Columna de [A | I] básica en cada fila
+        at_upper: Columnas escritas como u - x (longitud n + m)
+
+    Returns:
+        Tableau B^-1 [A' | I | b - A·desplazamiento] con la fila Z
+    """
+    n_constraints, n_vars = A.shape
+    flipped = at_upper[:n_vars]
+    offset = np.where(flipped, upper, lower)
+    sign = np.where(flipped, -1.0, 1.0)
+
+    tableau = np.zeros((n_constraints + 1, n_vars + n_constraints + 1))
+    tableau[:-1, :n_vars] = A * sign
+    tableau[np.arange(n_constraints), n_vars + np.arange(n_constraints)] = 1.0
+    tableau[:-1, -1] = b - A @ offset
+    tableau[-1, :n_vars] = -c * sign
+    tableau[-1, -1] = c @ offset
+
+    if n_constraints:
+        tableau[:-1] = np.linalg.solve(tableau[:-1, basic_vars], tableau[:-1])
+        tableau[-1] -= tableau[-1, basic_vars] @ tableau[:-1]
+    tableau[:, basic_vars] = 0.0
+    tableau[np.arange(n_constraints), basic_vars] = 1.0
+    return tableau
+
+
+def shift_bound(tableau: np.ndarray, col: int, delta: float):
+    """
+    Desplazar la variable x' de la columna col (x' = x'' + delta) al cambiar la
+    cota desde la que se mide: solo cambian el lado derecho y el valor de Z
+    """
+    tableau[:, -1] -= delta * tableau[:, col]
+
+
+def bounded_dual_simplex(tableau: np.ndarray, basic_vars: List[int], at_upper: np.ndarray,
+                         span: np.ndarray, kernel: PivotKernel, max_pivots: int,
+                         tolerance: float = 1e-9) -> Tuple[str, int]:
+    """
+    Simplex dual con variables acotadas desde una base dual factible (fila Z >= 0)
+
+    En cada paso sale la básica más infactible: por debajo de cero o por encima
+    de su rango u - l (esta se reescribe antes como u - x, con lo que queda
+    negativa). La que entra es la del cociente mínimo |z_j / a_rj| entre a_rj < 0.
+
+    Args:
+        tableau: Tableau a modificar in-place
+        basic_vars: Variables básicas (se actualizan in-place)
+        at_upper: Columnas escritas como u - x (se actualiza in-place)
+        span: Rango u - l de cada columna (inf para las holguras)
+        kernel: Kernel de pivoteo con buffers para este tableau
+        max_pivots: Límite de pivoteos
+        tolerance: Infactibilidad admitida
+
+    Returns:
+        Tuple con ('optimal', 'infeasible' o 'iteration_limit', pivoteos)
+    """
+    pivots = 0
+    while True:
+        rhs = tableau[:-1, -1]
+        below = -rhs
+        above = rhs - span[basic_vars]
+        row_below = int(np.argmax(below)) if len(rhs) else 0
+        row_above = int(np.argmax(above)) if len(rhs) else 0
+        if not len(rhs) or max(below[row_below], above[row_above]) <= tolerance:
+            return 'optimal', pivots
+        if pivots >= max_pivots:
+            return 'iteration_limit', pivots
+
+        pivot_row = row_below
+        if above[row_above] > below[row_below]:
+            pivot_row = row_above
+            leaving = basic_vars[pivot_row]
+            kernel.flip_row(tableau, pivot_row, leaving, span[leaving])
+            at_upper[leaving] = not at_upper[leaving]
+
+        row = tableau[pivot_row, :-1]
+        candidates = np.flatnonzero(row < -tolerance)
+        if not len(candidates):
+            return 'infeasible', pivots
+        ratios = np.maximum(tableau[-1, candidates], 0.0) / -row[candidates]
+        pivot_col = int(candidates[np.argmin(ratios)])
+        kernel.pivot(tableau, pivot_row, pivot_col)
+        basic_vars[pivot_row] = pivot_col
+        pivots += 1
+
+
+class TreeSearch:
+    """
+    Exploración de (parte de) un árbol de ramificación y acotamiento
+
+    Cada nodo se resuelve con el Simplex dual con variables acotadas partiendo de
+    la base óptima de su padre: la ramificación x_j <= piso(v) o x_j >= techo(v)
+    solo cambia una cota, así que la base sigue siendo dual factible. Con
+    'depth_first' el hijo más cercano al valor fraccionario se resuelve sobre el
+    mismo tableau del padre (sin reconstruirlo) y el otro se apila; con
+    'best_bound' se expande siempre el nodo con mejor cota.
+    """
+
+    def __init__(self, c: np.ndarray, A: np.ndarray, b: np.ndarray, integer: np.ndarray,
+                 node_selection: str = 'best_bound', tolerance: float = 1e-6,
+                 gap_tolerance: float = 1e-6, max_pivots: Optional[int] = None):
+        """
+        Args:
+            c, A, b: Problema (A densa)
+            integer: Máscara de variables enteras
+            node_selection: 'best_bound' o 'depth_first'
+            tolerance: Distancia a un entero por debajo de la cual un valor es entero
+            gap_tolerance: Brecha relativa con la que se poda un nodo
+            max_pivots: Pivoteos del Simplex dual por nodo (por defecto según el tamaño)
+        """
+        if node_selection not in BranchAndBound.NODE_SELECTIONS:
+            raise ValueError(f"Selección de nodos desconocida: {node_selection}")
+        self.c, self.A, self.b = c, A, b
+        self.integer = integer
+        self.node_selection = node_selection
+        self.tolerance = tolerance
+        self.gap_tolerance = gap_tolerance
+        n_constraints, n_vars = A.shape
+        self.max_pivots = max_pivots or max(100, 20 * (n_vars + n_constraints))
+        self.kernel = PivotKernel((n_constraints + 1, n_vars + n_constraints + 1))
+        self.slack_span = np.full(n_constraints, np.inf)
+
+        self.open: List = []
+        self._counter = 0
+        self.incumbent = -np.inf
+        self.solution = None
+        self.nodes = 0
+        self.pivots = 0
+        self.max_depth = 0
+
+    # ------------------------------------------------------------------
+    # Nodos abiertos
+    # ------------------------------------------------------------------
+
+    def push(self, node: Node):
+        """Agregar un nodo abierto"""
+        self._counter += 1
+        if self.node_selection == 'best_bound':
+            heapq.heappush(self.open, (-node.bound, self._counter, node))
+        else:
+            self.open.append(node)
+
+    def pop(self) -> Node:
+        if self.node_selection == 'best_bound':
+            return heapq.heappop(self.open)[2]
+        return self.open.pop()
+
+    def open_nodes(self) -> List[Node]:
+        """Nodos abiertos (sin sacarlos)"""
+        if self.node_selection == 'best_bound':
+            return [entry[2] for entry in self.open]
+        return list(self.open)
+
+    def best_bound(self) -> float:
+        """Cota superior del óptimo entero: la mejor entre los abiertos y la incumbente"""
+        bounds = [node.bound for node in self.open_nodes()]
+        return max(bounds + [self.incumbent]) if bounds else self.incumbent
+
+    def prunable(self, bound: float, incumbent: Optional[float] = None) -> bool:
+        """Indicar si un nodo con esa cota no puede mejorar la incumbente"""
+        incumbent = self.incumbent if incumbent is None else incumbent
+        if incumbent == -np.inf:
+            return False
+        return bound <= incumbent + max(self.tolerance, self.gap_tolerance * abs(incumbent))
+
+    # ------------------------------------------------------------------
+    # Exploración
+    # ------------------------------------------------------------------
+
+    def run(self, should_stop=None, max_nodes: Optional[int] = None,
+            shared=None, until_open: Optional[int] = None) -> Optional[str]:
+        """
+        Explorar nodos abiertos hasta agotar el árbol o detenerse
+
+        Args:
+            should_stop: Función de stop_check (None: sin límite de tiempo ni cancelación)
+            max_nodes: Nodos resueltos como máximo
+            shared: Incumbente y evento de cancelación compartidos entre procesos
+                    (ver _init_worker); la incumbente ajena también poda
+            until_open: Parar en cuanto haya al menos este número de nodos
+                        abiertos (reparto inicial entre procesos)
+
+        Returns:
+            None si el árbol se agotó (o se alcanzó until_open); si no,
+            'time_limit', 'cancelled' o 'node_limit'
+        """
+        while self.open:
+            if until_open is not None and len(self.open) >= until_open:
+                return None
+            stop = should_stop and should_stop()
+            if stop:
+                return stop
+            if max_nodes is not None and self.nodes >= max_nodes:
+                return 'node_limit'
+            node = self.pop()
+            if self.prunable(node.bound, self._shared_incumbent(shared)):
+                continue
+            self._dive(node, shared, until_open, should_stop, max_nodes)
+        return None
+
+    def _dive(self, node: Node, shared, until_open: Optional[int], should_stop=None,
+              max_nodes: Optional[int] = None):
+        """
+        Resolver un nodo y, en profundidad, seguir por el hijo más cercano; si hay
+        que detenerse a mitad de la inmersión el hijo queda como nodo abierto
+        """
+        tableau = node_tableau(self.c, self.A, self.b, node.lower, node.upper,
+                               node.basic_vars, node.at_upper)
+        basic_vars = list(node.basic_vars)
+        at_upper = node.at_upper.copy()
+        lower, upper, depth = node.lower, node.upper, node.depth
+        while True:
+            span = np.concatenate([upper - lower, self.slack_span])
+            status, pivots = bounded_dual_simplex(tableau, basic_vars, at_upper, span,
+                                                  self.kernel, self.max_pivots)
+            self.nodes += 1
+            self.pivots += pivots
+            self.max_depth = max(self.max_depth, depth)
+            if status != 'optimal':
+                return
+            value = float(tableau[-1, -1])
+            if self.prunable(value, self._shared_incumbent(shared)):
+                return
+
+            x = self._solution(tableau, basic_vars, at_upper, lower, upper)
+            fractional = np.abs(x - np.round(x)) * self.integer
+            j = int(np.argmax(fractional))
+            if fractional[j] <= self.tolerance:
+                x = np.where(self.integer, np.round(x), x)
+                self._new_incumbent(float(self.c @ x), x, shared)
+                return
+
+            # Hijos: x_j <= piso(v) y x_j >= techo(v); el más cercano primero
+            down_upper, up_lower = upper.copy(), lower.copy()
+            down_upper[j] = math.floor(x[j])
+            up_lower[j] = math.ceil(x[j])
+            children = [(lower, down_upper), (up_lower, upper)]
+            if x[j] - math.floor(x[j]) > 0.5:
+                children.reverse()
+            if self.node_selection == 'best_bound' or until_open is not None:
+                for child_lower, child_upper in reversed(children):
+                    self.push(Node(child_lower, child_upper, list(basic_vars), at_upper.copy(),
+                                   value, depth + 1))
+                return
+
+            far_lower, far_upper = children[1]
+            self.push(Node(far_lower, far_upper, list(basic_vars), at_upper.copy(), value, depth + 1))
+            near_lower, near_upper = children[0]
+            if ((should_stop and should_stop())
+                    or (max_nodes is not None and self.nodes >= max_nodes)):
+                self.push(Node(near_lower, near_upper, list(basic_vars), at_upper.copy(),
+                               value, depth + 1))
+                return
+            # El cambio de cota desplaza x' si se mide desde la cota que cambió
+            if at_upper[j] and near_upper[j] != upper[j]:
+                shift_bound(tableau, j, upper[j] - near_upper[j])
+            elif not at_upper[j] and near_lower[j] != lower[j]:
+                shift_bound(tableau, j, near_lower[j] - lower[j])
+            lower, upper, depth = near_lower, near_upper, depth + 1
+
+    def _solution(self, tableau: np.ndarray, basic_vars: List[int], at_upper: np.ndarray,
+                  lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """Valores de las variables originales en la base actual"""
+        n_vars = len(self.c)
+        x_prime = np.zeros(len(at_upper))
+        x_prime[basic_vars] = tableau[:-1, -1]
+        x_prime = x_prime[:n_vars]
+        flipped = at_upper[:n_vars]
+        return np.where(flipped, upper - x_prime, lower + x_prime)
+
+    def _new_incumbent(self, value: float, x: np.ndarray, shared):
+        if value > self.incumbent:
+            self.incumbent = value
+            self.solution = x
+        if shared is not None:
+            with shared[0].get_lock():
+                shared[0].value = max(shared[0].value, value)
+
+    def _shared_incumbent(self, shared) -> float:
+        if shared is None:
+            return self.incumbent
+        return max(self.incumbent, shared[0].value)
+
+
+# Estado de cada proceso de trabajo (se inicializa una vez por proceso)
+_worker_problem = None
+_worker_shared = None
+
+
+def _init_worker(problem: Tuple, shared: Tuple):
+    """Guardar el problema, la incumbente compartida y el evento de cancelación"""
+    global _worker_problem, _worker_shared
+    _worker_problem = problem
+    _worker_shared = shared
+
+
+def _solve_subtree(node: Node, time_left: Optional[float], node_budget: int) -> Dict:
+    """
+    Explorar en un proceso de trabajo hasta node_budget nodos del subárbol que
+    cuelga de node y devolver los nodos que quedaron abiertos
+    """
+    c, A, b, integer, node_selection, tolerance, gap_tolerance = _worker_problem
+    search = TreeSearch(c, A, b, integer, node_selection, tolerance, gap_tolerance)
+    search.push(node)
+    cancel_event = _worker_shared[1]
+    deadline = stop_check(time_limit=time_left)
+
+    def should_stop():
+        if cancel_event.is_set():
+            return 'cancelled'
+        return deadline() if deadline else None
+
+    stop = search.run(should_stop, node_budget, shared=_worker_shared)
+    return {'stop': stop, 'incumbent': search.incumbent, 'solution': search.solution,
+            'nodes': search.nodes, 'pivots': search.pivots, 'max_depth': search.max_depth,
+            'open': search.open_nodes()}
+
+
+class BranchAndBound:
+    """
+    Programación entera mixta por ramificación y acotamiento sobre SimplexSolver:
+    max c^T x, Ax <= b (b >= 0), 0 <= x <= u, x_j entero para las variables marcadas.
+
+    La relajación de la raíz se resuelve con SimplexSolver (Simplex con variables
+    acotadas, con su historial); los nodos parten de la base óptima del padre y
+    se resuelven con el Simplex dual con variables acotadas (ver TreeSearch).
+    Con workers > 1 los nodos abiertos se reparten entre procesos de trabajo que
+    exploran por turnos parte de su subárbol (ver _search_parallel); la
+    incumbente se comparte para podar entre procesos.
+    """
+
+    NODE_SELECTIONS = ('best_bound', 'depth_first')
+    # Opciones de solve que se pasan a la relajación de la raíz
+    ROOT_OPTIONS = ('history', 'pricing', 'max_iterations', 'anti_cycling', 'scaling', 'callback')
+    # Nodos que explora un proceso de trabajo antes de devolver sus nodos abiertos
+    NODES_PER_TASK = 256
+
+    def __init__(self, solver, c: np.ndarray, A, b: np.ndarray, integer,
+                 upper_bounds: Optional[np.ndarray] = None):
+        """
+        Args:
+            solver: SimplexSolver para la relajación de la raíz
+            c, A, b: Problema (A densa o CSRMatrix; los nodos trabajan con A densa)
+            integer: Máscara booleana o índices de las variables enteras
+            upper_bounds: Cotas superiores (inf: sin cota); las de variables
+                          enteras se redondean hacia abajo
+        """
+        self.solver = solver
+        self.c = np.asarray(c, dtype=float)
+        self.A = A.toarray() if is_sparse(A) else np.asarray(A, dtype=float).reshape(len(b), len(c))
+        self.b = np.asarray(b, dtype=float)
+        n_vars = len(self.c)
+        mask = np.zeros(n_vars, dtype=bool)
+        integer = np.asarray(integer)
+        mask[integer if integer.dtype != bool else np.flatnonzero(integer)] = True
+        self.integer = mask
+        self.upper = (np.full(n_vars, np.inf) if upper_bounds is None
+                      else np.asarray(upper_bounds, dtype=float).copy())
+        self.upper[mask] = np.floor(self.upper[mask] + 1e-9)
+
+    def solve(self, node_selection: str = 'best_bound', workers: int = 1,
+              time_limit: Optional[float] = None, max_nodes: int = 100000,
+              gap_tolerance: float = 1e-6, tolerance: float = 1e-6,
+              cancel_token: Optional[CancellationToken] = None, **root_options) -> Dict:
+        """
+        Resolver el problema entero
+
+        Args:
+            node_selection: 'best_bound' (mejor cota primero) o 'depth_first'
+                            (en profundidad, reutilizando el tableau del padre)
+            workers: Procesos para explorar subárboles (1: en este proceso)
+            time_limit: Segundos de reloj para todo el árbol
+            max_nodes: Nodos resueltos como máximo
+            gap_tolerance: Brecha relativa con la que se poda (y se da por óptimo)
+            tolerance: Distancia a un entero por debajo de la cual un valor es entero
+            cancel_token: CancellationToken (ver solve)
+            **root_options: Opciones de SimplexSolver.solve para la relajación
+                            de la raíz (ver ROOT_OPTIONS)
+
+        Returns:
+            Diccionario con 'status' ('optimal', 'infeasible', 'unbounded',
+            'node_limit', 'time_limit' o 'cancelled'), la mejor solución entera
+            ('solution', 'optimal_value'), 'relaxation' (valor de la raíz), las
+            iteraciones de la raíz y 'branch_and_bound': nodos, nodos por segundo,
+            pivoteos, profundidad, brecha final, 'gap_history' (tiempo,
+            incumbente, cota, brecha) y tiempo total
+        """
+        unknown = set(root_options) - set(self.ROOT_OPTIONS)
+        if unknown:
+            raise ValueError(f"Opciones no admitidas en ramificación y acotamiento: {sorted(unknown)}")
+        if workers < 1:
+            raise ValueError("workers debe ser al menos 1")
+        start = time.perf_counter()
+        should_stop = stop_check(cancel_token, time_limit)
+        n_vars, n_constraints = len(self.c), len(self.b)
+
+        # Relajación de la raíz (sin caché: hace falta su base óptima)
+        cache, self.solver.cache = self.solver.cache, None
+        try:
+            root = self.solver.solve(self.c, self.A, self.b, upper_bounds=self.upper,
+                                     time_limit=time_limit, cancel_token=cancel_token,
+                                     **root_options)
+        finally:
+            self.solver.cache = cache
+        info = {'node_selection': node_selection, 'workers': workers, 'nodes': 0,
+                'nodes_per_second': 0.0, 'pivots': 0, 'max_depth': 0, 'gap': None,
+                'best_bound': root.get('optimal_value'), 'gap_history': []}
+        result = {
+            'iterations': root['iterations'],
+            'iteration_count': root.get('iteration_count', 0),
+            'variable_names': [f'x{i+1}' for i in range(n_vars)],
+            'relaxation': {'status': root['status'], 'optimal_value': root.get('optimal_value'),
+                           'solution': root.get('solution')},
+            'branch_and_bound': info
+        }
+        if root['status'] != 'optimal':
+            result.update(status=root['status'], message=root.get('message', ''))
+            result.pop('solution', None)
+            info['wall_time'] = time.perf_counter() - start
+            return result
+
+        at_upper = np.zeros(n_vars + n_constraints, dtype=bool)
+        at_upper[root.get('at_upper', [])] = True
+        search = TreeSearch(self.c, self.A, self.b, self.integer, node_selection,
+                            tolerance, gap_tolerance)
+        search.push(Node(np.zeros(n_vars), self.upper.copy(), list(root['basic_vars']),
+                         at_upper, float(root['optimal_value']), 0))
+
+        def record_gap(bound: float):
+            incumbent = search.incumbent
+            gap = (None if incumbent == -np.inf
+                   else max(bound - incumbent, 0.0) / max(1.0, abs(incumbent)))
+            info['gap_history'].append((time.perf_counter() - start,
+                                        None if incumbent == -np.inf else incumbent, bound, gap))
+            info['gap'], info['best_bound'] = gap, bound
+
+        if workers == 1:
+            stop = self._search_serial(search, should_stop, max_nodes, record_gap)
+            bound = search.best_bound() if stop else search.incumbent
+        else:
+            stop, bound = self._search_parallel(search, workers, should_stop, time_limit,
+                                                max_nodes, cancel_token, record_gap, start)
+        record_gap(bound if stop else search.incumbent)
+
+        elapsed = time.perf_counter() - start
+        info.update(nodes=search.nodes, pivots=search.pivots, max_depth=search.max_depth,
+                    wall_time=elapsed, nodes_per_second=search.nodes / elapsed if elapsed > 0 else 0.0)
+        if search.solution is not None:
+            result['solution'] = search.solution
+            result['optimal_value'] = search.incumbent
+        if stop is None:
+            if search.solution is None:
+                result.update(status='infeasible', message='El problema no tiene solución entera')
+            else:
+                result['status'] = 'optimal'
+        else:
+            messages = {'node_limit': 'Se alcanzó el límite de {} nodos',
+                        'time_limit': 'Se alcanzó el límite de tiempo tras {} nodos',
+                        'cancelled': 'Resolución cancelada tras {} nodos'}
+            result.update(status=stop, message=messages[stop].format(search.nodes))
+        return result
+
+    def _search_serial(self, search: TreeSearch, should_stop, max_nodes: int, record_gap) -> Optional[str]:
+        """Explorar el árbol en este proceso registrando la brecha cada cierto número de nodos"""
+        stop, step = None, 64
+        # La mejor cota primero rara vez llega a una hoja entera al principio
+        if search.node_selection == 'best_bound':
+            stop = search.run(should_stop, max_nodes, until_open=2)
+            if not stop and search.open and search.incumbent == -np.inf:
+                self._dive_for_incumbent(search, should_stop, max_nodes)
+                record_gap(search.best_bound())
+        while search.open and stop is None:
+            incumbent = search.incumbent
+            stop = search.run(should_stop, min(max_nodes, search.nodes + step))
+            if stop == 'node_limit' and search.nodes < max_nodes:
+                stop = None
+            if search.incumbent != incumbent or not search.open or stop:
+                record_gap(search.best_bound())
+        return stop
+
+    def _dive_for_incumbent(self, search: TreeSearch, should_stop, max_nodes: int):
+        """Buscar en profundidad una primera solución entera sin sacar nodos del árbol"""
+        dive = TreeSearch(self.c, self.A, self.b, self.integer, 'depth_first',
+                          search.tolerance, search.gap_tolerance)
+        dive.push(max(search.open_nodes(), key=lambda node: node.bound))
+        dive.run(lambda: (should_stop and should_stop()) or ('found' if dive.solution is not None else None),
+                 max_nodes - search.nodes)
+        search.nodes += dive.nodes
+        search.pivots += dive.pivots
+        search.max_depth = max(search.max_depth, dive.max_depth)
+        if dive.solution is not None:
+            search.incumbent, search.solution = dive.incumbent, dive.solution
+
+    def _search_parallel(self, search: TreeSearch, workers: int, should_stop,
+                         time_limit: Optional[float], max_nodes: int,
+                         cancel_token: Optional[CancellationToken], record_gap,
+                         start: float) -> Tuple[Optional[str], float]:
+        """
+        Explorar el árbol con procesos de trabajo
+
+        Este proceso guarda la cola global de nodos abiertos (en el orden de
+        node_selection) y entrega a cada proceso libre el siguiente nodo; el
+        proceso explora hasta NODES_PER_TASK nodos de su subárbol y devuelve los
+        que quedaron abiertos, que vuelven a la cola. Así el orden global de
+        exploración se conserva aunque los subárboles se resuelvan en paralelo.
+
+        Returns:
+            Tuple con (motivo de la detención o None, cota superior final)
+        """
+        stop = search.run(should_stop, max_nodes, until_open=workers)
+        if stop or not search.open:
+            return stop, search.best_bound()
+        # Sin incumbente los nodos repartidos no se podan entre sí
+        if search.incumbent == -np.inf:
+            self._dive_for_incumbent(search, should_stop, max_nodes)
+        record_gap(search.best_bound())
+
+        context = multiprocessing.get_context()
+        shared = (context.Value('d', search.incumbent), context.Event())
+        unregister = cancel_token.on_cancel(shared[1].set) if cancel_token is not None else None
+        problem = (self.c, self.A, self.b, self.integer, search.node_selection,
+                   search.tolerance, search.gap_tolerance)
+        pending = {}
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                     initializer=_init_worker, initargs=(problem, shared)) as pool:
+                while search.open or pending:
+                    stop = stop or (should_stop and should_stop())
+                    if not stop and search.nodes >= max_nodes:
+                        stop = 'node_limit'
+                    while not stop and search.open and len(pending) < workers:
+                        node = search.pop()
+                        if search.prunable(node.bound, shared[0].value):
+                            continue
+                        time_left = (None if time_limit is None
+                                     else max(time_limit - (time.perf_counter() - start), 0.0))
+                        budget = min(self.NODES_PER_TASK, max_nodes - search.nodes
+                                     - sum(budget for _, budget in pending.values()))
+                        if budget <= 0:
+                            search.push(node)
+                            break
+                        pending[pool.submit(_solve_subtree, node, time_left, budget)] = (node, budget)
+                    if not pending:
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    incumbent = search.incumbent
+                    for future in done:
+                        pending.pop(future)
+                        part = future.result()
+                        search.nodes += part['nodes']
+                        search.pivots += part['pivots']
+                        search.max_depth = max(search.max_depth, part['max_depth'])
+                        if part['solution'] is not None and part['incumbent'] > search.incumbent:
+                            search.incumbent, search.solution = part['incumbent'], part['solution']
+                        for node in part['open']:
+                            search.push(node)
+                        if part['stop'] in ('time_limit', 'cancelled'):
+                            stop = stop or part['stop']
+                    if search.incumbent != incumbent or not (search.open or pending):
+                        record_gap(max([node.bound for node, _ in pending.values()] + [search.best_bound()]))
+        finally:
+            if unregister is not None:
+                unregister()
+        # Los nodos abiertos ya podados por la incumbente no cuentan
+        remaining = [node for node in search.open_nodes() if not search.prunable(node.bound)]
+        search.open.clear()
+        for node in remaining:
+            search.push(node)
+        if not search.open:
+            return None, search.incumbent
+        return stop or 'node_limit', search.best_bound()
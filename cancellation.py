@@ -0,0 +1,98 @@
+import threading
+import time
+from typing import Callable, List, Optional
+
+
+class CancelledError(Exception):
+    """Trabajo interrumpido por un CancellationToken"""
+
+
+class CancellationToken:
+    """
+    Señal de cancelación compartida entre la interfaz y un trabajo en otro hilo
+
+    El trabajo la consulta en puntos seguros (entre pivoteos del Simplex, por
+    ejemplo) o registra con on_cancel() una función que interrumpe una espera
+    bloqueante, como una petición HTTP en curso.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """Indicar si se pidió la cancelación"""
+        return self._event.is_set()
+
+    def cancel(self):
+        """Pedir la cancelación y ejecutar las funciones registradas (una sola vez)"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Registrar una función que se ejecuta al cancelar (de inmediato si ya se canceló)
+
+        Args:
+            callback: Función sin argumentos
+
+        Returns:
+            Función que quita el registro
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        callback()
+        return lambda: None
+
+    def _remove(self, callback: Callable[[], None]):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Esperar la cancelación hasta timeout segundos; devuelve si se canceló"""
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self):
+        """Lanzar CancelledError si se pidió la cancelación"""
+        if self._event.is_set():
+            raise CancelledError("Operación cancelada")
+
+
+def stop_check(cancel_token: Optional[CancellationToken] = None,
+               time_limit: Optional[float] = None) -> Optional[Callable[[], Optional[str]]]:
+    """
+    Función que los ciclos de pivoteo consultan para saber si deben detenerse
+
+    Args:
+        cancel_token: Token de cancelación (None: sin cancelación)
+        time_limit: Segundos de reloj desde ahora (None: sin límite)
+
+    Returns:
+        None si no hay nada que comprobar; si no, una función que devuelve
+        'cancelled', 'time_limit' o None
+    """
+    if cancel_token is None and time_limit is None:
+        return None
+    if time_limit is not None and time_limit < 0:
+        raise ValueError("time_limit no puede ser negativo")
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    event = None if cancel_token is None else cancel_token._event
+
+    def check() -> Optional[str]:
+        if event is not None and event.is_set():
+            return 'cancelled'
+        if deadline is not None and time.perf_counter() >= deadline:
+            return 'time_limit'
+        return None
+
+    return check
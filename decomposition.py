@@ -0,0 +1,454 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from sparse_matrix import CSRMatrix, is_sparse
+from cancellation import CancellationToken, stop_check
+
+
+class BlockStructure:
+    """
+    Partición de un modelo en bloques: filas de enlace, filas y columnas de cada
+    bloque, y columnas que solo aparecen en filas de enlace (van directo al maestro)
+    """
+
+    def __init__(self, linking_rows: np.ndarray, blocks: List[Tuple[np.ndarray, np.ndarray]],
+                 master_cols: np.ndarray):
+        self.linking_rows = linking_rows
+        self.blocks = blocks
+        self.master_cols = master_cols
+
+
+class Block:
+    """
+    Subproblema de un bloque: max (c - L^T·π)^T x s.a. A x <= b, x >= 0, con L
+    las filas de enlace restringidas a sus columnas
+
+    A y L se guardan dispersas; A solo se densifica en el proceso que resuelve
+    el bloque (ver price_block).
+    """
+
+    def __init__(self, rows: np.ndarray, cols: np.ndarray, c: np.ndarray, A: CSRMatrix,
+                 b: np.ndarray, link: CSRMatrix):
+        self.rows = rows
+        self.cols = cols
+        self.c = c
+        self.A = A
+        self.b = b
+        self.link = link
+
+
+def _triplets(A) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Filas, columnas y valores de los coeficientes no nulos de A (densa o CSRMatrix)"""
+    if is_sparse(A):
+        return A.row_index(), A.indices, A.data
+    A = np.asarray(A, dtype=float)
+    rows, cols = np.nonzero(A)
+    return rows, cols, A[rows, cols]
+
+
+def _submatrix(triplets: Tuple, n_rows: int, n_cols: int, rows: np.ndarray,
+               cols: np.ndarray) -> CSRMatrix:
+    """Submatriz dispersa A[rows][:, cols] a partir de los coeficientes no nulos"""
+    all_rows, all_cols, values = triplets
+    row_pos = np.full(n_rows, -1)
+    row_pos[rows] = np.arange(len(rows))
+    col_pos = np.full(n_cols, -1)
+    col_pos[cols] = np.arange(len(cols))
+    keep = (row_pos[all_rows] >= 0) & (col_pos[all_cols] >= 0)
+    return CSRMatrix.from_triplets(row_pos[all_rows[keep]], col_pos[all_cols[keep]], values[keep],
+                                   (len(rows), len(cols)))
+
+
+def _find(parent: List[int], i: int) -> int:
+    """Raíz de i en el bosque de unión-búsqueda (con compresión de caminos)"""
+    root = i
+    while parent[root] != root:
+        root = parent[root]
+    while parent[i] != root:
+        parent[i], i = root, parent[i]
+    return root
+
+
+def _structure(triplets: Tuple, shape: Tuple[int, int], labels: np.ndarray) -> BlockStructure:
+    """
+    Clasificar las filas según el bloque de sus columnas: una fila es de un
+    bloque si todas sus columnas lo son y de enlace en otro caso
+
+    Args:
+        triplets: Coeficientes no nulos de A
+        shape: Dimensiones de A
+        labels: Bloque de cada columna (-1: columna del maestro)
+    """
+    n_rows, _ = shape
+    rows, cols, _ = triplets
+    n_blocks = int(labels.max()) + 1 if len(labels) else 0
+    # Menor y mayor etiqueta de cada fila (-1 cuenta como un bloque más)
+    low = np.full(n_rows, n_blocks)
+    high = np.full(n_rows, -2)
+    np.minimum.at(low, rows, labels[cols])
+    np.maximum.at(high, rows, labels[cols])
+    empty = high == -2
+    linking = ~empty & ((low != high) | (low == -1))
+    row_block = np.where(linking | empty, -1, low)
+    blocks = [(np.flatnonzero(row_block == k), np.flatnonzero(labels == k)) for k in range(n_blocks)]
+    return BlockStructure(np.flatnonzero(linking), blocks, np.flatnonzero(labels == -1))
+
+
+def blocks_from_columns(A, blocks: List) -> BlockStructure:
+    """
+    Estructura con los bloques de columnas dados; las filas que tocan más de un
+    bloque (o columnas fuera de todos) son de enlace
+
+    Args:
+        A: Matriz de restricciones (densa o CSRMatrix)
+        blocks: Lista con los índices de columna de cada bloque
+
+    Returns:
+        BlockStructure
+    """
+    labels = np.full(A.shape[1], -1)
+    for k, cols in enumerate(blocks):
+        cols = np.asarray(cols, dtype=np.int64)
+        if np.any(labels[cols] != -1):
+            raise ValueError("Una columna aparece en más de un bloque")
+        labels[cols] = k
+    return _structure(_triplets(A), A.shape, labels)
+
+
+def detect_blocks(A, max_linking_fraction: float = 0.2) -> BlockStructure:
+    """
+    Detectar una estructura angular por bloques
+
+    Las candidatas a filas de enlace son las filas con más coeficientes (como
+    mucho max_linking_fraction de las filas). Sin las k primeras candidatas, las
+    demás filas unen sus columnas en componentes conexas (los bloques); se elige
+    el k que minimiza el área de la matriz cubierta por las filas de enlace y
+    los bloques, k·n + Σ filas_k·columnas_k (el menor k, entre empates). El área
+    se calcula para todo k en una sola pasada agregando las candidatas en orden
+    inverso.
+
+    Args:
+        A: Matriz de restricciones (densa o CSRMatrix)
+        max_linking_fraction: Fracción máxima de filas de enlace
+
+    Returns:
+        BlockStructure
+    """
+    triplets = _triplets(A)
+    n_rows, n_cols = A.shape
+    rows, cols, _ = triplets
+    order = np.argsort(rows, kind='stable')
+    cols = cols[order].tolist()
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+    counts = np.diff(indptr)
+    n_candidates = min(int(max_linking_fraction * n_rows), int(np.sum(counts >= 2)))
+    candidates = np.argsort(-counts, kind='stable')[:n_candidates]
+
+    def components(linking: np.ndarray, record: bool) -> Tuple[List[int], List[bool], List[int]]:
+        """Unir las columnas de las filas de bloque (y, con record, el área por k)"""
+        parent = list(range(n_cols))
+        touched = [False] * n_cols
+        size_rows, size_cols = [0] * n_cols, [1] * n_cols
+        area = 0
+        areas = []
+
+        def add(i: int):
+            nonlocal area
+            row_cols = cols[indptr[i]:indptr[i + 1]]
+            if not row_cols:
+                return
+            for j in row_cols:
+                touched[j] = True
+            root = _find(parent, row_cols[0])
+            for j in row_cols[1:]:
+                other = _find(parent, j)
+                if other != root:
+                    area -= size_rows[root] * size_cols[root] + size_rows[other] * size_cols[other]
+                    parent[other] = root
+                    size_rows[root] += size_rows[other]
+                    size_cols[root] += size_cols[other]
+                    area += size_rows[root] * size_cols[root]
+            area += size_cols[root]
+            size_rows[root] += 1
+
+        skip = np.zeros(n_rows, dtype=bool)
+        skip[linking] = True
+        for i in np.flatnonzero(~skip):
+            add(i)
+        if record:
+            areas.append(area + len(linking) * n_cols)
+            for k in range(len(linking) - 1, -1, -1):
+                add(linking[k])
+                areas.append(area + k * n_cols)
+        return parent, touched, areas[::-1]
+
+    # areas[k]: área con las k primeras candidatas como filas de enlace
+    _, _, areas = components(candidates, True)
+    best = int(np.argmin(areas))
+    parent, touched, _ = components(candidates[:best], False)
+    roots = np.array([_find(parent, j) if touched[j] else -1 for j in range(n_cols)], dtype=np.int64)
+    # Bloques numerados por su menor columna
+    labels = np.full(n_cols, -1)
+    _, first, inverse = np.unique(roots[roots >= 0], return_index=True, return_inverse=True)
+    labels[roots >= 0] = np.argsort(np.argsort(first))[inverse]
+    return _structure(triplets, A.shape, labels)
+
+
+def price_block(solver, block: Block, prices: np.ndarray, options: Dict) -> Dict:
+    """
+    Resolver el subproblema de precios de un bloque con SimplexSolver
+
+    Args:
+        solver: SimplexSolver
+        block: Bloque
+        prices: Precios duales de las filas de enlace
+        options: Opciones de solve
+
+    Returns:
+        Diccionario con 'status', 'pivots' y, si es óptimo, 'value', 'vector'
+        (punto extremo) y 'duals' de las filas del bloque; si no está acotado,
+        'vector' es un rayo extremo. Con 'vector', 'cost' = c^T·vector y 'link'
+        = L·vector son la columna del maestro
+    """
+    objective = block.c - block.link.rmatvec(prices)
+    # El tableau del subproblema es denso de todos modos: el bloque se densifica aquí
+    result = solver.solve(objective, block.A.toarray(), block.b, **options)
+    part = {'status': result['status'], 'pivots': result.get('iteration_count', 0)}
+    if result['status'] == 'optimal':
+        part.update(value=float(result['optimal_value']), vector=result['solution'],
+                    duals=result['duals'])
+    elif result['status'] == 'unbounded' and 'ray' in result:
+        part['vector'] = result['ray']
+    if 'vector' in part:
+        part.update(cost=float(block.c @ part['vector']), link=block.link.matvec(part['vector']))
+    return part
+
+
+# Solver de cada proceso de trabajo (se crea una vez por proceso)
+_worker_solver = None
+
+
+def _init_worker(solver_class):
+    """Crear el solver del proceso de trabajo"""
+    global _worker_solver
+    _worker_solver = solver_class()
+
+
+def _price_task(block: Block, prices: np.ndarray, options: Dict) -> Dict:
+    """Subproblema de precios en un proceso de trabajo (recibe solo su bloque)"""
+    return price_block(_worker_solver, block, prices, options)
+
+
+class DantzigWolfe:
+    """
+    Descomposición de Dantzig-Wolfe para modelos angulares por bloques:
+    max c^T x, Ax <= b (b >= 0), x >= 0, donde las filas se dividen en filas de
+    enlace y filas de bloques independientes.
+
+    El maestro restringido combina puntos y rayos extremos de cada bloque:
+    max Σ (c_k·v) λ s.a. Σ (L_k·v) λ <= b_L, Σ_v λ_kv <= 1 por bloque, λ >= 0
+    (la convexidad es <= porque el origen es factible en cada bloque), y se
+    resuelve con SimplexSolver. Con sus duales (π, σ) cada bloque resuelve
+    max (c_k - L_k^T·π)^T x_k; los bloques con valor mayor que σ_k agregan su
+    columna. Los subproblemas se resuelven en paralelo en procesos de trabajo
+    que reciben un bloque por tarea. El coordinador guarda los bloques dispersos
+    (memoria O(nnz)) y cada proceso solo densifica el bloque que está resolviendo.
+    """
+
+    # Opciones de solve que se pasan a los subproblemas
+    SUBPROBLEM_OPTIONS = ('pricing', 'max_iterations', 'anti_cycling', 'scaling')
+
+    def __init__(self, solver, c: np.ndarray, A, b: np.ndarray, blocks: Optional[List] = None,
+                 max_linking_fraction: float = 0.2):
+        """
+        Args:
+            solver: SimplexSolver para el maestro (y los subproblemas sin procesos)
+            c, A, b: Problema (A densa o CSRMatrix; b >= 0)
+            blocks: Índices de columna de cada bloque (None: detectar, ver detect_blocks)
+            max_linking_fraction: Fracción máxima de filas de enlace al detectar
+        """
+        self.solver = solver
+        self.c = np.asarray(c, dtype=float)
+        self.b = np.asarray(b, dtype=float)
+        if np.any(self.b < 0):
+            raise ValueError("La descomposición necesita b >= 0 (el origen factible en cada bloque)")
+        self.structure = (detect_blocks(A, max_linking_fraction) if blocks is None
+                          else blocks_from_columns(A, blocks))
+        triplets = _triplets(A)
+        n_rows, n_cols = A.shape
+        linking = self.structure.linking_rows
+        self.blocks = [Block(rows, cols, self.c[cols],
+                             _submatrix(triplets, n_rows, n_cols, rows, cols), self.b[rows],
+                             _submatrix(triplets, n_rows, n_cols, linking, cols))
+                       for rows, cols in self.structure.blocks]
+        master = self.structure.master_cols
+        self.master_link = _submatrix(triplets, n_rows, n_cols, linking, master)
+
+    def solve(self, workers: int = 1, max_iterations: int = 1000, gap_tolerance: float = 1e-6,
+              tolerance: float = 1e-9, time_limit: Optional[float] = None,
+              cancel_token: Optional[CancellationToken] = None, **subproblem_options) -> Dict:
+        """
+        Resolver por generación de columnas
+
+        Args:
+            workers: Procesos para los subproblemas (1: en este proceso)
+            max_iterations: Iteraciones del maestro como máximo
+            gap_tolerance: Brecha relativa entre la cota de Lagrange y el valor
+                           del maestro con la que se da por óptimo
+            tolerance: Costo reducido mínimo de una columna nueva
+            time_limit: Segundos de reloj (se comprueba entre iteraciones)
+            cancel_token: CancellationToken (ver solve)
+            **subproblem_options: Opciones de solve para los subproblemas
+                                  (ver SUBPROBLEM_OPTIONS)
+
+        Returns:
+            Diccionario con 'status' ('optimal', 'unbounded', 'iteration_limit',
+            'time_limit', 'cancelled' o 'error'), 'solution', 'optimal_value' y
+            'duals' del modelo original, y 'decomposition': bloques, filas de
+            enlace, tamaño del mayor bloque, iteraciones, columnas generadas,
+            pivoteos de los subproblemas, tiempos del maestro y de los precios,
+            'bound_history' (tiempo, valor del maestro, cota, brecha) y tiempo total
+        """
+        unknown = set(subproblem_options) - set(self.SUBPROBLEM_OPTIONS)
+        if unknown:
+            raise ValueError(f"Opciones no admitidas en la descomposición: {sorted(unknown)}")
+        if workers < 1:
+            raise ValueError("workers debe ser al menos 1")
+        start = time.perf_counter()
+        should_stop = stop_check(cancel_token, time_limit)
+        options = dict(subproblem_options, history='none', method='tableau')
+        n_link, n_blocks = len(self.structure.linking_rows), len(self.blocks)
+        b_link = self.b[self.structure.linking_rows]
+
+        # Columnas del maestro: (costo, columna de enlace, bloque o -1, vector del bloque)
+        columns = [(self.c[j], self.master_link.column(k), -1, None)
+                   for k, j in enumerate(self.structure.master_cols)]
+        block_duals = [np.zeros(len(block.rows)) for block in self.blocks]
+        info = {
+            'blocks': n_blocks, 'linking_rows': n_link, 'workers': workers,
+            'block_sizes': [(len(block.rows), len(block.cols)) for block in self.blocks],
+            'largest_block': max([len(block.rows) * len(block.cols) for block in self.blocks], default=0),
+            'iterations': 0, 'columns': 0, 'subproblem_solves': 0, 'subproblem_pivots': 0,
+            'master_time': 0.0, 'pricing_time': 0.0, 'gap': None, 'bound_history': []
+        }
+        bound = np.inf
+        status, master = None, None
+
+        cache, self.solver.cache = self.solver.cache, None
+        pool = (ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                    initargs=(type(self.solver),)) if workers > 1 else None)
+        try:
+            while status is None:
+                if info['iterations'] >= max_iterations:
+                    status = 'iteration_limit'
+                    break
+                status = should_stop and should_stop()
+                if status:
+                    break
+                info['iterations'] += 1
+
+                # Maestro restringido
+                master_start = time.perf_counter()
+                master = self._solve_master(columns, b_link)
+                info['master_time'] += time.perf_counter() - master_start
+                if master['status'] != 'optimal':
+                    status = master['status']
+                    break
+                prices, sigma = master['duals'][:n_link], master['duals'][n_link:]
+
+                # Subproblemas de precios (en paralelo con procesos de trabajo)
+                pricing_start = time.perf_counter()
+                if pool is None:
+                    parts = [price_block(self.solver, block, prices, options) for block in self.blocks]
+                else:
+                    parts = list(pool.map(_price_task, self.blocks, repeat(prices), repeat(options)))
+                info['pricing_time'] += time.perf_counter() - pricing_start
+                info['subproblem_solves'] += n_blocks
+                info['subproblem_pivots'] += sum(part['pivots'] for part in parts)
+
+                # Cota de Lagrange: π^T·b_L + Σ z_k (las columnas del maestro ya no mejoran)
+                lagrangian = float(prices @ b_link)
+                added = 0
+                for k, part in enumerate(parts):
+                    if part['status'] == 'optimal':
+                        lagrangian += part['value']
+                        block_duals[k] = part['duals']
+                        if part['value'] > sigma[k] + tolerance * max(1.0, abs(part['value'])):
+                            columns.append((part['cost'], part['link'], k, part['vector']))
+                            added += 1
+                    elif 'vector' in part:
+                        lagrangian = np.inf
+                        columns.append((part['cost'], part['link'], -2 - k, part['vector']))
+                        added += 1
+                    else:
+                        status = 'error'
+                info['columns'] += added
+                bound = min(bound, lagrangian)
+                value = float(master['optimal_value'])
+                gap = float(max(bound - value, 0.0) / max(1.0, abs(value)))
+                info['gap'] = None if bound == np.inf else gap
+                info['bound_history'].append((time.perf_counter() - start, value,
+                                              None if bound == np.inf else bound, info['gap']))
+                if status is None and (added == 0 or gap <= gap_tolerance):
+                    status = 'optimal'
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            self.solver.cache = cache
+
+        info['wall_time'] = time.perf_counter() - start
+        result = {'status': status, 'decomposition': info,
+                  'variable_names': [f'x{i+1}' for i in range(len(self.c))]}
+        messages = {
+            'unbounded': 'El problema no está acotado',
+            'error': 'Un subproblema no terminó (ni óptimo ni con un rayo)',
+            'iteration_limit': 'Se alcanzó el límite de {} iteraciones del maestro',
+            'time_limit': 'Se alcanzó el límite de tiempo tras {} iteraciones del maestro',
+            'cancelled': 'Resolución cancelada tras {} iteraciones del maestro'
+        }
+        if status in messages:
+            result['message'] = messages[status].format(info['iterations'])
+        if master is not None and master['status'] == 'optimal':
+            result['solution'] = self._combine(columns, master['solution'])
+            result['optimal_value'] = float(master['optimal_value'])
+            if status == 'optimal':
+                result['duals'] = self._duals(master['duals'][:n_link], block_duals)
+        return result
+
+    def _solve_master(self, columns: List[Tuple], b_link: np.ndarray) -> Dict:
+        """Resolver el maestro restringido: filas de enlace y una fila de convexidad por bloque"""
+        n_link, n_blocks = len(b_link), len(self.blocks)
+        A = np.zeros((n_link + n_blocks, len(columns)))
+        c = np.empty(len(columns))
+        for q, (cost, link, block, _) in enumerate(columns):
+            c[q] = cost
+            A[:n_link, q] = link
+            if block >= 0:
+                A[n_link + block, q] = 1.0
+        b = np.concatenate([b_link, np.ones(n_blocks)])
+        if not columns:
+            return {'status': 'optimal', 'solution': np.zeros(0), 'optimal_value': 0.0,
+                    'duals': np.zeros(len(b))}
+        return self.solver.solve(c, A, b, history='none')
+
+    def _combine(self, columns: List[Tuple], weights: np.ndarray) -> np.ndarray:
+        """Solución del modelo original: columnas del maestro y combinación de vectores de cada bloque"""
+        x = np.zeros(len(self.c))
+        for (_, _, block, vector), weight in zip(columns, weights):
+            if block == -1:
+                continue
+            k = block if block >= 0 else -2 - block
+            x[self.blocks[k].cols] += weight * vector
+        x[self.structure.master_cols] = weights[:len(self.structure.master_cols)]
+        return x
+
+    def _duals(self, prices: np.ndarray, block_duals: List[np.ndarray]) -> np.ndarray:
+        """Precios duales del modelo original: π en las filas de enlace y los duales de cada bloque"""
+        duals = np.zeros(len(self.b))
+        duals[self.structure.linking_rows] = prices
+        for block, y in zip(self.blocks, block_duals):
+            duals[block.rows] = y
+        return duals
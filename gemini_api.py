@@ -1,7 +1,9 @@
 import requests
 import json
 import base64
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Optional
+from cancellation import CancellationToken, CancelledError
 
 class GeminiAPI:
     def __init__(self, api_key: str):
@@ -18,12 +20,15 @@ class GeminiAPI:
             'X-goog-api-key': self.api_key
         }
     
-    def analyze_linear_programming_problem(self, image_data: Dict[str, Any]) -> str:
+    def analyze_linear_programming_problem(self, image_data: Dict[str, Any],
+                                           cancel_token: Optional[CancellationToken] = None) -> str:
         """
         Analizar un problema de programación lineal desde una imagen
         
         Args:
             image_data (Dict): Diccionario con los datos de la imagen en base64
+            cancel_token (CancellationToken): Al cancelarlo se abandona la petición
+                                              en curso y se lanza CancelledError
             
         Returns:
             str: Respuesta de Gemini con el análisis y solución
@@ -75,6 +80,7 @@ class GeminiAPI:
         - Restricciones de límite superior (x1 <= valor, x2 <= valor)
         - Restricciones de no negatividad (x1 >= 0, x2 >= 0)
         - Cualquier restricción de límite inferior (x1 >= valor, x2 >= valor)
+        - Si el problema exige valores enteros, una línea como "- x1, x2 enteros"
 
         Usa SIEMPRE el formato exacto mostrado arriba para que el programa pueda leerlo correctamente.
 
@@ -135,12 +141,7 @@ class GeminiAPI:
         
         try:
             # Realizar la petición a la API
-            response = requests.post(
-                self.base_url,
-                headers=self.headers,
-                data=json.dumps(payload),
-                timeout=60
-            )
+            response = self._post(payload, timeout=60, cancel_token=cancel_token)
             
             # Verificar el código de estado
             if response.status_code != 200:
@@ -165,6 +166,8 @@ class GeminiAPI:
             
             return parts[0]['text']
             
+        except CancelledError:
+            raise
         except requests.exceptions.Timeout:
             raise Exception("Timeout al conectar con Gemini API")
         except requests.exceptions.ConnectionError:
@@ -178,6 +181,53 @@ class GeminiAPI:
         except Exception as e:
             raise Exception(f"Error inesperado: {str(e)}")
     
+    def _post(self, payload: Dict[str, Any], timeout: float,
+              cancel_token: Optional[CancellationToken] = None) -> requests.Response:
+        """
+        Enviar una petición a la API
+        
+        Con cancel_token la petición se hace en un hilo auxiliar y este hilo espera
+        la respuesta o la cancelación, lo que ocurra primero; al cancelar se cierra
+        la sesión y la respuesta que llegue después se descarta.
+        
+        Args:
+            payload (Dict): Cuerpo de la petición
+            timeout (float): Tiempo máximo de espera en segundos
+            cancel_token (CancellationToken): Token de cancelación
+            
+        Returns:
+            requests.Response: Respuesta de la API
+        """
+        if cancel_token is None:
+            return requests.post(self.base_url, headers=self.headers,
+                                 data=json.dumps(payload), timeout=timeout)
+        
+        cancel_token.raise_if_cancelled()
+        session = requests.Session()
+        outcome = {}
+        done = threading.Event()
+        
+        def send():
+            try:
+                outcome['response'] = session.post(self.base_url, headers=self.headers,
+                                                   data=json.dumps(payload), timeout=timeout)
+            except Exception as e:
+                outcome['error'] = e
+            finally:
+                done.set()
+        
+        unregister = cancel_token.on_cancel(done.set)
+        threading.Thread(target=send, daemon=True).start()
+        try:
+            done.wait()
+            cancel_token.raise_if_cancelled()
+            if 'error' in outcome:
+                raise outcome['error']
+            return outcome['response']
+        finally:
+            unregister()
+            session.close()
+    
     def test_connection(self) -> bool:
         """
         Probar la conexión con la API de Gemini
@@ -0,0 +1,259 @@
+import time
+import numpy as np
+from typing import Callable, Dict, List, Optional
+from sparse_matrix import is_sparse
+
+
+def _cholesky_solve(L: np.ndarray, rhs: np.ndarray, block: int = 64) -> np.ndarray:
+    """
+    Resolver L·L^T·x = rhs con sustitución por bloques
+
+    Cada bloque diagonal se resuelve con np.linalg.solve y el resto son productos
+    matriz-vector, así el costo es O(m^2) en lugar de refactorizar.
+    """
+    m = L.shape[0]
+    y = np.array(rhs, dtype=float)
+    for start in range(0, m, block):
+        end = min(start + block, m)
+        if start:
+            y[start:end] -= L[start:end, :start] @ y[:start]
+        y[start:end] = np.linalg.solve(L[start:end, start:end], y[start:end])
+    for end in range(m, 0, -block):
+        start = max(end - block, 0)
+        if end < m:
+            y[start:end] -= L[end:, start:end].T @ y[end:]
+        y[start:end] = np.linalg.solve(L[start:end, start:end].T, y[start:end])
+    return y
+
+
+def _cholesky(M: np.ndarray) -> np.ndarray:
+    """Cholesky de M con regularización creciente si no es definida positiva"""
+    shift = 0.0
+    scale = max(float(np.max(np.diag(M))), 1.0)
+    while True:
+        try:
+            if shift:
+                return np.linalg.cholesky(M + shift * np.eye(M.shape[0]))
+            return np.linalg.cholesky(M)
+        except np.linalg.LinAlgError:
+            shift = max(shift * 100.0, 1e-14 * scale)
+
+
+def _step_length(v: np.ndarray, dv: np.ndarray) -> float:
+    """Paso máximo en [0, 1] con v + alpha·dv >= 0"""
+    negative = dv < 0
+    if not np.any(negative):
+        return 1.0
+    return min(1.0, float(np.min(-v[negative] / dv[negative])))
+
+
+class InteriorPoint:
+    """
+    Método de punto interior primal-dual (predictor-corrector de Mehrotra) para
+    max c^T x, Ax <= b, x >= 0.
+
+    Trabaja con la forma estándar min -c^T x, [A | I]·(x, s) = b y en cada iteración
+    resuelve las ecuaciones normales (A·D_x·A^T + D_s)·dy = r con una factorización de
+    Cholesky, que se reutiliza para el paso predictor y el corrector. Una CSRMatrix
+    se densifica, ya que la matriz de las ecuaciones normales es densa.
+    """
+
+    MAX_ITERATIONS = 100
+    # Desplazamiento mínimo del punto inicial, relativo a su escala
+    START_SHIFT = 1e-2
+
+    def __init__(self, tolerance: float = 1e-8, step_factor: float = 0.99):
+        """
+        Args:
+            tolerance: Tolerancia relativa de residuos y brecha de dualidad
+            step_factor: Fracción del paso máximo hasta la frontera
+        """
+        self.tolerance = tolerance
+        self.step_factor = step_factor
+
+    def solve(self, c: np.ndarray, A, b: np.ndarray, max_iterations: int = MAX_ITERATIONS,
+              should_stop: Optional[Callable[[], Optional[str]]] = None,
+              callback: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Resolver el problema
+
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones (densa o CSRMatrix)
+            b: Valores del lado derecho (no negativos)
+            max_iterations: Límite de iteraciones
+            should_stop: Función consultada antes de cada iteración; si devuelve un
+                         estado ('cancelled', 'time_limit') se detiene con él
+            callback: Función llamada con la entrada de gap_history de cada iteración
+
+        Returns:
+            Diccionario con 'status' ('optimal', 'unbounded', 'iteration_limit' o
+            el estado de should_stop), 'x' (variables y holguras), 'duals',
+            'reduced_costs' (z >= 0 de la forma estándar), 'iterations',
+            'gap_history' y 'time'
+        """
+        start = time.perf_counter()
+        A = A.toarray() if is_sparse(A) else np.asarray(A, dtype=float)
+        b = np.asarray(b, dtype=float)
+        n_constraints, n_vars = A.shape
+        cost = np.concatenate([-np.asarray(c, dtype=float), np.zeros(n_constraints)])
+
+        def a_mul(v):
+            return A @ v[:n_vars] + v[n_vars:]
+
+        def at_mul(y):
+            return np.concatenate([A.T @ y, y])
+
+        # Una columna que mejora el objetivo sin consumir recursos es un rayo
+        improving = cost[:n_vars] < 0
+        if np.any(improving & np.all(A <= 0, axis=0)):
+            return self._result('unbounded', np.zeros(n_vars + n_constraints),
+                                np.zeros(n_constraints), np.zeros(n_vars + n_constraints),
+                                0, [], start)
+
+        # Punto inicial de Mehrotra
+        L = _cholesky(A @ A.T + np.eye(n_constraints))
+        x = at_mul(_cholesky_solve(L, b))
+        y = _cholesky_solve(L, a_mul(cost))
+        z = cost - at_mul(y)
+        # El desplazamiento estrictamente positivo deja x y z en el interior aun
+        # cuando ya son >= 0 con x·z = 0 (por ejemplo c = 0)
+        x += max(-1.5 * float(np.min(x)), 0.0) + self.START_SHIFT * (1.0 + float(np.max(np.abs(x))))
+        z += max(-1.5 * float(np.min(z)), 0.0) + self.START_SHIFT * (1.0 + float(np.max(np.abs(z))))
+        xz = float(x @ z)
+        x += 0.5 * xz / max(float(np.sum(z)), 1e-300)
+        z += 0.5 * xz / max(float(np.sum(x)), 1e-300)
+
+        norm_b = 1.0 + float(np.linalg.norm(b))
+        norm_c = 1.0 + float(np.linalg.norm(cost))
+        n_total = n_vars + n_constraints
+        history: List[Dict] = []
+        status = 'iteration_limit'
+        iteration = 0
+
+        while True:
+            r_primal = a_mul(x) - b
+            r_dual = at_mul(y) + z - cost
+            mu = float(x @ z) / n_total
+            primal_obj = float(cost @ x)
+            dual_obj = float(b @ y)
+            gap = abs(primal_obj - dual_obj) / (1.0 + abs(primal_obj))
+            primal_res = float(np.linalg.norm(r_primal)) / norm_b
+            dual_res = float(np.linalg.norm(r_dual)) / norm_c
+            history.append({'iteration': iteration, 'mu': mu, 'gap': gap,
+                            'primal_residual': primal_res, 'dual_residual': dual_res,
+                            'objective': -primal_obj})
+            if callback is not None:
+                callback(history[-1])
+
+            # Con mu = 0 el punto ya es complementario y no hay brecha que reducir
+            if primal_res < self.tolerance and dual_res < self.tolerance and (gap < self.tolerance
+                                                                              or mu <= 0.0):
+                status = 'optimal'
+                break
+            # x crece sin límite mientras el dual sigue infactible: problema no acotado
+            if float(np.max(x)) > 1e10 * norm_b and dual_res > self.tolerance:
+                status = 'unbounded'
+                break
+            if iteration >= max_iterations or mu <= 0.0:
+                break
+            stop = should_stop and should_stop()
+            if stop:
+                status = stop
+                break
+
+            # Ecuaciones normales (A·D_x·A^T + D_s) con D = X·Z^{-1}
+            d = x / z
+            M = (A * d[:n_vars]) @ A.T
+            M[np.diag_indices(n_constraints)] += d[n_vars:]
+            L = _cholesky(M)
+
+            def direction(r_xz):
+                # S·dx + X·dz = -r_xz, A·dx = -r_primal, A^T·dy + dz = -r_dual
+                rhs = -r_primal + a_mul(r_xz / z - d * r_dual)
+                dy = _cholesky_solve(L, rhs)
+                dz = -r_dual - at_mul(dy)
+                dx = -(r_xz + x * dz) / z
+                return dx, dy, dz
+
+            # Predictor (dirección afín)
+            dx, dy, dz = direction(x * z)
+            alpha_p = _step_length(x, dx)
+            alpha_d = _step_length(z, dz)
+            mu_aff = float((x + alpha_p * dx) @ (z + alpha_d * dz)) / n_total
+            sigma = (mu_aff / mu) ** 3
+
+            # Corrector con centrado
+            dx, dy, dz = direction(x * z + dx * dz - sigma * mu)
+            alpha_p = min(1.0, self.step_factor * _step_length(x, dx))
+            alpha_d = min(1.0, self.step_factor * _step_length(z, dz))
+            x += alpha_p * dx
+            y += alpha_d * dy
+            z += alpha_d * dz
+            iteration += 1
+
+        return self._result(status, x, y, z, iteration, history, start)
+
+    @staticmethod
+    def _result(status: str, x: np.ndarray, y: np.ndarray, z: np.ndarray, iteration: int,
+                history: List[Dict], start: float) -> Dict:
+        return {
+            'status': status,
+            'x': x,
+            # Duales del problema de maximización (y >= 0)
+            'duals': -y,
+            'reduced_costs': z,
+            'iterations': iteration,
+            'gap_history': history,
+            'time': time.perf_counter() - start
+        }
+
+
+def crossover_basis(A, x: np.ndarray, z: np.ndarray) -> List[int]:
+    """
+    Elegir una base a partir de la solución de punto interior
+
+    Las columnas de [A | I] se ordenan por x_j / z_j (las más claramente básicas
+    primero). Las holguras candidatas entran directamente; las columnas
+    estructurales candidatas se eliminan con pivoteo parcial sobre las filas libres
+    y se descartan las linealmente dependientes. Las filas que quedan sin pivote se
+    completan con su holgura, de modo que la base siempre es no singular.
+
+    Args:
+        A: Matriz de restricciones (densa o CSRMatrix)
+        x: Variables y holguras de la solución interior
+        z: Costos reducidos de la forma estándar
+
+    Returns:
+        Variables básicas (una por fila)
+    """
+    n_constraints, n_vars = A.shape
+    order = np.argsort(-(x / np.maximum(z, 1e-300)), kind='stable')
+    candidates = order[x[order] > z[order]]
+
+    basis = np.full(n_constraints, -1, dtype=np.int64)
+    slack_rows = candidates[candidates >= n_vars] - n_vars
+    basis[slack_rows] = slack_rows + n_vars
+
+    structural = candidates[candidates < n_vars]
+    free_rows = np.flatnonzero(basis < 0)
+    if len(structural) and len(free_rows):
+        columns = A.columns(structural) if is_sparse(A) else np.asarray(A, dtype=float)[:, structural]
+        W = columns[free_rows]
+        available = np.ones(len(free_rows), dtype=bool)
+        for k, j in enumerate(structural):
+            if not available.any():
+                break
+            column = W[:, k]
+            magnitude = np.where(available, np.abs(column), 0.0)
+            p = int(np.argmax(magnitude))
+            if magnitude[p] <= 1e-9 * max(1.0, float(np.max(np.abs(column)))):
+                continue
+            basis[free_rows[p]] = j
+            available[p] = False
+            if k + 1 < len(structural):
+                W[:, k+1:] -= np.outer(column / column[p], W[p, k+1:])
+
+    missing = np.flatnonzero(basis < 0)
+    basis[missing] = missing + n_vars
+    return [int(j) for j in basis]
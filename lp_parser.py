@@ -0,0 +1,116 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+_NUMBER = r'(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?'
+
+# Cada coincidencia es un término completo (signo, coeficiente y variable), una
+# constante, una relación o una coma; findall recorre la línea una sola vez en C
+_TOKEN_PATTERN = rf"""
+    \s*(?:
+        (?P<term>([+-])?\s*(?:({_NUMBER})\s*\*?\s*)?[xX](\d+))
+      | (?P<constant>([+-])?\s*({_NUMBER}))
+      | (?P<relation><=|>=|≤|≥|=)
+      | (?P<comma>,)
+    )"""
+_TOKEN = re.compile(_TOKEN_PATTERN, re.VERBOSE)
+# La línea completa debe ser una sucesión de tokens
+_LINE = re.compile(rf"(?:{_TOKEN_PATTERN})*\s*", re.VERBOSE)
+
+_RELATIONS = {'<=': '<=', '≤': '<=', '>=': '>=', '≥': '>=', '=': '='}
+
+
+def parse_linear(text: str) -> Tuple[Dict[int, float], Optional[str], float]:
+    """
+    Parsear una expresión o restricción lineal en una sola pasada
+
+    Acepta términos como "3x1", "-x2", "2.5*x3", "1e-3 x4" y constantes en ambos
+    lados. Las variables repetidas se suman y todo se lleva a la forma
+    "términos relación rhs" (las variables del lado derecho pasan al izquierdo y
+    las constantes del izquierdo al derecho). Las comas separan términos, como
+    en "x1, x2 >= 0".
+
+    Args:
+        text: Expresión ("3x1 + 2x2") o restricción ("2x1 + x2 <= 10")
+
+    Returns:
+        Tupla (términos, relación, rhs): términos es un diccionario
+        {índice de variable desde 0: coeficiente}, relación es '<=', '>=', '=' o
+        None si no hay relación
+
+    Raises:
+        ValueError: Si la línea tiene caracteres o términos no válidos
+    """
+    if _LINE.fullmatch(text) is None:
+        raise ValueError(f"Expresión lineal no válida: '{text}'")
+
+    terms: Dict[int, float] = {}
+    relation = None
+    side = 1.0          # -1 en el lado derecho
+    constant = 0.0      # constantes de (izquierdo - derecho)
+    expect_term = True  # al inicio o tras una relación o coma no hace falta signo
+    get = terms.get
+
+    for term, t_sign, t_coef, var, _, c_sign, c_coef, op, _ in _TOKEN.findall(text):
+        if op:
+            if relation is not None:
+                raise ValueError(f"Más de una relación en '{text}'")
+            relation = _RELATIONS[op]
+            side = -1.0
+            expect_term = True
+            continue
+        if term:
+            sign, coef = t_sign, t_coef
+        elif c_coef:
+            sign, coef = c_sign, c_coef
+        else:
+            # Coma
+            expect_term = True
+            continue
+
+        if not sign and not expect_term:
+            raise ValueError(f"Falta un operador entre términos en '{text}'")
+        value = side * (float(coef) if coef else 1.0)
+        if sign == '-':
+            value = -value
+        if term:
+            index = int(var) - 1
+            if index < 0:
+                raise ValueError(f"Índice de variable no válido en '{text}'")
+            terms[index] = get(index, 0.0) + value
+        else:
+            constant += value
+        expect_term = False
+
+    return terms, relation, 0.0 - constant
+
+
+# Marcas de integralidad: "x1, x2 enteros", "x1 y x2 ∈ Z", "x1, x2 >= 0 y enteras",
+# "int x1, x2", "enteras: x1 x2"
+_INTEGER_WORD = r'(?:enter[oa]s?|int(?:eger)?s?|(?:∈|en|in)\s*[Zℤ]\+?)'
+_VARIABLE_LIST = r'[xX]\d+(?:\s*(?:,|\by\b|\band\b)?\s*[xX]\d+)*'
+_INTEGER_SUFFIX = re.compile(
+    rf'\s*({_VARIABLE_LIST})\s*(?:(?:>=|≥)\s*0\s*)?(?:,|\by\b|\band\b)?\s*'
+    rf'(?:(?:son|es|are|is)\s+)?{_INTEGER_WORD}\s*\.?\s*', re.IGNORECASE)
+_INTEGER_PREFIX = re.compile(rf'\s*{_INTEGER_WORD}\s*:?\s*({_VARIABLE_LIST})\s*\.?\s*',
+                             re.IGNORECASE)
+_VARIABLE = re.compile(r'[xX](\d+)')
+
+
+def parse_integrality(text: str) -> Optional[List[int]]:
+    """
+    Reconocer una línea que marca variables como enteras
+
+    Args:
+        text: Línea de restricción, por ejemplo "x1, x2 enteros" o "x1, x2 ∈ Z"
+
+    Returns:
+        Índices (desde 0) de las variables marcadas, o None si la línea no es una
+        marca de integralidad
+    """
+    match = _INTEGER_SUFFIX.fullmatch(text) or _INTEGER_PREFIX.fullmatch(text)
+    if match is None:
+        return None
+    indices = [int(var) - 1 for var in _VARIABLE.findall(match.group(1))]
+    if any(index < 0 for index in indices):
+        raise ValueError(f"Índice de variable no válido en '{text}'")
+    return indices
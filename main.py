@@ -14,6 +14,8 @@ from gemini_api import GeminiAPI
 from image_processor import ImageProcessor
 from config import Config
 from simplex_solver import SimplexSolver
+from solve_cache import SolveCache
+from cancellation import CancellationToken, CancelledError
 
 class LinearProgrammingGUI:
     def __init__(self):
@@ -27,8 +29,11 @@ class LinearProgrammingGUI:
         self.gemini_api = None
         self.image_processor = ImageProcessor()
         self.current_image_path = None
-        self.simplex_solver = SimplexSolver()
+        # Caché de resultados: re-analizar la misma imagen no vuelve a resolver el problema
+        self.simplex_solver = SimplexSolver(cache=SolveCache(
+            os.path.join(self.config.config_dir, ".linear_programming_solver_cache.sqlite")))
         self.current_problem_data = None  # Guardar datos del problema analizado
+        self.cancel_token = None  # Token del análisis o resolución en curso
         
         self.setup_ui()
         self.check_api_key()
@@ -188,6 +193,11 @@ class LinearProgrammingGUI:
         
         self.progress_bar = ttk.Progressbar(self.progress_frame, mode='indeterminate')
         self.progress_bar.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        
+        # Botón para cancelar el análisis o la resolución en curso
+        self.cancel_btn = ttk.Button(self.progress_frame, text="Cancelar",
+                                     command=self.cancel_task, state="disabled")
+        self.cancel_btn.grid(row=0, column=2, padx=(10, 0))
     
     def check_api_key(self):
         """Verificar si hay una API key configurada"""
@@ -262,10 +272,20 @@ class LinearProgrammingGUI:
             return
         
         # Ejecutar en hilo separado para no bloquear la UI
-        threading.Thread(target=self._analyze_image_thread, daemon=True).start()
+        self.cancel_token = CancellationToken()
+        threading.Thread(target=self._analyze_image_thread, args=(self.cancel_token,),
+                         daemon=True).start()
+    
+    def cancel_task(self):
+        """Cancelar el análisis o la resolución en curso"""
+        if self.cancel_token:
+            self.cancel_token.cancel()
+            self.progress_label.config(text="Cancelando...")
+            self.cancel_btn.config(state="disabled")
     
-    def _analyze_image_thread(self):
+    def _analyze_image_thread(self, cancel_token):
         """Hilo para análisis de imagen"""
+        final_message = "Listo"
         try:
             # Actualizar UI
             self.root.after(0, self._update_progress, True, "Procesando imagen...")
@@ -273,18 +293,21 @@ class LinearProgrammingGUI:
             # Procesar imagen
             image_data = self.image_processor.process_image(self.current_image_path)
             
+            cancel_token.raise_if_cancelled()
             self.root.after(0, self._update_progress, True, "Enviando a Gemini AI...")
             
             # Enviar a Gemini
-            response = self.gemini_api.analyze_linear_programming_problem(image_data)
+            response = self.gemini_api.analyze_linear_programming_problem(image_data, cancel_token)
             
             # Mostrar resultado
             self.root.after(0, self._display_result, response)
             
+        except CancelledError:
+            final_message = "Análisis cancelado"
         except Exception as e:
             self.root.after(0, self._show_error, str(e))
         finally:
-            self.root.after(0, self._update_progress, False, "Listo")
+            self.root.after(0, self._update_progress, False, final_message)
     
     def _update_progress(self, active, message):
         """Actualizar barra de progreso"""
@@ -292,9 +315,12 @@ class LinearProgrammingGUI:
         if active:
             self.progress_bar.start()
             self.analyze_btn.config(state="disabled")
+            if not (self.cancel_token and self.cancel_token.cancelled):
+                self.cancel_btn.config(state="normal")
         else:
             self.progress_bar.stop()
             self.analyze_btn.config(state="normal")
+            self.cancel_btn.config(state="disabled")
     
     def _display_result(self, response):
         """Mostrar resultado en el área de texto y generar gráfica"""
@@ -868,9 +894,11 @@ class LinearProgrammingGUI:
             return
         
         # Ejecutar en hilo separado
-        threading.Thread(target=self._solve_simplex_thread, daemon=True).start()
+        self.cancel_token = CancellationToken()
+        threading.Thread(target=self._solve_simplex_thread, args=(self.cancel_token,),
+                         daemon=True).start()
     
-    def _solve_simplex_thread(self):
+    def _solve_simplex_thread(self, cancel_token):
         """Hilo para resolver con Simplex"""
         try:
             self.root.after(0, self._update_progress, True, "Resolviendo con Simplex...")
@@ -884,8 +912,12 @@ class LinearProgrammingGUI:
                 self.root.after(0, self._show_error, "Datos del problema incompletos")
                 return
             
-            # Resolver con Simplex
-            result = self.simplex_solver.solve_from_text(objective, restrictions)
+            # Resolver con Simplex (historial compacto: los tableaux se reconstruyen al mostrarlos)
+            # Las restricciones de una sola variable (x2 <= 5) se manejan como cotas, no como filas
+            result = self.simplex_solver.solve_from_text(objective, restrictions, history='compact',
+                                                         warm_start=True, bounds=True,
+                                                         sensitivity=True,
+                                                         cancel_token=cancel_token)
             
             # Mostrar resultado
             self.root.after(0, self._display_simplex_result, result)
@@ -917,6 +949,25 @@ class LinearProgrammingGUI:
             self.simplex_status_label.config(text="Problema no acotado")
             return
         
+        # Resolución detenida: mostrar la última base (o la mejor solución entera) y las iteraciones hechas
+        branch_and_bound = result.get('branch_and_bound')
+        if result['status'] in ('cancelled', 'time_limit', 'iteration_limit', 'node_limit'):
+            stop_frame = ttk.LabelFrame(self.simplex_content_frame,
+                                        text="RESOLUCIÓN DETENIDA",
+                                        padding="15")
+            stop_frame.pack(fill=tk.X, padx=10, pady=10)
+            ttk.Label(stop_frame, text=result['message'], foreground='orange',
+                      font=('Arial', 12, 'bold')).pack(anchor=tk.W, pady=5)
+            # Ramificación y acotamiento detenido antes de encontrar una solución entera
+            if 'solution' in result:
+                values = ", ".join(f"{var_name} = {val:.4f}" for var_name, val
+                                   in zip(result['variable_names'], result['solution']))
+                prefix = "Mejor solución entera" if branch_and_bound else "Última base"
+                ttk.Label(stop_frame,
+                          text=f"{prefix}: Z = {result['optimal_value']:.4f}; {values}",
+                          font=('Arial', 12)).pack(anchor=tk.W, pady=5)
+            self.simplex_status_label.config(text=result['message'])
+        
         # Mostrar solución óptima
         if result['status'] == 'optimal':
             solution_frame = ttk.LabelFrame(self.simplex_content_frame, 
@@ -944,6 +995,28 @@ class LinearProgrammingGUI:
             vars_label.pack(anchor=tk.W, pady=5)
             
             self.simplex_status_label.config(text="Solución óptima encontrada")
+            
+            # Análisis de sensibilidad sobre la base óptima (sin volver a resolver)
+            if 'sensitivity' in result:
+                self._create_sensitivity_panel(result)
+        
+        # Variables enteras: resumen del árbol; las iteraciones son las de la relajación de la raíz
+        if branch_and_bound:
+            relaxation = result['relaxation'].get('optimal_value')
+            gap = branch_and_bound['gap']
+            summary = (f"Relajación lineal: Z = {relaxation:.4f} | " if relaxation is not None else "")
+            summary += (f"Nodos: {branch_and_bound['nodes']} "
+                        f"({branch_and_bound['nodes_per_second']:.0f} nodos/s) | "
+                        f"Tiempo: {branch_and_bound['wall_time']:.3f} s")
+            if gap is not None:
+                summary += f" | Brecha: {gap:.2%}"
+            bb_frame = ttk.LabelFrame(self.simplex_content_frame,
+                                      text="RAMIFICACIÓN Y ACOTAMIENTO",
+                                      padding="15")
+            bb_frame.pack(fill=tk.X, padx=10, pady=10)
+            ttk.Label(bb_frame, text=summary, font=('Arial', 11)).pack(anchor=tk.W, pady=5)
+            ttk.Label(bb_frame, text="Las tablas siguientes son las de la relajación lineal de la raíz",
+                      font=('Arial', 10), foreground='gray').pack(anchor=tk.W)
         
         # Mostrar iteraciones
         iterations = result.get('iterations', [])
@@ -961,6 +1034,63 @@ class LinearProgrammingGUI:
         self.simplex_content_frame.update_idletasks()
         self.simplex_canvas.configure(scrollregion=self.simplex_canvas.bbox('all'))
     
+    def _create_sensitivity_panel(self, result):
+        """Crear las tablas de sensibilidad: variables (costo reducido y rango de c) y restricciones (precio sombra y rango de b)"""
+        sensitivity = result['sensitivity']
+        panel = ttk.LabelFrame(self.simplex_content_frame,
+                               text="ANÁLISIS DE SENSIBILIDAD",
+                               padding="15")
+        panel.pack(fill=tk.X, padx=10, pady=10)
+        
+        def number(value):
+            if value == float('inf'):
+                return "∞"
+            if value == float('-inf'):
+                return "-∞"
+            return f"{value:.4f}"
+        
+        statuses = {'basic': 'Básica', 'lower': 'En 0', 'upper': 'En su cota'}
+        variables = [
+            (name, number(value), statuses[status], number(reduced),
+             number(low), number(high))
+            for name, value, status, reduced, (low, high)
+            in zip(result['variable_names'], result['solution'], sensitivity['variable_status'],
+                   sensitivity['reduced_costs'], sensitivity['objective_ranges'])
+        ]
+        constraints = [
+            (f"R{i + 1}", number(slack), number(price), number(low), number(high))
+            for i, (slack, price, (low, high))
+            in enumerate(zip(sensitivity['slacks'], sensitivity['shadow_prices'],
+                             sensitivity['rhs_ranges']))
+        ]
+        tables = (
+            ("Variables", ("Variable", "Valor", "Estado", "Costo reducido", "Coef. mínimo", "Coef. máximo"),
+             variables),
+            ("Restricciones", ("Restricción", "Holgura", "Precio sombra", "RHS mínimo", "RHS máximo"),
+             constraints)
+        )
+        for title, headers, rows in tables:
+            ttk.Label(panel, text=title, font=('Arial', 11, 'bold')).pack(anchor=tk.W, pady=(5, 2))
+            table_frame = tk.Frame(panel, relief=tk.SOLID, borderwidth=1)
+            table_frame.pack(anchor=tk.W, pady=(0, 5))
+            for j, header in enumerate(headers):
+                tk.Label(table_frame, text=header, font=('Arial', 10, 'bold'),
+                         relief=tk.RIDGE, borderwidth=1, bg='lightgray',
+                         width=14).grid(row=0, column=j, sticky='nsew')
+            for i, row in enumerate(rows):
+                for j, text in enumerate(row):
+                    tk.Label(table_frame, text=text, font=('Arial', 9, 'bold' if j == 0 else 'normal'),
+                             relief=tk.RIDGE, borderwidth=1,
+                             bg='lightgray' if j == 0 else 'white',
+                             width=14).grid(row=i + 1, column=j, sticky='nsew')
+        
+        note = ("Los rangos indican entre qué valores puede moverse cada coeficiente (uno a la vez) "
+                "sin que cambie la base óptima")
+        if sensitivity['degenerate']:
+            note += "; la solución es degenerada, así que otra base óptima puede dar rangos distintos"
+        ttk.Label(panel, text=note, font=('Arial', 9), foreground='gray',
+                  wraplength=800).pack(anchor=tk.W, pady=(5, 0))
+    
     def _create_iteration_table(self, iter_data):
         """Crear tabla para una iteración del Simplex"""
         iteration_num = iter_data['iteration']
@@ -986,23 +1116,39 @@ class LinearProgrammingGUI:
                                foreground=title_color)
         title_label.pack(anchor=tk.W, pady=(0, 5))
         
+        tableau = iter_data['tableau']
+        
         # Información de pivote
         if iter_data['pivot_row'] >= 0 and iter_data['pivot_col'] >= 0:
             pivot_col_name = iter_data['col_names'][iter_data['pivot_col']]
             pivot_row_name = iter_data['row_names'][iter_data['pivot_row']]
-            pivot_val = iter_data['tableau'][iter_data['pivot_row'], iter_data['pivot_col']]
             
-            pivot_info = f"Columna Pivote: {pivot_col_name} | Fila Pivote: {pivot_row_name} | Elemento Pivote: {pivot_val:.4f}"
+            pivot_info = f"Columna Pivote: {pivot_col_name} | Fila Pivote: {pivot_row_name}"
+            # El tableau guardado es el posterior al pivoteo (allí el pivote ya vale 1)
+            pivot_val = iter_data.get('pivot_element')
+            if pivot_val is not None:
+                pivot_info += f" | Elemento Pivote: {pivot_val:.4f}"
             pivot_label = ttk.Label(iter_frame, text=pivot_info,
                                    font=('Arial', 10),
                                    foreground='darkred')
             pivot_label.pack(anchor=tk.W, pady=(0, 10))
+        elif iter_data['pivot_col'] >= 0:
+            # Cambio de cota del Simplex con variables acotadas: no hay fila pivote
+            pivot_col_name = iter_data['col_names'][iter_data['pivot_col']]
+            pivot_label = ttk.Label(iter_frame,
+                                   text=f"Cambio de cota: {pivot_col_name} pasa a su cota superior (sin pivoteo)",
+                                   font=('Arial', 10),
+                                   foreground='darkred')
+            pivot_label.pack(anchor=tk.W, pady=(0, 10))
+        
+        # El Simplex revisado no construye tableau: solo se muestra el pivote
+        if tableau is None:
+            return
         
         # Crear tabla
         table_frame = tk.Frame(iter_frame, relief=tk.SOLID, borderwidth=1)
         table_frame.pack(fill=tk.BOTH, expand=True)
         
-        tableau = iter_data['tableau']
         col_names = iter_data['col_names']
         row_names = iter_data['row_names']
         pivot_row = iter_data['pivot_row']
@@ -0,0 +1,393 @@
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
+from model_io import LPModel, INF
+from sparse_matrix import CSRMatrix
+from simplex_solver import SimplexSolver
+
+Number = Union[int, float]
+
+
+class Var:
+    """Referencia liviana a una variable de un Model (solo el modelo y el índice)"""
+
+    __slots__ = ('model', 'index')
+
+    def __init__(self, model: 'Model', index: int):
+        self.model = model
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return self.model.var_name(self.index)
+
+    @property
+    def value(self) -> Optional[float]:
+        """Valor en la última solución de Model.solve() (None si no hay)"""
+        solution = self.model.solution
+        return None if solution is None else float(solution[self.index])
+
+    def __repr__(self) -> str:
+        return f"Var({self.name})"
+
+    def _expr(self) -> 'LinExpr':
+        return LinExpr([self.index], [1.0])
+
+    def __mul__(self, coef: Number) -> 'LinExpr':
+        return LinExpr([self.index], [float(coef)])
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> 'LinExpr':
+        return LinExpr([self.index], [-1.0])
+
+    def __add__(self, other) -> 'LinExpr':
+        return self._expr() + other
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> 'LinExpr':
+        return self._expr() - other
+
+    def __rsub__(self, other) -> 'LinExpr':
+        return -self._expr() + other
+
+    def __le__(self, rhs) -> 'Constraint':
+        return self._expr() <= rhs
+
+    def __ge__(self, rhs) -> 'Constraint':
+        return self._expr() >= rhs
+
+    def __eq__(self, rhs) -> 'Constraint':
+        return self._expr() == rhs
+
+    __hash__ = object.__hash__
+
+
+class LinExpr:
+    """
+    Expresión lineal sum(coef·x_j) + constante guardada como dos listas paralelas
+    (índices y coeficientes); los índices repetidos se suman al construir la matriz
+    """
+
+    __slots__ = ('indices', 'coefs', 'constant')
+
+    def __init__(self, indices=None, coefs=None, constant: float = 0.0):
+        self.indices = indices if indices is not None else []
+        self.coefs = coefs if coefs is not None else []
+        self.constant = float(constant)
+
+    @staticmethod
+    def _of(other) -> 'LinExpr':
+        if isinstance(other, LinExpr):
+            return other
+        if isinstance(other, Var):
+            return other._expr()
+        return LinExpr(constant=float(other))
+
+    def __add__(self, other) -> 'LinExpr':
+        # Copia los dos operandos: sum() sobre n términos es O(n²), usar
+        # Model.quicksum o += para acumular muchos términos
+        other = LinExpr._of(other)
+        return LinExpr([*self.indices, *other.indices], [*self.coefs, *other.coefs],
+                       self.constant + other.constant)
+
+    __radd__ = __add__
+
+    def __iadd__(self, other) -> 'LinExpr':
+        # Extiende las listas en el lugar: acumular término a término es lineal
+        other = LinExpr._of(other)
+        if not isinstance(self.indices, list):
+            self.indices = list(self.indices)
+        if not isinstance(self.coefs, list):
+            self.coefs = list(self.coefs)
+        self.indices.extend(other.indices)
+        self.coefs.extend(other.coefs)
+        self.constant += other.constant
+        return self
+
+    def __neg__(self) -> 'LinExpr':
+        return LinExpr(list(self.indices), [-coef for coef in self.coefs], -self.constant)
+
+    def __sub__(self, other) -> 'LinExpr':
+        return self + (-LinExpr._of(other))
+
+    def __rsub__(self, other) -> 'LinExpr':
+        return -self + other
+
+    def __mul__(self, factor: Number) -> 'LinExpr':
+        factor = float(factor)
+        return LinExpr(list(self.indices), [coef * factor for coef in self.coefs],
+                       self.constant * factor)
+
+    __rmul__ = __mul__
+
+    def __le__(self, rhs) -> 'Constraint':
+        return Constraint(self - rhs, '<=')
+
+    def __ge__(self, rhs) -> 'Constraint':
+        return Constraint(self - rhs, '>=')
+
+    def __eq__(self, rhs) -> 'Constraint':
+        return Constraint(self - rhs, '=')
+
+    __hash__ = object.__hash__
+
+    def __repr__(self) -> str:
+        return f"LinExpr({len(self.indices)} términos, constante={self.constant})"
+
+
+class Constraint:
+    """Restricción "expresión relación 0" producida al comparar expresiones"""
+
+    __slots__ = ('expr', 'sense')
+
+    def __init__(self, expr: LinExpr, sense: str):
+        self.expr = expr
+        self.sense = sense
+
+
+class Model:
+    """
+    Constructor de modelos lineales sin pasar por texto.
+
+    Las variables, cotas, coeficientes del objetivo y las tripletas
+    (fila, columna, valor) de las restricciones se guardan en arreglos compactos
+    (array) y to_lp_model() los convierte en un LPModel con A en CSR, que
+    SimplexSolver.solve_model() resuelve directamente. arrays() devuelve el
+    (c, A, b) de la forma estándar para llamar a SimplexSolver.solve.
+
+    Ejemplo:
+        m = Model()
+        x = m.add_var('x')
+        y = m.add_var('y', ub=6)
+        m.add_constraint(x + y <= 12)
+        m.add_constraint(2 * x + y, '<=', 16)
+        m.set_objective(40 * x + 30 * y, sense='max')
+        m.solve()
+    """
+
+    def __init__(self, name: str = ''):
+        """
+        Args:
+            name: Nombre del modelo
+        """
+        self.name = name
+        self.sense = 'max'
+        self.objective_constant = 0.0
+        self._obj = array('d')
+        self._lower = array('d')
+        self._upper = array('d')
+        self._integer = array('b')
+        self._var_names: Dict[int, str] = {}
+        self._rows = array('q')
+        self._cols = array('q')
+        self._vals = array('d')
+        self._row_lower = array('d')
+        self._row_upper = array('d')
+        self._row_names: Dict[int, str] = {}
+        self.solution = None
+        self.result = None
+
+    @property
+    def num_vars(self) -> int:
+        return len(self._obj)
+
+    @property
+    def num_constraints(self) -> int:
+        return len(self._row_lower)
+
+    def var_name(self, index: int) -> str:
+        """Nombre de la variable (x1, x2, ... si no se dio uno)"""
+        return self._var_names.get(index) or f'x{index + 1}'
+
+    def add_var(self, name: Optional[str] = None, lb: float = 0.0, ub: float = INF,
+                obj: float = 0.0, integer: bool = False) -> Var:
+        """
+        Agregar una variable
+
+        Args:
+            name: Nombre (por defecto x<índice>)
+            lb: Cota inferior (-inf para variables libres)
+            ub: Cota superior
+            obj: Coeficiente en la función objetivo
+            integer: Marcar como entera (solve_model resuelve por ramificación y acotamiento)
+
+        Returns:
+            Var
+        """
+        index = len(self._obj)
+        self._obj.append(obj)
+        self._lower.append(lb)
+        self._upper.append(ub)
+        self._integer.append(bool(integer))
+        if name is not None:
+            self._var_names[index] = name
+        return Var(self, index)
+
+    def add_vars(self, count: int, name: Optional[str] = None, lb=0.0, ub=INF, obj=0.0,
+                 integer: bool = False) -> List[Var]:
+        """
+        Agregar varias variables de una vez (cotas y costos escalares o arreglos)
+
+        Args:
+            count: Número de variables
+            name: Prefijo de los nombres (name1, name2, ...); por defecto x<índice>
+            lb, ub, obj: Cotas y coeficientes del objetivo
+            integer: Marcar todas como enteras
+
+        Returns:
+            Lista de Var
+        """
+        start = len(self._obj)
+        for target, values in ((self._obj, obj), (self._lower, lb), (self._upper, ub)):
+            target.frombytes(np.broadcast_to(np.asarray(values, dtype=float), (count,)).tobytes())
+        self._integer.frombytes(bytes([bool(integer)]) * count)
+        if name is not None:
+            self._var_names.update((start + k, f'{name}{k + 1}') for k in range(count))
+        return [Var(self, index) for index in range(start, start + count)]
+
+    @staticmethod
+    def dot(variables: Iterable[Var], coefs) -> LinExpr:
+        """Expresión sum(coefs[k]·variables[k]) sin crear expresiones intermedias"""
+        return LinExpr([var.index for var in variables], [float(coef) for coef in coefs])
+
+    @staticmethod
+    def quicksum(terms: Iterable) -> LinExpr:
+        """
+        Suma de variables, expresiones y números en una sola expresión
+
+        A diferencia de sum(), que copia la expresión acumulada en cada suma
+        (O(n²) en el número de términos), extiende una única expresión.
+
+        Args:
+            terms: Var, LinExpr o números
+
+        Returns:
+            LinExpr
+        """
+        expr = LinExpr()
+        indices, coefs = expr.indices, expr.coefs
+        for term in terms:
+            if isinstance(term, Var):
+                indices.append(term.index)
+                coefs.append(1.0)
+            else:
+                expr += term
+        return expr
+
+    def set_objective(self, expr, sense: str = 'max'):
+        """
+        Fijar la función objetivo (reemplaza los coeficientes obj de add_var)
+
+        Args:
+            expr: LinExpr, Var o número
+            sense: 'max' o 'min'
+        """
+        if sense not in ('max', 'min'):
+            raise ValueError(f"Sentido de optimización desconocido: {sense}")
+        expr = LinExpr._of(expr)
+        obj = np.bincount(np.asarray(expr.indices, dtype=np.int64),
+                          weights=np.asarray(expr.coefs, dtype=float), minlength=self.num_vars)
+        self._obj = array('d', obj)
+        self.objective_constant = expr.constant
+        self.sense = sense
+
+    def add_constraint(self, expr, sense: Optional[str] = None, rhs: float = 0.0,
+                       name: Optional[str] = None) -> int:
+        """
+        Agregar una restricción
+
+        Se puede pasar una comparación (m.add_constraint(x + y <= 12)) o la
+        expresión, la relación y el lado derecho (m.add_constraint(x + y, '<=', 12)).
+
+        Args:
+            expr: Constraint, LinExpr o Var
+            sense: '<=', '>=' o '=' (si expr no es una Constraint)
+            rhs: Lado derecho
+            name: Nombre de la fila (por defecto r<índice>)
+
+        Returns:
+            Índice de la restricción
+        """
+        if isinstance(expr, Constraint):
+            if sense is not None:
+                raise ValueError("La relación ya está en la restricción")
+            expr, sense = expr.expr, expr.sense
+        elif sense is None:
+            raise ValueError("Falta la relación de la restricción")
+        expr = LinExpr._of(expr)
+        return self._add_row(expr.indices, expr.coefs, sense, rhs - expr.constant, name)
+
+    def add_constraint_arrays(self, indices, coefs, sense: str, rhs: float,
+                              name: Optional[str] = None) -> int:
+        """
+        Agregar una restricción desde arreglos de índices de variable y coeficientes
+
+        Es el camino más rápido para modelos generados por programa.
+
+        Returns:
+            Índice de la restricción
+        """
+        return self._add_row(indices, coefs, sense, rhs, name)
+
+    def _add_row(self, indices, coefs, sense: str, rhs: float, name: Optional[str]) -> int:
+        if sense in ('<=', '≤'):
+            lower, upper = -INF, rhs
+        elif sense in ('>=', '≥'):
+            lower, upper = rhs, INF
+        elif sense in ('=', '=='):
+            lower = upper = rhs
+        else:
+            raise ValueError(f"Relación desconocida: {sense}")
+        row = len(self._row_lower)
+        indices = np.asarray(indices, dtype=np.int64)
+        if len(indices) and (indices.min() < 0 or indices.max() >= self.num_vars):
+            raise ValueError("La restricción usa variables que no pertenecen al modelo")
+        coefs = np.asarray(coefs, dtype=float)
+        if len(coefs) != len(indices):
+            raise ValueError("Índices y coeficientes de distinta longitud")
+        self._rows.frombytes(np.full(len(indices), row, dtype=np.int64).tobytes())
+        self._cols.frombytes(indices.tobytes())
+        self._vals.frombytes(coefs.tobytes())
+        self._row_lower.append(lower)
+        self._row_upper.append(upper)
+        if name is not None:
+            self._row_names[row] = name
+        return row
+
+    def to_lp_model(self) -> LPModel:
+        """Convertir el modelo en un LPModel (A en CSR, coeficientes repetidos sumados)"""
+        n_rows, n_cols = self.num_constraints, self.num_vars
+        A = CSRMatrix.from_triplets(np.frombuffer(self._rows, dtype=np.int64),
+                                    np.frombuffer(self._cols, dtype=np.int64),
+                                    np.frombuffer(self._vals, dtype=float), (n_rows, n_cols))
+        col_names = [self.var_name(j) for j in range(n_cols)]
+        row_names = [self._row_names.get(i) or f'r{i + 1}' for i in range(n_rows)]
+        return LPModel(np.array(self._obj), A, np.array(self._row_lower), np.array(self._row_upper),
+                       np.array(self._lower), np.array(self._upper), sense=self.sense,
+                       constant=self.objective_constant, name=self.name,
+                       col_names=col_names, row_names=row_names,
+                       integer=np.frombuffer(self._integer, dtype=np.int8).astype(bool))
+
+    def arrays(self) -> Tuple[np.ndarray, CSRMatrix, np.ndarray]:
+        """(c, A, b) de la forma estándar max c^T x, Ax <= b, x >= 0 para SimplexSolver.solve"""
+        standard = self.to_lp_model().standard_form()
+        return standard.c, standard.A, standard.b
+
+    def solve(self, solver=None, **solve_options) -> Dict:
+        """
+        Resolver el modelo con SimplexSolver.solve_model
+
+        Args:
+            solver: SimplexSolver a usar (por defecto uno nuevo)
+            **solve_options: Opciones para solve
+
+        Returns:
+            Diccionario de resultado; la solución queda disponible en Var.value
+        """
+        if solver is None:
+            solver = SimplexSolver()
+        self.result = solver.solve_model(self.to_lp_model(), **solve_options)
+        self.solution = self.result.get('solution')
+        return self.result
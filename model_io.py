@@ -0,0 +1,882 @@
+import gzip
+import re
+from array import array
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from sparse_matrix import CSRMatrix
+
+INF = float('inf')
+
+
+class LPModel:
+    """
+    Modelo lineal general leído de un archivo MPS o LP:
+
+        optimizar  c^T x + constante
+        sujeto a   row_lower <= A x <= row_upper
+                   lower <= x <= upper
+
+    Las filas de igualdad tienen row_lower == row_upper y las filas sin cota de
+    un lado usan ±inf. A se guarda como CSRMatrix. standard_form() lo lleva a la
+    forma max c^T x, Ax <= b, x >= 0 que resuelve SimplexSolver.
+    """
+
+    def __init__(self, c: np.ndarray, A: CSRMatrix, row_lower: np.ndarray,
+                 row_upper: np.ndarray, lower: Optional[np.ndarray] = None,
+                 upper: Optional[np.ndarray] = None, sense: str = 'min',
+                 constant: float = 0.0, name: str = '',
+                 col_names: Optional[List[str]] = None,
+                 row_names: Optional[List[str]] = None,
+                 integer: Optional[np.ndarray] = None, objective_name: str = 'obj'):
+        """
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones
+            row_lower: Cota inferior de cada fila (-inf si no tiene)
+            row_upper: Cota superior de cada fila (inf si no tiene)
+            lower: Cota inferior de cada variable (por defecto 0)
+            upper: Cota superior de cada variable (por defecto inf)
+            sense: 'min' o 'max'
+            constant: Término constante de la función objetivo
+            name: Nombre del modelo
+            col_names: Nombres de las variables (por defecto x1, x2, ...)
+            row_names: Nombres de las filas (por defecto r1, r2, ...)
+            integer: Máscara de variables enteras (ver SimplexSolver.solve_model)
+            objective_name: Nombre de la fila objetivo
+        """
+        if sense not in ('min', 'max'):
+            raise ValueError(f"Sentido de optimización desconocido: {sense}")
+        n_rows, n_cols = A.shape
+        self.c = np.asarray(c, dtype=float)
+        self.A = A
+        self.row_lower = np.asarray(row_lower, dtype=float)
+        self.row_upper = np.asarray(row_upper, dtype=float)
+        self.lower = np.zeros(n_cols) if lower is None else np.asarray(lower, dtype=float)
+        self.upper = np.full(n_cols, INF) if upper is None else np.asarray(upper, dtype=float)
+        self.sense = sense
+        self.constant = float(constant)
+        self.name = name
+        self.col_names = col_names or [f'x{j+1}' for j in range(n_cols)]
+        self.row_names = row_names or [f'r{i+1}' for i in range(n_rows)]
+        self.integer = np.zeros(n_cols, dtype=bool) if integer is None else np.asarray(integer, dtype=bool)
+        self.objective_name = objective_name
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Dimensiones (filas, variables)"""
+        return self.A.shape
+
+    def integer_bounds(self) -> 'LPModel':
+        """
+        Modelo con las cotas de las variables enteras redondeadas hacia dentro
+        (techo de la inferior, piso de la superior), que no cambia sus valores
+        factibles; así la forma estándar tiene desplazamientos enteros
+
+        Returns:
+            El propio modelo si ya eran enteras; si no, una copia
+        """
+        lower = np.where(self.integer, np.ceil(self.lower - 1e-9), self.lower)
+        upper = np.where(self.integer, np.floor(self.upper + 1e-9), self.upper)
+        if np.array_equal(lower, self.lower) and np.array_equal(upper, self.upper):
+            return self
+        return LPModel(self.c, self.A, self.row_lower, self.row_upper, lower, upper,
+                       self.sense, self.constant, self.name, self.col_names, self.row_names,
+                       self.integer, self.objective_name)
+
+    def standard_form(self, bound_rows: bool = True) -> 'StandardForm':
+        """Llevar el modelo a max c^T x, Ax <= b, x >= 0 (ver StandardForm)"""
+        return StandardForm(self, bound_rows=bound_rows)
+
+
+class StandardForm:
+    """
+    Forma estándar max c^T x', A x' <= b, x' >= 0 de un LPModel.
+
+    Cada variable original se escribe como x = offset + signo·x' (cota inferior
+    finita: x' = x - l; solo cota superior: x' = u - x) o como x = x'+ - x'- si es
+    libre. Las cotas superiores restantes pasan a ser filas x' <= u - l (o, con
+    bound_rows=False, el vector upper para el Simplex con cotas), las filas
+    con cota superior quedan como A x <= u y las de cota inferior como -A x <= -l
+    (las igualdades y las filas con rango dan las dos).
+
+    El Simplex parte de la base de holguras, así que necesita b >= 0 (el origen de
+    la forma estándar es factible, ver origin_feasible); con filas >= o de
+    igualdad con lado derecho positivo solo el punto interior puede resolverla.
+    """
+
+    def __init__(self, model: LPModel, tolerance: float = 1e-10, bound_rows: bool = True):
+        """
+        Args:
+            model: Modelo a transformar
+            tolerance: Tolerancia para considerar b >= 0
+            bound_rows: Si es False las cotas x' <= u - l no se agregan como filas
+                        y quedan en self.upper (inf si no hay cota)
+        """
+        self.model = model
+        n_rows, n_cols = model.shape
+        lower, upper = model.lower, model.upper
+        if np.any(lower > upper):
+            raise ValueError("Hay variables con cota inferior mayor que la superior")
+
+        # Variables de la forma estándar: columna original y signo
+        finite_lower = np.isfinite(lower)
+        flipped = ~finite_lower & np.isfinite(upper)
+        free = ~finite_lower & ~flipped
+        self.offset = np.where(finite_lower, lower, np.where(flipped, upper, 0.0))
+        sign = np.where(flipped, -1.0, 1.0)
+        negative_part = n_cols + np.cumsum(free) - 1
+        self.col_source = np.concatenate([np.arange(n_cols), np.flatnonzero(free)])
+        self.col_sign = np.concatenate([sign, -np.ones(int(free.sum()))])
+        n_std = len(self.col_source)
+
+        # Coeficientes de A sobre las columnas estándar
+        rows, cols, vals = model.A.row_index(), model.A.indices, model.A.data
+        extra = free[cols]
+        rows = np.concatenate([rows, rows[extra]])
+        std_cols = np.concatenate([cols, negative_part[cols[extra]]])
+        vals = np.concatenate([vals * sign[cols], -vals[extra]])
+
+        # El desplazamiento mueve A·offset al lado derecho
+        activity = model.A.matvec(self.offset)
+        has_upper = np.isfinite(model.row_upper)
+        has_lower = np.isfinite(model.row_lower)
+        upper_id = np.cumsum(has_upper) - 1
+        lower_id = int(has_upper.sum()) + np.cumsum(has_lower) - 1
+        in_upper, in_lower = has_upper[rows], has_lower[rows]
+        bounded = np.flatnonzero(finite_lower & np.isfinite(upper))
+        self.upper = None
+        if not bound_rows:
+            self.upper = np.full(n_std, np.inf)
+            self.upper[bounded] = upper[bounded] - lower[bounded]
+            bounded = bounded[:0]
+        n_ineq = int(has_upper.sum() + has_lower.sum())
+
+        out_rows = np.concatenate([upper_id[rows[in_upper]], lower_id[rows[in_lower]],
+                                   n_ineq + np.arange(len(bounded))])
+        out_cols = np.concatenate([std_cols[in_upper], std_cols[in_lower], bounded])
+        out_vals = np.concatenate([vals[in_upper], -vals[in_lower], np.ones(len(bounded))])
+        self.b = np.concatenate([(model.row_upper - activity)[has_upper],
+                                 -(model.row_lower - activity)[has_lower],
+                                 upper[bounded] - lower[bounded]])
+        self.A = CSRMatrix.from_triplets(out_rows, out_cols, out_vals,
+                                         (len(self.b), n_std))
+        self.upper_rows = np.flatnonzero(has_upper)
+        self.lower_rows = np.flatnonzero(has_lower)
+
+        # Sin b >= 0 el origen no es factible y el Simplex no puede partir de la
+        # base de holguras (el punto interior no lo necesita)
+        self.origin_feasible = bool(np.all(self.b >= -tolerance))
+        if self.origin_feasible:
+            self.b = np.maximum(self.b, 0.0)
+
+        objective = model.c if model.sense == 'max' else -model.c
+        self.c = objective[self.col_source] * self.col_sign
+        self.objective_offset = float(model.c @ self.offset) + model.constant
+
+    def solution(self, x_std: np.ndarray) -> np.ndarray:
+        """Valores de las variables originales a partir de la solución estándar"""
+        return self.offset + np.bincount(self.col_source, weights=self.col_sign * x_std,
+                                         minlength=len(self.offset))
+
+    def objective(self, z_std: float) -> float:
+        """Valor de la función objetivo original"""
+        z = z_std if self.model.sense == 'max' else -z_std
+        return float(z + self.objective_offset)
+
+    def duals(self, y_std: np.ndarray) -> np.ndarray:
+        """
+        Precios duales de las filas originales: variación del objetivo original por
+        unidad de aumento de la cota activa de cada fila
+        """
+        n_upper = len(self.upper_rows)
+        y = np.zeros(self.model.shape[0])
+        y[self.upper_rows] += y_std[:n_upper]
+        y[self.lower_rows] -= y_std[n_upper:n_upper + len(self.lower_rows)]
+        return y if self.model.sense == 'max' else -y
+
+
+# ---------------------------------------------------------------------------
+# Lectura
+# ---------------------------------------------------------------------------
+
+class _ModelAccumulator:
+    """Tripletas y nombres acumulados en arreglos compactos durante la lectura"""
+
+    def __init__(self):
+        self.rows = array('q')
+        self.cols = array('q')
+        self.vals = array('d')
+        self.obj_cols = array('q')
+        self.obj_vals = array('d')
+        self.col_index: Dict[str, int] = {}
+        self.row_index: Dict[str, int] = {}
+        self.row_lower = array('d')
+        self.row_upper = array('d')
+        self.bounds: Dict[int, List[float]] = {}
+        self.integer = set()
+
+    def column(self, name: str) -> int:
+        index = self.col_index.get(name)
+        if index is None:
+            index = self.col_index[name] = len(self.col_index)
+        return index
+
+    def add_row(self, name: str, lower: float, upper: float) -> int:
+        if name in self.row_index:
+            raise ValueError(f"Fila repetida: {name}")
+        index = self.row_index[name] = len(self.row_index)
+        self.row_lower.append(lower)
+        self.row_upper.append(upper)
+        return index
+
+    def bound(self, col: int) -> List[float]:
+        bound = self.bounds.get(col)
+        if bound is None:
+            bound = self.bounds[col] = [0.0, INF]
+        return bound
+
+    def build(self, sense: str, constant: float, name: str, objective_name: str) -> LPModel:
+        n_rows, n_cols = len(self.row_index), len(self.col_index)
+        c = np.bincount(np.frombuffer(self.obj_cols, dtype=np.int64),
+                        weights=np.frombuffer(self.obj_vals, dtype=float), minlength=n_cols)
+        A = CSRMatrix.from_triplets(np.frombuffer(self.rows, dtype=np.int64),
+                                    np.frombuffer(self.cols, dtype=np.int64),
+                                    np.frombuffer(self.vals, dtype=float), (n_rows, n_cols))
+        lower, upper = np.zeros(n_cols), np.full(n_cols, INF)
+        for col, (lo, up) in self.bounds.items():
+            lower[col], upper[col] = lo, up
+        integer = np.zeros(n_cols, dtype=bool)
+        integer[list(self.integer)] = True
+        return LPModel(c, A, np.array(self.row_lower), np.array(self.row_upper), lower, upper,
+                       sense=sense, constant=constant, name=name,
+                       col_names=list(self.col_index), row_names=list(self.row_index),
+                       integer=integer, objective_name=objective_name)
+
+
+def _open(path: str, mode: str = 'rt'):
+    """Abrir un archivo de texto, comprimido con gzip si termina en .gz"""
+    if str(path).endswith('.gz'):
+        return gzip.open(path, mode, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def _fixed_fields(line: str) -> List[str]:
+    """Campos de una línea MPS de formato fijo (columnas 2-3, 5-12, 15-22, 25-36, 40-47, 50-61)"""
+    fields = [line[1:3], line[4:12], line[14:22], line[24:36], line[39:47], line[49:61]]
+    fields = [field.strip() for field in fields]
+    while fields and not fields[-1]:
+        fields.pop()
+    return fields[1:] if not fields[0] else fields
+
+
+def read_mps(path: str, fixed: bool = False) -> LPModel:
+    """
+    Leer un modelo en formato MPS libre o fijo, línea por línea
+
+    Secciones: NAME, OBJSENSE, ROWS, COLUMNS (con marcadores INTORG/INTEND),
+    RHS, RANGES, BOUNDS (UP, LO, FX, FR, MI, PL, BV, LI, UI) y ENDATA. La primera
+    fila N es el objetivo; las demás filas N se ignoran.
+
+    Args:
+        path: Ruta del archivo (.mps o .mps.gz)
+        fixed: Formato fijo por columnas (permite espacios en los nombres)
+
+    Returns:
+        LPModel
+    """
+    acc = _ModelAccumulator()
+    name, sense, objective, constant = '', 'min', None, 0.0
+    free_rows = set()
+    senses: Dict[int, str] = {}
+    section = None
+    integer_block = False
+    col_name, col = None, -1
+    row_index = acc.row_index
+    add_row, add_col, add_val = acc.rows.append, acc.cols.append, acc.vals.append
+
+    with _open(path) as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip() or line[0] == '*':
+                continue
+            if not line[0].isspace():
+                words = line.split()
+                section = words[0].upper()
+                if section == 'NAME':
+                    name = line[4:].strip() if fixed else ' '.join(words[1:])
+                elif section == 'OBJSENSE' and len(words) > 1:
+                    sense = 'max' if words[1].upper().startswith('MAX') else 'min'
+                elif section == 'ENDATA':
+                    break
+                elif section not in ('ROWS', 'COLUMNS', 'RHS', 'RANGES', 'BOUNDS', 'OBJSENSE'):
+                    raise ValueError(f"Línea {number}: sección MPS desconocida '{words[0]}'")
+                continue
+
+            fields = _fixed_fields(line) if fixed else line.split()
+            try:
+                if section == 'COLUMNS':
+                    if len(fields) >= 3 and fields[1].strip("'").upper() == 'MARKER':
+                        integer_block = fields[-1].strip("'").upper() == 'INTORG'
+                        continue
+                    # Las líneas de una misma columna son consecutivas
+                    if fields[0] != col_name:
+                        col_name = fields[0]
+                        col = acc.column(col_name)
+                        if integer_block:
+                            acc.integer.add(col)
+                    for k in range(1, len(fields) - 1, 2):
+                        row, value = fields[k], float(fields[k + 1])
+                        if row == objective:
+                            acc.obj_cols.append(col)
+                            acc.obj_vals.append(value)
+                        elif row not in free_rows:
+                            add_row(row_index[row])
+                            add_col(col)
+                            add_val(value)
+                elif section == 'ROWS':
+                    kind, row = fields[0].upper(), fields[1]
+                    if kind == 'N':
+                        if objective is None:
+                            objective = row
+                        else:
+                            free_rows.add(row)
+                    elif kind in ('L', 'G', 'E'):
+                        i = acc.add_row(row, -INF if kind == 'L' else 0.0, INF if kind == 'G' else 0.0)
+                        senses[i] = kind
+                    else:
+                        raise ValueError(f"tipo de fila desconocido '{fields[0]}'")
+                elif section in ('RHS', 'RANGES'):
+                    # El nombre del conjunto es opcional en formato libre
+                    start = len(fields) % 2
+                    for k in range(start, len(fields) - 1, 2):
+                        row, value = fields[k], float(fields[k + 1])
+                        if row == objective:
+                            if section == 'RHS':
+                                constant = -value
+                            continue
+                        if row in free_rows:
+                            continue
+                        i = acc.row_index[row]
+                        if section == 'RHS':
+                            _set_rhs(acc, i, senses[i], value)
+                        else:
+                            _set_range(acc, i, senses[i], value)
+                elif section == 'BOUNDS':
+                    kind = fields[0].upper()
+                    has_value = kind in ('UP', 'LO', 'FX', 'LI', 'UI')
+                    col_field = 2 if len(fields) == (4 if has_value else 3) else 1
+                    col = acc.column(fields[col_field])
+                    value = float(fields[col_field + 1]) if has_value else 0.0
+                    _set_bound(acc, col, kind, value)
+                elif section == 'OBJSENSE':
+                    sense = 'max' if fields[0].upper().startswith('MAX') else 'min'
+                else:
+                    raise ValueError("datos fuera de una sección")
+            except (KeyError, IndexError, ValueError) as e:
+                raise ValueError(f"Línea {number}: {e}") from None
+
+    return acc.build(sense, constant, name, objective or 'obj')
+
+
+def _set_rhs(acc: _ModelAccumulator, i: int, kind: str, value: float):
+    """Fijar el lado derecho de una fila L, G o E"""
+    if kind == 'L':
+        acc.row_upper[i] = value
+    elif kind == 'G':
+        acc.row_lower[i] = value
+    else:
+        acc.row_lower[i] = acc.row_upper[i] = value
+
+
+def _set_range(acc: _ModelAccumulator, i: int, kind: str, value: float):
+    """Aplicar un RANGES sobre una fila cuyo RHS ya se leyó"""
+    if kind == 'L':
+        acc.row_lower[i] = acc.row_upper[i] - abs(value)
+    elif kind == 'G':
+        acc.row_upper[i] = acc.row_lower[i] + abs(value)
+    elif value >= 0:
+        acc.row_upper[i] = acc.row_lower[i] + value
+    else:
+        acc.row_lower[i] = acc.row_upper[i] + value
+
+
+def _set_bound(acc: _ModelAccumulator, col: int, kind: str, value: float):
+    """Aplicar una cota de la sección BOUNDS"""
+    bound = acc.bound(col)
+    if kind in ('UP', 'UI'):
+        # Convención MPS: una cota superior negativa sin cota inferior la vuelve -inf
+        if value < 0 and bound[0] == 0.0:
+            bound[0] = -INF
+        bound[1] = value
+    elif kind in ('LO', 'LI'):
+        bound[0] = value
+    elif kind == 'FX':
+        bound[0] = bound[1] = value
+    elif kind == 'FR':
+        bound[0], bound[1] = -INF, INF
+    elif kind == 'MI':
+        bound[0] = -INF
+    elif kind == 'PL':
+        bound[1] = INF
+    elif kind == 'BV':
+        bound[0], bound[1] = 0.0, 1.0
+    else:
+        raise ValueError(f"tipo de cota no soportado '{kind}'")
+    if kind in ('LI', 'UI', 'BV'):
+        acc.integer.add(col)
+
+
+# Formato LP: nombres como los de CPLEX, números, relaciones, signos y ':'
+_LP_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<name>[A-Za-z_!"\#$%&()/,.;?@'{}|~][A-Za-z0-9_!"\#$%&()/,.;?@'{}|~\[\]^]*)
+      | (?P<relation><=|>=|=<|=>|<|>|=)
+      | (?P<sign>[+-])
+      | (?P<colon>:)
+    )""", re.VERBOSE)
+
+_LP_SECTIONS = [
+    (re.compile(r'(maximi[sz]e|maximum|max)\b', re.I), 'max'),
+    (re.compile(r'(minimi[sz]e|minimum|min)\b', re.I), 'min'),
+    (re.compile(r'(subject\s+to|such\s+that|st|s\.t\.)(?=\s|$)', re.I), 'constraints'),
+    (re.compile(r'bounds?\b', re.I), 'bounds'),
+    (re.compile(r'(generals?|gen|integers?)\b', re.I), 'general'),
+    (re.compile(r'(binary|binaries|bin)\b', re.I), 'binary'),
+    (re.compile(r'end\b', re.I), 'end'),
+]
+
+_LP_RELATIONS = {'<=': '<=', '=<': '<=', '<': '<=', '>=': '>=', '=>': '>=', '>': '>=', '=': '='}
+
+
+def _lp_tokens(text: str, number: int) -> List[Tuple[str, str]]:
+    """Tokens (tipo, texto) de una línea LP"""
+    tokens = []
+    pos, end = 0, len(text)
+    while pos < end:
+        token = _LP_TOKEN.match(text, pos)
+        if token is None:
+            if text[pos:].strip():
+                raise ValueError(f"Línea {number}: carácter inesperado '{text[pos:].strip()[0]}'")
+            break
+        pos = token.end()
+        kind = token.lastgroup
+        value = token.group(kind)
+        if kind == 'name' and value.lower() in ('inf', 'infinity'):
+            kind, value = 'number', 'inf'
+        elif kind == 'relation':
+            value = _LP_RELATIONS[value]
+        tokens.append((kind, value))
+    return tokens
+
+
+def _lp_expression(tokens: List[Tuple[str, str]], start: int, acc: _ModelAccumulator,
+                   number: int) -> Tuple[List[Tuple[int, float]], float, int]:
+    """
+    Leer una expresión lineal desde tokens[start] hasta la siguiente relación
+
+    Returns:
+        (términos [(columna, coeficiente)], constante, posición del siguiente token)
+    """
+    terms, constant = [], 0.0
+    sign, coef = 1.0, None
+    k = start
+    while k < len(tokens):
+        kind, value = tokens[k]
+        if kind == 'relation':
+            break
+        if kind == 'sign':
+            if coef is not None:
+                constant += sign * coef
+                sign, coef = 1.0, None
+            if value == '-':
+                sign = -sign
+        elif kind == 'number':
+            coef = float(value)
+        elif kind == 'name':
+            terms.append((acc.column(value), sign * (1.0 if coef is None else coef)))
+            sign, coef = 1.0, None
+        else:
+            raise ValueError(f"Línea {number}: token inesperado '{value}'")
+        k += 1
+    if coef is not None:
+        constant += sign * coef
+    return terms, constant, k
+
+
+def _lp_number(tokens: List[Tuple[str, str]], k: int, number: int) -> Tuple[float, int]:
+    """Leer un número con signo opcional"""
+    sign = 1.0
+    while k < len(tokens) and tokens[k][0] == 'sign':
+        if tokens[k][1] == '-':
+            sign = -sign
+        k += 1
+    if k >= len(tokens) or tokens[k][0] != 'number':
+        raise ValueError(f"Línea {number}: se esperaba un número")
+    return sign * float(tokens[k][1]), k + 1
+
+
+def _lp_statement_complete(tokens: List[Tuple[str, str]]) -> bool:
+    """Una restricción termina con relación seguida de un número (dos si es un rango)"""
+    body = tokens[2:] if len(tokens) > 1 and tokens[1][0] == 'colon' else tokens
+    relations = [k for k, (kind, _) in enumerate(body) if kind == 'relation']
+    needed = 2 if body and body[0][0] in ('number', 'sign') and relations and \
+        all(kind in ('number', 'sign') for kind, _ in body[:relations[0]]) else 1
+    if len(relations) < needed:
+        return False
+    tail = body[relations[needed - 1] + 1:]
+    return any(kind == 'number' for kind, _ in tail)
+
+
+def read_lp(path: str) -> LPModel:
+    """
+    Leer un modelo en formato LP de CPLEX, línea por línea
+
+    Secciones: Maximize/Minimize, Subject To, Bounds, Generals, Binaries y End.
+    Las expresiones pueden ocupar varias líneas; las restricciones pueden tener
+    nombre ("c1: ...") y ser rangos ("2 <= x + y <= 5"). Las cotas aceptan
+    "x <= 4", "-inf <= x <= 5", "x = 3" y "x free".
+
+    Args:
+        path: Ruta del archivo (.lp o .lp.gz)
+
+    Returns:
+        LPModel
+    """
+    acc = _ModelAccumulator()
+    sense, constant, objective_name = 'min', 0.0, 'obj'
+    section = None
+    pending: List[Tuple[str, str]] = []
+    pending_line = 0
+
+    def flush_objective():
+        nonlocal constant, objective_name
+        tokens = pending
+        if len(tokens) > 1 and tokens[1][0] == 'colon':
+            objective_name, tokens = tokens[0][1], tokens[2:]
+        terms, const, k = _lp_expression(tokens, 0, acc, pending_line)
+        if k != len(tokens):
+            raise ValueError(f"Línea {pending_line}: relación en la función objetivo")
+        for col, value in terms:
+            acc.obj_cols.append(col)
+            acc.obj_vals.append(value)
+        constant += const
+
+    def flush_constraint():
+        tokens = pending
+        name = f'r{len(acc.row_index) + 1}'
+        if len(tokens) > 1 and tokens[1][0] == 'colon':
+            name, tokens = tokens[0][1], tokens[2:]
+        k, lower_range = 0, None
+        if tokens and tokens[0][0] in ('number', 'sign'):
+            # Rango "l <= expresión <= u" (o al revés con >=)
+            left, k = _lp_number(tokens, 0, pending_line)
+            if k < len(tokens) and tokens[k][0] == 'relation':
+                lower_range = (left, tokens[k][1])
+                k += 1
+            else:
+                k = 0
+        terms, const, k = _lp_expression(tokens, k, acc, pending_line)
+        if k >= len(tokens):
+            raise ValueError(f"Línea {pending_line}: restricción sin relación")
+        relation = tokens[k][1]
+        rhs, k = _lp_number(tokens, k + 1, pending_line)
+        if k != len(tokens):
+            raise ValueError(f"Línea {pending_line}: tokens de más en la restricción")
+        rhs -= const
+        lower, upper = -INF, INF
+        if relation in ('<=', '='):
+            upper = rhs
+        if relation in ('>=', '='):
+            lower = rhs
+        if lower_range is not None:
+            bound, op = lower_range[0] - const, lower_range[1]
+            if op == '<=':
+                lower = max(lower, bound)
+            elif op == '>=':
+                upper = min(upper, bound)
+            else:
+                lower = upper = bound
+        i = acc.add_row(name, lower, upper)
+        for col, value in terms:
+            acc.rows.append(i)
+            acc.cols.append(col)
+            acc.vals.append(value)
+
+    def flush():
+        nonlocal pending
+        if pending:
+            if section in ('max', 'min'):
+                flush_objective()
+            elif section == 'constraints':
+                flush_constraint()
+        pending = []
+
+    with _open(path) as f:
+        for number, line in enumerate(f, 1):
+            line = line.split('\\', 1)[0]
+            text = line.strip()
+            if not text:
+                continue
+            for pattern, new_section in _LP_SECTIONS:
+                keyword = pattern.match(text)
+                if keyword:
+                    flush()
+                    section = new_section
+                    if section in ('max', 'min'):
+                        sense = section
+                    text = text[keyword.end():].strip()
+                    break
+            if section == 'end':
+                break
+            if not text:
+                continue
+
+            if section in ('max', 'min', 'constraints'):
+                tokens = _lp_tokens(text, number)
+                if section == 'constraints' and pending and len(tokens) > 1 \
+                        and tokens[1][0] == 'colon' and _lp_statement_complete(pending):
+                    flush()
+                if not pending:
+                    pending_line = number
+                pending.extend(tokens)
+                if section == 'constraints' and _lp_statement_complete(pending):
+                    flush()
+            elif section == 'bounds':
+                _lp_bound(_lp_tokens(text, number), acc, number)
+            elif section in ('general', 'binary'):
+                for name in text.split():
+                    col = acc.column(name)
+                    acc.integer.add(col)
+                    if section == 'binary':
+                        acc.bound(col)[:] = [0.0, 1.0]
+            else:
+                raise ValueError(f"Línea {number}: datos fuera de una sección")
+        flush()
+
+    return acc.build(sense, constant, '', objective_name)
+
+
+def _lp_bound(tokens: List[Tuple[str, str]], acc: _ModelAccumulator, number: int):
+    """Aplicar una línea de la sección Bounds"""
+    if len(tokens) == 2 and tokens[0][0] == 'name' and tokens[1][1].lower() == 'free':
+        acc.bound(acc.column(tokens[0][1]))[:] = [-INF, INF]
+        return
+    k, left = 0, None
+    if tokens and tokens[0][0] in ('number', 'sign'):
+        value, k = _lp_number(tokens, 0, number)
+        left = (value, tokens[k][1])
+        k += 1
+    if k >= len(tokens) or tokens[k][0] != 'name':
+        raise ValueError(f"Línea {number}: cota sin variable")
+    bound = acc.bound(acc.column(tokens[k][1]))
+    k += 1
+
+    def apply(value: float, relation: str):
+        # relation se lee como "variable relation value"
+        if relation in ('>=', '='):
+            bound[0] = value
+        if relation in ('<=', '='):
+            bound[1] = value
+
+    if left is not None:
+        value, op = left
+        apply(value, {'<=': '>=', '>=': '<=', '=': '='}[op])
+    if k < len(tokens):
+        if tokens[k][0] != 'relation':
+            raise ValueError(f"Línea {number}: cota no válida")
+        value, end = _lp_number(tokens, k + 1, number)
+        if end != len(tokens):
+            raise ValueError(f"Línea {number}: tokens de más en la cota")
+        apply(value, tokens[k][1])
+
+
+def read_model(path: str) -> LPModel:
+    """Leer un modelo MPS (libre) o LP según la extensión (.mps, .lp, opcionalmente .gz)"""
+    base = str(path)[:-3] if str(path).endswith('.gz') else str(path)
+    if base.lower().endswith('.lp'):
+        return read_lp(path)
+    if base.lower().endswith('.mps'):
+        return read_mps(path)
+    raise ValueError(f"Extensión de modelo desconocida: {path}")
+
+
+# ---------------------------------------------------------------------------
+# Escritura
+# ---------------------------------------------------------------------------
+
+def _number(value: float, width: Optional[int] = None) -> str:
+    """Número con precisión completa o, si se da width, con la mayor que quepa"""
+    text = repr(float(value))
+    digits = width or 17
+    while width is not None and len(text) > width:
+        digits -= 1
+        text = f"{value:.{digits}g}"
+    return text
+
+
+def write_mps(model: LPModel, path: str, fixed: bool = False):
+    """
+    Escribir el modelo en formato MPS libre o fijo, fila por fila
+
+    Las filas con rango se escriben con RANGES, el sentido 'max' con OBJSENSE y
+    las variables enteras entre marcadores INTORG/INTEND.
+
+    Args:
+        model: Modelo a escribir
+        path: Ruta del archivo (.gz para comprimir)
+        fixed: Formato fijo por columnas (los nombres deben tener hasta 8 caracteres)
+    """
+    names = model.col_names
+    rows = model.row_names
+    if fixed and any(len(name) > 8 for name in names + rows + [model.objective_name]):
+        raise ValueError("El formato MPS fijo admite nombres de hasta 8 caracteres")
+
+    def number(value: float) -> str:
+        return _number(value, 12 if fixed else None)
+
+    def record(*fields: str) -> str:
+        if fixed:
+            layout = [(1, 2), (4, 8), (14, 8), (24, 12), (39, 8), (49, 12)]
+            line = ''
+            for (column, width), field in zip(layout, fields):
+                line = line.ljust(column) + field.ljust(width)
+            return line.rstrip() + '\n'
+        return ' ' + ' '.join(fields) + '\n'
+
+    lower, upper = model.row_lower, model.row_upper
+    kinds = np.where(lower == upper, 'E', np.where(np.isinf(lower), 'L', 'G'))
+    rhs = np.where(kinds == 'G', lower, upper)
+    ranged = np.isfinite(lower) & np.isfinite(upper) & (lower != upper)
+    kinds[ranged] = 'L'
+    rhs[ranged] = upper[ranged]
+
+    values, row_of, colptr = model.A._column_storage()
+    with _open(path, 'wt') as f:
+        f.write(f"NAME          {model.name}\n" if fixed else f"NAME {model.name}\n")
+        if model.sense == 'max':
+            f.write("OBJSENSE\n" + record('', 'MAX') if fixed else "OBJSENSE\n    MAX\n")
+        f.write("ROWS\n")
+        f.write(record('N', model.objective_name))
+        for name, kind in zip(rows, kinds):
+            f.write(record(str(kind), name))
+
+        f.write("COLUMNS\n")
+        integer_block, marker = False, 0
+        for j, name in enumerate(names):
+            if model.integer[j] != integer_block:
+                integer_block = bool(model.integer[j])
+                f.write(record('', f'MARKER{marker}', "'MARKER'", '',
+                               "'INTORG'" if integer_block else "'INTEND'"))
+                marker += 1
+            entries = []
+            if model.c[j] != 0:
+                entries.append((model.objective_name, model.c[j]))
+            start, end = colptr[j], colptr[j + 1]
+            entries.extend((rows[i], v) for i, v in zip(row_of[start:end], values[start:end]))
+            if not entries:
+                entries.append((model.objective_name, 0.0))
+            for k in range(0, len(entries), 2):
+                fields = ['', name]
+                for row, value in entries[k:k + 2]:
+                    fields += [row, number(value)]
+                f.write(record(*fields))
+        if integer_block:
+            f.write(record('', f'MARKER{marker}', "'MARKER'", '', "'INTEND'"))
+
+        f.write("RHS\n")
+        if model.constant:
+            f.write(record('', 'RHS', model.objective_name, number(-model.constant)))
+        for name, value in zip(rows, rhs):
+            if value != 0:
+                f.write(record('', 'RHS', name, number(value)))
+
+        if np.any(ranged):
+            f.write("RANGES\n")
+            for i in np.flatnonzero(ranged):
+                f.write(record('', 'RNG', rows[i], number(upper[i] - lower[i])))
+
+        f.write("BOUNDS\n")
+        for j, name in enumerate(names):
+            lo, up = model.lower[j], model.upper[j]
+            if lo == up:
+                f.write(record('FX', 'BND', name, number(lo)))
+                continue
+            if lo == -INF and up == INF:
+                f.write(record('FR', 'BND', name))
+                continue
+            if lo == -INF:
+                f.write(record('MI', 'BND', name))
+            elif lo != 0:
+                f.write(record('LO', 'BND', name, number(lo)))
+            if up != INF:
+                f.write(record('UP', 'BND', name, number(up)))
+        f.write("ENDATA\n")
+
+
+def write_lp(model: LPModel, path: str, terms_per_line: int = 8):
+    """
+    Escribir el modelo en formato LP de CPLEX
+
+    Las filas con rango se escriben como "nombre: l <= expresión <= u".
+
+    Args:
+        model: Modelo a escribir
+        path: Ruta del archivo (.gz para comprimir)
+        terms_per_line: Términos por línea en expresiones largas
+    """
+    names = model.col_names
+
+    def expression(cols, values) -> str:
+        parts = []
+        for k, (j, value) in enumerate(zip(cols, values)):
+            sign = '-' if value < 0 else '+'
+            term = f"{sign} {_number(abs(value))} {names[j]}"
+            if k and k % terms_per_line == 0:
+                term = '\n   ' + term
+            parts.append(term)
+        return ' '.join(parts) if parts else '0 ' + names[0] if names else '0'
+
+    with _open(path, 'wt') as f:
+        f.write("\\ " + (model.name or 'modelo') + "\n")
+        f.write("Maximize\n" if model.sense == 'max' else "Minimize\n")
+        nonzero = np.flatnonzero(model.c)
+        objective = expression(nonzero, model.c[nonzero])
+        if model.constant:
+            objective += f" {'-' if model.constant < 0 else '+'} {_number(abs(model.constant))}"
+        f.write(f" {model.objective_name}: {objective}\n")
+
+        f.write("Subject To\n")
+        for i, name in enumerate(model.row_names):
+            cols, values = model.A.row(i)
+            lo, up = model.row_lower[i], model.row_upper[i]
+            body = expression(cols, values)
+            if lo == up:
+                f.write(f" {name}: {body} = {_number(up)}\n")
+            elif np.isinf(lo):
+                f.write(f" {name}: {body} <= {_number(up)}\n")
+            elif np.isinf(up):
+                f.write(f" {name}: {body} >= {_number(lo)}\n")
+            else:
+                f.write(f" {name}: {_number(lo)} <= {body} <= {_number(up)}\n")
+
+        f.write("Bounds\n")
+        for j, name in enumerate(names):
+            lo, up = model.lower[j], model.upper[j]
+            if lo == 0 and up == INF:
+                continue
+            if lo == -INF and up == INF:
+                f.write(f" {name} free\n")
+            elif lo == up:
+                f.write(f" {name} = {_number(lo)}\n")
+            elif lo == 0:
+                f.write(f" {name} <= {_number(up)}\n")
+            else:
+                left = '-inf' if lo == -INF else _number(lo)
+                right = 'inf' if up == INF else _number(up)
+                f.write(f" {left} <= {name} <= {right}\n")
+
+        if np.any(model.integer):
+            f.write("Generals\n")
+            for j in np.flatnonzero(model.integer):
+                f.write(f" {names[j]}\n")
+        f.write("End\n")
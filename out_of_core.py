@@ -0,0 +1,77 @@
+import os
+import tempfile
+import numpy as np
+from typing import Optional
+from sparse_matrix import is_sparse
+
+# Tamaño por defecto de un bloque de filas al pivotear un tableau en disco: es
+# el buffer residente del kernel de pivoteo (el resto lo pagina el sistema)
+DEFAULT_BLOCK_BYTES = 64 << 20
+
+
+def block_rows_for(n_cols: int, block_bytes: int = DEFAULT_BLOCK_BYTES) -> int:
+    """
+    Filas por bloque para que un bloque ocupe unos block_bytes
+
+    Args:
+        n_cols: Columnas del tableau (incluyendo RHS)
+        block_bytes: Bytes por bloque
+
+    Returns:
+        Número de filas (al menos 1)
+    """
+    return max(1, block_bytes // (8 * max(n_cols, 1)))
+
+
+def disk_tableau(c: np.ndarray, A, b: np.ndarray, scratch_dir: Optional[str] = None,
+                 block_rows: Optional[int] = None) -> np.memmap:
+    """
+    Construir el tableau inicial [A | I | b; -c | 0 | 0] en un archivo temporal
+    mapeado en memoria (np.memmap)
+
+    El archivo se crea con tempfile.TemporaryFile, no tiene nombre visible y el
+    sistema lo borra al liberar el tableau, también si la resolución falla. Su
+    espacio se reserva al crearlo: un disco lleno da OSError aquí y no un error
+    de bus a mitad de la resolución. Se llena por bloques de filas, de modo que
+    una A densa también puede ser un np.memmap.
+
+    Args:
+        c: Coeficientes de la función objetivo
+        A: Matriz de restricciones (densa, np.memmap o CSRMatrix)
+        b: Valores del lado derecho
+        scratch_dir: Directorio del archivo (por defecto el temporal del sistema)
+        block_rows: Filas por bloque al copiar A (por defecto block_rows_for)
+
+    Returns:
+        Tableau de (n_restricciones + 1) x (n_variables + n_restricciones + 1)
+    """
+    if scratch_dir is not None and not os.path.isdir(scratch_dir):
+        raise ValueError(f"El directorio de trabajo no existe: {scratch_dir}")
+    n_vars = len(c)
+    n_constraints = len(b)
+    shape = (n_constraints + 1, n_vars + n_constraints + 1)
+    if block_rows is None:
+        block_rows = block_rows_for(shape[1])
+
+    size = shape[0] * shape[1] * np.dtype(float).itemsize
+    # El mapeo conserva el archivo abierto: el descriptor se cierra al crearlo
+    with tempfile.TemporaryFile(dir=scratch_dir, suffix='.tableau') as scratch:
+        # El archivo nuevo se lee como ceros: solo se escriben A, la identidad, b y -c
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(scratch.fileno(), 0, size)
+        else:
+            scratch.truncate(size)
+        tableau = np.memmap(scratch, dtype=float, mode='r+', shape=shape)
+
+    b = np.asarray(b, dtype=float)
+    if is_sparse(A):
+        A.scatter_into(tableau)
+    for start in range(0, n_constraints, block_rows):
+        end = min(start + block_rows, n_constraints)
+        if not is_sparse(A):
+            tableau[start:end, :n_vars] = A[start:end]
+        rows = np.arange(start, end)
+        tableau[rows, n_vars + rows] = 1.0
+        tableau[start:end, -1] = b[start:end]
+    tableau[-1, :n_vars] = -np.asarray(c)
+    return tableau
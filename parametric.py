@@ -0,0 +1,221 @@
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+from pivot_kernel import PivotKernel
+
+# Magnitud mínima de un coeficiente del tableau en las pruebas de cociente
+TOLERANCE = 1e-10
+
+
+def _next_crossing(base: np.ndarray, slope: np.ndarray, t: float) -> Tuple[float, int]:
+    """
+    Primer t' >= t en que alguna de las rectas base + t'·slope (>= 0 en t) se
+    hace negativa
+
+    Args:
+        base: Valores en t = 0
+        slope: Pendientes
+        t: Valor actual del parámetro
+
+    Returns:
+        Tuple con (t', índice); (inf, -1) si ninguna decrece
+    """
+    falling = np.flatnonzero(slope < -TOLERANCE)
+    if len(falling) == 0:
+        return np.inf, -1
+    crossings = np.maximum(-base[falling] / slope[falling], t)
+    first = crossings.min()
+    # Entre empates, el menor índice (regla de Bland)
+    return float(first), int(falling[np.argmax(crossings <= first + TOLERANCE * max(1.0, abs(first)))])
+
+
+def _piece(interval: Tuple[float, float], basic_vars: List[int], n_vars: int,
+           x_base: np.ndarray, x_slope: np.ndarray, duals: Tuple[np.ndarray, np.ndarray],
+           value: Tuple[float, float]) -> Dict:
+    """Tramo del barrido: todo es lineal en t con la base fija"""
+    solution = np.zeros((2, len(duals[0]) + n_vars))
+    solution[0, basic_vars] = x_base
+    solution[1, basic_vars] = x_slope
+    return {
+        'interval': interval,
+        'basic_vars': list(basic_vars),
+        'solution': (solution[0, :n_vars], solution[1, :n_vars]),
+        'duals': (duals[0].copy(), duals[1].copy()),
+        'value': (float(value[0]), float(value[1]))
+    }
+
+
+def _sweep(tableau: np.ndarray, basic_vars: List[int], parameter: str, t_start: float,
+           t_end: float, max_pivots: int, should_stop: Optional[Callable]) -> Dict:
+    """
+    Recorrer [t_start, t_end] pivoteando solo en los cambios de base
+
+    El tableau aumentado tiene una fila de más (fila Z de la dirección, con
+    'objective') o una columna de más (B^-1·g, con 'rhs'), de modo que los
+    costos reducidos o los valores de las básicas son base + t·pendiente.
+    """
+    n_constraints = len(basic_vars)
+    n_cols = tableau.shape[1] - (1 if parameter == 'objective' else 2)
+    n_vars = n_cols - n_constraints
+    slacks = slice(n_vars, n_cols)
+    kernel = PivotKernel(tableau.shape)
+    basic_vars = list(basic_vars)
+    pieces, breakpoints = [], []
+    status, pivots, start = 'optimal', 0, t_start
+
+    while True:
+        if parameter == 'objective':
+            # Costos reducidos z + t·z_d de las no básicas; la que llega a 0 entra
+            t_next, col = _next_crossing(tableau[-2, :-1], tableau[-1, :-1], start)
+            rows = tableau[:n_constraints]
+            x_base, x_slope = rows[:, -1], np.zeros(n_constraints)
+            duals = (tableau[-2, slacks], tableau[-1, slacks])
+            value = (tableau[-2, -1], tableau[-1, -1])
+        else:
+            # Valores de las básicas B^-1·b + t·B^-1·g; la que llega a 0 sale
+            t_next, row = _next_crossing(tableau[:-1, -2], tableau[:-1, -1], start)
+            x_base, x_slope = tableau[:-1, -2], tableau[:-1, -1]
+            duals = (tableau[-1, slacks], np.zeros(n_constraints))
+            value = (tableau[-1, -2], tableau[-1, -1])
+
+        end = min(t_next, t_end)
+        # Una base que solo es óptima en un punto no forma un tramo
+        if end > start:
+            pieces.append(_piece((start, end), basic_vars, n_vars, x_base, x_slope, duals, value))
+        if t_next >= t_end:
+            break
+        if pivots >= max_pivots:
+            status = 'iteration_limit'
+            break
+        stop = should_stop and should_stop()
+        if stop:
+            status = stop
+            break
+
+        if parameter == 'objective':
+            # Prueba del cociente primal en la columna que entra
+            column = tableau[:n_constraints, col]
+            positive = column > TOLERANCE
+            if not positive.any():
+                status = 'unbounded'
+                break
+            ratios = np.full(n_constraints, np.inf)
+            ratios[positive] = np.maximum(tableau[:n_constraints, -1][positive], 0.0) / column[positive]
+            row = int(np.argmin(ratios))
+        else:
+            # Prueba del cociente dual en la fila que sale
+            entries = tableau[row, :n_cols]
+            negative = entries < -TOLERANCE
+            if not negative.any():
+                status = 'infeasible'
+                break
+            ratios = np.full(n_cols, np.inf)
+            ratios[negative] = np.maximum(tableau[-1, :n_cols][negative], 0.0) / -entries[negative]
+            col = int(np.argmin(ratios))
+
+        kernel.pivot(tableau, row, col)
+        basic_vars[row] = col
+        pivots += 1
+        if t_next > start:
+            breakpoints.append(t_next)
+        start = t_next
+
+    if not pieces:
+        # Se detuvo en t_start antes de pivotear: la base sigue siendo la
+        # óptima en ese punto y forma el tramo degenerado [t_start, t_start]
+        pieces.append(_piece((start, start), basic_vars, n_vars, x_base, x_slope, duals, value))
+
+    return {
+        'status': status,
+        'parameter': parameter,
+        'end': pieces[-1]['interval'][1] if pieces else t_start,
+        'breakpoints': breakpoints,
+        'pieces': pieces,
+        'pivots': pivots
+    }
+
+
+def objective_sweep(tableau: np.ndarray, basic_vars: List[int], direction: np.ndarray,
+                    t_start: float, t_end: float, max_pivots: int,
+                    should_stop: Optional[Callable] = None) -> Dict:
+    """
+    Programación paramétrica en la función objetivo: max (c + t·d)^T x para t
+    en [t_start, t_end], partiendo de la base óptima en t_start
+
+    Args:
+        tableau: Tableau de la base óptima con la fila Z de c (t = 0); no se modifica
+        basic_vars: Variables básicas de ese tableau
+        direction: Dirección d del cambio de c
+        t_start: Valor inicial del parámetro (la base es óptima en él)
+        t_end: Valor final del parámetro (puede ser inf)
+        max_pivots: Límite de pivoteos del barrido
+        should_stop: Función que devuelve el estado de detención (ver cancellation.py)
+
+    Returns:
+        Diccionario del barrido (ver SimplexSolver.parametric_sweep)
+    """
+    n_constraints = len(basic_vars)
+    direction = np.concatenate([np.asarray(direction, dtype=float), np.zeros(n_constraints)])
+    augmented = np.vstack([tableau, np.zeros(tableau.shape[1])])
+    # Fila Z de d: d_B^T·B^-1·[A | I | b] - [d | 0]
+    augmented[-1, :-1] = -direction
+    augmented[-1] += direction[basic_vars] @ tableau[:n_constraints]
+    augmented[-1, basic_vars] = 0.0
+    return _sweep(augmented, basic_vars, 'objective', t_start, t_end, max_pivots, should_stop)
+
+
+def rhs_sweep(tableau: np.ndarray, basic_vars: List[int], direction: np.ndarray,
+              t_start: float, t_end: float, max_pivots: int,
+              should_stop: Optional[Callable] = None) -> Dict:
+    """
+    Programación paramétrica en el lado derecho: max c^T x con Ax <= b + t·g
+    para t en [t_start, t_end], partiendo de la base óptima en t_start
+
+    Args:
+        tableau: Tableau de la base óptima con el RHS de b (t = 0); no se modifica
+        basic_vars: Variables básicas de ese tableau
+        direction: Dirección g del cambio de b
+        t_start, t_end, max_pivots, should_stop: Ver objective_sweep
+
+    Returns:
+        Diccionario del barrido (ver SimplexSolver.parametric_sweep)
+    """
+    n_constraints = len(basic_vars)
+    n_vars = tableau.shape[1] - 1 - n_constraints
+    # Las columnas de holgura contienen B^-1 y, en la fila Z, los duales
+    augmented = np.hstack([tableau, np.zeros((tableau.shape[0], 1))])
+    augmented[:, -1] = tableau[:, n_vars:n_vars + n_constraints] @ np.asarray(direction, dtype=float)
+    return _sweep(augmented, basic_vars, 'rhs', t_start, t_end, max_pivots, should_stop)
+
+
+def evaluate_sweep(sweep: Dict, points) -> Dict:
+    """
+    Evaluar un barrido en muchos valores del parámetro sin pivotear
+
+    Args:
+        sweep: Resultado de objective_sweep o rhs_sweep
+        points: Valores del parámetro
+
+    Returns:
+        Diccionario con 'points', 'values' (valor óptimo), 'solutions' (una
+        fila por punto) y 'piece' (índice del tramo, -1 fuera del recorrido);
+        los puntos fuera del recorrido valen nan
+    """
+    points = np.asarray(points, dtype=float)
+    pieces = sweep['pieces']
+    n_vars = len(pieces[0]['solution'][0]) if pieces else 0
+    values = np.full(len(points), np.nan)
+    solutions = np.full((len(points), n_vars), np.nan)
+    piece = np.full(len(points), -1)
+    if pieces:
+        starts = np.array([p['interval'][0] for p in pieces])
+        ends = np.array([p['interval'][1] for p in pieces])
+        index = np.clip(np.searchsorted(starts, points, side='right') - 1, 0, len(pieces) - 1)
+        inside = (points >= starts[0]) & (points <= ends[index])
+        piece[inside] = index[inside]
+        value = np.array([p['value'] for p in pieces])
+        base = np.array([p['solution'][0] for p in pieces])
+        slope = np.array([p['solution'][1] for p in pieces])
+        t, k = points[inside], index[inside]
+        values[inside] = value[k, 0] + t * value[k, 1]
+        solutions[inside] = base[k] + t[:, None] * slope[k]
+    return {'points': points, 'values': values, 'solutions': solutions, 'piece': piece}
@@ -0,0 +1,164 @@
+import numpy as np
+from typing import Tuple
+
+
+class PivotKernel:
+    """
+    Prueba del cociente y pivoteo in-place sobre un tableau con buffers preasignados.
+
+    La eliminación de la columna pivote es una actualización de rango 1
+    T -= columna ⊗ fila_pivote hecha por bloques de filas en un buffer reutilizable,
+    de modo que un pivoteo no crea arreglos temporales del tamaño del tableau.
+    """
+
+    def __init__(self, shape: Tuple[int, int], block_rows: int = None, tolerance: float = 1e-10):
+        """
+        Args:
+            shape: Dimensiones del tableau (filas incluyendo la fila Z, columnas incluyendo RHS)
+            block_rows: Filas por bloque en la actualización de rango 1
+                        (por defecto un buffer de ~256 KB que cabe en caché)
+            tolerance: Valor mínimo de un elemento para considerarlo pivote
+        """
+        n_rows, n_cols = shape
+        if block_rows is None:
+            block_rows = max(1, (1 << 15) // max(n_cols, 1))
+        self.shape = (n_rows, n_cols)
+        self.tolerance = tolerance
+        self.block_rows = min(block_rows, n_rows)
+
+        self.column = np.empty(n_rows)
+        self.row = np.empty(n_cols)
+        self.block = np.empty((self.block_rows, n_cols))
+        self.ratios = np.empty(n_rows - 1)
+        self.mask = np.empty(n_rows - 1, dtype=bool)
+
+    def ratio_test(self, tableau: np.ndarray, pivot_col: int) -> int:
+        """
+        Prueba del cociente mínimo con operaciones enmascaradas
+
+        Args:
+            tableau: Tableau actual
+            pivot_col: Columna que entra a la base
+
+        Returns:
+            Fila pivote, o -1 si ninguna fila limita el paso
+        """
+        # Sin filas de restricciones nada limita el paso
+        if len(self.ratios) == 0:
+            return -1
+        col = tableau[:-1, pivot_col]
+        rhs = tableau[:-1, -1]
+        ratios, mask = self.ratios, self.mask
+
+        ratios.fill(np.inf)
+        np.greater(col, self.tolerance, out=mask)
+        np.divide(rhs, col, out=ratios, where=mask)
+        # Un RHS apenas negativo (error numérico) es un paso nulo: la fila sigue
+        # limitando el paso, de lo contrario su básica quedaría negativa
+        np.maximum(ratios, 0.0, out=ratios)
+
+        pivot_row = int(np.argmin(ratios))
+        if ratios[pivot_row] == np.inf:
+            return -1
+        return pivot_row
+
+    def bounded_ratio_test(self, tableau: np.ndarray, pivot_col: int, basic_upper: np.ndarray,
+                           entering_upper: float) -> Tuple[int, float]:
+        """
+        Prueba del cociente con cotas superiores: el paso también lo limitan las
+        básicas que crecen hasta su cota (a_iq < 0) y la cota de la que entra
+
+        Args:
+            tableau: Tableau actual
+            pivot_col: Columna que entra a la base
+            basic_upper: Cota superior de la variable básica de cada fila (inf si no tiene)
+            entering_upper: Cota superior de la variable que entra
+
+        Returns:
+            Tuple con (fila pivote, paso); la fila es -1 si el paso lo limita la
+            cota de la variable que entra (paso inf: ninguna cota lo limita)
+        """
+        pivot_row = self.ratio_test(tableau, pivot_col)
+        col = tableau[:-1, pivot_col]
+        ratios = self.ratios
+        rising = (col < -self.tolerance) & np.isfinite(basic_upper)
+        if rising.any():
+            rhs = tableau[:-1, -1]
+            # Los cocientes negativos (RHS apenas por encima de la cota) son pasos nulos
+            ratios[rising] = np.maximum((basic_upper[rising] - rhs[rising]) / -col[rising], 0.0)
+            pivot_row = int(np.argmin(ratios))
+        step = np.inf if pivot_row == -1 else ratios[pivot_row]
+        if entering_upper <= step:
+            return -1, entering_upper
+        return pivot_row, step
+
+    def flip_column(self, tableau: np.ndarray, col: int, upper: float):
+        """
+        Cambiar una variable no básica x por x' = u - x (pasa a su cota superior
+        sin cambiar la base)
+
+        Args:
+            tableau: Tableau a modificar
+            col: Columna de la variable
+            upper: Cota superior u
+        """
+        tableau[:, -1] -= upper * tableau[:, col]
+        tableau[:, col] *= -1.0
+
+    def flip_row(self, tableau: np.ndarray, row: int, col: int, upper: float):
+        """
+        Cambiar la variable básica x de la fila row por x' = u - x, dejando la
+        fila en forma canónica para x' (antes de que salga en su cota superior)
+
+        Args:
+            tableau: Tableau a modificar
+            row: Fila de la variable básica
+            col: Columna de la variable básica
+            upper: Cota superior u
+        """
+        tableau[row] *= -1.0
+        tableau[row, col] = 1.0
+        tableau[row, -1] += upper
+
+    def tied_rows(self, pivot_row: int) -> np.ndarray:
+        """
+        Filas empatadas en el cociente mínimo de la última prueba del cociente
+
+        Args:
+            pivot_row: Fila devuelta por ratio_test
+
+        Returns:
+            Índices de las filas cuyo cociente coincide (dentro de la tolerancia)
+        """
+        return np.flatnonzero(self.ratios <= self.ratios[pivot_row] + self.tolerance)
+
+    def pivot(self, tableau: np.ndarray, pivot_row: int, pivot_col: int):
+        """
+        Pivotear in-place sobre el elemento (pivot_row, pivot_col)
+
+        Args:
+            tableau: Tableau a modificar
+            pivot_row: Fila pivote
+            pivot_col: Columna pivote
+        """
+        column, row, block = self.column, self.row, self.block
+
+        np.copyto(column, tableau[:, pivot_col])
+        tableau[pivot_row] /= column[pivot_row]
+        np.copyto(row, tableau[pivot_row])
+        # La fila pivote ya está normalizada: factor cero para no modificarla
+        column[pivot_row] = 0.0
+
+        n_rows = tableau.shape[0]
+        for start in range(0, n_rows, self.block_rows):
+            end = min(start + self.block_rows, n_rows)
+            # Bloques sin entradas en la columna pivote no cambian
+            if not column[start:end].any():
+                continue
+            out = block[:end - start]
+            np.multiply(column[start:end, None], row, out=out)
+            tableau[start:end] -= out
+
+        # La columna pivote queda exactamente como vector unitario
+        tableau[:, pivot_col] = 0.0
+        tableau[pivot_row, pivot_col] = 1.0
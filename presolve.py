@@ -0,0 +1,281 @@
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from sparse_matrix import CSRMatrix, is_sparse
+
+
+class Presolver:
+    """
+    Reducción del problema max c^T x, Ax <= b (b >= 0), x >= 0 antes del Simplex.
+
+    Aplica en pasadas repetidas hasta que el problema deja de cambiar:
+    - filas vacías y filas redundantes (su actividad máxima no alcanza b_i)
+    - filas duplicadas (múltiplos positivos de otra fila; se conserva la más ajustada)
+    - filas con una sola variable, que pasan a ser cotas superiores x_j <= u_j
+      (o se descartan si el coeficiente es negativo, ya que x_j >= 0)
+    - filas forzantes (b_i = 0 y coeficientes positivos: fijan sus variables en 0)
+    - variables fijas (cota superior 0), columnas vacías y columnas dominadas
+      (c_j <= 0 y coeficientes no negativos: existe un óptimo con x_j = 0)
+
+    Todas las variables eliminadas quedan fijas en 0, así que el lado derecho no
+    cambia. Cada eliminación que necesita un dual distinto de cero se apila para
+    postsolve(), que recupera la solución y los precios duales del modelo original.
+    """
+
+    MAX_PASSES = 20
+
+    def __init__(self, c: np.ndarray, A, b: np.ndarray, tolerance: float = 1e-10):
+        """
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones (densa o CSRMatrix)
+            b: Valores del lado derecho
+            tolerance: Tolerancia numérica
+        """
+        self.c = np.asarray(c, dtype=float)
+        self.b = np.asarray(b, dtype=float)
+        self.sparse_input = is_sparse(A)
+        self.A = A if self.sparse_input else CSRMatrix.from_dense(A)
+        self.tolerance = tolerance
+
+        n_constraints, n_vars = self.A.shape
+        self.row_active = np.ones(n_constraints, dtype=bool)
+        self.col_active = np.ones(n_vars, dtype=bool)
+        self.upper = np.full(n_vars, np.inf)
+        # Fila original y coeficiente que definen la cota de cada variable
+        self.bound_row = np.full(n_vars, -1, dtype=np.int64)
+        self.bound_coef = np.zeros(n_vars)
+
+        self.status = 'reduced'
+        self.stack: List[Tuple[int, np.ndarray, np.ndarray]] = []
+        self.stats = {
+            'empty_rows': 0, 'redundant_rows': 0, 'duplicate_rows': 0,
+            'singleton_rows': 0, 'forcing_rows': 0,
+            'fixed_columns': 0, 'dominated_columns': 0, 'passes': 0
+        }
+
+    def run(self) -> str:
+        """
+        Reducir el problema
+
+        Returns:
+            'reduced', o 'unbounded' si una columna mejora el objetivo sin límite
+        """
+        start = time.perf_counter()
+        for _ in range(self.MAX_PASSES):
+            self.stats['passes'] += 1
+            changed = self._singleton_rows()
+            changed |= self._fixed_columns()
+            changed |= self._forcing_rows()
+            changed |= self._columns()
+            if self.status != 'reduced':
+                break
+            changed |= self._redundant_rows()
+            changed |= self._duplicate_rows()
+            if not changed:
+                break
+        self.stats['time'] = time.perf_counter() - start
+        return self.status
+
+    def _active_entries(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Fila, columna y valor de los coeficientes del problema reducido actual"""
+        rows = self.A.row_index()
+        mask = self.row_active[rows] & self.col_active[self.A.indices]
+        return rows[mask], self.A.indices[mask], self.A.data[mask]
+
+    def _singleton_rows(self) -> bool:
+        rows, cols, vals = self._active_entries()
+        n_constraints = self.A.shape[0]
+        count = np.bincount(rows, minlength=n_constraints)
+
+        empty = self.row_active & (count == 0)
+        self.row_active[empty] = False
+        self.stats['empty_rows'] += int(empty.sum())
+
+        single = count[rows] == 1
+        for i, j, a in zip(rows[single], cols[single], vals[single]):
+            self.row_active[i] = False
+            self.stats['singleton_rows'] += 1
+            if a > 0 and self.b[i] / a < self.upper[j]:
+                self.upper[j] = self.b[i] / a
+                self.bound_row[j] = i
+                self.bound_coef[j] = a
+        return bool(empty.any() or single.any())
+
+    def _fix(self, cols: np.ndarray):
+        self.col_active[cols] = False
+
+    def _fixed_columns(self) -> bool:
+        fixed = np.flatnonzero(self.col_active & (self.upper <= self.tolerance))
+        for j in fixed:
+            # La fila de la cota u_j = 0 actúa como fila forzante de una variable
+            self.stack.append((int(self.bound_row[j]), np.array([j]), np.array([self.bound_coef[j]])))
+        self._fix(fixed)
+        self.stats['fixed_columns'] += len(fixed)
+        return len(fixed) > 0
+
+    def _forcing_rows(self) -> bool:
+        rows, cols, vals = self._active_entries()
+        n_constraints = self.A.shape[0]
+        count = np.bincount(rows, minlength=n_constraints)
+        negative = np.bincount(rows[vals < 0], minlength=n_constraints)
+        forcing = np.flatnonzero(self.row_active & (count > 0) & (negative == 0)
+                                 & (self.b <= self.tolerance))
+        for i in forcing:
+            in_row = rows == i
+            row_cols = cols[in_row]
+            # Una columna puede aparecer en varias filas forzantes de la misma pasada
+            new = self.col_active[row_cols]
+            self.stack.append((int(i), row_cols[new], vals[in_row][new]))
+            self._fix(row_cols)
+            self.row_active[i] = False
+        self.stats['forcing_rows'] += len(forcing)
+        return len(forcing) > 0
+
+    def _columns(self) -> bool:
+        rows, cols, vals = self._active_entries()
+        n_vars = self.A.shape[1]
+        negative = np.bincount(cols[vals < 0], minlength=n_vars)
+        positive = np.bincount(cols[vals > 0], minlength=n_vars)
+
+        unbounded = (self.col_active & (self.c > self.tolerance) & (positive == 0)
+                     & np.isinf(self.upper))
+        if unbounded.any():
+            self.status = 'unbounded'
+            return False
+
+        dominated = np.flatnonzero(self.col_active & (self.c <= 0) & (negative == 0))
+        self._fix(dominated)
+        self.stats['dominated_columns'] += len(dominated)
+        return len(dominated) > 0
+
+    def _redundant_rows(self) -> bool:
+        rows, cols, vals = self._active_entries()
+        n_constraints = self.A.shape[0]
+        positive = vals > 0
+        with np.errstate(invalid='ignore'):
+            contribution = vals[positive] * self.upper[cols[positive]]
+        max_activity = np.bincount(rows[positive], weights=contribution, minlength=n_constraints)
+        redundant = self.row_active & (max_activity <= self.b + self.tolerance)
+        self.row_active[redundant] = False
+        self.stats['redundant_rows'] += int(redundant.sum())
+        return bool(redundant.any())
+
+    def _duplicate_rows(self) -> bool:
+        rows, cols, vals = self._active_entries()
+        if len(rows) == 0:
+            return False
+        # Normalizar cada fila por su coeficiente de mayor valor absoluto
+        n_constraints = self.A.shape[0]
+        scale = np.zeros(n_constraints)
+        np.maximum.at(scale, rows, np.abs(vals))
+        normalized = np.round(vals / scale[rows], 12)
+
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+        ends = np.r_[starts[1:], len(rows)]
+        kept: Dict[bytes, int] = {}
+        removed = 0
+        for start, end in zip(starts, ends):
+            i = rows[start]
+            key = cols[start:end].tobytes() + normalized[start:end].tobytes()
+            other = kept.get(key)
+            if other is None:
+                kept[key] = i
+                continue
+            # Conservar la fila con menor b_i / escala (la más ajustada)
+            removed += 1
+            if self.b[i] / scale[i] < self.b[other] / scale[other]:
+                self.row_active[other] = False
+                kept[key] = i
+            else:
+                self.row_active[i] = False
+        self.stats['duplicate_rows'] += removed
+        return removed > 0
+
+    def reduced_problem(self, bounds_as_rows: bool = True):
+        """
+        Problema reducido
+
+        Args:
+            bounds_as_rows: Agregar las cotas superiores finitas como filas x_j <= u_j
+                            (para los motores que no manejan cotas)
+
+        Returns:
+            Tuple con (c, A, b, upper): A del mismo tipo que la matriz original y
+            upper con las cotas de las columnas conservadas (inf si no tienen)
+        """
+        self.kept_rows = np.flatnonzero(self.row_active)
+        self.kept_cols = np.flatnonzero(self.col_active)
+        col_map = np.full(self.A.shape[1], -1, dtype=np.int64)
+        col_map[self.kept_cols] = np.arange(len(self.kept_cols))
+        row_map = np.full(self.A.shape[0], -1, dtype=np.int64)
+        row_map[self.kept_rows] = np.arange(len(self.kept_rows))
+
+        rows, cols, vals = self._active_entries()
+        rows, cols = row_map[rows], col_map[cols]
+        b = self.b[self.kept_rows]
+        upper = self.upper[self.kept_cols]
+
+        self.bound_cols = np.array([], dtype=np.int64)
+        if bounds_as_rows:
+            self.bound_cols = np.flatnonzero(np.isfinite(upper))
+            first = len(self.kept_rows)
+            rows = np.concatenate([rows, first + np.arange(len(self.bound_cols))])
+            cols = np.concatenate([cols, self.bound_cols])
+            vals = np.concatenate([vals, np.ones(len(self.bound_cols))])
+            b = np.concatenate([b, upper[self.bound_cols]])
+
+        shape = (len(b), len(self.kept_cols))
+        A = CSRMatrix.from_triplets(rows, cols, vals, shape)
+        if not self.sparse_input:
+            A = A.toarray()
+        return self.c[self.kept_cols], A, b, upper
+
+    def postsolve(self, x: np.ndarray, y: Optional[np.ndarray] = None
+                  ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Llevar la solución y los duales del problema reducido al modelo original
+
+        Args:
+            x: Solución del problema reducido
+            y: Precios duales del problema reducido (incluye las filas de cotas)
+
+        Returns:
+            Tuple con (solución, duales) del modelo original
+        """
+        x_full = np.zeros(self.A.shape[1])
+        x_full[self.kept_cols] = x
+        if y is None:
+            return x_full, None
+
+        y_full = np.zeros(self.A.shape[0])
+        n_kept = len(self.kept_rows)
+        y_full[self.kept_rows] = y[:n_kept]
+        # x_j <= u_j equivale a la fila original a·x_j <= b escalada por 1/a
+        cols = self.kept_cols[self.bound_cols]
+        y_full[self.bound_row[cols]] = y[n_kept:] / self.bound_coef[cols]
+
+        # Deshacer las filas forzantes en orden inverso: su dual es el mínimo que
+        # deja costos reducidos c_j - y^T a_j <= 0 en las columnas que fijaron
+        for i, cols, vals in reversed(self.stack):
+            if i < 0 or len(cols) == 0:
+                continue
+            reduced = self.c[cols] - np.array([self.A.column(j) @ y_full for j in cols])
+            y_full[i] = max(0.0, float(np.max(reduced / vals)))
+        return x_full, y_full
+
+    def summary(self) -> Dict:
+        """
+        Resumen de la reducción
+
+        Returns:
+            Diccionario con el tamaño antes y después y lo eliminado por cada regla
+        """
+        rows, cols, vals = self._active_entries()
+        return {
+            'rows': (self.A.shape[0], int(self.row_active.sum())),
+            'columns': (self.A.shape[1], int(self.col_active.sum())),
+            'nonzeros': (self.A.nnz, len(vals)),
+            'bounds': int(np.isfinite(self.upper[self.col_active]).sum()),
+            **self.stats
+        }
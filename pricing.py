@@ -0,0 +1,207 @@
+import numpy as np
+from typing import Callable, Optional, Union
+
+
+class PricingRule:
+    """
+    Regla de selección de la columna entrante.
+
+    Trabaja con los costos reducidos en la convención de la fila Z del tableau
+    (un valor negativo indica que la variable mejora el objetivo). Las reglas con
+    pesos los actualizan de forma incremental con update(), que se llama antes de
+    cada pivoteo.
+    """
+
+    name = 'base'
+    needs_pivot_row = False
+    # Si reset() usa las normas de las columnas (calcularlas recorre la matriz)
+    needs_column_norms = False
+
+    def __init__(self, tolerance: float = 1e-10):
+        """
+        Args:
+            tolerance: Costo reducido mínimo (en valor absoluto) para entrar a la base
+        """
+        self.tolerance = tolerance
+
+    def reset(self, n_columns: int, column_norms: Optional[np.ndarray] = None):
+        """
+        Preparar la regla para una nueva resolución
+
+        Args:
+            n_columns: Número de columnas candidatas (variables + holguras)
+            column_norms: ||a_j||^2 de cada columna en la base inicial (solo si
+                          needs_column_norms; None en las demás reglas)
+        """
+
+    def select(self, reduced_costs: np.ndarray) -> int:
+        """
+        Elegir la columna entrante
+
+        Args:
+            reduced_costs: Fila Z sin la columna RHS
+
+        Returns:
+            Índice de la columna, o -1 si la base es óptima
+        """
+        raise NotImplementedError
+
+    def update(self, pivot_row_values: Optional[np.ndarray], pivot_col_values: np.ndarray,
+               pivot_row: int, pivot_col: int, leaving: int,
+               column_dots: Optional[Callable[[], np.ndarray]] = None):
+        """
+        Actualizar los pesos antes del pivoteo
+
+        Args:
+            pivot_row_values: Fila pivote alpha_r (todas las columnas, sin RHS)
+            pivot_col_values: Columna pivote alpha_q (filas de restricciones)
+            pivot_row: Fila pivote
+            pivot_col: Columna que entra
+            leaving: Columna que sale de la base
+            column_dots: Función que devuelve alpha_q^T·alpha_j para todas las columnas
+        """
+
+
+class DantzigPricing(PricingRule):
+    """Regla de Dantzig: el costo reducido más negativo"""
+
+    name = 'dantzig'
+
+    def select(self, reduced_costs: np.ndarray) -> int:
+        pivot_col = int(np.argmin(reduced_costs))
+        if reduced_costs[pivot_col] >= -self.tolerance:
+            return -1
+        return pivot_col
+
+
+class PartialPricing(PricingRule):
+    """
+    Precio parcial: recorre las columnas por segmentos de forma cíclica y elige el
+    más negativo del primer segmento que tenga candidatos, sin examinar el resto.
+    """
+
+    name = 'partial'
+
+    def __init__(self, segment_size: Optional[int] = None, tolerance: float = 1e-10):
+        """
+        Args:
+            segment_size: Columnas por segmento (por defecto ~10% de las columnas, mínimo 50)
+            tolerance: Costo reducido mínimo para entrar a la base
+        """
+        super().__init__(tolerance)
+        self.segment_size = segment_size
+        self._start = 0
+
+    def reset(self, n_columns: int, column_norms: Optional[np.ndarray] = None):
+        if self.segment_size is None:
+            self._segment = max(50, n_columns // 10)
+        else:
+            self._segment = max(1, self.segment_size)
+        self._start = 0
+
+    def select(self, reduced_costs: np.ndarray) -> int:
+        n_columns = len(reduced_costs)
+        segment = min(self._segment, n_columns)
+        start = self._start % n_columns
+        scanned = 0
+        while scanned < n_columns:
+            end = min(start + segment, n_columns)
+            window = reduced_costs[start:end]
+            best = int(np.argmin(window))
+            if window[best] < -self.tolerance:
+                self._start = end
+                return start + best
+            scanned += end - start
+            start = end % n_columns
+        return -1
+
+
+class DevexPricing(PricingRule):
+    """
+    Regla Devex: aproxima el steepest edge con pesos de referencia w_j que se
+    actualizan con la fila pivote; elige el máximo d_j^2 / w_j.
+    """
+
+    name = 'devex'
+    needs_pivot_row = True
+
+    def reset(self, n_columns: int, column_norms: Optional[np.ndarray] = None):
+        self.weights = np.ones(n_columns)
+
+    def select(self, reduced_costs: np.ndarray) -> int:
+        scores = np.where(reduced_costs < -self.tolerance,
+                          reduced_costs ** 2 / self.weights, -1.0)
+        pivot_col = int(np.argmax(scores))
+        if scores[pivot_col] < 0:
+            return -1
+        return pivot_col
+
+    def update(self, pivot_row_values, pivot_col_values, pivot_row, pivot_col, leaving,
+               column_dots=None):
+        pivot_element = pivot_row_values[pivot_col]
+        weight_q = self.weights[pivot_col]
+        ratios = pivot_row_values / pivot_element
+        np.maximum(self.weights, ratios ** 2 * weight_q, out=self.weights)
+        self.weights[leaving] = max(weight_q / pivot_element ** 2, 1.0)
+        self.weights[pivot_col] = 1.0
+
+
+class SteepestEdgePricing(PricingRule):
+    """
+    Steepest edge: pesos exactos gamma_j = 1 + ||B^{-1} a_j||^2 actualizados con
+    las fórmulas de Goldfarb–Reid; elige el máximo d_j^2 / gamma_j.
+    """
+
+    name = 'steepest_edge'
+    needs_pivot_row = True
+    needs_column_norms = True
+
+    def reset(self, n_columns: int, column_norms: Optional[np.ndarray] = None):
+        # En la base de holguras B = I, así que gamma_j = 1 + ||a_j||^2
+        if column_norms is None:
+            self.weights = np.ones(n_columns)
+        else:
+            self.weights = 1.0 + column_norms
+
+    def select(self, reduced_costs: np.ndarray) -> int:
+        scores = np.where(reduced_costs < -self.tolerance,
+                          reduced_costs ** 2 / self.weights, -1.0)
+        pivot_col = int(np.argmax(scores))
+        if scores[pivot_col] < 0:
+            return -1
+        return pivot_col
+
+    def update(self, pivot_row_values, pivot_col_values, pivot_row, pivot_col, leaving,
+               column_dots=None):
+        pivot_element = pivot_row_values[pivot_col]
+        gamma_q = 1.0 + pivot_col_values @ pivot_col_values
+        ratios = pivot_row_values / pivot_element
+        dots = column_dots()
+        updated = self.weights - 2.0 * ratios * dots + ratios ** 2 * gamma_q
+        np.maximum(updated, 1.0 + ratios ** 2, out=self.weights)
+        self.weights[leaving] = max(gamma_q / pivot_element ** 2, 1.0)
+
+
+PRICING_RULES = {
+    'dantzig': DantzigPricing,
+    'partial': PartialPricing,
+    'devex': DevexPricing,
+    'steepest_edge': SteepestEdgePricing
+}
+
+
+def make_pricing(rule: Union[str, PricingRule]) -> PricingRule:
+    """
+    Obtener una regla de precios a partir de su nombre o una instancia
+
+    Args:
+        rule: 'dantzig', 'partial', 'devex', 'steepest_edge' o un PricingRule
+
+    Returns:
+        Instancia de PricingRule
+    """
+    if isinstance(rule, PricingRule):
+        return rule
+    if rule not in PRICING_RULES:
+        raise ValueError(f"Regla de precios desconocida: {rule}")
+    return PRICING_RULES[rule]()
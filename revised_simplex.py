@@ -0,0 +1,430 @@
+import time
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+from sparse_matrix import is_sparse
+from pricing import DantzigPricing, PricingRule
+
+
+def _lu_factor(B: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Factorización LU con pivoteo parcial (P·B = L·U) guardada en una sola matriz
+
+    Args:
+        B: Matriz cuadrada a factorizar
+
+    Returns:
+        Tuple con (matriz_lu, permutacion_filas)
+    """
+    lu = np.array(B, dtype=float)
+    m = lu.shape[0]
+    perm = np.arange(m)
+
+    for k in range(m):
+        p = k + int(np.argmax(np.abs(lu[k:, k])))
+        if abs(lu[p, k]) < 1e-12:
+            raise np.linalg.LinAlgError("La matriz básica es singular")
+        if p != k:
+            lu[[k, p]] = lu[[p, k]]
+            perm[[k, p]] = perm[[p, k]]
+        lu[k+1:, k] /= lu[k, k]
+        lu[k+1:, k+1:] -= np.outer(lu[k+1:, k], lu[k, k+1:])
+
+    return lu, perm
+
+
+def _diagonal_inverses(lu: np.ndarray, block: int) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Inversas de los bloques diagonales de L (diagonal unitaria) y de U
+
+    Args:
+        lu: Factores L y U en una sola matriz (ver _lu_factor)
+        block: Tamaño de los bloques
+
+    Returns:
+        Lista con (L_bb^{-1}, U_bb^{-1}) por bloque
+    """
+    inverses = []
+    for start in range(0, lu.shape[0], block):
+        end = min(start + block, lu.shape[0])
+        diagonal = lu[start:end, start:end]
+        inverses.append((np.linalg.inv(np.tril(diagonal, -1) + np.eye(end - start)),
+                         np.linalg.inv(np.triu(diagonal))))
+    return inverses
+
+
+def _lu_solve(lu: np.ndarray, inverses: List, block: int, b: np.ndarray) -> np.ndarray:
+    """
+    Resolver L·U·x = b por sustitución por bloques: fuera de la diagonal son
+    productos matriz-vector con los factores, sin invertirlos
+
+    Args:
+        lu: Factores L y U en una sola matriz
+        inverses: Inversas de los bloques diagonales (ver _diagonal_inverses)
+        block: Tamaño de los bloques
+        b: Lado derecho
+
+    Returns:
+        Solución x
+    """
+    k = lu.shape[0]
+    starts = range(0, k, block)
+    x = np.array(b, dtype=float)
+    # L·w = b hacia adelante
+    for i, start in enumerate(starts):
+        end = min(start + block, k)
+        if start:
+            x[start:end] -= lu[start:end, :start] @ x[:start]
+        x[start:end] = inverses[i][0] @ x[start:end]
+    # U·x = w hacia atrás
+    for i in reversed(range(len(starts))):
+        start = starts[i]
+        end = min(start + block, k)
+        if end < k:
+            x[start:end] -= lu[start:end, end:] @ x[end:]
+        x[start:end] = inverses[i][1] @ x[start:end]
+    return x
+
+
+def _lu_solve_transpose(lu: np.ndarray, inverses: List, block: int, c: np.ndarray) -> np.ndarray:
+    """Resolver (L·U)^T·y = c por sustitución por bloques (ver _lu_solve)"""
+    k = lu.shape[0]
+    starts = range(0, k, block)
+    y = np.array(c, dtype=float)
+    # U^T·w = c hacia adelante
+    for i, start in enumerate(starts):
+        end = min(start + block, k)
+        if start:
+            y[start:end] -= lu[:start, start:end].T @ y[:start]
+        y[start:end] = inverses[i][1].T @ y[start:end]
+    # L^T·y = w hacia atrás
+    for i in reversed(range(len(starts))):
+        start = starts[i]
+        end = min(start + block, k)
+        if end < k:
+            y[start:end] -= lu[end:, start:end].T @ y[end:]
+        y[start:end] = inverses[i][0].T @ y[start:end]
+    return y
+
+
+class BasisFactorization:
+    """
+    Factorización de la base B = P^T·L·U con actualizaciones en forma producto (PFI).
+
+    Cada cambio de base agrega un vector eta en lugar de refactorizar; cuando se
+    acumulan `refactor_frequency` etas se vuelve a factorizar desde cero para
+    controlar el error numérico y el costo de FTRAN/BTRAN.
+
+    Las columnas unitarias de la base (holguras) se resuelven directamente y solo
+    se factoriza el núcleo formado por las columnas estructurales y las filas no
+    cubiertas por holguras. Los factores L y U del núcleo se guardan en una sola
+    matriz k x k y FTRAN/BTRAN los aplican por sustitución en bloques de
+    `block` filas: solo se invierten los bloques diagonales, y fuera de ellos
+    son productos matriz-vector (BLAS) con los factores.
+    """
+
+    def __init__(self, refactor_frequency: int = 50, block: int = 64):
+        """
+        Args:
+            refactor_frequency: Número de actualizaciones eta antes de refactorizar
+            block: Tamaño de los bloques de la sustitución triangular
+        """
+        self.refactor_frequency = refactor_frequency
+        self.block = block
+        self.lu = None
+        self.diagonal_inverses = None
+        self.perm = None
+        self.unit_pos = self.unit_rows = None
+        self.kernel_pos = self.kernel_rows = None
+        self.unit_kernel_block = None
+        self.etas: List[Tuple[int, np.ndarray]] = []
+
+    def factorize(self, A, basic_vars: List[int]):
+        """
+        Factorizar la base formada por las columnas `basic_vars` de [A | I]
+        y descartar las etas acumuladas
+
+        Args:
+            A: Matriz de restricciones (densa o CSRMatrix)
+            basic_vars: Índice de la columna de [A | I] en cada posición de la base
+        """
+        m, n_vars = A.shape
+        self.etas = []
+
+        # Las holguras básicas son columnas e_i: se resuelven sin factorizar
+        basic = np.asarray(basic_vars)
+        self.unit_pos = np.flatnonzero(basic >= n_vars)
+        self.unit_rows = basic[self.unit_pos] - n_vars
+        self.kernel_pos = np.flatnonzero(basic < n_vars)
+        self.kernel_rows = np.setdiff1d(np.arange(m), self.unit_rows)
+
+        # Solo el núcleo k x k es denso; con CSRMatrix las filas de holguras de
+        # las columnas estructurales quedan dispersas
+        structural = basic[self.kernel_pos]
+        if is_sparse(A):
+            self.unit_kernel_block = A.submatrix(self.unit_rows, structural)
+            kernel = A.submatrix(self.kernel_rows, structural).toarray()
+        else:
+            self.unit_kernel_block = A[np.ix_(self.unit_rows, structural)]
+            kernel = A[np.ix_(self.kernel_rows, structural)]
+
+        if len(self.kernel_pos) == 0:
+            self.lu, self.diagonal_inverses, self.perm = None, None, None
+        else:
+            self.lu, self.perm = _lu_factor(kernel)
+            self.diagonal_inverses = _diagonal_inverses(self.lu, self.block)
+
+    def needs_refactor(self) -> bool:
+        """Indicar si ya se alcanzó el límite de actualizaciones eta"""
+        return len(self.etas) >= self.refactor_frequency
+
+    def update(self, pivot_row: int, column: np.ndarray):
+        """
+        Registrar el cambio de base en forma producto
+
+        Args:
+            pivot_row: Posición de la base que sale
+            column: Columna entrante ya transformada (B^{-1}·a_q)
+        """
+        self.etas.append((pivot_row, column.copy()))
+
+    def ftran(self, a: np.ndarray) -> np.ndarray:
+        """Resolver B·x = a"""
+        x = self._solve_lu(np.array(a, dtype=float))
+        for r, d in self.etas:
+            xr = x[r] / d[r]
+            x -= xr * d
+            x[r] = xr
+        return x
+
+    def btran(self, c: np.ndarray) -> np.ndarray:
+        """Resolver y^T·B = c^T"""
+        w = np.array(c, dtype=float)
+        for r, d in reversed(self.etas):
+            # E^T solo modifica la componente r: w_r = (w_r - d·w + d_r·w_r) / d_r
+            w[r] = (w[r] - d @ w + d[r] * w[r]) / d[r]
+        return self._solve_lu_transpose(w)
+
+    def _solve_lu(self, b: np.ndarray) -> np.ndarray:
+        x = np.empty_like(b)
+        if len(self.kernel_pos):
+            # Núcleo K = P^T·L·U  =>  L·U·x_K = P·b_K
+            x_kernel = _lu_solve(self.lu, self.diagonal_inverses, self.block,
+                                 b[self.kernel_rows][self.perm])
+            x[self.kernel_pos] = x_kernel
+            x[self.unit_pos] = b[self.unit_rows] - self._unit_block_mul(x_kernel)
+        else:
+            x[self.unit_pos] = b[self.unit_rows]
+        return x
+
+    def _unit_block_mul(self, v: np.ndarray) -> np.ndarray:
+        if is_sparse(self.unit_kernel_block):
+            return self.unit_kernel_block.matvec(v)
+        return self.unit_kernel_block @ v
+
+    def _unit_block_rmul(self, y: np.ndarray) -> np.ndarray:
+        if is_sparse(self.unit_kernel_block):
+            return self.unit_kernel_block.rmatvec(y)
+        return self.unit_kernel_block.T @ y
+
+    def _solve_lu_transpose(self, c: np.ndarray) -> np.ndarray:
+        y = np.empty_like(c)
+        y[self.unit_rows] = c[self.unit_pos]
+        if len(self.kernel_pos):
+            rhs = c[self.kernel_pos] - self._unit_block_rmul(y[self.unit_rows])
+            # K^T = U^T·L^T·P  =>  (L·U)^T·z = rhs, y_K = P^T·z
+            z = _lu_solve_transpose(self.lu, self.diagonal_inverses, self.block, rhs)
+            y_kernel = np.empty_like(z)
+            y_kernel[self.perm] = z
+            y[self.kernel_rows] = y_kernel
+        return y
+
+
+class RevisedSimplex:
+    """
+    Método Simplex revisado para problemas de maximización max c^T x, Ax <= b, x >= 0.
+
+    En lugar de pivotear un tableau completo, mantiene una factorización de la base
+    y en cada iteración calcula únicamente el vector de precios (BTRAN), los costos
+    reducidos y la columna entrante (FTRAN).
+    """
+
+    def __init__(self, refactor_frequency: int = 50, tolerance: float = 1e-10,
+                 stall_pivots: int = 10):
+        """
+        Args:
+            refactor_frequency: Actualizaciones eta entre refactorizaciones
+            tolerance: Tolerancia para costos reducidos y pivotes
+            stall_pivots: Pivoteos degenerados seguidos que activan la regla de Bland
+        """
+        self.refactor_frequency = refactor_frequency
+        self.tolerance = tolerance
+        self.stall_pivots = stall_pivots
+
+    def solve(self, c: np.ndarray, A, b: np.ndarray, max_iterations: int,
+              pricing: Optional[PricingRule] = None, anti_cycling: bool = True,
+              should_stop: Optional[Callable[[], Optional[str]]] = None,
+              callback: Optional[Callable] = None) -> Dict:
+        """
+        Resolver el problema partiendo de la base de holguras
+
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones (densa o CSRMatrix; nunca se densifica)
+            b: Valores del lado derecho (no negativos)
+            max_iterations: Número máximo de pivoteos
+            pricing: Regla de la columna entrante (por defecto Dantzig)
+            anti_cycling: Usar la regla de Bland tras stall_pivots pivoteos
+                          degenerados seguidos, hasta el siguiente paso no nulo
+            should_stop: Función consultada antes de cada pivoteo; si devuelve un
+                         estado ('cancelled', 'time_limit') se detiene con él
+            callback: Función llamada tras cada pivoteo con (iteración, fila, columna,
+                      elemento pivote, degenerado, x_B, valor objetivo)
+
+        Returns:
+            Diccionario con 'status', 'x_basic', 'basic_vars', 'pivots'
+            (lista de (fila_pivote, columna_pivote, elemento_pivote)), 'duals'
+            (precios y^T = c_B^T B^{-1} de la última base), 'pricing_time',
+            'ratio_test_time', 'update_time' (actualización y refactorización de la
+            base), 'degenerate_pivots' y 'stalls'
+        """
+        tol = self.tolerance
+        n_constraints, n_vars = A.shape
+        c_full = np.concatenate([np.asarray(c, dtype=float), np.zeros(n_constraints)])
+
+        basic_vars = list(range(n_vars, n_vars + n_constraints))
+        factor = BasisFactorization(self.refactor_frequency)
+        factor.factorize(A, basic_vars)
+        if is_sparse(A):
+            price = A.rmatvec
+        else:
+            price = lambda y: A.T @ y
+
+        pricing = pricing or DantzigPricing(tol)
+        column_norms = None
+        if pricing.needs_column_norms:
+            if is_sparse(A):
+                norms = np.bincount(A.indices, weights=A.data ** 2, minlength=n_vars)
+            else:
+                norms = np.einsum('ij,ij->j', A, A)
+            column_norms = np.concatenate([norms, np.ones(n_constraints)])
+        pricing.reset(n_vars + n_constraints, column_norms)
+        pricing_time = ratio_test_time = update_time = 0.0
+        x_basic = np.array(b, dtype=float)
+        pivots = []
+
+        status = 'optimal'
+        iteration = 0
+        degenerate_pivots = stalls = streak = 0
+        stalled = False
+        while True:
+            # Fila de precios: y^T = c_B^T B^{-1}, costos reducidos d_j = c_j - y^T a_j
+            pricing_start = time.perf_counter()
+            y = factor.btran(c_full[basic_vars])
+            reduced = np.empty(n_vars + n_constraints)
+            reduced[:n_vars] = c_full[:n_vars] - price(y)
+            reduced[n_vars:] = -y
+            # Las básicas tienen costo reducido cero; el error de redondeo no debe elegirlas
+            reduced[basic_vars] = 0.0
+
+            # La regla de precios usa la convención de la fila Z (negativo = mejora)
+            # (con la regla de Bland entra el menor índice que mejora)
+            if stalled:
+                candidates = np.flatnonzero(reduced > pricing.tolerance)
+                pivot_col = int(candidates[0]) if len(candidates) else -1
+            else:
+                pivot_col = pricing.select(-reduced)
+            pricing_time += time.perf_counter() - pricing_start
+            if pivot_col == -1:
+                break
+
+            if iteration >= max_iterations:
+                status = 'iteration_limit'
+                break
+            stop = should_stop and should_stop()
+            if stop:
+                status = stop
+                break
+
+            # Columna entrante transformada: alpha = B^{-1} a_q
+            ratio_start = time.perf_counter()
+            alpha = factor.ftran(self._column(A, pivot_col))
+
+            positive = alpha > tol
+            if not np.any(positive):
+                status = 'unbounded'
+                break
+
+            ratios = np.full(n_constraints, np.inf)
+            ratios[positive] = x_basic[positive] / alpha[positive]
+            pivot_row = int(np.argmin(ratios))
+            theta = ratios[pivot_row]
+            if stalled:
+                # Bland: entre los empates sale la variable básica de menor índice
+                ties = np.flatnonzero(ratios <= theta + tol)
+                pivot_row = int(min(ties, key=lambda i: basic_vars[i]))
+            pricing_start = time.perf_counter()
+            ratio_test_time += pricing_start - ratio_start
+
+            if pricing.needs_pivot_row:
+                # Fila pivote alpha_r = e_r^T B^{-1} [A | I] con la base anterior
+                unit = np.zeros(n_constraints)
+                unit[pivot_row] = 1.0
+                rho = factor.btran(unit)
+
+                def column_dots():
+                    tau = factor.btran(alpha)
+                    return np.concatenate([price(tau), tau])
+
+                pricing.update(np.concatenate([price(rho), rho]), alpha, pivot_row,
+                               pivot_col, basic_vars[pivot_row], column_dots)
+
+            update_start = time.perf_counter()
+            pricing_time += update_start - pricing_start
+            x_basic -= theta * alpha
+            x_basic[pivot_row] = theta
+            basic_vars[pivot_row] = pivot_col
+
+            factor.update(pivot_row, alpha)
+            if factor.needs_refactor():
+                factor.factorize(A, basic_vars)
+                x_basic = factor.ftran(b)
+            update_time += time.perf_counter() - update_start
+
+            iteration += 1
+            pivots.append((pivot_row, pivot_col, alpha[pivot_row]))
+            if callback is not None:
+                callback(iteration, pivot_row, pivot_col, alpha[pivot_row], bool(theta <= tol),
+                         x_basic, float(c_full[basic_vars] @ x_basic))
+
+            if theta > tol:
+                streak = 0
+                stalled = False
+                continue
+            degenerate_pivots += 1
+            streak += 1
+            if anti_cycling and not stalled and streak >= self.stall_pivots:
+                stalls += 1
+                stalled = True
+
+        return {
+            'status': status,
+            'x_basic': x_basic,
+            'basic_vars': basic_vars,
+            'pivots': pivots,
+            'duals': y,
+            'pricing_time': pricing_time,
+            'ratio_test_time': ratio_test_time,
+            'update_time': update_time,
+            'degenerate_pivots': degenerate_pivots,
+            'stalls': stalls
+        }
+
+    @staticmethod
+    def _column(A, j: int) -> np.ndarray:
+        """Columna j de [A | I]"""
+        n_constraints, n_vars = A.shape
+        if j < n_vars:
+            return A.column(j) if is_sparse(A) else A[:, j]
+        col = np.zeros(n_constraints)
+        col[j - n_vars] = 1.0
+        return col
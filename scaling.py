@@ -0,0 +1,160 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from sparse_matrix import CSRMatrix, is_sparse
+
+
+def _nonzeros(A) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fila, columna y valor absoluto de los coeficientes no nulos"""
+    if is_sparse(A):
+        return A.row_index(), A.indices, np.abs(A.data)
+    rows, cols = np.nonzero(A)
+    return rows, cols, np.abs(A[rows, cols])
+
+
+def _power_of_two(factors: np.ndarray) -> np.ndarray:
+    """Redondear cada factor a la potencia de dos más cercana (escalado sin error)"""
+    return np.exp2(np.round(np.log2(factors)))
+
+
+class Scaling:
+    """
+    Escalado de filas y columnas del problema max c^T x, Ax <= b.
+
+    El problema escalado es A' = R·A·S, b' = R·b, c' = S·c con R y S diagonales
+    cuyos factores son potencias de dos, de modo que escalar y desescalar no
+    introduce errores de redondeo. La solución es x = S·x', los duales y = R·y'
+    y el valor óptimo no cambia.
+    """
+
+    def __init__(self, row_scale: np.ndarray, col_scale: np.ndarray, method: str):
+        """
+        Args:
+            row_scale: Factores de fila (diagonal de R)
+            col_scale: Factores de columna (diagonal de S)
+            method: Nombre del método con que se calcularon
+        """
+        self.row_scale = row_scale
+        self.col_scale = col_scale
+        self.method = method
+        # Factor de cada columna del tableau (x = D·x'); la holgura escalada es
+        # s'_i = r_i·s_i, así que su factor es 1/r_i
+        self.column_factors = np.concatenate([col_scale, 1.0 / row_scale])
+
+    @classmethod
+    def compute(cls, A, method: str = 'geometric', passes: int = 4) -> 'Scaling':
+        """
+        Calcular los factores de escala
+
+        Args:
+            A: Matriz de restricciones (densa o CSRMatrix)
+            method: 'geometric' (pasadas alternadas de media geométrica del mayor y
+                    menor coeficiente de cada fila y columna, terminadas con
+                    equilibrado) o 'equilibration' (mayor coeficiente de cada fila
+                    y luego de cada columna igual a 1)
+            passes: Pasadas de media geométrica
+
+        Returns:
+            Scaling
+        """
+        if method not in ('geometric', 'equilibration'):
+            raise ValueError(f"Método de escalado desconocido: {method}")
+
+        n_constraints, n_vars = A.shape
+        rows, cols, values = _nonzeros(A)
+        row_scale = np.ones(n_constraints)
+        col_scale = np.ones(n_vars)
+
+        def extremes(index, scaled, size):
+            largest = np.zeros(size)
+            smallest = np.full(size, np.inf)
+            np.maximum.at(largest, index, scaled)
+            np.minimum.at(smallest, index, scaled)
+            empty = largest == 0
+            largest[empty] = smallest[empty] = 1.0
+            return largest, smallest
+
+        if method == 'geometric':
+            for _ in range(passes):
+                scaled = values * row_scale[rows] * col_scale[cols]
+                largest, smallest = extremes(rows, scaled, n_constraints)
+                row_scale /= np.sqrt(largest * smallest)
+                scaled = values * row_scale[rows] * col_scale[cols]
+                largest, smallest = extremes(cols, scaled, n_vars)
+                col_scale /= np.sqrt(largest * smallest)
+
+        # Equilibrado: filas y luego columnas con coeficiente máximo 1
+        scaled = values * row_scale[rows] * col_scale[cols]
+        row_scale /= extremes(rows, scaled, n_constraints)[0]
+        scaled = values * row_scale[rows] * col_scale[cols]
+        col_scale /= extremes(cols, scaled, n_vars)[0]
+
+        return cls(_power_of_two(row_scale), _power_of_two(col_scale), method)
+
+    def scale_problem(self, c: np.ndarray, A, b: np.ndarray):
+        """
+        Construir el problema escalado
+
+        Returns:
+            Tuple con (c', A', b'); A' es del mismo tipo que A
+        """
+        c = np.asarray(c, dtype=float) * self.col_scale
+        b = np.asarray(b, dtype=float) * self.row_scale
+        if is_sparse(A):
+            data = A.data * self.row_scale[A.row_index()] * self.col_scale[A.indices]
+            A = CSRMatrix(data, A.indices, A.indptr, A.shape)
+        else:
+            A = np.asarray(A, dtype=float) * self.row_scale[:, None] * self.col_scale[None, :]
+        return c, A, b
+
+    def unscale_solution(self, x: np.ndarray) -> np.ndarray:
+        """Solución del problema original x = S·x'"""
+        return x * self.col_scale
+
+    def unscale_duals(self, y: np.ndarray) -> np.ndarray:
+        """Precios duales del problema original y = R·y'"""
+        return y * self.row_scale
+
+    def summary(self, A) -> Dict:
+        """
+        Rango de los coeficientes antes y después del escalado
+
+        Returns:
+            Diccionario con 'method', 'range_before' y 'range_after'
+            (cociente entre el mayor y el menor coeficiente no nulo)
+        """
+        rows, cols, values = _nonzeros(A)
+        if len(values) == 0:
+            return {'method': self.method, 'range_before': 1.0, 'range_after': 1.0}
+        scaled = values * self.row_scale[rows] * self.col_scale[cols]
+        return {
+            'method': self.method,
+            'range_before': float(values.max() / values.min()),
+            'range_after': float(scaled.max() / scaled.min())
+        }
+
+
+def unscale_tableau(tableau: np.ndarray, basic_vars: List[int],
+                    column_factors: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Llevar un tableau del problema escalado al problema original
+
+    Con D = diag(column_factors) se cumple T = D_B·T'·D^{-1} en las filas de
+    restricciones, RHS = D_B·RHS' y fila Z = Z'·D^{-1}; el valor de Z no cambia.
+
+    Args:
+        tableau: Tableau del problema escalado
+        basic_vars: Variables básicas de ese tableau
+        column_factors: Factores de columna (None = sin escalado)
+
+    Returns:
+        Tableau nuevo del problema original (o el mismo si no hay escalado)
+    """
+    if column_factors is None:
+        return tableau
+    basic_factors = column_factors[basic_vars]
+    out = np.empty_like(tableau)
+    np.divide(tableau[:, :-1], column_factors, out=out[:, :-1])
+    out[:-1, :-1] *= basic_factors[:, None]
+    out[:-1, -1] = tableau[:-1, -1] * basic_factors
+    out[-1, -1] = tableau[-1, -1]
+    return out
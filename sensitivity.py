@@ -0,0 +1,175 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+# Magnitud mínima de un coeficiente del tableau en las pruebas del cociente
+TOLERANCE = 1e-9
+
+
+def _feasibility_range(columns: np.ndarray, rhs: np.ndarray,
+                       basic_upper: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rango de delta con el que la base sigue siendo factible cuando los valores
+    de las básicas pasan a rhs + delta·columna (0 <= x_B <= u_B)
+
+    Args:
+        columns: Matriz (m x k) con una columna por cada cambio a analizar
+        rhs: Valores de las variables básicas
+        basic_upper: Cota superior de cada básica (inf si no tiene)
+
+    Returns:
+        Tuple con (delta mínimo, delta máximo) de cada columna
+    """
+    rhs = np.maximum(rhs, 0.0)[:, None]
+    upper = basic_upper[:, None]
+    positive = columns > TOLERANCE
+    negative = columns < -TOLERANCE
+    bounded = np.isfinite(upper)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        to_zero = -rhs / columns
+        to_upper = (upper - rhs) / columns
+    low = np.maximum(np.where(positive, to_zero, -np.inf),
+                     np.where(negative & bounded, to_upper, -np.inf))
+    high = np.minimum(np.where(negative, to_zero, np.inf),
+                      np.where(positive & bounded, to_upper, np.inf))
+    return (np.minimum(low.max(axis=0, initial=-np.inf), 0.0),
+            np.maximum(high.min(axis=0, initial=np.inf), 0.0))
+
+
+def _optimality_range(rows: np.ndarray, z_row: np.ndarray,
+                      nonbasic: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rango de delta con el que la base sigue siendo óptima cuando el costo de
+    la básica de cada fila cambia en delta (la fila Z pasa a z + delta·fila y
+    debe seguir >= 0 en las no básicas)
+
+    Args:
+        rows: Filas del tableau (k x columnas) de las básicas a analizar
+        z_row: Fila Z (costos reducidos, >= 0)
+        nonbasic: Máscara de las columnas no básicas
+
+    Returns:
+        Tuple con (delta mínimo, delta máximo) de cada fila
+    """
+    positive = (rows > TOLERANCE) & nonbasic
+    negative = (rows < -TOLERANCE) & nonbasic
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = -z_row / rows
+    return (np.minimum(np.where(positive, ratios, -np.inf).max(axis=1, initial=-np.inf), 0.0),
+            np.maximum(np.where(negative, ratios, np.inf).min(axis=1, initial=np.inf), 0.0))
+
+
+def sensitivity_report(tableau: np.ndarray, basic_vars: List[int], c: np.ndarray,
+                       b: np.ndarray, upper: Optional[np.ndarray] = None,
+                       at_upper: Optional[np.ndarray] = None) -> Dict:
+    """
+    Análisis de sensibilidad a partir del tableau óptimo, sin volver a resolver
+
+    Todo sale del tableau final con operaciones vectorizadas, en O(m·(n+m)): los
+    costos reducidos y precios sombra son la fila Z, el rango de cada c_j es el
+    intervalo en que la fila Z sigue siendo >= 0 y el de cada b_i (y de cada cota)
+    el intervalo en que las básicas siguen entre 0 y su cota. Los rangos valen
+    para la base actual; con una base degenerada ('degenerate') otra base óptima
+    puede dar rangos distintos.
+
+    Args:
+        tableau: Tableau óptimo del problema original (sin escalar)
+        basic_vars: Variables básicas de ese tableau
+        c: Coeficientes de la función objetivo
+        b: Valores del lado derecho
+        upper: Cotas superiores de las variables (None: sin cotas)
+        at_upper: Columnas escritas como u - x en el tableau (ver Simplex con
+                  variables acotadas)
+
+    Returns:
+        Diccionario con 'variable_status' ('basic', 'lower' o 'upper'),
+        'reduced_costs' (variación de Z por unidad de aumento de cada variable),
+        'objective_ranges' (n x 2: mínimo y máximo de cada c_j), 'shadow_prices',
+        'slacks', 'rhs_ranges' (m x 2: mínimo y máximo de cada b_i),
+        'degenerate' y, con cotas, 'bound_ranges' (n x 2)
+    """
+    c = np.asarray(c, dtype=float)
+    b = np.asarray(b, dtype=float)
+    n_vars, n_constraints = len(c), len(b)
+    n_cols = n_vars + n_constraints
+    basic_vars = np.asarray(basic_vars, dtype=np.int64)
+    rhs = tableau[:-1, -1]
+    z_row = np.maximum(tableau[-1, :-1], 0.0)
+
+    is_basic = np.zeros(n_cols, dtype=bool)
+    is_basic[basic_vars] = True
+    flipped = np.zeros(n_cols, dtype=bool) if at_upper is None else np.asarray(at_upper, dtype=bool)
+    span = np.full(n_cols, np.inf)
+    if upper is not None:
+        span[:n_vars] = upper
+    basic_upper = span[basic_vars]
+
+    # Costos reducidos: una variable en su cota inferior empeora Z en z_j por
+    # unidad que aumenta; una en su cota superior (x' = u - x) mejora Z en z_j
+    basic, at_bound = is_basic[:n_vars], flipped[:n_vars]
+    reduced_costs = np.where(basic, 0.0, np.where(at_bound, z_row[:n_vars], -z_row[:n_vars]))
+    status = np.where(basic, 'basic', np.where(at_bound, 'upper', 'lower'))
+
+    # Rango de c_j: las no básicas solo tienen un extremo finito
+    objective_ranges = np.column_stack([np.where(at_bound, c - z_row[:n_vars], -np.inf),
+                                        np.where(at_bound, np.inf, c + z_row[:n_vars])])
+    basic_cols = np.flatnonzero(basic)
+    if len(basic_cols):
+        row_of = np.empty(n_cols, dtype=np.int64)
+        row_of[basic_vars] = np.arange(n_constraints)
+        low, high = _optimality_range(tableau[row_of[basic_cols], :-1], z_row, ~is_basic)
+        # Una básica escrita como u - x tiene costo -c_j en el tableau
+        sign = np.where(flipped[basic_cols], -1.0, 1.0)
+        objective_ranges[basic_cols] = np.sort(
+            c[basic_cols, None] + sign[:, None] * np.column_stack([low, high]), axis=1)
+
+    # Rango de b_i: la columna de la holgura i es B^-1·e_i
+    low, high = _feasibility_range(tableau[:-1, n_vars:n_cols], rhs, basic_upper)
+    slacks = np.zeros(n_constraints)
+    slack_rows = basic_vars >= n_vars
+    slacks[basic_vars[slack_rows] - n_vars] = rhs[slack_rows]
+
+    report = {
+        'variable_status': status.tolist(),
+        'reduced_costs': reduced_costs,
+        'objective_ranges': objective_ranges,
+        'shadow_prices': tableau[-1, n_vars:n_cols].copy(),
+        'slacks': slacks,
+        'rhs_ranges': np.column_stack([b + low, b + high]),
+        'degenerate': bool(np.any(rhs <= TOLERANCE)
+                           or np.any(rhs >= basic_upper - TOLERANCE))
+    }
+
+    if upper is not None:
+        # Rango de cada cota: una básica o una variable en su cota inferior
+        # admiten cualquier cota por encima de su valor; en la cota superior
+        # cambiar u desplaza las básicas en u·(columna de x')
+        x = np.zeros(n_cols)
+        x[basic_vars] = rhs
+        x = np.where(flipped, span - x, x)[:n_vars]
+        bound_ranges = np.column_stack([x, np.full(n_vars, np.inf)])
+        moving = np.flatnonzero(at_bound & ~basic)
+        if len(moving):
+            low, high = _feasibility_range(tableau[:-1, moving], rhs, basic_upper)
+            bound_ranges[moving] = np.column_stack([np.maximum(upper[moving] + low, 0.0),
+                                                    upper[moving] + high])
+        bound_ranges[~np.isfinite(upper)] = np.inf
+        report['bound_ranges'] = bound_ranges
+    return report
+
+
+def select_rows(report: Dict, rows: np.ndarray) -> Dict:
+    """
+    Reporte restringido a algunas filas (por ejemplo, sin las filas de cotas
+    que se agregaron al final)
+
+    Args:
+        report: Resultado de sensitivity_report
+        rows: Índices de las filas a conservar
+
+    Returns:
+        Reporte nuevo con los arreglos por fila filtrados
+    """
+    report = dict(report)
+    for name in ('shadow_prices', 'slacks', 'rhs_ranges'):
+        report[name] = report[name][rows]
+    return report
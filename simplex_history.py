@@ -0,0 +1,214 @@
+import numpy as np
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from typing import Callable, List, Optional
+from pivot_kernel import PivotKernel
+from scaling import unscale_tableau
+
+
+class IterationView(Mapping):
+    """
+    Datos de una iteración con la misma forma que en el modo 'full'.
+    El tableau solo se materializa cuando se accede a la clave 'tableau'.
+    """
+
+    def __init__(self, history: 'IterationHistory', idx: int, fields: dict):
+        self._history = history
+        self._idx = idx
+        self._fields = fields
+
+    def __getitem__(self, key):
+        if key == 'tableau':
+            return self._history.tableau(self._idx)
+        return self._fields[key]
+
+    def __iter__(self):
+        yield 'tableau'
+        yield from self._fields
+
+    def __len__(self) -> int:
+        return len(self._fields) + 1
+
+
+class IterationHistory(Sequence):
+    """
+    Historial compacto de iteraciones del Simplex.
+
+    Por cada iteración guarda solo el pivote (fila, columna, elemento), la variable
+    que entra y la que sale. El tableau de cualquier iteración se reconstruye bajo
+    demanda repitiendo los pivoteos desde el tableau materializado más cercano,
+    que se conserva en una pequeña caché LRU; la base se reconstruye igual desde
+    copias guardadas cada BASIS_CHECKPOINT iteraciones. Se comporta como la lista
+    de diccionarios que devuelve el modo 'full'. Si el problema se resolvió
+    escalado, los tableaux y elementos pivote se devuelven en la escala original.
+    Con cotas superiores cada registro guarda además la variable que pasó a
+    x' = u - x (un cambio de cota sin pivoteo tiene fila -1).
+    """
+
+    BASIS_CHECKPOINT = 64
+
+    def __init__(self, basic_vars: List[int], names: List[str],
+                 initial_tableau: Optional[np.ndarray] = None,
+                 build_initial: Optional[Callable[[], np.ndarray]] = None,
+                 cache_size: int = 8, column_factors: Optional[np.ndarray] = None,
+                 upper: Optional[np.ndarray] = None):
+        """
+        Args:
+            basic_vars: Variables básicas de la tabla inicial
+            names: Nombres de todas las columnas (variables y holguras) sin 'RHS'
+            initial_tableau: Tableau inicial (se copia)
+            build_initial: Alternativa a initial_tableau: función que lo construye
+                           solo cuando se pide un tableau por primera vez
+            cache_size: Número de tableaux materializados que se conservan
+            column_factors: Factores de columna del escalado (ver scaling.py); los
+                            pivoteos se repiten en el problema escalado
+            upper: Cotas superiores de todas las columnas (las del problema escalado)
+        """
+        self._names = names
+        self.col_names = names + ['RHS']
+        self._initial = initial_tableau.copy() if initial_tableau is not None else None
+        self._build_initial = build_initial
+        self._cache_size = max(1, cache_size)
+        self._cache: 'OrderedDict[int, np.ndarray]' = OrderedDict()
+        self._kernel = None
+        self._column_factors = column_factors
+        self._upper = upper
+
+        # Una tupla por iteración: (fila, columna, elemento, entra, sale, es_optima,
+        # variable que cambió de cota o -1)
+        self._records = []
+        self._current_basis = list(basic_vars)
+        self._basis_checkpoints = {0: tuple(basic_vars)}
+        self._current_at_upper = set()
+        self._upper_checkpoints = {0: frozenset()}
+
+    def record(self, pivot_row: int, pivot_col: int, pivot_element: Optional[float],
+               is_optimal: bool, flipped: int = -1):
+        """
+        Registrar un pivoteo
+
+        Args:
+            pivot_row: Fila pivote (-1 en un cambio de cota sin pivoteo)
+            pivot_col: Columna pivote (variable que entra)
+            pivot_element: Elemento pivote antes de normalizar la fila (None sin pivoteo)
+            is_optimal: Si el tableau resultante es óptimo
+            flipped: Variable que pasó a x' = u - x antes del pivoteo (-1 si ninguna)
+        """
+        leaving = None
+        if pivot_row >= 0:
+            leaving = self._current_basis[pivot_row]
+            self._current_basis[pivot_row] = int(pivot_col)
+        if flipped >= 0:
+            self._current_at_upper ^= {int(flipped)}
+        self._records.append((int(pivot_row), int(pivot_col),
+                              None if pivot_element is None else float(pivot_element),
+                              int(pivot_col), leaving, bool(is_optimal), int(flipped)))
+        if len(self._records) % self.BASIS_CHECKPOINT == 0:
+            self._basis_checkpoints[len(self._records)] = tuple(self._current_basis)
+            self._upper_checkpoints[len(self._records)] = frozenset(self._current_at_upper)
+
+    def __len__(self) -> int:
+        return len(self._records) + 1
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("Iteración fuera de rango")
+
+        basic_vars = self.basic_vars(idx)
+        if idx == 0:
+            pivot_row, pivot_col, pivot_element, entering, leaving, is_optimal = -1, -1, None, None, None, False
+        else:
+            pivot_row, pivot_col, pivot_element, entering, leaving, is_optimal, _ = self._records[idx - 1]
+            if self._column_factors is not None and pivot_element is not None:
+                pivot_element *= self._column_factors[leaving] / self._column_factors[entering]
+
+        fields = {
+            'iteration': idx,
+            'basic_vars': basic_vars,
+            'pivot_row': pivot_row,
+            'pivot_col': pivot_col,
+            'pivot_element': pivot_element,
+            'entering': entering,
+            'leaving': leaving,
+            'col_names': self.col_names,
+            'row_names': [self._names[j] for j in basic_vars] + ['Z'],
+            'is_optimal': is_optimal
+        }
+        if self._upper is not None:
+            fields['at_upper'] = self.at_upper(idx)
+        return IterationView(self, idx, fields)
+
+    def basic_vars(self, idx: int) -> List[int]:
+        """Variables básicas de la iteración idx (desde la copia de base más cercana)"""
+        start = idx - idx % self.BASIS_CHECKPOINT
+        basis = list(self._basis_checkpoints[start])
+        for pivot_row, pivot_col, *_ in self._records[start:idx]:
+            if pivot_row >= 0:
+                basis[pivot_row] = pivot_col
+        return basis
+
+    def at_upper(self, idx: int) -> List[int]:
+        """Variables escritas como x' = u - x en la iteración idx"""
+        start = idx - idx % self.BASIS_CHECKPOINT
+        flipped = set(self._upper_checkpoints[start])
+        for record in self._records[start:idx]:
+            if record[-1] >= 0:
+                flipped ^= {record[-1]}
+        return sorted(flipped)
+
+    def tableau(self, idx: int) -> np.ndarray:
+        """
+        Materializar (de solo lectura) el tableau de la iteración idx en la escala
+        del problema original
+
+        Args:
+            idx: Índice de la iteración (0 = tabla inicial)
+
+        Returns:
+            Tableau de esa iteración
+        """
+        if idx in self._cache:
+            self._cache.move_to_end(idx)
+            return self._unscaled(idx, self._cache[idx])
+
+        # Partir del tableau materializado más cercano anterior a idx
+        start = max((k for k in self._cache if k < idx), default=None)
+        if start is None:
+            start, tableau = 0, self._initial_tableau().copy()
+        else:
+            tableau = self._cache[start].copy()
+
+        if self._kernel is None:
+            self._kernel = PivotKernel(tableau.shape)
+        for pivot_row, pivot_col, _, _, leaving, _, flipped in self._records[start:idx]:
+            if flipped >= 0:
+                if pivot_row == -1:
+                    self._kernel.flip_column(tableau, pivot_col, self._upper[pivot_col])
+                else:
+                    self._kernel.flip_row(tableau, pivot_row, leaving, self._upper[leaving])
+            if pivot_row >= 0:
+                self._kernel.pivot(tableau, pivot_row, pivot_col)
+
+        tableau.flags.writeable = False
+        self._cache[idx] = tableau
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return self._unscaled(idx, tableau)
+
+    def _unscaled(self, idx: int, tableau: np.ndarray) -> np.ndarray:
+        """Tableau en la escala original (la caché guarda los del problema escalado)"""
+        if self._column_factors is None:
+            return tableau
+        tableau = unscale_tableau(tableau, self.basic_vars(idx), self._column_factors)
+        tableau.flags.writeable = False
+        return tableau
+
+    def _initial_tableau(self) -> np.ndarray:
+        if self._initial is None:
+            self._initial = self._build_initial()
+            self._build_initial = None
+        return self._initial
@@ -1,6 +1,27 @@
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Tuple, Optional, Union
 import re
+import tempfile
+import time
+import warnings
+from revised_simplex import RevisedSimplex
+from sparse_matrix import CSRMatrix, is_sparse
+from pivot_kernel import PivotKernel
+from simplex_history import IterationHistory
+from pricing import PricingRule, make_pricing
+from presolve import Presolver
+from scaling import Scaling, unscale_tableau
+from interior_point import InteriorPoint, crossover_basis
+from lp_parser import parse_integrality, parse_linear
+from model_io import LPModel, read_model
+from solve_cache import SolveCache
+from cancellation import CancellationToken, stop_check
+from bounds import bounds_as_rows, split_bounds
+from branch_and_bound import BranchAndBound
+from decomposition import DantzigWolfe
+from sensitivity import select_rows, sensitivity_report
+from parametric import evaluate_sweep, objective_sweep, rhs_sweep
+from out_of_core import block_rows_for, disk_tableau
 
 class SimplexSolver:
     """
@@ -8,21 +29,55 @@ class SimplexSolver:
     Solo soporta problemas de MAXIMIZACIÓN.
     """
     
-    def __init__(self):
-        """Inicializar el solver Simplex"""
+    # Pivoteos degenerados seguidos que se consideran un estancamiento
+    STALL_PIVOTS = 10
+    # Tamaño del tableau denso a partir del cual solve advierte que densifica una CSRMatrix
+    DENSE_TABLEAU_WARN_BYTES = 64 << 20
+    ANTI_CYCLING_MODES = (None, 'bland', 'lexicographic', 'perturb')
+    # Estados de una resolución detenida antes de la optimalidad (con la última base)
+    STOP_MESSAGES = {
+        'iteration_limit': 'Se alcanzó el límite de {} iteraciones',
+        'time_limit': 'Se alcanzó el límite de tiempo tras {} iteraciones',
+        'cancelled': 'Resolución cancelada tras {} iteraciones'
+    }
+    
+    def __init__(self, cache: Optional[SolveCache] = None):
+        """
+        Inicializar el solver Simplex
+        
+        Args:
+            cache: Caché de resultados (ver solve_cache.py); si se da, solve y
+                   solve_from_text devuelven los problemas ya resueltos sin resolverlos
+        """
+        self.cache = cache
         self.iterations = []
         self.optimal_solution = None
         self.optimal_value = None
         self.variable_names = []
         self.slack_variable_names = []
+        self._warm_start = None
+        self._degeneracy = {'mode': None, 'degenerate_pivots': 0, 'stalls': 0, 'perturbed': False}
+        self._scaling = None
+        self._should_stop = None
+        self._callback = None
+        self._callback_start = 0.0
+        self._upper = None
+        self._at_upper = None
+        self._sensitivity = False
+        self._out_of_core = None
+        self._block_rows = None
+        self._ray = None
         
-    def parse_problem(self, objective: str, restrictions: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    def parse_problem(self, objective: str, restrictions: List[str],
+                      sparse: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Parsear el problema desde el formato de texto (solo maximización)
         
         Args:
             objective: Función objetivo en formato "Maximizar Z = 3x1 + 2x2"
             restrictions: Lista de restricciones en formato "2x1 + 1x2 <= 10"
+            sparse: Si es True la matriz de restricciones se devuelve como CSRMatrix
+                    (solo se guardan los coeficientes no nulos)
             
         Returns:
             Tuple con (coeficientes_objetivo, matriz_restricciones, valores_derecha)
@@ -36,304 +91,1725 @@ class SimplexSolver:
         if not obj_match:
             raise ValueError("No se pudo parsear la función objetivo")
         
-        obj_expr = obj_match.group(1).strip()
-        c = self._parse_expression(obj_expr)
-        n_vars = len(c)
+        obj_terms, relation, _ = parse_linear(obj_match.group(1))
+        if relation is not None:
+            raise ValueError("No se pudo parsear la función objetivo")
+        n_vars = max(obj_terms) + 1 if obj_terms else 0
+        c_array = np.zeros(n_vars)
+        c_array[list(obj_terms)] = list(obj_terms.values())
         
-        # Parsear restricciones
-        A = []
+        # Parsear restricciones como tripletas (fila, columna, valor)
         b = []
+        rows, cols, vals = [], [], []
         
         for restriction in restrictions:
-            # Limpiar restricción
-            restriction = restriction.strip()
-            
-            # Saltar restricciones de no negatividad
-            if '>= 0' in restriction or '≥ 0' in restriction:
+            try:
+                terms, relation, rhs = parse_linear(restriction)
+            except ValueError:
+                continue
+            if relation is None:
                 continue
             
-            # Separar lado izquierdo y derecho
-            for op in ['<=', '>=', '=', '≤', '≥']:
-                if op in restriction:
-                    parts = restriction.split(op)
-                    if len(parts) == 2:
-                        left = parts[0].strip()
-                        right = parts[1].strip()
-                        
-                        # Parsear lado izquierdo
-                        coeffs_left = self._parse_expression(left)
-                        
-                        # Verificar si el lado derecho tiene variables o es solo un número
-                        coeffs_right = self._parse_expression(right)
-                        
-                        if coeffs_right and any(c != 0 for c in coeffs_right):
-                            # Hay variables en el lado derecho, moverlas al lado izquierdo
-                            # Asegurar que ambos lados tengan el mismo tamaño
-                            max_len = max(len(coeffs_left), len(coeffs_right))
-                            while len(coeffs_left) < max_len:
-                                coeffs_left.append(0.0)
-                            while len(coeffs_right) < max_len:
-                                coeffs_right.append(0.0)
-                            
-                            # Restar lado derecho del izquierdo: ax1 + bx2 >= cx1 + dx2 -> (a-c)x1 + (b-d)x2 >= 0
-                            coeffs = [coeffs_left[i] - coeffs_right[i] for i in range(max_len)]
-                            rhs = 0.0
-                        else:
-                            # Lado derecho es solo un número
-                            coeffs = coeffs_left
-                            try:
-                                rhs = float(right)
-                            except ValueError:
-                                continue
-                        
-                        # Asegurar que tenga el mismo número de variables que la función objetivo
-                        while len(coeffs) < n_vars:
-                            coeffs.append(0.0)
-                        coeffs = coeffs[:n_vars]
-                        
-                        # Para >= convertir a <= multiplicando por -1
-                        if op in ['>=', '≥']:
-                            coeffs = [-x for x in coeffs]
-                            rhs = -rhs
-                        
-                        # Solo agregar restricciones válidas con RHS positivo o cero
-                        # (Simplex estándar requiere RHS >= 0)
-                        if rhs >= -1e-10:  # Permitir pequeños errores numéricos
-                            # Si RHS es negativo pequeño, ajustar a 0
-                            if rhs < 0:
-                                rhs = 0.0
-                            A.append(coeffs)
-                            b.append(rhs)
-                        break
+            if relation == '>=':
+                # Restricciones como "x1, x2 >= 0" son redundantes con x >= 0
+                if rhs == 0 and all(coef >= 0 for coef in terms.values()):
+                    continue
+                # Para >= convertir a <= multiplicando por -1
+                terms = {j: -coef for j, coef in terms.items()}
+                rhs = -rhs
+            
+            # Solo agregar restricciones válidas con RHS positivo o cero
+            # (Simplex estándar requiere RHS >= 0); '=' se trata como '<='
+            if rhs < -1e-10:
+                continue
+            # Las variables que no aparecen en la función objetivo se descartan
+            row = len(b)
+            for j, coef in terms.items():
+                if j < n_vars and coef != 0:
+                    rows.append(row)
+                    cols.append(j)
+                    vals.append(coef)
+            b.append(max(rhs, 0.0))
         
         # Convertir a arrays numpy
-        c_array = np.array(c, dtype=float)
-        A_array = np.array(A, dtype=float) if A else np.array([[]], dtype=float)
+        if sparse:
+            A_array = CSRMatrix.from_triplets(rows, cols, vals, (len(b), n_vars))
+        elif b:
+            A_array = np.zeros((len(b), n_vars))
+            A_array[rows, cols] = vals
+        else:
+            A_array = np.array([[]], dtype=float)
         b_array = np.array(b, dtype=float)
         
         return c_array, A_array, b_array
     
-    def _parse_expression(self, expr: str) -> List[float]:
+    def solve(self, c: np.ndarray, A: np.ndarray, b: np.ndarray, method: str = 'tableau',
+              history: Optional[str] = None,
+              pricing: Union[str, PricingRule] = 'dantzig',
+              max_iterations: Optional[int] = None,
+              anti_cycling: Optional[str] = 'bland',
+              presolve: bool = False,
+              scaling: Optional[str] = None,
+              crossover: bool = False,
+              time_limit: Optional[float] = None,
+              cancel_token: Optional[CancellationToken] = None,
+              callback: Optional[Callable[[Dict], None]] = None,
+              upper_bounds: Optional[np.ndarray] = None,
+              sensitivity: bool = False,
+              out_of_core: bool = False,
+              scratch_dir: Optional[str] = None,
+              block_rows: Optional[int] = None) -> Dict:
         """
-        Parsear una expresión lineal como "3x1 + 2x2 - 5x3" o "40x1 + 30x2"
+        Resolver el problema usando el método Simplex
         
         Args:
-            expr: Expresión a parsear
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones (densa o CSRMatrix)
+            b: Valores del lado derecho
+            method: 'tableau' (tableau completo; densifica una CSRMatrix y lo
+                    advierte con un warning si el tableau supera
+                    DENSE_TABLEAU_WARN_BYTES), 'revised' (Simplex revisado con
+                    factorización LU de la base; con CSRMatrix usa memoria
+                    O(nnz + k²), con k las columnas estructurales básicas) o
+                    'interior_point' (predictor-corrector de Mehrotra, ver interior_point.py)
+            history: 'full' (copia del tableau en cada iteración), 'compact' (solo
+                     pivotes; los tableaux se reconstruyen bajo demanda) o 'none'.
+                     Por defecto 'full' con tableau y 'compact' con revised
+            pricing: Regla de la columna entrante: 'dantzig', 'partial', 'devex',
+                     'steepest_edge' o una instancia de PricingRule
+            max_iterations: Límite de pivoteos (por defecto según el tamaño del
+                            problema); al alcanzarlo el estado es 'iteration_limit'
+            anti_cycling: Qué hacer tras STALL_PIVOTS pivoteos degenerados seguidos:
+                          'bland' (regla de Bland hasta el siguiente paso no nulo),
+                          'lexicographic' (prueba del cociente lexicográfica),
+                          'perturb' (perturbar el RHS y, si vuelve a estancarse, Bland)
+                          o None. El método revisado siempre usa Bland
+            presolve: Reducir el problema antes de resolverlo (ver presolve.py);
+                      la solución y los duales se devuelven en el modelo original
+            scaling: Escalar filas y columnas antes de pivotear: 'geometric',
+                     'equilibration' o None (ver scaling.py). La solución, el valor
+                     óptimo, los duales y los tableaux del historial se devuelven
+                     en la escala original
+            crossover: Con 'interior_point', pasar de la solución interior a una base
+                       óptima (solución en un vértice, con su historial de pivoteos)
+            time_limit: Segundos de reloj; al agotarse el estado es 'time_limit'
+            cancel_token: CancellationToken; al cancelarlo el estado es 'cancelled'.
+                          Ambos se comprueban entre pivoteos (o iteraciones de punto
+                          interior) y el resultado trae la solución de la última base
+            callback: Función llamada tras cada pivoteo (o iteración de punto
+                      interior) con un diccionario: 'phase', 'iteration',
+                      'pivot_row', 'pivot_col', 'pivot_element', 'degenerate',
+                      'objective', 'primal_infeasibility' y 'elapsed' (segundos
+                      desde el inicio de solve)
+            upper_bounds: Cotas superiores de las variables (inf: sin cota). Con
+                          'tableau' y sin presolve no se agregan como filas: el
+                          Simplex con variables acotadas las maneja en la prueba
+                          del cociente (y 'lexicographic' y 'perturb' pasan a
+                          Bland); los demás métodos las agregan como filas
+            sensitivity: Agregar al resultado óptimo 'sensitivity' (costos
+                         reducidos, precios sombra y rangos de c y b, ver
+                         sensitivity.py), calculado desde el tableau final o, sin
+                         él, desde la base óptima. No disponible con presolve ni
+                         con punto interior sin crossover
+            out_of_core: Guardar el tableau en un archivo temporal mapeado en
+                         memoria (ver out_of_core.py) en lugar de en RAM, para
+                         modelos densos más grandes que la memoria. Solo con
+                         'tableau' y history='none' (el valor por defecto en
+                         este modo), sin scaling ni sensitivity
+            scratch_dir: Directorio del archivo con out_of_core (por defecto el
+                         temporal del sistema)
+            block_rows: Filas por bloque al pivotear; con out_of_core es el
+                        conjunto de trabajo residente (por defecto bloques de
+                        ~64 MB; en memoria, de ~256 KB)
             
         Returns:
-            Lista de coeficientes
+            Diccionario con la solución, los precios duales ('duals') y todas las
+            iteraciones; 'pricing' resume la regla usada, las iteraciones y el tiempo
+            de resolución y de precios, y 'degeneracy' los pivoteos degenerados y
+            los estancamientos, y 'profile' el tiempo de precios, prueba del
+            cociente, eliminación, historial y callback, y los pivoteos
+            degenerados. Con 'interior_point', 'interior_point' informa las
+            iteraciones, la historia de la brecha de dualidad y el crossover. Con
+            caché, 'cache' indica si hubo acierto y el tiempo de la consulta. Con
+            upper_bounds, 'bound_duals' trae el precio dual de cada cota. Si el
+            problema no está acotado, con 'tableau' 'ray' es una dirección
+            factible en la que Z crece sin límite. Con out_of_core,
+            'out_of_core' informa el tamaño del tableau en disco y del bloque
         """
-        # Limpiar expresión y convertir a minúsculas
-        expr = expr.replace(' ', '').lower()
-        
-        # Patrón mejorado: captura coeficientes opcionales (incluyendo números grandes) antes de x
-        # ([+-]?\d+\.?\d*) captura: signo opcional + uno o más dígitos + punto decimal opcional + más dígitos opcionales
-        pattern = r'([+-]?\d+\.?\d*)?x(\d+)'
-        matches = re.findall(pattern, expr)
+        if method not in ('tableau', 'revised', 'interior_point'):
+            raise ValueError(f"Método desconocido: {method}")
+        if out_of_core:
+            if method != 'tableau':
+                raise ValueError("out_of_core solo está disponible con method='tableau'")
+            if history is None:
+                history = 'none'
+            elif history != 'none':
+                raise ValueError("out_of_core necesita history='none' (el historial copia el tableau)")
+            if scaling is not None or sensitivity:
+                raise ValueError("out_of_core no admite scaling ni sensitivity (copian A o el tableau en RAM)")
+        if block_rows is not None and block_rows < 1:
+            raise ValueError("block_rows debe ser >= 1")
+        if method == 'tableau' and not out_of_core and is_sparse(A):
+            # El tableau es denso: con CSRMatrix la memoria deja de ser O(nnz)
+            size = (len(b) + 1) * (len(c) + len(b) + 1) * 8
+            if size > self.DENSE_TABLEAU_WARN_BYTES:
+                warnings.warn(f"method='tableau' densifica la CSRMatrix en un tableau de "
+                              f"{size / 1e6:.1f} MB; method='revised' la usa sin densificar",
+                              stacklevel=2)
+        if history is None:
+            history = 'full' if method == 'tableau' else 'compact'
+        if history not in ('full', 'compact', 'none'):
+            raise ValueError(f"Modo de historial desconocido: {history}")
+        if upper_bounds is not None:
+            upper_bounds = np.asarray(upper_bounds, dtype=float)
+            if upper_bounds.shape != (len(c),):
+                raise ValueError("upper_bounds debe tener una cota por variable")
+            if np.any(np.isnan(upper_bounds)) or np.any(upper_bounds < 0):
+                raise ValueError("Las cotas superiores deben ser >= 0 (las variables son >= 0)")
+            if not np.isfinite(upper_bounds).any():
+                upper_bounds = None
+        self._should_stop = stop_check(cancel_token, time_limit)
+        self._callback = callback
+        self._callback_start = time.perf_counter()
+        self._sensitivity = sensitivity
+        self._out_of_core = {'scratch_dir': scratch_dir} if out_of_core else None
+        self._block_rows = block_rows
         
-        if not matches:
-            return []
+        if self.cache is None or not isinstance(pricing, str):
+            return self._dispatch(c, A, b, method, history, pricing, max_iterations,
+                                  anti_cycling, presolve, scaling, crossover, upper_bounds)
         
-        # Determinar número de variables
-        max_var = max(int(m[1]) for m in matches)
-        coeffs = [0.0] * max_var
+        start_time = time.perf_counter()
+        options = {'method': method, 'history': history, 'pricing': pricing,
+                   'max_iterations': max_iterations, 'anti_cycling': anti_cycling,
+                   'presolve': presolve, 'scaling': scaling, 'crossover': crossover,
+                   'upper_bounds': None if upper_bounds is None else upper_bounds.tobytes(),
+                   'sensitivity': sensitivity, 'out_of_core': out_of_core}
+        result, keys = self.cache.get(c, A, b, options)
+        if result is not None:
+            # Dejar el solver como si hubiera resuelto este problema
+            self.iterations = result['iterations']
+            self.optimal_solution = result.get('solution') if result['status'] == 'optimal' else None
+            self.optimal_value = result.get('optimal_value') if result['status'] == 'optimal' else None
+            self.variable_names = result.get('variable_names', self.variable_names)
+            basis = self.cache.basis(keys)
+            self._warm_start = None
+            if basis is not None:
+                self.slack_variable_names = [f's{i+1}' for i in range(len(b))]
+                self._all_names = self.variable_names + self.slack_variable_names
+                self._col_names = self._all_names + ['RHS']
+                self.history_mode = history
+                self._remember_basis(c, A, b, *basis)
+            result['cache'] = {'hit': True, 'time': time.perf_counter() - start_time}
+            return result
         
-        # Asignar coeficientes
-        for coef_str, var_num in matches:
-            var_idx = int(var_num) - 1
-            
-            # Si coef_str está vacío, el coeficiente es 1 (o -1 si hay signo)
-            if coef_str == '' or coef_str == '+':
-                coef = 1.0
-            elif coef_str == '-':
-                coef = -1.0
-            else:
-                # Convertir el string del coeficiente a float
-                coef = float(coef_str)
-            
-            coeffs[var_idx] = coef
+        self._warm_start = None
+        result = self._dispatch(c, A, b, method, history, pricing, max_iterations,
+                                anti_cycling, presolve, scaling, crossover, upper_bounds)
+        warm = self._warm_start
+        self.cache.put(keys, result, None if warm is None else (warm['basic_vars'], warm['cold_pivots']))
+        result['cache'] = {'hit': False, 'time': time.perf_counter() - start_time}
+        return result
+    
+    def _dispatch(self, c: np.ndarray, A, b: np.ndarray, method: str, history: str,
+                  pricing: Union[str, PricingRule], max_iterations: Optional[int],
+                  anti_cycling: Optional[str], presolve: bool, scaling: Optional[str],
+                  crossover: bool, upper: Optional[np.ndarray] = None) -> Dict:
+        """
+        Resolver con o sin presolve (ver solve)
         
-        return coeffs
+        Las cotas superiores solo llegan al tableau sin presolve; en los demás
+        casos se agregan como filas al final y sus duales pasan a 'bound_duals'
+        """
+        if upper is not None and (presolve or method != 'tableau'):
+            n_rows = len(b)
+            bounded = np.flatnonzero(np.isfinite(upper))
+            A, b = bounds_as_rows(A, b, upper)
+            result = self._dispatch(c, A, b, method, history, pricing, max_iterations,
+                                    anti_cycling, presolve, scaling, crossover)
+            if result.get('duals') is not None:
+                result['bound_duals'] = np.zeros(len(c))
+                result['bound_duals'][bounded] = result['duals'][n_rows:]
+                result['duals'] = result['duals'][:n_rows]
+            if 'sensitivity' in result:
+                # Los rangos de las filas de cotas son los rangos de las cotas
+                report = result['sensitivity']
+                bound_ranges = np.full((len(c), 2), np.inf)
+                bound_ranges[bounded] = report['rhs_ranges'][n_rows:]
+                result['sensitivity'] = select_rows(report, np.arange(n_rows))
+                result['sensitivity']['bound_ranges'] = bound_ranges
+            # La base (guardada y del resultado) incluye las filas de las cotas
+            self._warm_start = None
+            result.pop('basic_vars', None)
+            return result
+        if presolve:
+            return self._solve_presolved(c, A, b, method, history, pricing, max_iterations,
+                                         anti_cycling, scaling, crossover)
+        return self._solve(c, A, b, method, history, pricing, max_iterations, anti_cycling,
+                           scaling, crossover=crossover, upper=upper)
     
-    def solve(self, c: np.ndarray, A: np.ndarray, b: np.ndarray) -> Dict:
+    def _solve(self, c: np.ndarray, A, b: np.ndarray, method: str, history: str,
+               pricing: Union[str, PricingRule], max_iterations: Optional[int],
+               anti_cycling: Optional[str], scaling: Optional[str] = None,
+               names: Optional[Tuple[List[str], List[str]]] = None,
+               crossover: bool = False, upper: Optional[np.ndarray] = None) -> Dict:
         """
-        Resolver el problema usando el método Simplex
+        Resolver con las opciones ya validadas (ver solve)
         
         Args:
-            c: Coeficientes de la función objetivo
-            A: Matriz de restricciones
-            b: Valores del lado derecho
-            
-        Returns:
-            Diccionario con la solución y todas las iteraciones
+            names: Nombres de las variables y de las holguras (por defecto x1.., s1..)
+            upper: Cotas superiores de las variables (solo con method='tableau')
         """
         # Inicializar
         self.iterations = []
+        self.history_mode = history
+        start_time = time.perf_counter()
+        
+        # Escalar el problema; el resultado se lleva a la escala original al final
+        original = (c, A, b)
+        original_upper = upper
+        self._scaling = None
+        column_factors = None
+        if scaling is not None:
+            self._scaling = Scaling.compute(A, scaling)
+            column_factors = self._scaling.column_factors
+            c, A, b = self._scaling.scale_problem(c, A, b)
+            if upper is not None:
+                upper = upper / self._scaling.col_scale
+        
+        # Con cotas los cambios x' = u - x no admiten la regla lexicográfica ni la
+        # perturbación (ambas suponen RHS = B^-1 b)
+        if upper is not None and anti_cycling in ('lexicographic', 'perturb'):
+            anti_cycling = 'bland'
+        self._start_run(pricing, anti_cycling, b)
         n_vars = len(c)
         n_constraints = len(b)
+        if upper is not None:
+            self._upper = np.concatenate([upper, np.full(n_constraints, np.inf)])
+            self._at_upper = np.zeros(n_vars + n_constraints, dtype=bool)
+            self._warm_start = None
+        if max_iterations is None:
+            max_iterations = (InteriorPoint.MAX_ITERATIONS if method == 'interior_point'
+                              else self._iteration_budget(n_vars, n_constraints))
         
         # Crear nombres de variables
-        self.variable_names = [f'x{i+1}' for i in range(n_vars)]
-        self.slack_variable_names = [f's{i+1}' for i in range(n_constraints)]
-        
-        # Agregar variables de holgura para formar el tableau inicial
-        # Tableau: [A | I | b]
-        #          [c | 0 | 0]
+        if names is None:
+            self.variable_names = [f'x{i+1}' for i in range(n_vars)]
+            self.slack_variable_names = [f's{i+1}' for i in range(n_constraints)]
+        else:
+            self.variable_names, self.slack_variable_names = names
+        self._all_names = self.variable_names + self.slack_variable_names
+        self._col_names = self._all_names + ['RHS']
         
-        tableau = np.zeros((n_constraints + 1, n_vars + n_constraints + 1))
+        # Variables básicas iniciales (las de holgura)
+        basic_vars = list(range(n_vars, n_vars + n_constraints))
         
-        # Llenar parte de restricciones
-        tableau[:n_constraints, :n_vars] = A
-        tableau[:n_constraints, n_vars:n_vars+n_constraints] = np.eye(n_constraints)
-        tableau[:n_constraints, -1] = b
+        if method == 'interior_point':
+            result = self._solve_interior_point(c, A, b, max_iterations, crossover)
+            result = self._with_sensitivity(result, original)
+            return self._with_run_stats(self._unscale_result(result, *original), start_time)
         
-        # Llenar fila Z (función objetivo)
-        tableau[-1, :n_vars] = -c  # Negativo porque estamos en forma estándar
+        if method == 'revised':
+            if history == 'compact':
+                self.iterations = IterationHistory(
+                    basic_vars, self._all_names,
+                    build_initial=lambda: self._build_tableau(c, A, b),
+                    column_factors=column_factors)
+            result = self._with_sensitivity(self._solve_revised(c, A, b, max_iterations), original)
+            return self._with_run_stats(self._unscale_result(result, *original), start_time)
         
-        # Variables básicas iniciales (las de holgura)
-        basic_vars = list(range(n_vars, n_vars + n_constraints))
+        # Con out_of_core el tableau vive en disco y solo un bloque de filas a la vez en RAM
+        block_rows = self._block_rows
+        if self._out_of_core is not None:
+            block_rows = block_rows or block_rows_for(n_vars + n_constraints + 1)
+            tableau = disk_tableau(c, A, b, self._out_of_core['scratch_dir'], block_rows)
+        else:
+            tableau = self._build_tableau(c, A, b)
         
         # Guardar tableau inicial
-        self._save_iteration(tableau.copy(), basic_vars.copy(), -1, -1, 0)
+        if history == 'compact':
+            self.iterations = IterationHistory(basic_vars, self._all_names, initial_tableau=tableau,
+                                               column_factors=column_factors, upper=self._upper)
+        elif history == 'full':
+            self._save_iteration(tableau, basic_vars, -1, -1, 0)
+        
+        # Buffers de pivoteo reutilizados en todas las iteraciones
+        kernel = PivotKernel(tableau.shape, block_rows)
         
         # Iterar hasta encontrar solución óptima
-        iteration = 0
-        max_iterations = 100
+        self._reset_pricing(tableau)
+        status, iteration = self._run_primal(tableau, basic_vars, kernel, max_iterations)
         
-        while iteration < max_iterations:
-            # Verificar si es óptimo (todos los coeficientes en fila Z son >= 0)
-            if np.all(tableau[-1, :-1] >= -1e-10):
-                # Solución óptima encontrada
-                break
+        # resolve() parte de una base sin variables en su cota superior
+        if status == 'optimal' and self._upper is None:
+            self._remember_basis(c, A, b, basic_vars, iteration)
+        result = self._tableau_result(tableau, basic_vars, status, iteration)
+        result = self._with_sensitivity(result, original, original_upper, tableau)
+        if self._out_of_core is not None:
+            result['out_of_core'] = {
+                'scratch_dir': self._out_of_core['scratch_dir'] or tempfile.gettempdir(),
+                'tableau_bytes': tableau.nbytes,
+                'block_rows': kernel.block_rows,
+                'block_bytes': kernel.block.nbytes
+            }
+        return self._with_run_stats(self._unscale_result(result, *original), start_time)
+    
+    def _with_sensitivity(self, result: Dict, original: Tuple, upper: Optional[np.ndarray] = None,
+                          tableau: Optional[np.ndarray] = None) -> Dict:
+        """
+        Agregar 'sensitivity' a un resultado óptimo si se pidió (ver sensitivity.py)
+        
+        Args:
+            result: Resultado con 'basic_vars'
+            original: (c, A, b) sin escalar
+            upper: Cotas superiores sin escalar
+            tableau: Tableau final (escalado si hubo escalado); sin él se
+                     reconstruye desde la base óptima
+            
+        Returns:
+            El mismo resultado
+        """
+        if not self._sensitivity or result['status'] != 'optimal' or 'basic_vars' not in result:
+            return result
+        basic_vars = result['basic_vars']
+        if tableau is None:
+            tableau = self._tableau_from_basis(*original, basic_vars)
+        elif self._scaling is not None:
+            tableau = unscale_tableau(tableau, basic_vars, self._scaling.column_factors)
+        result['sensitivity'] = sensitivity_report(tableau, basic_vars, original[0], original[2],
+                                                   upper, self._at_upper)
+        return result
+    
+    def _solve_interior_point(self, c: np.ndarray, A, b: np.ndarray, max_iterations: int,
+                              crossover: bool) -> Dict:
+        """
+        Resolver con el método de punto interior y, si se pide, hacer crossover
+        
+        El crossover elige una base con crossover_basis(), construye su tableau y
+        termina con el Simplex primal (o dual si la base no es factible pero sí dual
+        factible); las iteraciones registradas son los pivoteos del crossover.
+        
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones
+            b: Valores del lado derecho
+            max_iterations: Límite de iteraciones de punto interior
+            crossover: Terminar en una base óptima
             
-            # Seleccionar columna pivote (más negativo en fila Z)
-            pivot_col = np.argmin(tableau[-1, :-1])
+        Returns:
+            Diccionario de resultado con la clave adicional 'interior_point'
+            ('iterations', 'gap_history', 'time' y 'crossover')
+        """
+        c = np.asarray(c, dtype=float)
+        b = np.asarray(b, dtype=float)
+        n_vars = len(c)
+        notify = self._notify_interior_point if self._callback is not None else None
+        run = InteriorPoint().solve(c, A, b, max_iterations, should_stop=self._should_stop,
+                                    callback=notify)
+        info = {
+            'iterations': run['iterations'],
+            'gap_history': run['gap_history'],
+            'time': run['time'],
+            'crossover': None
+        }
+        
+        if run['status'] == 'unbounded':
+            result = {
+                'status': 'unbounded',
+                'message': 'El problema no está acotado',
+                'iterations': self.iterations,
+                'iteration_count': run['iterations']
+            }
+        elif crossover and run['status'] == 'optimal':
+            start = time.perf_counter()
+            basic_vars = crossover_basis(A, run['x'], run['reduced_costs'])
+            tableau = self._tableau_from_basis(c, A, b, basic_vars)
+            strategy = 'primal'
+            if not np.all(tableau[:-1, -1] >= -1e-10):
+                if np.all(tableau[-1, :-1] >= -1e-10):
+                    strategy = 'dual'
+                else:
+                    # Base ni factible ni dual factible: Simplex desde las holguras
+                    strategy = 'cold'
+                    basic_vars = list(range(n_vars, n_vars + len(b)))
+                    tableau = self._build_tableau(c, A, b)
             
-            # Verificar factibilidad (problema no acotado)
-            if np.all(tableau[:-1, pivot_col] <= 0):
-                return {
-                    'status': 'unbounded',
-                    'message': 'El problema no está acotado',
-                    'iterations': self.iterations
+            if self.history_mode == 'compact':
+                self.iterations = IterationHistory(basic_vars, self._all_names, initial_tableau=tableau)
+            elif self.history_mode == 'full':
+                self._save_iteration(tableau, basic_vars, -1, -1, 0)
+            kernel = PivotKernel(tableau.shape)
+            self._reset_pricing(tableau)
+            budget = self._iteration_budget(n_vars, len(b))
+            if strategy == 'dual':
+                status, pivots = self._run_dual(tableau, basic_vars, kernel, budget)
+            else:
+                status, pivots = self._run_primal(tableau, basic_vars, kernel, budget)
+            
+            if status == 'optimal':
+                self._remember_basis(c, A, b, basic_vars, pivots)
+            result = self._tableau_result(tableau, basic_vars, status, pivots)
+            result['iteration_count'] = run['iterations']
+            info['crossover'] = {
+                'strategy': strategy,
+                'pivots': pivots,
+                'time': time.perf_counter() - start
+            }
+        else:
+            solution = run['x'][:n_vars].copy()
+            z_value = float(c @ solution)
+            result = {
+                'status': run['status'],
+                'solution': solution,
+                'optimal_value': z_value,
+                'duals': run['duals'],
+                'iterations': self.iterations,
+                'iteration_count': run['iterations'],
+                'variable_names': self.variable_names
+            }
+            if run['status'] == 'optimal':
+                self.optimal_solution = solution
+                self.optimal_value = z_value
+            else:
+                # Punto interior: la solución es el iterado actual, no una base
+                result['message'] = self.STOP_MESSAGES[run['status']].format(run['iterations'])
+        
+        result['interior_point'] = info
+        return result
+    
+    def _unscale_result(self, result: Dict, c: np.ndarray, A, b: np.ndarray) -> Dict:
+        """
+        Llevar la solución y los duales del problema escalado al original
+        
+        Args:
+            result: Resultado del problema escalado
+            c, A, b: Datos del problema original
+            
+        Returns:
+            El mismo resultado con la clave adicional 'scaling' (rango de los
+            coeficientes antes y después)
+        """
+        scaler = self._scaling
+        if scaler is None:
+            return result
+        if 'solution' in result:
+            result['solution'] = scaler.unscale_solution(result['solution'])
+        if 'ray' in result:
+            result['ray'] = scaler.unscale_solution(result['ray'])
+        if 'duals' in result:
+            result['duals'] = scaler.unscale_duals(result['duals'])
+        if 'bound_duals' in result:
+            result['bound_duals'] = result['bound_duals'] / scaler.col_scale
+        if result['status'] == 'optimal':
+            self.optimal_solution = result['solution']
+        if result['status'] == 'optimal' and self._warm_start is not None:
+            # resolve() trabaja con el problema sin escalar (la base es la misma)
+            self._warm_start.update(c=np.asarray(c, dtype=float), A=A,
+                                    b=np.asarray(b, dtype=float))
+        result['scaling'] = scaler.summary(A)
+        return result
+    
+    def _solve_presolved(self, c: np.ndarray, A, b: np.ndarray, method: str, history: str,
+                         pricing: Union[str, PricingRule], max_iterations: Optional[int],
+                         anti_cycling: Optional[str], scaling: Optional[str],
+                         crossover: bool) -> Dict:
+        """
+        Reducir el problema con Presolver, resolver el problema reducido y llevar la
+        solución y los duales al modelo original
+        
+        Returns:
+            Diccionario de resultado con la clave adicional 'presolve' (tamaño antes
+            y después, eliminaciones por regla y tiempo)
+        """
+        self.history_mode = history
+        presolver = Presolver(c, A, b)
+        status = presolver.run()
+        names = [f'x{i+1}' for i in range(len(c))]
+        
+        if status == 'unbounded':
+            self.iterations = []
+            result = {
+                'status': 'unbounded',
+                'message': 'El problema no está acotado',
+                'iterations': self.iterations,
+                'iteration_count': 0
+            }
+        else:
+            c_r, A_r, b_r, _ = presolver.reduced_problem()
+            if len(c_r) == 0:
+                # Todas las variables quedaron fijas en 0
+                self.iterations = []
+                result = {
+                    'status': 'optimal',
+                    'solution': np.zeros(0),
+                    'optimal_value': 0.0,
+                    'duals': np.zeros(len(b_r)),
+                    'iterations': self.iterations,
+                    'iteration_count': 0
                 }
+            else:
+                bound_rows = presolver.bound_row[presolver.kept_cols[presolver.bound_cols]]
+                reduced_names = ([names[j] for j in presolver.kept_cols],
+                                 [f's{i+1}' for i in presolver.kept_rows]
+                                 + [f's{i+1}' for i in bound_rows])
+                result = self._solve(c_r, A_r, b_r, method, history, pricing, max_iterations,
+                                     anti_cycling, scaling, names=reduced_names,
+                                     crossover=crossover)
+        
+        # La base de una resolución detenida (su análisis de sensibilidad y la
+        # dirección de no acotamiento) son del problema reducido
+        result.pop('basic_vars', None)
+        result.pop('sensitivity', None)
+        result.pop('ray', None)
+        if 'solution' in result:
+            solution, duals = presolver.postsolve(result['solution'], result.get('duals'))
+            result['solution'] = solution
+            if duals is not None:
+                result['duals'] = duals
+            result['variable_names'] = names
+            if result['status'] == 'optimal':
+                self.optimal_solution = solution
+                self.optimal_value = result['optimal_value']
+        self.variable_names = names
+        # La base guardada corresponde al problema reducido
+        self._warm_start = None
+        result['presolve'] = presolver.summary()
+        return result
+    
+    def _start_run(self, pricing: Union[str, PricingRule], anti_cycling: Optional[str], b):
+        """Preparar la regla de precios y el estado de degeneración de una resolución"""
+        if anti_cycling not in self.ANTI_CYCLING_MODES:
+            raise ValueError(f"Modo anti-ciclado desconocido: {anti_cycling}")
+        self._pricing = make_pricing(pricing)
+        self._pricing_time = 0.0
+        self._profile = {'ratio_test_time': 0.0, 'elimination_time': 0.0,
+                         'history_time': 0.0, 'callback_time': 0.0}
+        self._anti_cycling = anti_cycling
+        self._rhs = np.asarray(b, dtype=float)
+        self._ray = None
+        self._upper = None
+        self._at_upper = None
+        self._degeneracy = {'mode': anti_cycling, 'degenerate_pivots': 0, 'stalls': 0,
+                            'perturbed': False}
+    
+    def _with_run_stats(self, result: Dict, start_time: float) -> Dict:
+        """Agregar al resultado la regla de precios, los tiempos y la degeneración"""
+        result['pricing'] = {
+            'rule': self._pricing.name,
+            'iterations': result.get('iteration_count', 0),
+            'solve_time': time.perf_counter() - start_time,
+            'pricing_time': self._pricing_time
+        }
+        result['degeneracy'] = dict(self._degeneracy)
+        result['profile'] = dict(self._profile, pricing_time=self._pricing_time,
+                                 degenerate_pivots=self._degeneracy['degenerate_pivots'],
+                                 iterations=result['pricing']['iterations'],
+                                 solve_time=result['pricing']['solve_time'])
+        return result
+    
+    def _run_primal(self, tableau: np.ndarray, basic_vars: List[int], kernel: PivotKernel,
+                    max_iterations: int, iteration: int = 0) -> Tuple[str, int]:
+        """
+        Pivotear con el Simplex primal hasta la optimalidad (parte de una base factible)
+        
+        Args:
+            tableau: Tableau a modificar in-place
+            basic_vars: Variables básicas (se actualizan in-place)
+            kernel: Kernel de pivoteo con buffers para este tableau
+            max_iterations: Límite de iteraciones
+            iteration: Número de la última iteración registrada
             
-            # Seleccionar fila pivote (prueba del cociente mínimo)
-            ratios = []
-            for i in range(n_constraints):
-                if tableau[i, pivot_col] > 1e-10:
-                    ratio = tableau[i, -1] / tableau[i, pivot_col]
-                    ratios.append((ratio, i))
-                else:
-                    ratios.append((float('inf'), i))
+        Returns:
+            Tuple con (estado, número_de_iteración_final)
+        """
+        pricing = self._pricing
+        mode = self._anti_cycling
+        stats = self._degeneracy
+        should_stop = self._should_stop
+        profile = self._profile
+        upper = self._upper
+        stalled = False
+        streak = 0
+        while True:
+            # Seleccionar columna pivote según la regla de precios
+            # (-1 si todos los coeficientes en fila Z son >= 0: solución óptima).
+            # Durante un estancamiento con la regla de Bland entra el menor índice
+            pricing_start = time.perf_counter()
+            # Las básicas tienen costo reducido cero; se limpia el error de redondeo
+            tableau[-1, basic_vars] = 0.0
+            if stalled and mode != 'lexicographic':
+                candidates = np.flatnonzero(tableau[-1, :-1] < -pricing.tolerance)
+                pivot_col = int(candidates[0]) if len(candidates) else -1
+            else:
+                pivot_col = pricing.select(tableau[-1, :-1])
+            self._pricing_time += time.perf_counter() - pricing_start
+            if pivot_col == -1:
+                break
             
-            # Encontrar mínimo ratio válido
-            min_ratio = float('inf')
-            pivot_row = -1
-            for ratio, idx in ratios:
-                if 0 <= ratio < min_ratio:
-                    min_ratio = ratio
-                    pivot_row = idx
+            if iteration >= max_iterations:
+                return 'iteration_limit', iteration
+            stop = should_stop and should_stop()
+            if stop:
+                return stop, iteration
             
+            # Verificar factibilidad (problema no acotado)
+            ratio_start = time.perf_counter()
+            if upper is None:
+                # Seleccionar fila pivote (prueba del cociente mínimo); sin
+                # coeficientes mayores que la tolerancia ninguna fila limita el paso
+                pivot_row = kernel.ratio_test(tableau, pivot_col)
+                
+                if pivot_row == -1:
+                    self._ray = self._unbounded_ray(tableau, basic_vars, pivot_col)
+                    return 'unbounded', iteration
+            else:
+                # Con cotas: fila -1 si la variable que entra llega antes a su cota
+                pivot_row, step = kernel.bounded_ratio_test(tableau, pivot_col, upper[basic_vars],
+                                                            upper[pivot_col])
+                if step == np.inf:
+                    self._ray = self._unbounded_ray(tableau, basic_vars, pivot_col)
+                    return 'unbounded', iteration
+            
+            # Desempatar la prueba del cociente mientras el Simplex está estancado
+            if stalled and pivot_row >= 0:
+                ties = kernel.tied_rows(pivot_row)
+                if len(ties) > 1:
+                    if mode == 'lexicographic':
+                        pivot_row = self._lexicographic_row(tableau, pivot_col, ties)
+                    else:
+                        pivot_row = int(min(ties, key=lambda i: basic_vars[i]))
+            pricing_start = time.perf_counter()
+            profile['ratio_test_time'] += pricing_start - ratio_start
+            
+            flipped = -1
             if pivot_row == -1:
-                return {
-                    'status': 'error',
-                    'message': 'No se pudo encontrar fila pivote',
-                    'iterations': self.iterations
-                }
+                # Cambio de cota: la variable que entra pasa a x' = u - x sin cambiar la base
+                degenerate = step <= 1e-10
+                pivot_element = None
+                flipped = pivot_col
+                elimination_start = time.perf_counter()
+                self._pricing_time += elimination_start - pricing_start
+                kernel.flip_column(tableau, pivot_col, upper[pivot_col])
+            else:
+                if upper is not None and tableau[pivot_row, pivot_col] < 0:
+                    # La básica de la fila sale en su cota superior: se escribe como x' = u - x
+                    flipped = basic_vars[pivot_row]
+                    kernel.flip_row(tableau, pivot_row, flipped, upper[flipped])
+                
+                # Actualizar los pesos de la regla de precios con el tableau antes del pivoteo
+                if pricing.needs_pivot_row:
+                    pricing.update(tableau[pivot_row, :-1], tableau[:-1, pivot_col],
+                                   pivot_row, pivot_col, basic_vars[pivot_row],
+                                   column_dots=lambda: tableau[:-1, pivot_col] @ tableau[:-1, :-1])
+                
+                # Un pivoteo es degenerado si la variable que sale vale cero (paso nulo)
+                degenerate = tableau[pivot_row, -1] <= 1e-10
+                
+                # Realizar operación de pivoteo (actualización de rango 1 in-place)
+                pivot_element = tableau[pivot_row, pivot_col]
+                elimination_start = time.perf_counter()
+                self._pricing_time += elimination_start - pricing_start
+                kernel.pivot(tableau, pivot_row, pivot_col)
+                
+                # Actualizar variable básica
+                basic_vars[pivot_row] = pivot_col
+            if flipped >= 0:
+                self._at_upper[flipped] = not self._at_upper[flipped]
             
-            # Realizar operación de pivoteo
-            pivot_element = tableau[pivot_row, pivot_col]
+            # Guardar iteración
+            iteration += 1
+            history_start = time.perf_counter()
+            profile['elimination_time'] += history_start - elimination_start
+            self._record_iteration(tableau, basic_vars, pivot_row, pivot_col, iteration, pivot_element,
+                                   flipped)
+            profile['history_time'] += time.perf_counter() - history_start
+            if self._callback is not None:
+                self._notify('primal', tableau[:-1, -1], tableau[-1, -1], iteration,
+                             pivot_row, pivot_col, pivot_element, bool(degenerate))
             
-            # Dividir fila pivote por elemento pivote
-            tableau[pivot_row, :] /= pivot_element
+            # Detectar estancamiento: STALL_PIVOTS pivoteos degenerados seguidos
+            if not degenerate:
+                streak = 0
+                stalled = False
+                continue
+            stats['degenerate_pivots'] += 1
+            streak += 1
+            if mode is not None and not stalled and streak >= self.STALL_PIVOTS:
+                stats['stalls'] += 1
+                if mode == 'perturb' and not stats['perturbed']:
+                    self._perturb_rhs(tableau)
+                    streak = 0
+                else:
+                    stalled = True
+        
+        # Quitar la perturbación: RHS exacto y Simplex dual si quedó infactible
+        if stats['perturbed']:
+            self._restore_rhs(tableau)
+            return self._run_dual(tableau, basic_vars, kernel, max_iterations, iteration)
+        
+        return 'optimal', iteration
+    
+    def _run_dual(self, tableau: np.ndarray, basic_vars: List[int], kernel: PivotKernel,
+                  max_iterations: int, iteration: int = 0) -> Tuple[str, int]:
+        """
+        Pivotear con el Simplex dual hasta recuperar la factibilidad primal
+        (parte de una base dual factible: fila Z >= 0)
+        
+        Args:
+            tableau: Tableau a modificar in-place
+            basic_vars: Variables básicas (se actualizan in-place)
+            kernel: Kernel de pivoteo con buffers para este tableau
+            max_iterations: Límite de iteraciones
+            iteration: Número de la última iteración registrada
             
-            # Hacer ceros en el resto de la columna pivote
-            for i in range(n_constraints + 1):
-                if i != pivot_row:
-                    factor = tableau[i, pivot_col]
-                    tableau[i, :] -= factor * tableau[pivot_row, :]
+        Returns:
+            Tuple con (estado, número_de_iteración_final)
+        """
+        should_stop = self._should_stop
+        profile = self._profile
+        while True:
+            # Fila que sale: RHS más negativo
+            ratio_start = time.perf_counter()
+            pivot_row = int(np.argmin(tableau[:-1, -1]))
+            if tableau[pivot_row, -1] >= -1e-10:
+                break
+            if iteration >= max_iterations:
+                return 'iteration_limit', iteration
+            stop = should_stop and should_stop()
+            if stop:
+                return stop, iteration
             
-            # Actualizar variable básica
+            # Columna que entra: cociente mínimo |z_j / a_rj| entre los a_rj < 0
+            row = tableau[pivot_row, :-1]
+            negative = row < -1e-10
+            if not np.any(negative):
+                return 'infeasible', iteration
+            ratios = np.full(row.shape, np.inf)
+            ratios[negative] = tableau[-1, :-1][negative] / -row[negative]
+            pivot_col = int(np.argmin(ratios))
+            
+            pivot_element = tableau[pivot_row, pivot_col]
+            elimination_start = time.perf_counter()
+            profile['ratio_test_time'] += elimination_start - ratio_start
+            kernel.pivot(tableau, pivot_row, pivot_col)
             basic_vars[pivot_row] = pivot_col
             
-            # Guardar iteración
             iteration += 1
-            self._save_iteration(tableau.copy(), basic_vars.copy(), pivot_row, pivot_col, iteration)
+            history_start = time.perf_counter()
+            profile['elimination_time'] += history_start - elimination_start
+            self._record_iteration(tableau, basic_vars, pivot_row, pivot_col, iteration, pivot_element)
+            profile['history_time'] += time.perf_counter() - history_start
+            if self._callback is not None:
+                self._notify('dual', tableau[:-1, -1], tableau[-1, -1], iteration,
+                             pivot_row, pivot_col, pivot_element, False)
+        
+        return 'optimal', iteration
+    
+    def _notify(self, phase: str, rhs: np.ndarray, objective: float, iteration: int,
+                pivot_row: int, pivot_col: int, pivot_element: float, degenerate: bool):
+        """
+        Llamar al callback de la resolución con los datos de un pivoteo
+        
+        Args:
+            phase: 'primal', 'dual' o 'interior_point'
+            rhs: Valores de las variables básicas (su parte negativa es la infactibilidad)
+            objective: Valor de la función objetivo (escala interna del solver)
+            iteration, pivot_row, pivot_col, pivot_element, degenerate: Datos del pivoteo
+                (fila -1 y elemento None en un cambio de cota)
+        """
+        callback_start = time.perf_counter()
+        self._callback({
+            'phase': phase,
+            'iteration': iteration,
+            'pivot_row': pivot_row,
+            'pivot_col': pivot_col,
+            'pivot_element': None if pivot_element is None else float(pivot_element),
+            'degenerate': degenerate,
+            'objective': float(objective),
+            'primal_infeasibility': float(-np.minimum(rhs, 0.0).sum()) + 0.0,
+            'elapsed': callback_start - self._callback_start
+        })
+        self._profile['callback_time'] += time.perf_counter() - callback_start
+    
+    def _notify_revised(self, iteration: int, pivot_row: int, pivot_col: int, pivot_element: float,
+                        degenerate: bool, x_basic: np.ndarray, objective: float):
+        """Callback de RevisedSimplex: reenviar el pivoteo a _notify"""
+        self._notify('primal', x_basic, objective, iteration, pivot_row, pivot_col,
+                     pivot_element, degenerate)
+    
+    def _notify_interior_point(self, step: Dict):
+        """Llamar al callback de la resolución con una iteración de punto interior"""
+        callback_start = time.perf_counter()
+        self._callback({
+            'phase': 'interior_point',
+            'iteration': step['iteration'],
+            'pivot_row': -1,
+            'pivot_col': -1,
+            'pivot_element': None,
+            'degenerate': False,
+            'objective': step['objective'],
+            'primal_infeasibility': step['primal_residual'],
+            'gap': step['gap'],
+            'elapsed': callback_start - self._callback_start
+        })
+        self._profile['callback_time'] += time.perf_counter() - callback_start
+    
+    def _unbounded_ray(self, tableau: np.ndarray, basic_vars: List[int], pivot_col: int) -> np.ndarray:
+        """
+        Dirección de no acotamiento: la variable que entra crece en 1 y las
+        básicas cambian en -columna, sin salir nunca de la región factible
+        
+        Returns:
+            Dirección en las variables originales (c^T·dirección > 0)
+        """
+        n_vars = len(self.variable_names)
+        direction = np.zeros(tableau.shape[1] - 1)
+        direction[pivot_col] = 1.0
+        direction[basic_vars] = -tableau[:-1, pivot_col]
+        if self._upper is not None:
+            # Una columna escrita como u - x crece en sentido contrario
+            direction[self._at_upper] *= -1.0
+        return direction[:n_vars]
+    
+    def _lexicographic_row(self, tableau: np.ndarray, pivot_col: int, ties: np.ndarray) -> int:
+        """
+        Regla lexicográfica: entre las filas empatadas en el cociente, la de menor
+        fila (B^-1)_i / a_iq en orden lexicográfico
+        
+        Args:
+            tableau: Tableau actual
+            pivot_col: Columna que entra
+            ties: Filas empatadas en la prueba del cociente
+            
+        Returns:
+            Fila pivote
+        """
+        n_vars = len(self.variable_names)
+        n_constraints = tableau.shape[0] - 1
+        candidates = np.asarray(ties)
+        scaled = tableau[candidates, n_vars:n_vars + n_constraints] / tableau[candidates, pivot_col][:, None]
+        for k in range(n_constraints):
+            column = scaled[:, k]
+            keep = column <= column.min() + 1e-12
+            candidates, scaled = candidates[keep], scaled[keep]
+            if len(candidates) == 1:
+                break
+        return int(candidates[0])
+    
+    def _perturb_rhs(self, tableau: np.ndarray):
+        """
+        Perturbar el RHS de las filas degeneradas para salir de un estancamiento
+        
+        La perturbación equivale a cambiar b y se quita al final con _restore_rhs.
+        """
+        rhs = tableau[:-1, -1]
+        degenerate = rhs <= 1e-10
+        scale = 1e-7 * max(1.0, float(np.max(np.abs(rhs))))
+        rng = np.random.default_rng(len(rhs))
+        rhs[degenerate] += scale * rng.uniform(1.0, 2.0, size=int(degenerate.sum()))
+        self._degeneracy['perturbed'] = True
+    
+    def _restore_rhs(self, tableau: np.ndarray):
+        """
+        Recalcular el RHS exacto B^-1·b (y Z = y^T·b) con el b original
+        
+        Las columnas de holgura del tableau contienen B^-1 en las filas de
+        restricciones y los precios duales y en la fila Z.
+        """
+        n_vars = len(self.variable_names)
+        n_constraints = tableau.shape[0] - 1
+        tableau[:, -1] = tableau[:, n_vars:n_vars + n_constraints] @ self._rhs
+    
+    def _tableau_result(self, tableau: np.ndarray, basic_vars: List[int],
+                        status: str, iteration: int) -> Dict:
+        """
+        Armar el diccionario de resultado a partir del tableau final
+        
+        Args:
+            tableau: Tableau final
+            basic_vars: Variables básicas finales
+            status: Estado devuelto por el ciclo de pivoteo
+            iteration: Número de iteraciones realizadas
+            
+        Returns:
+            Diccionario con la solución y todas las iteraciones
+        """
+        messages = {
+            'unbounded': 'El problema no está acotado',
+            'infeasible': 'El problema no es factible',
+            'error': 'No se pudo encontrar fila pivote'
+        }
+        if status in messages:
+            result = {
+                'status': status,
+                'message': messages[status],
+                'iterations': self.iterations,
+                'iteration_count': iteration
+            }
+            if status == 'unbounded' and self._ray is not None:
+                result['ray'] = self._ray
+            return result
         
         # Extraer solución
+        n_vars = len(self.variable_names)
         solution = np.zeros(n_vars)
         for i, var_idx in enumerate(basic_vars):
             if var_idx < n_vars:
                 solution[var_idx] = tableau[i, -1]
+        if self._upper is not None:
+            # Deshacer los cambios x' = u - x
+            at_upper = self._at_upper[:n_vars]
+            solution[at_upper] = self._upper[:n_vars][at_upper] - solution[at_upper]
         
         # Valor óptimo
         z_value = tableau[-1, -1]
         
+        if status in self.STOP_MESSAGES:
+            return {
+                'status': status,
+                'message': self.STOP_MESSAGES[status].format(iteration),
+                'solution': solution,
+                'optimal_value': z_value,
+                'basic_vars': list(basic_vars),
+                'iterations': self.iterations,
+                'iteration_count': iteration,
+                'variable_names': self.variable_names
+            }
+        
+        self.optimal_solution = solution
+        self.optimal_value = z_value
+        
+        # Precios duales: coeficientes de las holguras en la fila Z
+        duals = tableau[-1, n_vars:-1].copy()
+        
+        result = {
+            'status': 'optimal',
+            'solution': solution,
+            'optimal_value': z_value,
+            'duals': duals,
+            'basic_vars': list(basic_vars),
+            'iterations': self.iterations,
+            'iteration_count': iteration,
+            'variable_names': self.variable_names
+        }
+        if self._upper is not None:
+            # Dual de cada cota: costo reducido de las variables en su cota superior
+            result['bound_duals'] = np.where(self._at_upper[:n_vars], tableau[-1, :n_vars], 0.0)
+            result['at_upper'] = [int(j) for j in np.flatnonzero(self._at_upper)]
+        return result
+    
+    def resolve(self, c: Optional[np.ndarray] = None, b: Optional[np.ndarray] = None,
+                history: Optional[str] = None,
+                pricing: Union[str, PricingRule] = 'dantzig',
+                max_iterations: Optional[int] = None,
+                anti_cycling: Optional[str] = 'bland',
+                time_limit: Optional[float] = None,
+                cancel_token: Optional[CancellationToken] = None,
+                callback: Optional[Callable[[Dict], None]] = None,
+                sensitivity: bool = False) -> Dict:
+        """
+        Volver a resolver tras cambiar la función objetivo y/o el lado derecho,
+        partiendo de la base óptima de la última resolución en lugar de la base
+        de holguras
+        
+        Si solo cambió c la base sigue siendo factible y se continúa con el Simplex
+        primal; si solo cambió b la base sigue siendo dual factible y se usa el
+        Simplex dual. Si la base no es factible ni dual factible se resuelve desde cero.
+        
+        Args:
+            c: Nuevos coeficientes de la función objetivo (None = sin cambios)
+            b: Nuevos valores del lado derecho (None = sin cambios)
+            history: Modo de historial (por defecto el de la última resolución)
+            pricing: Regla de precios para el Simplex primal
+            max_iterations: Límite de pivoteos (por defecto según el tamaño del problema)
+            anti_cycling: Manejo de estancamientos (ver solve)
+            time_limit: Segundos de reloj (ver solve)
+            cancel_token: Token de cancelación (ver solve)
+            callback: Función llamada tras cada pivoteo (ver solve)
+            sensitivity: Agregar el análisis de sensibilidad (ver solve)
+            
+        Returns:
+            Diccionario de resultado con la clave adicional 'warm_start'
+            ('strategy', 'pivots', 'cold_pivots', 'pivots_saved')
+        """
+        warm = self._warm_start
+        if warm is None:
+            raise ValueError("No hay una solución previa para reutilizar")
+        
+        c = warm['c'] if c is None else np.asarray(c, dtype=float)
+        b = warm['b'] if b is None else np.asarray(b, dtype=float)
+        A = warm['A']
+        if c.shape != warm['c'].shape or b.shape != warm['b'].shape:
+            raise ValueError("resolve solo admite cambios en los valores de c y b, no en las dimensiones")
+        
+        history = history or warm['history']
+        basic_vars = list(warm['basic_vars'])
+        try:
+            tableau = self._tableau_from_basis(c, A, b, basic_vars)
+        except np.linalg.LinAlgError:
+            tableau = None
+        
+        primal_feasible = tableau is not None and np.all(tableau[:-1, -1] >= -1e-10)
+        dual_feasible = tableau is not None and np.all(tableau[-1, :-1] >= -1e-10)
+        if not (primal_feasible or dual_feasible):
+            result = self.solve(c, A, b, history=history, pricing=pricing,
+                                max_iterations=max_iterations, anti_cycling=anti_cycling,
+                                time_limit=time_limit, cancel_token=cancel_token,
+                                callback=callback, sensitivity=sensitivity)
+            result['warm_start'] = {
+                'strategy': 'cold',
+                'pivots': result['iteration_count'],
+                'cold_pivots': warm['cold_pivots'],
+                'pivots_saved': 0
+            }
+            return result
+        
+        self.iterations = []
+        self.history_mode = history
+        self._scaling = None
+        start_time = time.perf_counter()
+        self._should_stop = stop_check(cancel_token, time_limit)
+        self._callback = callback
+        self._callback_start = start_time
+        self._sensitivity = sensitivity
+        self._start_run(pricing, anti_cycling, b)
+        if history == 'compact':
+            self.iterations = IterationHistory(basic_vars, self._all_names, initial_tableau=tableau)
+        elif history == 'full':
+            self._save_iteration(tableau, basic_vars, -1, -1, 0)
+        
+        kernel = PivotKernel(tableau.shape)
+        if max_iterations is None:
+            max_iterations = self._iteration_budget(len(c), len(b))
+        self._reset_pricing(tableau)
+        if primal_feasible:
+            strategy = 'primal'
+            status, iteration = self._run_primal(tableau, basic_vars, kernel, max_iterations)
+        else:
+            strategy = 'dual'
+            status, iteration = self._run_dual(tableau, basic_vars, kernel, max_iterations)
+        
+        if status == 'optimal':
+            self._remember_basis(c, A, b, basic_vars, warm['cold_pivots'])
+        result = self._tableau_result(tableau, basic_vars, status, iteration)
+        result = self._with_run_stats(self._with_sensitivity(result, (c, A, b), tableau=tableau),
+                                      start_time)
+        result['warm_start'] = {
+            'strategy': strategy,
+            'pivots': iteration,
+            'cold_pivots': warm['cold_pivots'],
+            'pivots_saved': max(warm['cold_pivots'] - iteration, 0)
+        }
+        return result
+    
+    def _remember_basis(self, c: np.ndarray, A, b: np.ndarray, basic_vars: List[int],
+                        cold_pivots: int):
+        """
+        Guardar la base óptima y los datos del problema para resolve()
+        
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones
+            b: Valores del lado derecho
+            basic_vars: Variables básicas óptimas
+            cold_pivots: Pivoteos que necesitó la última resolución desde cero
+        """
+        self._warm_start = {
+            'c': np.asarray(c, dtype=float),
+            'A': A,
+            'b': np.asarray(b, dtype=float),
+            'basic_vars': list(basic_vars),
+            'cold_pivots': cold_pivots,
+            'history': self.history_mode
+        }
+    
+    def _same_constraint_matrix(self, A) -> bool:
+        """Indicar si A coincide con la matriz de la última resolución óptima"""
+        if self._warm_start is None:
+            return False
+        previous = self._warm_start['A']
+        if is_sparse(A) != is_sparse(previous) or A.shape != previous.shape:
+            return False
+        if is_sparse(A):
+            return (np.array_equal(A.indptr, previous.indptr) and
+                    np.array_equal(A.indices, previous.indices) and
+                    np.array_equal(A.data, previous.data))
+        return np.array_equal(A, previous)
+    
+    def _tableau_from_basis(self, c: np.ndarray, A, b: np.ndarray,
+                            basic_vars: List[int]) -> np.ndarray:
+        """
+        Construir el tableau correspondiente a una base dada: B^{-1}[A | I | b]
+        con la fila Z recalculada para c
+        
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones (densa o CSRMatrix)
+            b: Valores del lado derecho
+            basic_vars: Columna de [A | I] básica en cada fila
+            
+        Returns:
+            Tableau en la base indicada
+        """
+        tableau = self._build_tableau(c, A, b)
+        n_constraints = len(b)
+        
+        basis = tableau[:n_constraints, basic_vars]
+        tableau[:n_constraints] = np.linalg.solve(basis, tableau[:n_constraints])
+        
+        # Fila Z: z_j = c_B^T·(B^{-1} a_j) - c_j (la fila inicial ya contiene -c)
+        c_basic = -tableau[-1, basic_vars]
+        tableau[-1] += c_basic @ tableau[:n_constraints]
+        
+        # Las columnas básicas quedan exactamente como vectores unitarios
+        tableau[:, basic_vars] = 0.0
+        tableau[np.arange(n_constraints), basic_vars] = 1.0
+        return tableau
+    
+    def _build_tableau(self, c: np.ndarray, A, b: np.ndarray) -> np.ndarray:
+        """
+        Construir el tableau inicial con la base de holguras
+        
+        Tableau: [A | I | b]
+                 [-c | 0 | 0]
+        
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones (densa o CSRMatrix)
+            b: Valores del lado derecho
+            
+        Returns:
+            Tableau de (n_restricciones + 1) x (n_variables + n_restricciones + 1)
+        """
+        n_vars = len(c)
+        n_constraints = len(b)
+        tableau = np.zeros((n_constraints + 1, n_vars + n_constraints + 1))
+        
+        # Llenar parte de restricciones (la identidad de holguras se escribe en la diagonal)
+        if is_sparse(A):
+            A.scatter_into(tableau)
+        else:
+            tableau[:n_constraints, :n_vars] = A
+        slack_rows = np.arange(n_constraints)
+        tableau[slack_rows, n_vars + slack_rows] = 1.0
+        tableau[:n_constraints, -1] = b
+        
+        # Llenar fila Z (función objetivo)
+        tableau[-1, :n_vars] = -np.asarray(c)  # Negativo porque estamos en forma estándar
+        return tableau
+    
+    def _reset_pricing(self, tableau: np.ndarray):
+        """
+        Preparar la regla de precios para pivotear sobre el tableau
+
+        Las normas ||B^-1·a_j||^2 de las columnas solo se calculan si la regla
+        las usa (steepest edge): recorren el tableau completo, que con
+        out_of_core es una lectura más del disco.
+
+        Args:
+            tableau: Tableau de la base de partida
+        """
+        column_norms = None
+        if self._pricing.needs_column_norms:
+            column_norms = np.einsum('ij,ij->j', tableau[:-1, :-1], tableau[:-1, :-1])
+        self._pricing.reset(tableau.shape[1] - 1, column_norms)
+    
+    def _solve_revised(self, c: np.ndarray, A: np.ndarray, b: np.ndarray,
+                       max_iterations: int) -> Dict:
+        """
+        Resolver con el Simplex revisado (ver revised_simplex.py)
+        
+        El método revisado nunca construye el tableau: en modo 'compact' el historial
+        lo reconstruye solo si se consulta, y en modo 'full' las iteraciones se
+        registran sin tableau.
+        
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones
+            b: Valores del lado derecho
+            max_iterations: Límite de pivoteos
+            
+        Returns:
+            Diccionario con la solución y las iteraciones
+        """
+        c = np.asarray(c, dtype=float)
+        if not is_sparse(A):
+            A = np.asarray(A, dtype=float)
+        b = np.asarray(b, dtype=float)
+        n_vars = len(c)
+        n_constraints = len(b)
+        
+        engine = RevisedSimplex(stall_pivots=self.STALL_PIVOTS)
+        notify = self._notify_revised if self._callback is not None else None
+        run = engine.solve(c, A, b, max_iterations, pricing=self._pricing,
+                           anti_cycling=self._anti_cycling is not None,
+                           should_stop=self._should_stop, callback=notify)
+        self._pricing_time = run['pricing_time']
+        self._profile['ratio_test_time'] = run['ratio_test_time']
+        self._profile['elimination_time'] = run['update_time']
+        history_start = time.perf_counter()
+        self._degeneracy['degenerate_pivots'] = run['degenerate_pivots']
+        self._degeneracy['stalls'] = run['stalls']
+        
+        basic_vars = list(range(n_vars, n_vars + n_constraints))
+        if self.history_mode == 'full':
+            self._save_iteration(None, basic_vars, -1, -1, 0)
+        for k, (pivot_row, pivot_col, pivot_element) in enumerate(run['pivots']):
+            is_last = k == len(run['pivots']) - 1
+            is_optimal = is_last and run['status'] == 'optimal'
+            if self.history_mode == 'full':
+                basic_vars[pivot_row] = pivot_col
+                self._save_iteration(None, basic_vars, pivot_row, pivot_col, k + 1,
+                                     is_optimal=is_optimal, pivot_element=pivot_element)
+            elif self.history_mode == 'compact':
+                self.iterations.record(pivot_row, pivot_col, pivot_element, is_optimal)
+        self._profile['history_time'] += time.perf_counter() - history_start
+        
+        if run['status'] == 'unbounded':
+            return {
+                'status': 'unbounded',
+                'message': 'El problema no está acotado',
+                'iterations': self.iterations,
+                'iteration_count': len(run['pivots'])
+            }
+        
+        solution = np.zeros(n_vars)
+        for i, var_idx in enumerate(run['basic_vars']):
+            if var_idx < n_vars:
+                solution[var_idx] = run['x_basic'][i]
+        
+        z_value = float(c @ solution)
+        
+        if run['status'] in self.STOP_MESSAGES:
+            return {
+                'status': run['status'],
+                'message': self.STOP_MESSAGES[run['status']].format(len(run['pivots'])),
+                'solution': solution,
+                'optimal_value': z_value,
+                'basic_vars': list(run['basic_vars']),
+                'iterations': self.iterations,
+                'iteration_count': len(run['pivots']),
+                'variable_names': self.variable_names
+            }
+        
         self.optimal_solution = solution
         self.optimal_value = z_value
+        self._remember_basis(c, A, b, run['basic_vars'], len(run['pivots']))
         
         return {
             'status': 'optimal',
             'solution': solution,
             'optimal_value': z_value,
+            'duals': run['duals'],
+            'basic_vars': list(run['basic_vars']),
             'iterations': self.iterations,
+            'iteration_count': len(run['pivots']),
             'variable_names': self.variable_names
         }
     
-    def _save_iteration(self, tableau: np.ndarray, basic_vars: List[int], 
-                       pivot_row: int, pivot_col: int, iteration_num: int):
+    def _record_iteration(self, tableau: np.ndarray, basic_vars: List[int],
+                          pivot_row: int, pivot_col: int, iteration_num: int,
+                          pivot_element: Optional[float], flipped: int = -1):
         """
-        Guardar información de una iteración
+        Registrar un pivoteo del tableau según el modo de historial activo
         
         Args:
-            tableau: Tableau actual
+            tableau: Tableau después del pivoteo
+            basic_vars: Variables básicas actuales
+            pivot_row: Fila pivote (-1 en un cambio de cota)
+            pivot_col: Columna pivote
+            iteration_num: Número de iteración
+            pivot_element: Elemento pivote antes de normalizar la fila
+            flipped: Variable que pasó a x' = u - x en este paso (-1 si ninguna)
+        """
+        if self.history_mode == 'none':
+            return
+        is_optimal = bool(np.all(tableau[-1, :-1] >= -1e-10))
+        if self.history_mode == 'compact':
+            self.iterations.record(pivot_row, pivot_col, pivot_element, is_optimal, flipped)
+        else:
+            self._save_iteration(tableau, basic_vars, pivot_row, pivot_col, iteration_num,
+                                 is_optimal=is_optimal, pivot_element=pivot_element)
+    
+    def _save_iteration(self, tableau: Optional[np.ndarray], basic_vars: List[int], 
+                       pivot_row: int, pivot_col: int, iteration_num: int,
+                       is_optimal: Optional[bool] = None,
+                       pivot_element: Optional[float] = None):
+        """
+        Guardar información de una iteración (modo de historial 'full')
+        
+        Args:
+            tableau: Tableau actual (se copia; None si el método no construye tableau)
             basic_vars: Variables básicas actuales
             pivot_row: Fila pivote (-1 si es inicial)
             pivot_col: Columna pivote (-1 si es inicial)
             iteration_num: Número de iteración
+            is_optimal: Indicador de optimalidad; si es None se deduce del tableau
+            pivot_element: Elemento pivote antes de normalizar la fila
         """
-        n_vars = len(self.variable_names)
-        n_slack = len(self.slack_variable_names)
+        # Nombres de filas según la base actual; la lista de columnas se comparte
+        row_names = [self._all_names[var_idx] for var_idx in basic_vars]
+        row_names.append('Z')
         
-        # Crear nombres de columnas
-        col_names = self.variable_names + self.slack_variable_names + ['RHS']
+        if is_optimal is None:
+            is_optimal = iteration_num > 0 and np.all(tableau[-1, :-1] >= -1e-10)
         
-        # Crear nombres de filas
-        row_names = []
-        for var_idx in basic_vars:
-            if var_idx < n_vars:
-                row_names.append(self.variable_names[var_idx])
-            else:
-                row_names.append(self.slack_variable_names[var_idx - n_vars])
-        row_names.append('Z')
+        leaving = self.iterations[-1]['basic_vars'][pivot_row] if pivot_row >= 0 else None
+        
+        if tableau is not None:
+            tableau = tableau.copy()
+            # Con el RHS perturbado se guarda el RHS del problema original,
+            # igual que al reconstruir el historial compacto
+            if self._degeneracy['perturbed']:
+                self._restore_rhs(tableau)
+        if self._scaling is not None:
+            # Tableau y elemento pivote en la escala del problema original
+            factors = self._scaling.column_factors
+            if tableau is not None:
+                tableau = unscale_tableau(tableau, basic_vars, factors)
+            if pivot_element is not None:
+                pivot_element *= factors[leaving] / factors[pivot_col]
         
         iteration_data = {
             'iteration': iteration_num,
-            'tableau': tableau.copy(),
-            'basic_vars': basic_vars.copy(),
+            'tableau': tableau,
+            'basic_vars': list(basic_vars),
             'pivot_row': pivot_row,
             'pivot_col': pivot_col,
-            'col_names': col_names,
+            'pivot_element': pivot_element,
+            'entering': pivot_col if pivot_col >= 0 else None,
+            'leaving': leaving,
+            'col_names': self._col_names,
             'row_names': row_names,
-            'is_optimal': iteration_num > 0 and np.all(tableau[-1, :-1] >= -1e-10)
+            'is_optimal': is_optimal
         }
+        if self._upper is not None:
+            # Variables escritas como x' = u - x en este tableau
+            iteration_data['at_upper'] = [int(j) for j in np.flatnonzero(self._at_upper)]
         
         self.iterations.append(iteration_data)
     
-    def solve_from_text(self, objective: str, restrictions: List[str]) -> Dict:
+    def solve_many(self, C: np.ndarray, A: np.ndarray, B: np.ndarray,
+                   record_history: bool = False,
+                   max_iterations: Optional[int] = None) -> Dict:
+        """
+        Resolver en lote muchos problemas con las mismas dimensiones
+        
+        Los tableaux se apilan en un arreglo 3-D y en cada paso se pivotean a la vez
+        todos los problemas que siguen activos; los que ya son óptimos o no acotados
+        quedan enmascarados.
+        
+        Args:
+            C: Coeficientes objetivo (k x n), o (n,) compartidos por todos
+            A: Matrices de restricciones (k x m x n), o (m x n) compartida
+            B: Lados derechos (k x m), o (m,) compartido
+            record_history: Si es True guarda un IterationHistory por problema
+            max_iterations: Límite de pivoteos por problema
+            
+        Returns:
+            Diccionario con arreglos por problema: 'status', 'solution',
+            'optimal_value', 'iteration_count' e 'iterations' (None sin historial)
+        """
+        C = np.asarray(C, dtype=float)
+        A = np.asarray(A, dtype=float)
+        B = np.asarray(B, dtype=float)
+        n_problems = max(C.shape[0] if C.ndim == 2 else 1,
+                         A.shape[0] if A.ndim == 3 else 1,
+                         B.shape[0] if B.ndim == 2 else 1)
+        n_constraints, n_vars = A.shape[-2:]
+        if max_iterations is None:
+            max_iterations = self._iteration_budget(n_vars, n_constraints)
+        
+        # Tableaux apilados: (k, m + 1, n + m + 1)
+        tableaux = np.zeros((n_problems, n_constraints + 1, n_vars + n_constraints + 1))
+        tableaux[:, :n_constraints, :n_vars] = A
+        slack_rows = np.arange(n_constraints)
+        tableaux[:, slack_rows, n_vars + slack_rows] = 1.0
+        tableaux[:, :n_constraints, -1] = B
+        tableaux[:, -1, :n_vars] = -C
+        
+        basis = np.tile(np.arange(n_vars, n_vars + n_constraints), (n_problems, 1))
+        status = np.full(n_problems, 'optimal', dtype=object)
+        iteration_count = np.zeros(n_problems, dtype=int)
+        
+        # El Simplex estándar necesita RHS >= 0 para partir de la base de holguras
+        infeasible_start = np.any(tableaux[:, :n_constraints, -1] < -1e-10, axis=1)
+        status[infeasible_start] = 'error'
+        active = ~infeasible_start
+        
+        histories = None
+        if record_history:
+            names = ([f'x{i+1}' for i in range(n_vars)] +
+                     [f's{i+1}' for i in range(n_constraints)])
+            histories = [IterationHistory(list(basis[p]), names, initial_tableau=tableaux[p])
+                         for p in range(n_problems)]
+        
+        for _ in range(max_iterations):
+            idx = np.flatnonzero(active)
+            if len(idx) == 0:
+                break
+            
+            # Columna pivote: más negativo de la fila Z de cada problema activo
+            z_rows = tableaux[idx, -1, :-1]
+            pivot_cols = np.argmin(z_rows, axis=1)
+            optimal = z_rows[np.arange(len(idx)), pivot_cols] >= -1e-10
+            active[idx[optimal]] = False
+            idx, pivot_cols = idx[~optimal], pivot_cols[~optimal]
+            if len(idx) == 0:
+                break
+            
+            # Prueba del cociente enmascarada sobre todos los problemas a la vez
+            sub = tableaux[idx]
+            rows = np.arange(len(idx))
+            columns = sub[rows, :, pivot_cols]
+            positive = columns[:, :-1] > 1e-10
+            unbounded = ~positive.any(axis=1)
+            if unbounded.any():
+                status[idx[unbounded]] = 'unbounded'
+                active[idx[unbounded]] = False
+                keep = ~unbounded
+                idx, pivot_cols, sub, columns, positive = (
+                    idx[keep], pivot_cols[keep], sub[keep], columns[keep], positive[keep])
+                rows = np.arange(len(idx))
+                if len(idx) == 0:
+                    break
+            
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ratios = np.where(positive, sub[:, :-1, -1] / columns[:, :-1], np.inf)
+            ratios[ratios < 0] = np.inf
+            pivot_rows = np.argmin(ratios, axis=1)
+            
+            # Pivoteo en lote: normalizar filas pivote y actualización de rango 1
+            pivot_elements = columns[rows, pivot_rows]
+            pivot_row_values = sub[rows, pivot_rows, :] / pivot_elements[:, None]
+            columns[rows, pivot_rows] = 0.0
+            sub -= columns[:, :, None] * pivot_row_values[:, None, :]
+            sub[rows, pivot_rows, :] = pivot_row_values
+            tableaux[idx] = sub
+            
+            basis[idx, pivot_rows] = pivot_cols
+            iteration_count[idx] += 1
+            
+            if histories is not None:
+                now_optimal = np.all(sub[:, -1, :-1] >= -1e-10, axis=1)
+                for k, p in enumerate(idx):
+                    histories[p].record(pivot_rows[k], pivot_cols[k], pivot_elements[k], now_optimal[k])
+        else:
+            # Quedan problemas activos tras agotar el presupuesto
+            still_active = active.copy()
+            z_rows = tableaux[still_active, -1, :-1]
+            still_active[still_active] = np.any(z_rows < -1e-10, axis=1)
+            status[still_active] = 'iteration_limit'
+        
+        # Extraer soluciones: los valores RHS se asignan a las variables básicas
+        values = np.zeros((n_problems, n_vars + n_constraints))
+        values[np.arange(n_problems)[:, None], basis] = tableaux[:, :n_constraints, -1]
+        solution = values[:, :n_vars]
+        optimal_value = tableaux[:, -1, -1].copy()
+        
+        failed = (status == 'unbounded') | (status == 'error')
+        solution[failed] = np.nan
+        optimal_value[failed] = np.nan
+        
+        return {
+            'status': status,
+            'solution': solution,
+            'optimal_value': optimal_value,
+            'iteration_count': iteration_count,
+            'iterations': histories,
+            'variable_names': [f'x{i+1}' for i in range(n_vars)]
+        }
+    
+    def solve_integer(self, c: np.ndarray, A, b: np.ndarray, integer,
+                      upper_bounds: Optional[np.ndarray] = None, **options) -> Dict:
+        """
+        Resolver un problema entero mixto por ramificación y acotamiento (ver
+        branch_and_bound.py)
+        
+        La relajación de la raíz se resuelve con solve (su historial queda en
+        self.iterations) y cada nodo con el Simplex dual partiendo de la base
+        óptima de su padre.
+        
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones
+            b: Valores del lado derecho (b >= 0)
+            integer: Índices o máscara booleana de las variables enteras
+            upper_bounds: Cotas superiores de las variables (inf: sin cota)
+            **options: Opciones de BranchAndBound.solve (node_selection, workers,
+                       time_limit, max_nodes, gap_tolerance, cancel_token) y de
+                       solve para la raíz (history, pricing, anti_cycling, scaling...)
+            
+        Returns:
+            Diccionario de resultado con la mejor solución entera, 'relaxation'
+            y 'branch_and_bound' (nodos, nodos por segundo, brecha a lo largo del
+            tiempo y tiempo total)
+        """
+        if options.pop('method', 'tableau') != 'tableau':
+            raise ValueError("La ramificación y acotamiento solo admite method='tableau'")
+        # Los rangos de la relajación no valen para el óptimo entero
+        options.pop('sensitivity', None)
+        result = BranchAndBound(self, c, A, b, integer, upper_bounds).solve(**options)
+        if result['status'] == 'optimal':
+            self.optimal_solution = result['solution']
+            self.optimal_value = result['optimal_value']
+        return result
+    
+    def solve_decomposed(self, c: np.ndarray, A, b: np.ndarray, blocks: Optional[List] = None,
+                         max_linking_fraction: float = 0.2, **options) -> Dict:
+        """
+        Resolver un modelo angular por bloques con la descomposición de
+        Dantzig-Wolfe (ver decomposition.py)
+        
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones (densa o CSRMatrix)
+            b: Valores del lado derecho (b >= 0)
+            blocks: Índices de columna de cada bloque (None: detectar la estructura)
+            max_linking_fraction: Fracción máxima de filas de enlace al detectar
+            **options: Opciones de DantzigWolfe.solve (workers, max_iterations,
+                       gap_tolerance, time_limit, cancel_token) y de solve para
+                       los subproblemas (pricing, anti_cycling, scaling...)
+            
+        Returns:
+            Diccionario de resultado con la solución y los duales del modelo
+            completo y 'decomposition' (bloques, iteraciones del maestro,
+            columnas, tiempos y evolución de la cota)
+        """
+        result = DantzigWolfe(self, c, A, b, blocks, max_linking_fraction).solve(**options)
+        if result['status'] == 'optimal':
+            self.optimal_solution = result['solution']
+            self.optimal_value = result['optimal_value']
+        return result
+    
+    def parametric_sweep(self, c: np.ndarray, A, b: np.ndarray, direction: np.ndarray,
+                         parameter: str = 'objective', t_range: Tuple[float, float] = (0.0, 1.0),
+                         points=None, max_pivots: Optional[int] = None, **solve_options) -> Dict:
+        """
+        Programación paramétrica: recorrer max (c + t·d)^T x s.a. Ax <= b
+        ('objective') o max c^T x s.a. Ax <= b + t·g ('rhs') para t en t_range
+        (ver parametric.py)
+
+        Se resuelve en t_range[0] con solve y desde esa base óptima se sigue el
+        parámetro pivoteando solo donde cambia la base: entre dos puntos de quiebre
+        la solución, los duales y el valor óptimo son lineales en t, así que
+        evaluar la curva en muchos puntos no cuesta pivoteos.
+
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones (densa o CSRMatrix)
+            b: Valores del lado derecho (b + t_range[0]·g >= 0 con 'rhs')
+            direction: Dirección d (de c) o g (de b) del cambio
+            parameter: 'objective' o 'rhs'
+            t_range: (inicio, fin) del parámetro; el fin puede ser inf
+            points: Valores de t donde evaluar la curva (opcional)
+            max_pivots: Límite de pivoteos del barrido (por defecto según el tamaño)
+            **solve_options: Opciones de solve para la resolución inicial (method,
+                             pricing, scaling...); time_limit y cancel_token
+                             también cubren el barrido
+
+        Returns:
+            Diccionario con 'status' ('optimal' si se recorrió todo el rango;
+            'unbounded' o 'infeasible' si deja de haber óptimo pasado 'end'),
+            'breakpoints' (valores de t donde cambia la base), 'pieces' (por
+            tramo: 'interval', 'basic_vars' y los pares (base, pendiente) de
+            'solution', 'duals' y 'value', es decir valor = base + t·pendiente),
+            'end', 'pivots' (del barrido), 'initial' (resultado de solve en
+            t_range[0]) y, con points, 'curve' (ver evaluate_sweep)
+        """
+        if parameter not in ('objective', 'rhs'):
+            raise ValueError(f"Parámetro desconocido: {parameter}")
+        if solve_options.get('presolve') or solve_options.get('upper_bounds') is not None:
+            raise ValueError("El barrido paramétrico no admite presolve ni upper_bounds")
+        c = np.asarray(c, dtype=float)
+        b = np.asarray(b, dtype=float)
+        direction = np.asarray(direction, dtype=float)
+        if direction.shape != (c.shape if parameter == 'objective' else b.shape):
+            raise ValueError("La dirección debe tener un valor por "
+                             + ("variable" if parameter == 'objective' else "restricción"))
+        t_start, t_end = float(t_range[0]), float(t_range[1])
+        if not np.isfinite(t_start) or t_end < t_start:
+            raise ValueError("t_range debe ser (inicio, fin) con inicio finito y fin >= inicio")
+
+        solve_options.setdefault('history', 'none')
+        solve_options.pop('sensitivity', None)
+        if parameter == 'objective':
+            initial = self.solve(c + t_start * direction, A, b, **solve_options)
+        else:
+            initial = self.solve(c, A, b + t_start * direction, **solve_options)
+        if initial['status'] == 'optimal' and 'basic_vars' not in initial:
+            raise ValueError("El barrido paramétrico necesita la base óptima "
+                             "(punto interior requiere crossover=True)")
+        
+        if initial['status'] != 'optimal':
+            sweep = {'status': initial['status'], 'message': initial.get('message', ''),
+                     'parameter': parameter, 'end': t_start, 'breakpoints': [], 'pieces': [],
+                     'pivots': 0}
+        else:
+            # Tableau de la base óptima con los datos en t = 0: lo que depende de t
+            # se escribe como base + t·pendiente
+            basic_vars = initial['basic_vars']
+            tableau = self._tableau_from_basis(c, A, b, basic_vars)
+            if max_pivots is None:
+                max_pivots = self._iteration_budget(len(c), len(b))
+            sweep = (objective_sweep if parameter == 'objective' else rhs_sweep)(
+                tableau, basic_vars, direction, t_start, t_end, max_pivots, self._should_stop)
+            messages = {
+                'optimal': f"{len(sweep['breakpoints'])} puntos de quiebre en [{t_start:g}, {t_end:g}]",
+                'unbounded': f"El problema no está acotado para t > {sweep['end']:g}",
+                'infeasible': f"El problema no es factible para t > {sweep['end']:g}",
+                'iteration_limit': f"Se alcanzó el límite de {max_pivots} pivoteos en t = {sweep['end']:g}"
+            }
+            sweep['message'] = messages.get(sweep['status'],
+                                            f"Barrido detenido en t = {sweep['end']:g}")
+        sweep['initial'] = initial
+        if points is not None:
+            sweep['curve'] = evaluate_sweep(sweep, points)
+        return sweep
+
+    @staticmethod
+    def _iteration_budget(n_vars: int, n_constraints: int) -> int:
+        """Límite de pivoteos por defecto según el tamaño del problema"""
+        return max(100, 20 * (n_vars + n_constraints))
+    
+    def solve_from_text(self, objective: str, restrictions: List[str], **solve_options) -> Dict:
         """
         Resolver problema directamente desde formato texto
         
         Args:
             objective: Función objetivo como string
             restrictions: Lista de restricciones como strings
+            **solve_options: Opciones adicionales para solve (por ejemplo method='revised');
+                             sparse=True parsea la matriz en formato disperso,
+                             warm_start=True usa resolve() si solo cambiaron c o b y
+                             bounds=True pasa las restricciones de una sola variable
+                             (como "x2 <= 5") a upper_bounds en lugar de filas y
+                             relax_integrality=True ignora las marcas de integralidad
             
         Returns:
-            Diccionario con solución completa
+            Diccionario con solución completa; los duales se devuelven por
+            restricción, también para las que pasaron a cotas. Si alguna línea
+            marca variables como enteras ("x1, x2 enteros", "x1 ∈ Z") el problema
+            se resuelve con solve_integer y el resultado es el de ramificación y
+            acotamiento (sin duales)
         """
         try:
+            warm_start = solve_options.pop('warm_start', False)
+            bounds = solve_options.pop('bounds', False)
+            relax_integrality = solve_options.pop('relax_integrality', False)
+            
+            # Las líneas como "x1, x2 enteros" marcan variables enteras, no son filas
+            integer, linear = [], []
+            for restriction in restrictions:
+                marked = parse_integrality(restriction)
+                if marked is None:
+                    linear.append(restriction)
+                else:
+                    integer.extend(marked)
+            
             # Parsear problema
-            c, A, b = self.parse_problem(objective, restrictions)
+            c, A, b = self.parse_problem(objective, linear,
+                                        sparse=solve_options.pop('sparse', False))
             
             # Validar que se parseó correctamente
             if len(c) == 0 or len(A) == 0:
@@ -343,8 +1819,30 @@ class SimplexSolver:
                     'iterations': []
                 }
             
+            # Las variables que no aparecen en la función objetivo se descartan
+            integer = sorted(j for j in set(integer) if j < len(c))
+            if integer and not relax_integrality:
+                upper = None
+                if bounds:
+                    A, b, upper = split_bounds(A, b)[:3]
+                return self.solve_integer(c, A, b, integer, upper_bounds=upper, **solve_options)
+            
+            # Sin filas de una sola variable se sigue por el camino normal (con arranque en caliente)
+            if bounds:
+                split = split_bounds(A, b)
+                if np.isfinite(split[2]).any():
+                    return self._solve_with_bounds(c, A, b, split, solve_options)
+            
+            # Reutilizar la base anterior si la matriz de restricciones no cambió
+            if warm_start and self._same_constraint_matrix(A):
+                return self.resolve(c, b, history=solve_options.get('history'),
+                                    time_limit=solve_options.get('time_limit'),
+                                    cancel_token=solve_options.get('cancel_token'),
+                                    callback=solve_options.get('callback'),
+                                    sensitivity=solve_options.get('sensitivity', False))
+            
             # Resolver
-            return self.solve(c, A, b)
+            return self.solve(c, A, b, **solve_options)
         
         except Exception as e:
             return {
@@ -352,7 +1850,131 @@ class SimplexSolver:
                 'message': f'Error al resolver: {str(e)}',
                 'iterations': []
             }
-    
+
+    def _solve_with_bounds(self, c: np.ndarray, A, b: np.ndarray, split: Tuple,
+                           solve_options: Dict) -> Dict:
+        """
+        Resolver con las filas de una sola variable como cotas superiores y
+        devolver los duales en el orden de las filas originales
+        
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones original
+            b: Lado derecho original
+            split: Resultado de split_bounds sobre el problema original
+            solve_options: Opciones para solve
+            
+        Returns:
+            Diccionario de resultado de solve con la clave adicional 'bounds'
+            (filas convertidas en cotas)
+        """
+        A_rows, b_rows, upper, kept_rows, source, coefficient = split
+        result = self.solve(c, A_rows, b_rows, upper_bounds=upper, **solve_options)
+        if result.get('duals') is not None:
+            duals = np.zeros(len(b))
+            duals[kept_rows] = result['duals']
+            bounded = source >= 0
+            bound_duals = result.get('bound_duals', np.zeros(len(c)))
+            duals[source[bounded]] = bound_duals[bounded] / coefficient[bounded]
+            result['duals'] = duals
+        if 'sensitivity' in result:
+            result['sensitivity'] = self._bound_rows_sensitivity(result, A, b, split)
+        result['bounds'] = {'rows': len(b), 'bound_rows': len(b) - len(kept_rows),
+                            'bounded_vars': int(np.isfinite(upper).sum())}
+        return result
+
+    def _bound_rows_sensitivity(self, result: Dict, A, b: np.ndarray, split: Tuple) -> Dict:
+        """
+        Análisis de sensibilidad en el orden de las filas originales: las filas
+        a·x_j <= b_i que pasaron a cotas toman el rango de la cota (por a) si son
+        la cota activa de x_j y, si no, cualquier b_i >= a·x_j
+        """
+        A_rows, b_rows, upper, kept_rows, source, coefficient = split
+        report = result['sensitivity']
+        removed = np.setdiff1d(np.arange(len(b)), kept_rows)
+        if is_sparse(A):
+            cols, coefs = A.indices[A.indptr[removed]], A.data[A.indptr[removed]]
+        else:
+            cols = np.argmax(A[removed] != 0, axis=1)
+            coefs = A[removed, cols]
+        x = result['solution']
+        
+        rhs_ranges = np.zeros((len(b), 2))
+        rhs_ranges[kept_rows] = report['rhs_ranges']
+        rhs_ranges[removed] = np.column_stack([coefs * x[cols], np.full(len(removed), np.inf)])
+        bounded = np.flatnonzero(source >= 0)
+        rhs_ranges[source[bounded]] = report['bound_ranges'][bounded] * coefficient[bounded, None]
+        slacks = np.zeros(len(b))
+        slacks[kept_rows] = report['slacks']
+        slacks[removed] = b[removed] - coefs * x[cols]
+        
+        report = dict(report, shadow_prices=result['duals'], slacks=slacks, rhs_ranges=rhs_ranges)
+        report.pop('bound_ranges')
+        return report
+
+    def solve_model(self, model: Union[str, LPModel], **solve_options) -> Dict:
+        """
+        Resolver un modelo general (archivo MPS/LP o LPModel)
+
+        El modelo se lleva a la forma estándar max c^T x, Ax <= b, x >= 0 con
+        LPModel.standard_form() (las cotas superiores de las variables quedan
+        como upper_bounds, no como filas) y la solución, el valor óptimo y los
+        duales se devuelven en términos del modelo original.
+
+        Args:
+            model: LPModel o ruta de un archivo .mps/.lp (opcionalmente .gz)
+            **solve_options: Opciones para solve. Si la forma estándar no tiene
+                             b >= 0 (filas >= o de igualdad con lado derecho
+                             positivo) solo se admite method='interior_point'.
+                             Si el modelo tiene variables enteras se resuelve con
+                             solve_integer (y sus opciones), salvo con
+                             relax_integrality=True
+
+        Returns:
+            Diccionario de resultado de solve; 'solution' y 'variable_names' se
+            refieren a las variables del modelo y 'duals' a sus filas
+        """
+        if not isinstance(model, LPModel):
+            model = read_model(model)
+        integer = not solve_options.pop('relax_integrality', False) and bool(model.integer.any())
+        if integer:
+            model = model.integer_bounds()
+        standard = model.standard_form(bound_rows=False)
+        if not standard.origin_feasible and solve_options.get('method', 'tableau') != 'interior_point':
+            raise ValueError("El modelo no tiene el origen factible (b < 0 en la forma estándar); "
+                             "el Simplex parte de la base de holguras, use method='interior_point'")
+        if integer:
+            result = self.solve_integer(standard.c, standard.A, standard.b,
+                                        model.integer[standard.col_source],
+                                        upper_bounds=standard.upper, **solve_options)
+        else:
+            result = self.solve(standard.c, standard.A, standard.b, upper_bounds=standard.upper,
+                                **solve_options)
+
+        if 'solution' in result:
+            result['solution'] = standard.solution(result['solution'])
+            result['optimal_value'] = standard.objective(result['optimal_value'])
+            result['variable_names'] = model.col_names
+            if result.get('duals') is not None:
+                result['duals'] = standard.duals(result['duals'])
+            if result['status'] == 'optimal':
+                self.optimal_solution = result['solution']
+                self.optimal_value = result['optimal_value']
+        if 'ray' in result:
+            # Una dirección no lleva el desplazamiento de las cotas inferiores
+            result['ray'] = standard.solution(result['ray']) - standard.solution(np.zeros_like(result['ray']))
+        if integer:
+            relaxation, info = result['relaxation'], result['branch_and_bound']
+            if relaxation.get('solution') is not None:
+                relaxation['solution'] = standard.solution(relaxation['solution'])
+                relaxation['optimal_value'] = standard.objective(relaxation['optimal_value'])
+            if info['best_bound'] is not None:
+                info['best_bound'] = standard.objective(info['best_bound'])
+            info['gap_history'] = [(elapsed, None if incumbent is None else standard.objective(incumbent),
+                                    standard.objective(bound), gap)
+                                   for elapsed, incumbent, bound, gap in info['gap_history']]
+        return result
+
     def get_iteration_summary(self, iteration_idx: int) -> str:
         """
         Obtener resumen de una iteración
@@ -378,11 +2000,17 @@ class SimplexSolver:
         if iter_data['pivot_row'] >= 0 and iter_data['pivot_col'] >= 0:
             col_name = iter_data['col_names'][iter_data['pivot_col']]
             row_name = iter_data['row_names'][iter_data['pivot_row']]
-            pivot_val = iter_data['tableau'][iter_data['pivot_row'], iter_data['pivot_col']]
             
             summary += f"Columna Pivote: {col_name} (columna {iter_data['pivot_col']})\n"
             summary += f"Fila Pivote: {row_name} (fila {iter_data['pivot_row']})\n"
-            summary += f"Elemento Pivote: {pivot_val:.4f}\n\n"
+            pivot_val = iter_data.get('pivot_element')
+            if pivot_val is None and iter_data['tableau'] is not None:
+                pivot_val = iter_data['tableau'][iter_data['pivot_row'], iter_data['pivot_col']]
+            if pivot_val is not None:
+                summary += f"Elemento Pivote: {pivot_val:.4f}\n\n"
+        elif iter_data['pivot_col'] >= 0:
+            col_name = iter_data['col_names'][iter_data['pivot_col']]
+            summary += f"Cambio de cota: {col_name} pasa a su cota superior (sin pivoteo)\n\n"
         
         if iter_data['is_optimal']:
             summary += "*** SOLUCIÓN ÓPTIMA ALCANZADA ***\n\n"
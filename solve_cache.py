@@ -0,0 +1,297 @@
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import numpy as np
+from sparse_matrix import is_sparse
+
+
+class SolveCache:
+    """
+    Caché de resultados de SimplexSolver.solve indexada por un hash canónico del
+    problema.
+
+    La forma canónica divide cada fila (y su b_i) por su coeficiente de mayor
+    magnitud y ordena las filas, así que el mismo problema con las restricciones
+    en otro orden o multiplicadas por una constante positiva da la misma clave.
+    Los duales se guardan en esa forma y se devuelven en el orden y la escala de
+    cada consulta. Las iteraciones dependen del orden de las filas, por eso solo
+    se sirven a una consulta idéntica a la que produjo el resultado; si se pide
+    historial para una variante reordenada se vuelve a resolver. Los coeficientes
+    normalizados se redondean a `decimals` decimales, así que una variante escalada
+    cuyo redondeo cae justo en un límite da un fallo (se resuelve de nuevo).
+
+    Hay dos niveles: un LRU en memoria (con un índice por los bytes exactos del
+    problema, que evita recalcular la forma canónica en las repeticiones) y, si se
+    da una ruta, un almacén SQLite con expulsión de los menos usados cuando supera
+    max_bytes. Los resultados se guardan con pickle: el archivo debe ser de
+    confianza.
+    """
+
+    def __init__(self, path: Optional[str] = None, memory_entries: int = 256,
+                 max_bytes: int = 256 * 1024 * 1024, decimals: int = 9):
+        """
+        Args:
+            path: Archivo SQLite (None: solo memoria)
+            memory_entries: Resultados que se conservan en memoria
+            max_bytes: Tamaño máximo de los resultados guardados en disco
+            decimals: Decimales con que se redondean los coeficientes normalizados
+                      al calcular la clave
+        """
+        self.memory_entries = memory_entries
+        self.max_bytes = max_bytes
+        self.decimals = decimals
+        self._memory: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._exact: 'OrderedDict[str, Tuple[str, np.ndarray, np.ndarray]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.memory_hits = self.disk_hits = 0
+        self._db = None
+        self._disk_bytes = 0
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False, timeout=30.0)
+            self._db.execute("""CREATE TABLE IF NOT EXISTS results (
+                                    key TEXT PRIMARY KEY, value BLOB NOT NULL,
+                                    size INTEGER NOT NULL, last_used REAL NOT NULL)""")
+            self._db.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+            self._db.commit()
+            self._disk_bytes = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def close(self):
+        """Cerrar el almacén en disco"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    # ------------------------------------------------------------------
+    # Forma canónica
+    # ------------------------------------------------------------------
+
+    def problem_key(self, c: np.ndarray, A, b: np.ndarray,
+                    options: Dict) -> Tuple[str, str, np.ndarray, np.ndarray]:
+        """
+        Claves del problema
+
+        Returns:
+            (clave canónica, clave exacta, orden de las filas en la forma
+            canónica, factor de cada fila)
+        """
+        c = np.ascontiguousarray(c, dtype=float)
+        b = np.ascontiguousarray(b, dtype=float)
+        option_bytes = repr(sorted(options.items())).encode()
+        exact = hashlib.sha256()
+        exact.update(option_bytes)
+        exact.update(np.asarray(A.shape if is_sparse(A) else np.shape(A), dtype=np.int64).tobytes())
+        if is_sparse(A):
+            for part in (A.data, A.indices, A.indptr):
+                exact.update(np.ascontiguousarray(part).tobytes())
+        else:
+            exact.update(np.ascontiguousarray(A, dtype=float).tobytes())
+        exact.update(c.tobytes())
+        exact.update(b.tobytes())
+        exact_key = exact.hexdigest()
+
+        with self._lock:
+            known = self._exact.get(exact_key)
+            if known is not None:
+                self._exact.move_to_end(exact_key)
+                return (known[0], exact_key) + known[1:]
+
+        canonical_key, order, scale = self._canonical(c, A, b, option_bytes)
+        with self._lock:
+            self._exact[exact_key] = (canonical_key, order, scale)
+            if len(self._exact) > 4 * self.memory_entries:
+                self._exact.popitem(last=False)
+        return canonical_key, exact_key, order, scale
+
+    def _canonical(self, c: np.ndarray, A, b: np.ndarray,
+                   option_bytes: bytes) -> Tuple[str, np.ndarray, np.ndarray]:
+        """Hash de las filas normalizadas y ordenadas"""
+        decimals = self.decimals
+        if is_sparse(A):
+            magnitude = np.abs(A.data)
+            scale = np.zeros(A.shape[0])
+            np.maximum.at(scale, A.row_index(), magnitude)
+        else:
+            A = np.asarray(A, dtype=float)
+            scale = np.max(np.abs(A), axis=1) if A.size else np.zeros(len(b))
+        scale[scale == 0] = 1.0
+        b_norm = np.round(b / scale, decimals) + 0.0
+
+        if is_sparse(A):
+            values = np.round(A.data / scale[A.row_index()], decimals) + 0.0
+            rows = [A.indices[start:end].tobytes() + values[start:end].tobytes()
+                    for start, end in zip(A.indptr[:-1], A.indptr[1:])]
+        else:
+            normalized = np.round(A / scale[:, None], decimals) + 0.0
+            rows = [row.tobytes() for row in normalized]
+        rows = [row + b_norm[i:i + 1].tobytes() for i, row in enumerate(rows)]
+        order = np.array(sorted(range(len(rows)), key=rows.__getitem__), dtype=np.int64)
+
+        digest = hashlib.sha256()
+        digest.update(option_bytes)
+        digest.update(np.asarray(A.shape, dtype=np.int64).tobytes())
+        digest.update((np.round(c, decimals) + 0.0).tobytes())
+        for i in order:
+            digest.update(len(rows[i]).to_bytes(8, 'little'))
+            digest.update(rows[i])
+        return digest.hexdigest(), order, scale
+
+    # ------------------------------------------------------------------
+    # Consulta y almacenamiento
+    # ------------------------------------------------------------------
+
+    def get(self, c: np.ndarray, A, b: np.ndarray, options: Dict) -> Tuple[Optional[Dict], Tuple]:
+        """
+        Buscar el resultado de un problema
+
+        Args:
+            c, A, b: Problema
+            options: Opciones de solve que afectan al resultado
+
+        Returns:
+            (resultado o None, claves para put())
+        """
+        keys = self.problem_key(c, A, b, options)
+        canonical_key, exact_key, order, scale = keys
+        entry, source = self._lookup(canonical_key)
+        # Las iteraciones y los rangos por fila solo valen para el mismo orden de filas
+        if (entry is not None and entry['exact_key'] != exact_key
+                and (options.get('history') != 'none' or options.get('sensitivity'))):
+            entry = None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None, keys
+            self.hits += 1
+            if source == 'memory':
+                self.memory_hits += 1
+            else:
+                self.disk_hits += 1
+
+        result = dict(entry['result'])
+        for name in ('solution', 'duals', 'bound_duals'):
+            if isinstance(result.get(name), np.ndarray):
+                result[name] = result[name].copy()
+        if 'sensitivity' in result:
+            result['sensitivity'] = {name: value.copy() if isinstance(value, np.ndarray) else value
+                                     for name, value in result['sensitivity'].items()}
+        if entry['duals'] is not None:
+            duals = np.zeros(len(order))
+            duals[order] = entry['duals'] / scale[order]
+            result['duals'] = duals
+        if entry['exact_key'] != exact_key:
+            # Las iteraciones y la base dependen del orden de las filas
+            result['iterations'] = []
+            result.pop('basic_vars', None)
+        return result, keys
+
+    def basis(self, keys: Tuple) -> Optional[Tuple]:
+        """Base óptima guardada con el resultado, solo si el problema es idéntico"""
+        canonical_key, exact_key = keys[:2]
+        with self._lock:
+            entry = self._memory.get(canonical_key)
+        if entry is None or entry['exact_key'] != exact_key:
+            return None
+        return entry.get('basis')
+
+    def _lookup(self, key: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """Entrada guardada y de dónde salió ('memory' o 'disk')"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry, 'memory'
+            if self._db is None:
+                return None, None
+            row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None, None
+            self._db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            entry = pickle.loads(row[0])
+            self._remember(key, entry)
+            return entry, 'disk'
+
+    def put(self, keys: Tuple, result: Dict, basis: Optional[Tuple] = None):
+        """
+        Guardar un resultado calculado (no se guardan los errores ni las
+        resoluciones detenidas por tiempo o cancelación)
+
+        Args:
+            keys: Claves devueltas por get()
+            result: Resultado de solve
+            basis: (variables básicas óptimas, pivoteos desde cero) para que un
+                   acierto exacto deje listo el arranque en caliente
+        """
+        if result.get('status') in ('error', 'time_limit', 'cancelled'):
+            return
+        canonical_key, exact_key, order, scale = keys
+        result = {name: value for name, value in result.items() if name != 'cache'}
+        duals = result.get('duals')
+        entry = {
+            'result': result,
+            'exact_key': exact_key,
+            'basis': basis,
+            # Duales de la forma canónica (filas ordenadas y normalizadas)
+            'duals': None if duals is None else (np.asarray(duals) * scale)[order]
+        }
+        with self._lock:
+            self._remember(canonical_key, entry)
+            if self._db is None:
+                return
+            try:
+                value = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                # Historial compacto con funciones locales: guardar las iteraciones materializadas
+                stored = dict(result, iterations=[dict(it) for it in result.get('iterations', [])])
+                value = pickle.dumps(dict(entry, result=stored), protocol=pickle.HIGHEST_PROTOCOL)
+            previous = self._db.execute("SELECT size FROM results WHERE key = ?",
+                                        (canonical_key,)).fetchone()
+            self._db.execute("INSERT OR REPLACE INTO results (key, value, size, last_used) "
+                             "VALUES (?, ?, ?, ?)", (canonical_key, value, len(value), time.time()))
+            self._disk_bytes += len(value) - (previous[0] if previous else 0)
+            self._evict()
+            self._db.commit()
+
+    def _remember(self, key: str, entry: Dict):
+        """Guardar en el LRU de memoria"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        """Borrar del disco los resultados menos usados hasta quedar bajo max_bytes"""
+        while self._disk_bytes > self.max_bytes:
+            oldest = self._db.execute("SELECT key, size FROM results ORDER BY last_used "
+                                      "LIMIT 64").fetchall()
+            if not oldest:
+                self._disk_bytes = 0
+                break
+            for key, size in oldest:
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._disk_bytes -= size
+                if self._disk_bytes <= self.max_bytes:
+                    break
+
+    def stats(self) -> Dict:
+        """Aciertos, fallos, tasa de aciertos y tamaño de la caché"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            disk_entries = 0
+            if self._db is not None:
+                disk_entries = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'memory_entries': len(self._memory),
+                'disk_entries': disk_entries,
+                'disk_bytes': self._disk_bytes
+            }
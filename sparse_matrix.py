@@ -0,0 +1,157 @@
+import numpy as np
+from typing import Tuple
+
+
+class CSRMatrix:
+    """
+    Matriz dispersa en formato CSR (filas comprimidas) sobre arreglos de NumPy.
+
+    Guarda solo los coeficientes no nulos de la matriz de restricciones. El acceso
+    por columnas que necesita el Simplex revisado se sirve desde una copia CSC que
+    se construye una sola vez, la primera vez que se pide una columna.
+    """
+
+    def __init__(self, data: np.ndarray, indices: np.ndarray, indptr: np.ndarray,
+                 shape: Tuple[int, int]):
+        """
+        Args:
+            data: Valores no nulos ordenados por fila
+            indices: Índice de columna de cada valor
+            indptr: Inicio de cada fila dentro de data (longitud n_filas + 1)
+            shape: Dimensiones (n_filas, n_columnas)
+        """
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = (int(shape[0]), int(shape[1]))
+        self._row_index = None
+        self._csc = None
+
+    @classmethod
+    def from_triplets(cls, rows, cols, values, shape: Tuple[int, int]) -> 'CSRMatrix':
+        """
+        Construir la matriz desde tripletas (fila, columna, valor)
+
+        Las entradas repetidas se suman y los ceros explícitos se descartan.
+
+        Args:
+            rows: Índices de fila
+            cols: Índices de columna
+            values: Valores
+            shape: Dimensiones (n_filas, n_columnas)
+
+        Returns:
+            CSRMatrix
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+        n_rows, n_cols = int(shape[0]), int(shape[1])
+
+        # Ordenar por (fila, columna) y sumar duplicados
+        keys = rows * n_cols + cols
+        order = np.argsort(keys, kind='stable')
+        keys, values = keys[order], values[order]
+        unique_keys, starts = np.unique(keys, return_index=True)
+        summed = np.add.reduceat(values, starts) if len(values) else values
+
+        keep = summed != 0
+        unique_keys, summed = unique_keys[keep], summed[keep]
+        row_of = unique_keys // n_cols if n_cols else unique_keys
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_of, minlength=n_rows), out=indptr[1:])
+
+        return cls(summed, unique_keys - row_of * n_cols, indptr, (n_rows, n_cols))
+
+    @classmethod
+    def from_dense(cls, A) -> 'CSRMatrix':
+        """Construir la matriz dispersa a partir de una matriz densa"""
+        A = np.atleast_2d(np.asarray(A, dtype=float))
+        rows, cols = np.nonzero(A)
+        return cls.from_triplets(rows, cols, A[rows, cols], A.shape)
+
+    @property
+    def nnz(self) -> int:
+        """Número de coeficientes no nulos"""
+        return len(self.data)
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria ocupada por los arreglos CSR"""
+        return self.data.nbytes + self.indices.nbytes + self.indptr.nbytes
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def row_index(self) -> np.ndarray:
+        """Índice de fila de cada valor no nulo (se calcula una sola vez)"""
+        if self._row_index is None:
+            self._row_index = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return self._row_index
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """Calcular A·x"""
+        products = self.data * np.asarray(x, dtype=float)[self.indices]
+        return np.bincount(self.row_index(), weights=products, minlength=self.shape[0])
+
+    def rmatvec(self, y: np.ndarray) -> np.ndarray:
+        """Calcular A^T·y"""
+        products = self.data * np.asarray(y, dtype=float)[self.row_index()]
+        return np.bincount(self.indices, weights=products, minlength=self.shape[1])
+
+    def _column_storage(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Copia CSC (valores, filas, punteros de columna) construida bajo demanda"""
+        if self._csc is None:
+            order = np.argsort(self.indices, kind='stable')
+            colptr = np.zeros(self.shape[1] + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.indices, minlength=self.shape[1]), out=colptr[1:])
+            self._csc = (self.data[order], self.row_index()[order], colptr)
+        return self._csc
+
+    def column(self, j: int) -> np.ndarray:
+        """Columna j como vector denso"""
+        values, rows, colptr = self._column_storage()
+        col = np.zeros(self.shape[0])
+        start, end = colptr[j], colptr[j + 1]
+        col[rows[start:end]] = values[start:end]
+        return col
+
+    def columns(self, cols) -> np.ndarray:
+        """Submatriz densa con las columnas indicadas (n_filas x len(cols))"""
+        values, rows, colptr = self._column_storage()
+        out = np.zeros((self.shape[0], len(cols)))
+        for k, j in enumerate(cols):
+            start, end = colptr[j], colptr[j + 1]
+            out[rows[start:end], k] = values[start:end]
+        return out
+
+    def submatrix(self, rows, cols) -> 'CSRMatrix':
+        """Submatriz dispersa con las filas y columnas indicadas, en ese orden"""
+        row_map = np.full(self.shape[0], -1, dtype=np.int64)
+        row_map[np.asarray(rows, dtype=np.int64)] = np.arange(len(rows))
+        col_map = np.full(self.shape[1], -1, dtype=np.int64)
+        col_map[np.asarray(cols, dtype=np.int64)] = np.arange(len(cols))
+        new_rows, new_cols = row_map[self.row_index()], col_map[self.indices]
+        keep = (new_rows >= 0) & (new_cols >= 0)
+        return CSRMatrix.from_triplets(new_rows[keep], new_cols[keep], self.data[keep],
+                                       (len(rows), len(cols)))
+
+    def row(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Índices de columna y valores no nulos de la fila i"""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def scatter_into(self, out: np.ndarray):
+        """Copiar los coeficientes en el bloque superior izquierdo de un arreglo denso"""
+        out[self.row_index(), self.indices] = self.data
+
+    def toarray(self) -> np.ndarray:
+        """Convertir a matriz densa"""
+        out = np.zeros(self.shape)
+        self.scatter_into(out)
+        return out
+
+
+def is_sparse(A) -> bool:
+    """Indicar si la matriz de restricciones está en formato disperso"""
+    return isinstance(A, CSRMatrix)